@@ -0,0 +1,87 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Compare the IVF vector store with exact search on synthetic embeddings.
+
+    python -m benchmarks.ann_benchmark --rows 200000 --dimensions 1536
+
+Embeddings are drawn around random topic centres, like the chunks of a real corpus,
+so that the clusters found by the index are meaningful. No network access is needed.
+"""
+
+import time
+from argparse import ArgumentParser
+from typing import List
+from typing import Set
+
+# pylint: disable=import-error
+import numpy as np
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from coded_tools.tools.rag.ivf_vector_store import IvfVectorStore
+
+
+def make_embeddings(rows: int, dimensions: int, topics: int, seed: int) -> np.ndarray:
+    """
+    :param rows: Number of vectors
+    :param dimensions: Vector size
+    :param topics: Number of topic centres the vectors are drawn around
+    :param seed: Random seed
+    :return: float32 matrix of shape (rows, dimensions)
+    """
+    rng = np.random.default_rng(seed)
+    centres: np.ndarray = rng.standard_normal((topics, dimensions), dtype=np.float32)
+    noise: np.ndarray = rng.standard_normal((rows, dimensions), dtype=np.float32)
+    return centres[rng.integers(topics, size=rows)] + 0.6 * noise
+
+
+def main():
+    """Build the store, then report index build time, recall@k and query latency per n_probe."""
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100000, help="Chunks in the store")
+    parser.add_argument("--dimensions", type=int, default=384, help="Embedding size")
+    parser.add_argument("--topics", type=int, default=500, help="Topic centres of the synthetic embeddings")
+    parser.add_argument("--queries", type=int, default=200, help="Queries to run")
+    parser.add_argument("--k", type=int, default=4, help="Results per query")
+    parser.add_argument("--n-probe", type=int, nargs="+", default=[4, 8, 16, 32, 64], help="n_probe values to try")
+    args = parser.parse_args()
+
+    matrix: np.ndarray = make_embeddings(args.rows, args.dimensions, args.topics, seed=0)
+    queries: np.ndarray = make_embeddings(args.queries, args.dimensions, args.topics, seed=1)
+    store = IvfVectorStore(embedding=DeterministicFakeEmbedding(size=args.dimensions), min_rows=0)
+    store.add_embeddings([str(row) for row in range(args.rows)], matrix)
+
+    started_at: float = time.perf_counter()
+    store.build_index()
+    print(f"{args.rows} rows x {args.dimensions} dimensions, index built in {time.perf_counter() - started_at:.2f}s")
+
+    started_at = time.perf_counter()
+    exact: List[Set[int]] = [{row for row, _ in store.exact_search_rows(query, args.k)} for query in queries]
+    exact_ms: float = 1000 * (time.perf_counter() - started_at) / args.queries
+    print(f"{'search':>12} {'recall@' + str(args.k):>10} {'ms/query':>10} {'speed-up':>10}")
+    print(f"{'exact':>12} {1.0:>10.3f} {exact_ms:>10.3f} {1.0:>10.1f}")
+
+    for n_probe in args.n_probe:
+        started_at = time.perf_counter()
+        found: List[Set[int]] = [{row for row, _ in store.search_rows(query, args.k, n_probe)} for query in queries]
+        ivf_ms: float = 1000 * (time.perf_counter() - started_at) / args.queries
+        recall: float = float(np.mean([len(hits & truth) / args.k for hits, truth in zip(found, exact)]))
+        print(f"{'n_probe=' + str(n_probe):>12} {recall:>10.3f} {ivf_ms:>10.3f} {exact_ms / ivf_ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Measure the throughput of ProcessLogBridge's multi-line JSON reassembly on records of growing size.
+
+    python -m benchmarks.json_reassembly_benchmark --record-kb 1 16 256 --total-kb 4096
+
+Pretty-printed JSON records with nested objects, and braces, quotes and backslashes in their strings,
+are fed line by line to the renderer of the bridge as it was with a char by char brace count, and as it is
+with the incremental brace scanner. Reports MB/s of the brace scan alone and of the whole reassembly,
+which includes parsing and logging every record, but not the console output itself. Results are written as JSON.
+"""
+
+import json
+import logging
+import time
+from argparse import ArgumentParser
+from argparse import Namespace
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from plugins.log_bridge.line_parsing import try_parse_json_fragment
+from plugins.log_bridge.process_log_bridge import ProcessLogBridge
+
+# A string value, about 100 characters long, with the characters a brace scan has to get right
+SENTENCE = 'Tool said "use {braces} like }}{ this" in C:\\tools\\ and \\"kept\\" going: ok. '
+
+
+class CharLoopLogBridge(ProcessLogBridge):
+    """
+    ProcessLogBridge counting the braces of each line char by char, without carrying quote state from line to line,
+    and parsing a collected block as a whole before parsing its fragment. The baseline of the benchmark.
+    """
+
+    @staticmethod
+    def _scan_braces(state: Dict[str, Any], line: str) -> None:
+        depth = 0
+        in_str = False
+        esc = False
+        for ch in line:
+            if esc:
+                esc = False
+                continue
+            if ch == "\\":
+                esc = True
+                continue
+            if ch == '"':
+                in_str = not in_str
+                continue
+            if in_str:
+                continue
+            if ch == "{":
+                depth += 1
+            elif ch == "}":
+                depth -= 1
+        state["balance"] += depth
+
+    def _emit_collected(self, state: Dict[str, Any], block: str, plain: bool = False, quiet: bool = False) -> None:
+        obj = try_parse_json_fragment(block, loads=self._loads_json)
+        if obj is not None:
+            self._emit_json_block(state, obj, quiet)
+            return
+        rebuilt = self._rebuild_neurosan_request_reporting(block)
+        if rebuilt is not None:
+            self._emit_json_block(state, rebuilt, quiet)
+            return
+        if not quiet:
+            self._emit_text_line(state, " ".join(p.strip() for p in block.splitlines() if p.strip()))
+
+
+def make_record_lines(record_kb: int, number: int) -> List[str]:
+    """
+    :param record_kb: Approximate size of the record in kilobytes
+    :param number: Number of the record, used in its request_id
+    :return: Lines of a pretty-printed JSON record
+    """
+    sentences: int = max(1, record_kb * 1024 // (2 * len(SENTENCE)))
+    record: Dict[str, Any] = {
+        "message": SENTENCE * sentences,
+        "details": {
+            "steps": [{"step": step, "output": SENTENCE, "empty": {}} for step in range(sentences // 4)],
+            "note": SENTENCE * (sentences - sentences // 4),
+        },
+        "message_type": "Info",
+        "source": "HttpServer",
+        "request_id": f"r-{number}",
+    }
+    return json.dumps(record, indent=2).splitlines()
+
+
+def time_variant(bridge_class: type, lines: List[str], repeats: int, handle: Optional[str] = None) -> Dict[str, float]:
+    """
+    :param bridge_class: ProcessLogBridge or a subclass
+    :param lines: Lines of the records to feed to the bridge
+    :param repeats: Times to feed the lines, keeping the fastest
+    :param handle: Name of the bridge method taking a stream state and a line, by default its renderer
+    :return: Seconds taken and MB/s
+    """
+    root_handlers: List[logging.Handler] = list(logging.getLogger().handlers)
+    bridge = bridge_class(level="CRITICAL")
+    try:
+        seconds: float = float("inf")
+        for _ in range(repeats):
+            # pylint: disable=protected-access
+            state: Dict[str, Any] = bridge._make_stream_state("NeuroSan", None)
+            handle_line: Callable = getattr(bridge, handle or "_render_line")
+            start: float = time.perf_counter()
+            for line in lines:
+                handle_line(state, line)
+            seconds = min(seconds, time.perf_counter() - start)
+    finally:
+        logging.getLogger().handlers[:] = root_handlers
+    megabytes: float = sum(len(line) + 1 for line in lines) / 1_000_000
+    return {"seconds": seconds, "mb_per_second": megabytes / seconds}
+
+
+def run_benchmark(args: Namespace) -> Dict[str, Any]:
+    """
+    :param args: Parsed command line arguments
+    :return: The timings of every variant for every record size
+    """
+    results: Dict[str, Any] = {"total_kb": args.total_kb, "sizes": {}}
+    for record_kb in args.record_kb:
+        records: int = max(1, args.total_kb // record_kb)
+        lines: List[str] = []
+        for number in range(records):
+            lines.extend(make_record_lines(record_kb, number))
+        results["sizes"][str(record_kb)] = {
+            "records": records,
+            "lines": len(lines),
+            "variants": {
+                "char_loop_scan": time_variant(CharLoopLogBridge, lines, args.repeats, "_scan_braces"),
+                "incremental_scan": time_variant(ProcessLogBridge, lines, args.repeats, "_scan_braces"),
+                "char_loop_reassembly": time_variant(CharLoopLogBridge, lines, args.repeats),
+                "incremental_reassembly": time_variant(ProcessLogBridge, lines, args.repeats),
+            },
+        }
+    return results
+
+
+def build_parser() -> ArgumentParser:
+    """
+    :return: Parser of the command line arguments
+    """
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--record-kb", nargs="+", type=int, default=[1, 16, 256], help="Record sizes in kilobytes")
+    parser.add_argument("--total-kb", type=int, default=4096, help="Kilobytes of records fed per record size")
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per variant, the fastest of which is reported")
+    parser.add_argument("--output", default="json_reassembly_benchmark.json", help="JSON file to write the results to")
+    return parser
+
+
+def main():
+    """Run the benchmark and write its results as JSON."""
+    args: Namespace = build_parser().parse_args()
+    results: Dict[str, Any] = run_benchmark(args)
+    with open(args.output, "w", encoding="utf-8") as output_file:
+        json.dump(results, output_file, indent=2)
+
+    print(f"{'record KB':>10} {'variant':>24} {'MB/s':>8} {'speedup':>8}")
+    for record_kb, size in results["sizes"].items():
+        for name, variant in size["variants"].items():
+            baseline: Dict[str, float] = size["variants"][name.replace("incremental", "char_loop")]
+            speedup: float = variant["mb_per_second"] / baseline["mb_per_second"]
+            print(f"{record_kb:>10} {name:>24} {variant['mb_per_second']:>8.1f} {speedup:>7.2f}x")
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Measure how fast ProcessLogBridge drains chatty child processes in each of its drain modes.
+
+    python -m benchmarks.log_bridge_benchmark --processes 4 --lines 5000 --output log_bridge_benchmark.json
+
+Child processes write a mix of plain text and JSON log lines to stdout and stderr as fast as they can,
+as run.py starts them. Reports lines/s, how long the children took to write their output, the CPU time
+of the bridge's process per thousand lines, the number of threads the bridge started, and how many lines
+were rendered rich, plain or not at all. Console output is rendered as usual, then discarded.
+"""
+
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from argparse import ArgumentParser
+from argparse import Namespace
+from typing import Any
+from typing import Dict
+from typing import List
+
+from plugins.log_bridge.process_log_bridge import ProcessLogBridge
+
+# Writes argv[1] lines, alternating stdout and stderr, every argv[2]-th one a JSON record
+CHILD_SCRIPT = """
+import json
+import sys
+
+lines, json_every = int(sys.argv[1]), int(sys.argv[2])
+for number in range(lines):
+    stream = sys.stdout if number % 2 == 0 else sys.stderr
+    if json_every and number % json_every == 0:
+        record = {"message": f"Request {number} handled", "message_type": "Info", "request_id": f"r-{number}"}
+        stream.write(json.dumps(record) + "\\n")
+    else:
+        stream.write(f"2025-01-01 12:00:00 INFO neuro_san.server: Handled request {number} in 3 ms\\n")
+"""
+
+
+# pylint: disable=too-many-locals
+def run_mode(mode: str, args: Namespace, temp_dir: str) -> Dict[str, Any]:
+    """
+    :param mode: One of ProcessLogBridge.DRAIN_MODES
+    :param args: Parsed command line arguments
+    :param temp_dir: Directory of the tee files
+    :return: Measurements of draining every child process in the mode
+    """
+    root_handlers: List[logging.Handler] = list(logging.getLogger().handlers)
+    bridge = ProcessLogBridge(level=args.level, drain_mode=mode)
+    # pylint: disable=consider-using-with
+    devnull = open(os.devnull, "w", encoding="utf-8")
+    bridge.console.file = devnull
+    log_files: List[str] = [os.path.join(temp_dir, f"{mode}_{number}.log") for number in range(args.processes)]
+    try:
+        threads_before: int = threading.active_count()
+        start: float = time.perf_counter()
+        cpu_start: float = time.process_time()
+        processes: List[subprocess.Popen] = []
+        for number, log_file in enumerate(log_files):
+            process = subprocess.Popen(
+                [sys.executable, "-c", CHILD_SCRIPT, str(args.lines), str(args.json_every)],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+            )
+            bridge.attach_process_logger(process, f"child{number}", log_file)
+            processes.append(process)
+        threads: int = threading.active_count() - threads_before
+        for process in processes:
+            process.wait()
+        children_seconds: float = time.perf_counter() - start
+        bridge.wait_for_streams()
+        seconds: float = time.perf_counter() - start
+        cpu_seconds: float = time.process_time() - cpu_start
+    finally:
+        devnull.close()
+        logging.getLogger().handlers[:] = root_handlers
+
+    lines: int = args.processes * args.lines
+    teed: int = 0
+    for log_file in log_files:
+        with open(log_file, encoding="utf-8") as tee:
+            teed += sum(1 for _ in tee)
+    return {
+        "seconds": seconds,
+        "lines_per_second": lines / seconds,
+        # Children block on full pipes, so this grows when the bridge drains too slowly
+        "children_seconds": children_seconds,
+        "cpu_seconds": cpu_seconds,
+        "cpu_ms_per_1000_lines": cpu_seconds * 1000 * 1000 / lines,
+        "threads": threads,
+        "lines_teed": teed,
+        "lines_rendered": dict(bridge.render_counts),
+    }
+
+
+def run_benchmark(args: Namespace) -> Dict[str, Any]:
+    """
+    :param args: Parsed command line arguments
+    :return: The workload and the measurements of every drain mode
+    """
+    results: Dict[str, Any] = {
+        "workload": {
+            "processes": args.processes,
+            "lines_per_process": args.lines,
+            "json_every": args.json_every,
+            "level": args.level,
+        },
+        "modes": {},
+    }
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for mode in args.modes:
+            results["modes"][mode] = run_mode(mode, args, temp_dir)
+    return results
+
+
+def build_parser() -> ArgumentParser:
+    """
+    :return: Parser of the command line arguments
+    """
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--processes", type=int, default=4, help="Child processes logging concurrently")
+    parser.add_argument("--lines", type=int, default=5000, help="Lines written by each child process")
+    parser.add_argument("--json-every", type=int, default=10, help="Every n-th line is a JSON record, 0 for none")
+    parser.add_argument("--level", default="INFO", help="Console log level of the bridge")
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=ProcessLogBridge.DRAIN_MODES,
+        default=list(ProcessLogBridge.DRAIN_MODES),
+        help="Drain modes to measure",
+    )
+    parser.add_argument("--output", default="log_bridge_benchmark.json", help="JSON file to write the results to")
+    return parser
+
+
+def main():
+    """Run the benchmark and write its results as JSON."""
+    args: Namespace = build_parser().parse_args()
+    results: Dict[str, Any] = run_benchmark(args)
+    with open(args.output, "w", encoding="utf-8") as output_file:
+        json.dump(results, output_file, indent=2)
+
+    print(f"{args.processes} processes x {args.lines} lines")
+    print(
+        f"{'mode':>12} {'lines/s':>10} {'child s':>8} {'cpu s':>8} {'cpu ms/1k':>10} {'threads':>8} {'teed':>8} "
+        f"{'rich':>8} {'plain':>8} {'skipped':>8}"
+    )
+    for mode, measured in results["modes"].items():
+        rendered: Dict[str, int] = measured["lines_rendered"]
+        print(
+            f"{mode:>12} {measured['lines_per_second']:>10.0f} {measured['children_seconds']:>8.3f} "
+            f"{measured['cpu_seconds']:>8.3f} {measured['cpu_ms_per_1000_lines']:>10.3f} {measured['threads']:>8} "
+            f"{measured['lines_teed']:>8} {rendered['rich']:>8} {rendered['plain']:>8} {rendered['skipped']:>8}"
+        )
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Measure the per-line cost of ProcessLogBridge's line rendering on captured server logs.
+
+    python -m benchmarks.log_line_benchmark --log-file logs/server.log --lines 100000
+
+Replays the lines of the log file, or of a bundled sample of server output when there is no logs/server.log,
+through the renderer of the bridge as it was before lines were classified, and as it is with each
+available JSON backend. The console only shows CRITICAL records, so the times cover classification, parsing,
+reassembly, level inference and logging, but not the console output itself. Results are written as JSON.
+"""
+
+import json
+import logging
+import os
+import time
+from argparse import ArgumentParser
+from argparse import Namespace
+from typing import Any
+from typing import Dict
+from typing import List
+
+from plugins.log_bridge.line_parsing import LEVEL_WORD
+from plugins.log_bridge.line_parsing import classify_line
+from plugins.log_bridge.line_parsing import orjson
+from plugins.log_bridge.line_parsing import try_parse_json_fragment
+from plugins.log_bridge.process_log_bridge import ProcessLogBridge
+
+DEFAULT_LOG_FILE = os.path.join("logs", "server.log")
+SAMPLE_LOG_FILE = os.path.join(os.path.dirname(__file__), "samples", "server_log_sample.txt")
+
+
+class UnclassifiedLogBridge(ProcessLogBridge):
+    """
+    ProcessLogBridge handling lines as it did before they were classified: every line goes through
+    the JSON parsers and the level regular expression. The baseline of the benchmark.
+    """
+
+    def _render_line(self, state: Dict[str, Any], line: str, plain: bool = False, shown: bool = True) -> None:
+        obj = try_parse_json_fragment(line)
+        if obj is not None:
+            self._emit_json_block(state, obj)
+            return
+        if not state["collecting"]:
+            if self._reasm_start_if_jsonish(state, line):
+                if state["balance"] <= 0:
+                    self._emit_collected(state, self._reasm_flush(state))
+                return
+            self._emit_text_line(state, line)
+            return
+        self._reasm_add(state, line)
+        if self._reasm_should_flush(state, line):
+            self._emit_collected(state, self._reasm_flush(state))
+
+    def _infer_level_from_text(self, line: str, default: int = logging.INFO) -> int:
+        if not line:
+            return default
+        m = LEVEL_WORD.search(line)
+        if not m:
+            return logging.ERROR if "traceback" in line.lower() else default
+        word = m.group(1).upper()
+        return logging.CRITICAL if word == "FATAL" else getattr(logging, word, default)
+
+
+def read_lines(path: str, count: int) -> List[str]:
+    """
+    :param path: Log file
+    :param count: Number of lines to return, repeating the lines of the file as needed
+    :return: The lines, without their line endings
+    """
+    with open(path, encoding="utf-8", errors="replace") as log_file:
+        lines: List[str] = log_file.read().splitlines()
+    if not lines:
+        raise ValueError(f"No lines in {path}")
+    return (lines * (count // len(lines) + 1))[:count]
+
+
+def time_variant(bridge_class: type, json_backend: str, lines: List[str], repeats: int) -> Dict[str, float]:
+    """
+    :param bridge_class: ProcessLogBridge or a subclass
+    :param json_backend: JSON backend of the bridge
+    :param lines: Lines to handle
+    :param repeats: Times to handle the lines, keeping the fastest
+    :return: Seconds taken and microseconds per line
+    """
+    root_handlers: List[logging.Handler] = list(logging.getLogger().handlers)
+    bridge = bridge_class(level="CRITICAL", config={"json_backend": json_backend})
+    try:
+        with open(os.devnull, "w", encoding="utf-8") as devnull:
+            seconds: float = float("inf")
+            for _ in range(repeats):
+                # pylint: disable=protected-access
+                state: Dict[str, Any] = bridge._make_stream_state("NeuroSan", devnull)
+                start: float = time.perf_counter()
+                for line in lines:
+                    if line:
+                        bridge._render_line(state, line)
+                seconds = min(seconds, time.perf_counter() - start)
+    finally:
+        logging.getLogger().handlers[:] = root_handlers
+    return {"seconds": seconds, "us_per_line": seconds * 1_000_000 / len(lines)}
+
+
+def run_benchmark(args: Namespace) -> Dict[str, Any]:
+    """
+    :param args: Parsed command line arguments
+    :return: The line kinds of the log and the timings of every variant
+    """
+    log_file: str = args.log_file or (DEFAULT_LOG_FILE if os.path.exists(DEFAULT_LOG_FILE) else SAMPLE_LOG_FILE)
+    lines: List[str] = read_lines(log_file, args.lines)
+    kinds: Dict[str, int] = {}
+    for line in set(lines):
+        kind: str = classify_line(line) if line else "empty"
+        kinds[kind] = kinds.get(kind, 0) + 1
+
+    variants: Dict[str, Dict[str, float]] = {
+        "before": time_variant(UnclassifiedLogBridge, "json", lines, args.repeats),
+        "classified_json": time_variant(ProcessLogBridge, "json", lines, args.repeats),
+    }
+    if orjson is not None:
+        variants["classified_orjson"] = time_variant(ProcessLogBridge, "orjson", lines, args.repeats)
+    return {"log_file": log_file, "lines": len(lines), "distinct_line_kinds": kinds, "variants": variants}
+
+
+def build_parser() -> ArgumentParser:
+    """
+    :return: Parser of the command line arguments
+    """
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--log-file", help="Captured log, by default logs/server.log or the bundled sample")
+    parser.add_argument("--lines", type=int, default=100000, help="Lines to handle, repeating the log as needed")
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per variant, the fastest of which is reported")
+    parser.add_argument("--output", default="log_line_benchmark.json", help="JSON file to write the results to")
+    return parser
+
+
+def main():
+    """Run the benchmark and write its results as JSON."""
+    args: Namespace = build_parser().parse_args()
+    results: Dict[str, Any] = run_benchmark(args)
+    with open(args.output, "w", encoding="utf-8") as output_file:
+        json.dump(results, output_file, indent=2)
+
+    print(f"{results['lines']} lines of {results['log_file']}, distinct lines: {results['distinct_line_kinds']}")
+    print(f"{'variant':>18} {'us/line':>8} {'speedup':>8}")
+    before: float = results["variants"]["before"]["us_per_line"]
+    for name, variant in results["variants"].items():
+        print(f"{name:>18} {variant['us_per_line']:>8.2f} {before / variant['us_per_line']:>7.2f}x")
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
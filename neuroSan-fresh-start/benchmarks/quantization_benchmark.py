@@ -0,0 +1,113 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Compare the memory and recall of quantized vector stores with the full-precision stores on synthetic embeddings.
+
+    python -m benchmarks.quantization_benchmark --rows 100000 --dimensions 1536
+
+Memory is the resident embedding memory per chunk: Python float lists for InMemoryVectorStore,
+the float32 matrix for NumpyVectorStore, and the codes of a saved QuantizedVectorStore, whose
+full-precision matrix stays memory-mapped. No network access is needed.
+"""
+
+import os
+import tempfile
+import time
+import tracemalloc
+from argparse import ArgumentParser
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+# pylint: disable=import-error
+import numpy as np
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from benchmarks.ann_benchmark import make_embeddings
+from coded_tools.tools.rag.quantized_vector_store import QuantizedVectorStore
+
+
+def list_bytes_per_chunk(matrix: np.ndarray) -> float:
+    """
+    :param matrix: Embeddings
+    :return: Bytes per chunk taken by the embeddings as lists of Python floats, as InMemoryVectorStore keeps them
+    """
+    tracemalloc.start()
+    vectors: List[List[float]] = [row.tolist() for row in matrix]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del vectors
+    return size / len(matrix)
+
+
+def search_all(
+    search: Callable[..., List[Tuple[int, float]]], queries: np.ndarray, k: int, *args: Any
+) -> Tuple[List[Set[int]], float]:
+    """
+    :param search: Search function taking a query embedding, k and the extra arguments
+    :param queries: Query embeddings
+    :param k: Results per query
+    :param args: Extra arguments of the search function
+    :return: Tuple of (rows found for each query, milliseconds per query)
+    """
+    started_at: float = time.perf_counter()
+    found: List[Set[int]] = [{row for row, _ in search(query, k, *args)} for query in queries]
+    return found, 1000 * (time.perf_counter() - started_at) / len(queries)
+
+
+def main():
+    """Build the stores, then report bytes/chunk, recall@k and query latency per quantized variant."""
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=50000, help="Chunks in the store")
+    parser.add_argument("--dimensions", type=int, default=1536, help="Embedding size")
+    parser.add_argument("--topics", type=int, default=500, help="Topic centres of the synthetic embeddings")
+    parser.add_argument("--queries", type=int, default=200, help="Queries to run")
+    parser.add_argument("--k", type=int, default=4, help="Results per query")
+    parser.add_argument("--rescore", type=int, nargs="+", default=[0, 1, 4, 16], help="Rescore factors to try")
+    args = parser.parse_args()
+
+    matrix: np.ndarray = make_embeddings(args.rows, args.dimensions, args.topics, seed=0)
+    queries: np.ndarray = make_embeddings(args.queries, args.dimensions, args.topics, seed=1)
+    print(f"{args.rows} rows x {args.dimensions} dimensions")
+    print(f"{'store':>24} {'bytes/chunk':>12} {'recall@' + str(args.k):>10} {'ms/query':>10}")
+    print(f"{'in_memory (float lists)':>24} {list_bytes_per_chunk(matrix[:1000]):>12.0f} {1.0:>10.3f} {'-':>10}")
+
+    exact: Optional[List[Set[int]]] = None
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for dtype in ["float16", "int8"]:
+            store = QuantizedVectorStore(embedding=DeterministicFakeEmbedding(size=args.dimensions), dtype=dtype)
+            store.add_embeddings([str(row) for row in range(args.rows)], matrix)
+            store.dump(os.path.join(temp_dir, f"{dtype}.npy"))
+            if exact is None:
+                # A full scan of the float32 matrix, as done by NumpyVectorStore, is the ground truth
+                exact, elapsed_ms = search_all(store.exact_search_rows, queries, args.k)
+                print(f"{'npy (float32)':>24} {4 * (args.dimensions + 1):>12.0f} {1.0:>10.3f} {elapsed_ms:>10.3f}")
+
+            # pylint: disable=protected-access
+            quantized_bytes: float = (store._codes.nbytes + store._scales.nbytes + store._norms.nbytes) / args.rows
+            for factor in args.rescore:
+                found, elapsed_ms = search_all(store.search_rows, queries, args.k, factor)
+                recall: float = float(np.mean([len(hits & truth) / args.k for hits, truth in zip(found, exact)]))
+                name: str = f"{dtype} rescore={factor}"
+                print(f"{name:>24} {quantized_bytes:>12.0f} {recall:>10.3f} {elapsed_ms:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
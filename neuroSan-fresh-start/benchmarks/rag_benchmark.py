@@ -0,0 +1,433 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Measure BaseRag ingestion and query performance offline, on a synthetic corpus with hash-seeded embeddings.
+
+    python -m benchmarks.rag_benchmark --documents 2000 --output rag_benchmark.json
+
+Reports load, split, embed and insert throughput, end-to-end ingestion through BaseRag,
+save and load times, resident memory and query latency percentiles for every in-memory store type.
+Results are written as JSON so that runs can be compared for regressions. No network access is needed.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import platform
+import resource
+import tempfile
+import time
+from argparse import ArgumentParser
+from argparse import Namespace
+from dataclasses import dataclass
+from typing import Any
+from typing import AsyncIterator
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+# pylint: disable=import-error
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from coded_tools.tools.base_rag import BaseRag
+from coded_tools.tools.rag.chunking import ChunkDeduplicator
+from coded_tools.tools.rag.chunking import ChunkingSettings
+
+# Store variants: (vector_store_type passed to BaseRag, extension of the saved store)
+STORE_VARIANTS: Dict[str, Tuple[str, str]] = {
+    "in_memory": ("in_memory", ".json"),
+    "npy": ("in_memory", ".npy"),
+    "ann": ("ann", ".npy"),
+    "quantized": ("quantized", ".npy"),
+}
+# Roughly four characters per token of English text
+CHARACTERS_PER_TOKEN = 4
+WORDS_PER_SENTENCE = 15
+SENTENCES_PER_PARAGRAPH = 8
+
+
+@dataclass
+class Workload:
+    """Synthetic documents, their chunks and the queries run against every store."""
+
+    corpus: List[str]
+    chunks: List[Document]
+    queries: List[str]
+
+
+class HashEmbeddings(Embeddings):
+    """
+    Deterministic bag-of-words embeddings: every token gets a vector drawn from a generator seeded with its hash,
+    and a text is the normalized sum of its token vectors. Texts sharing words are similar, as with a real model,
+    and the vectors are the same on every machine and run.
+    """
+
+    def __init__(self, dimensions: int):
+        """
+        :param dimensions: Embedding size
+        """
+        self.dimensions: int = dimensions
+        self._token_vectors: Dict[str, np.ndarray] = {}
+
+    def _token_vector(self, token: str) -> np.ndarray:
+        vector = self._token_vectors.get(token)
+        if vector is None:
+            seed: int = int.from_bytes(hashlib.sha256(token.encode("utf-8")).digest()[:8], "little")
+            vector = np.random.default_rng(seed).standard_normal(self.dimensions, dtype=np.float32)
+            self._token_vectors[token] = vector
+        return vector
+
+    def embed_query(self, text: str) -> List[float]:
+        vector: np.ndarray = np.zeros(self.dimensions, dtype=np.float32)
+        for token in text.lower().split():
+            vector += self._token_vector(token.strip(".,"))
+        return (vector / (np.linalg.norm(vector) + 1e-12)).tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self.embed_query(text) for text in texts]
+
+
+class LookupEmbeddings(Embeddings):
+    """Serves precomputed document embeddings, so that inserting into a store can be timed without embedding."""
+
+    def __init__(self, vectors: Dict[str, List[float]], underlying: Embeddings):
+        """
+        :param vectors: Embedding of every text that will be inserted
+        :param underlying: Embeddings for queries
+        """
+        self.vectors: Dict[str, List[float]] = vectors
+        self.underlying: Embeddings = underlying
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self.vectors[text] for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.underlying.embed_query(text)
+
+
+class TimedEmbeddings(Embeddings):
+    """Embeddings wrapper that adds up the time spent embedding documents."""
+
+    def __init__(self, underlying: Embeddings):
+        """
+        :param underlying: Embeddings to time
+        """
+        self.underlying: Embeddings = underlying
+        self.seconds: float = 0.0
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        started_at: float = time.perf_counter()
+        vectors: List[List[float]] = self.underlying.embed_documents(texts)
+        self.seconds += time.perf_counter() - started_at
+        return vectors
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.underlying.embed_query(text)
+
+
+def make_corpus(documents: int, words_per_document: int, vocabulary: int, seed: int) -> List[str]:
+    """
+    :param documents: Number of documents
+    :param words_per_document: Words per document
+    :param vocabulary: Number of distinct words, drawn with Zipf-like frequencies as in natural text
+    :param seed: Random seed
+    :return: Texts made of sentences and paragraphs, so that the splitter cuts them as it cuts real documents
+    """
+    rng = np.random.default_rng(seed)
+    frequencies: np.ndarray = 1.0 / np.arange(1, vocabulary + 1)
+    frequencies /= frequencies.sum()
+    texts: List[str] = []
+    for _ in range(documents):
+        words: np.ndarray = rng.choice(vocabulary, size=words_per_document, p=frequencies)
+        sentences: List[str] = [
+            " ".join(f"w{word}" for word in words[start : start + WORDS_PER_SENTENCE]) + "."
+            for start in range(0, words_per_document, WORDS_PER_SENTENCE)
+        ]
+        paragraphs: List[str] = [
+            " ".join(sentences[start : start + SENTENCES_PER_PARAGRAPH])
+            for start in range(0, len(sentences), SENTENCES_PER_PARAGRAPH)
+        ]
+        texts.append("\n\n".join(paragraphs))
+    return texts
+
+
+class SyntheticRag(BaseRag):
+    """BaseRag over a generated corpus, with hash-seeded embeddings and timers around loading and splitting."""
+
+    def __init__(self, corpus: List[str], embeddings: Embeddings):
+        """
+        :param corpus: Document texts
+        :param embeddings: Embeddings replacing the OpenAI model
+        """
+        # The OpenAI embeddings created by BaseRag are replaced below and never called
+        os.environ.setdefault("OPENAI_API_KEY", "offline-benchmark")
+        super().__init__()
+        self.corpus: List[str] = corpus
+        self.embeddings = embeddings
+        self.use_vector_store_cache = False
+        self.load_seconds: float = 0.0
+        self.split_seconds: float = 0.0
+
+    def _get_text_splitter(self, settings: ChunkingSettings) -> RecursiveCharacterTextSplitter:
+        # Character-based splitting of the same size, since the tiktoken encoding would have to be downloaded
+        return RecursiveCharacterTextSplitter(
+            chunk_size=settings.chunk_size * CHARACTERS_PER_TOKEN,
+            chunk_overlap=settings.chunk_overlap * CHARACTERS_PER_TOKEN,
+            separators=settings.separators,
+        )
+
+    def _split_source(self, source: str, source_docs: List[Document], content_hash: str) -> List[Document]:
+        started_at: float = time.perf_counter()
+        chunks: List[Document] = super()._split_source(source, source_docs, content_hash)
+        self.split_seconds += time.perf_counter() - started_at
+        return chunks
+
+    async def alazy_load_documents(self, loader_args: Any) -> AsyncIterator[List[Document]]:
+        for number, text in enumerate(self.corpus):
+            started_at: float = time.perf_counter()
+            doc = Document(page_content=text, metadata={"source": f"synthetic://{number}"})
+            self.load_seconds += time.perf_counter() - started_at
+            yield [doc]
+
+    async def load_documents(self, loader_args: Any) -> List[Document]:
+        return [doc async for docs in self.alazy_load_documents(loader_args) for doc in docs]
+
+    async def split_corpus(self) -> List[Document]:
+        """
+        :return: Chunks of the corpus, as ingested by generate_vector_store()
+        """
+        deduplicator = ChunkDeduplicator(self.chunk_dedup)
+        return [chunk async for chunks in self._iter_chunks({}, deduplicator) for chunk in chunks]
+
+
+def rss_bytes() -> int:
+    """
+    :return: Current resident set size, or the peak where the current size is not available
+    """
+    try:
+        with open("/proc/self/statm", "r", encoding="utf-8") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return peak_rss_bytes()
+
+
+def peak_rss_bytes() -> int:
+    """
+    :return: Peak resident set size of the process
+    """
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if platform.system() == "Darwin" else peak * 1024
+
+
+def make_queries(chunks: List[Document], count: int, words: int, seed: int) -> List[str]:
+    """
+    :param chunks: Chunks of the corpus
+    :param count: Number of queries
+    :param words: Words per query, taken from a random chunk so that every query has relevant chunks
+    :param seed: Random seed
+    :return: Query texts
+    """
+    rng = np.random.default_rng(seed)
+    queries: List[str] = []
+    for chunk_number in rng.integers(len(chunks), size=count):
+        chunk_words: List[str] = chunks[chunk_number].page_content.split()
+        queries.append(" ".join(rng.choice(chunk_words, size=min(words, len(chunk_words)), replace=False)))
+    return queries
+
+
+async def time_insert(
+    store_class: type, chunks: List[Document], embeddings: Embeddings, batch_size: int
+) -> Dict[str, float]:
+    """
+    :param store_class: Vector store class
+    :param chunks: Chunks to insert into an empty store, in batches
+    :param embeddings: Embeddings of the chunks, computed before the insert is timed
+    :param batch_size: Chunks per insert
+    :return: Insert time and throughput
+    """
+    texts: List[str] = [chunk.page_content for chunk in chunks]
+    store: VectorStore = store_class(
+        embedding=LookupEmbeddings(dict(zip(texts, embeddings.embed_documents(texts))), embeddings)
+    )
+    started_at: float = time.perf_counter()
+    for start in range(0, len(chunks), batch_size):
+        await store.aadd_documents(chunks[start : start + batch_size])
+    seconds: float = time.perf_counter() - started_at
+    return {"insert_seconds": seconds, "insert_chunks_per_second": len(chunks) / seconds}
+
+
+def time_save_and_load(store: VectorStore, path: str, embeddings: Embeddings) -> Tuple[Dict[str, float], VectorStore]:
+    """
+    :param store: Store to save
+    :param path: Path to save it to
+    :param embeddings: Embeddings of the loaded store
+    :return: Tuple of (save and load times and the size of the saved files, the loaded store)
+    """
+    started_at: float = time.perf_counter()
+    store.dump(path)
+    save_seconds: float = time.perf_counter() - started_at
+    base: str = os.path.splitext(path)[0]
+    directory: str = os.path.dirname(path)
+    file_bytes: int = sum(
+        os.path.getsize(os.path.join(directory, file_name))
+        for file_name in os.listdir(directory)
+        if os.path.join(directory, file_name).startswith(base + ".")
+    )
+
+    started_at = time.perf_counter()
+    loaded: VectorStore = type(store).load(path=path, embedding=embeddings)
+    timings: Dict[str, float] = {
+        "save_seconds": save_seconds,
+        "load_store_seconds": time.perf_counter() - started_at,
+        "file_bytes": file_bytes,
+    }
+    return timings, loaded
+
+
+def time_queries(store: VectorStore, queries: List[str], k: int) -> Dict[str, float]:
+    """
+    :param store: Store to search
+    :param queries: Query texts, embedded as part of each query
+    :param k: Results per query
+    :return: p50 and p99 query latency in milliseconds
+    """
+    latencies: List[float] = []
+    for query in queries:
+        started_at: float = time.perf_counter()
+        store.similarity_search(query, k=k)
+        latencies.append(time.perf_counter() - started_at)
+    return {
+        "query_ms_p50": float(np.percentile(latencies, 50) * 1000),
+        "query_ms_p99": float(np.percentile(latencies, 99) * 1000),
+    }
+
+
+async def benchmark_store(name: str, workload: Workload, args: Namespace, temp_dir: str) -> Dict[str, Any]:
+    """
+    :param name: Store variant, a key of STORE_VARIANTS
+    :param workload: Corpus, chunks and queries
+    :param args: Command line arguments
+    :param temp_dir: Directory to save the store in
+    :return: Measurements of the store variant
+    """
+    embeddings = TimedEmbeddings(HashEmbeddings(args.dimensions))
+    rag = SyntheticRag(workload.corpus, embeddings)
+    path: str = os.path.join(temp_dir, name + STORE_VARIANTS[name][1])
+    rag.configure_vector_store_path(path)
+
+    rss_before: int = rss_bytes()
+    started_at: float = time.perf_counter()
+    store: VectorStore = await rag.generate_vector_store(loader_args={}, vector_store_type=STORE_VARIANTS[name][0])
+    ingest_seconds: float = time.perf_counter() - started_at
+    results: Dict[str, Any] = {
+        "ingest_seconds": ingest_seconds,
+        "ingest_chunks_per_second": len(workload.chunks) / ingest_seconds,
+        "rss_delta_bytes": rss_bytes() - rss_before,
+        # Time spent in each stage of the ingestion above; embedding is summed over concurrent batches
+        "load_seconds": rag.load_seconds,
+        "split_seconds": rag.split_seconds,
+        "embed_seconds": embeddings.seconds,
+    }
+    results.update(await time_insert(type(store), workload.chunks, embeddings.underlying, args.batch_size))
+
+    timings, loaded = time_save_and_load(store, path, embeddings.underlying)
+    results.update(timings)
+    results.update(time_queries(loaded, workload.queries, args.k))
+    return results
+
+
+async def run_benchmark(args: Namespace) -> Dict[str, Any]:
+    """
+    :param args: Command line arguments, see build_parser()
+    :return: Machine-readable results
+    """
+    corpus: List[str] = make_corpus(args.documents, args.words_per_document, args.vocabulary, args.seed)
+    chunks: List[Document] = await SyntheticRag(corpus, HashEmbeddings(args.dimensions)).split_corpus()
+    workload = Workload(corpus, chunks, make_queries(chunks, args.queries, args.query_words, args.seed + 1))
+
+    results: Dict[str, Any] = {
+        "config": {key: value for key, value in vars(args).items() if key != "output"},
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+        },
+        "corpus": {
+            "documents": len(corpus),
+            "characters": sum(len(text) for text in corpus),
+            "chunks": len(chunks),
+        },
+        "stores": {},
+    }
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name in args.stores:
+            results["stores"][name] = await benchmark_store(name, workload, args, temp_dir)
+    results["peak_rss_bytes"] = peak_rss_bytes()
+    return results
+
+
+def build_parser() -> ArgumentParser:
+    """
+    :return: Parser of the command line arguments
+    """
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--documents", type=int, default=1000, help="Documents in the corpus")
+    parser.add_argument("--words-per-document", type=int, default=2000, help="Words per document")
+    parser.add_argument("--vocabulary", type=int, default=20000, help="Distinct words in the corpus")
+    parser.add_argument("--dimensions", type=int, default=1536, help="Embedding size")
+    parser.add_argument("--queries", type=int, default=200, help="Queries per store")
+    parser.add_argument("--query-words", type=int, default=6, help="Words per query")
+    parser.add_argument("--k", type=int, default=4, help="Results per query")
+    parser.add_argument("--batch-size", type=int, default=256, help="Chunks per insert when timing inserts")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the corpus and queries")
+    parser.add_argument(
+        "--stores", nargs="+", choices=list(STORE_VARIANTS), default=list(STORE_VARIANTS), help="Stores to measure"
+    )
+    parser.add_argument("--output", default="rag_benchmark.json", help="JSON file to write the results to")
+    return parser
+
+
+def main():
+    """Run the benchmark and write its results as JSON."""
+    args: Namespace = build_parser().parse_args()
+    results: Dict[str, Any] = asyncio.run(run_benchmark(args))
+    with open(args.output, "w", encoding="utf-8") as output_file:
+        json.dump(results, output_file, indent=2)
+
+    print(f"{results['corpus']['chunks']} chunks from {results['corpus']['documents']} documents")
+    print(f"{'store':>10} {'ingest/s':>10} {'insert/s':>10} {'save s':>8} {'load s':>8} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, store in results["stores"].items():
+        print(
+            f"{name:>10} {store['ingest_chunks_per_second']:>10.0f} {store['insert_chunks_per_second']:>10.0f} "
+            f"{store['save_seconds']:>8.3f} {store['load_store_seconds']:>8.3f} "
+            f"{store['query_ms_p50']:>8.3f} {store['query_ms_p99']:>8.3f}"
+        )
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,7 @@
 
 """Tool module for doing RAG from a pdf file"""
 
+import asyncio
 from typing import Any
 from typing import Dict
 from typing import List
@@ -28,6 +29,8 @@ from langchain_openai import OpenAIEmbeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from neuro_san.interfaces.coded_tool import CodedTool
 
+from coded_tools.tools.rag.http_cache import HttpCache
+
 PDF_FILE_URL = "https://www.replicon.com/wp-content/uploads/2016/06/RFP-Template_Replicon.pdf"
 
 
@@ -97,8 +100,17 @@ class Rag(CodedTool):
         :return: In-memory vector store containing the embedded document chunks
         """
 
-        loader = PyPDFLoader(file_path=url)
-        docs: List[Document] = await loader.aload()
+        # Read the PDF from the HTTP cache, which only revalidates it with the server once its max age has passed
+        http_cache: HttpCache = HttpCache.get_shared()
+        file_path: str = await asyncio.to_thread(http_cache.acquire, url) if http_cache.enabled else url
+        try:
+            loader = PyPDFLoader(file_path=file_path)
+            docs: List[Document] = await loader.aload()
+        finally:
+            if http_cache.enabled:
+                http_cache.release(file_path)
+        for doc in docs:
+            doc.metadata["source"] = url
 
         # Split documents into smaller chunks for better embedding and
         # retrieval
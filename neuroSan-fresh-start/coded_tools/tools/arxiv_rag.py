@@ -14,6 +14,7 @@
 #
 # END COPYRIGHT
 
+import json
 import logging
 from typing import Any
 from typing import Dict
@@ -69,12 +70,15 @@ class ArxivRag(CodedTool):
             return "❌ Missing required1 input: 'query'."
 
         # Initialize ArxivRetriever with the provided arguments
-        retriever = ArxivRetriever(
-            top_k_results=int(args.get("top_k_results", 3)),
-            get_full_documents=bool(args.get("get_full_documents", True)),
-            doc_content_chars_max=int(args.get("doc_content_chars_max", 4000)),
-            load_all_available_meta=bool(args.get("load_all_available_meta", False)),
-            continue_on_failure=bool(args.get("continue_on_failure", True)),
-        )
+        retriever_args: Dict[str, Any] = {
+            "top_k_results": int(args.get("top_k_results", 3)),
+            "get_full_documents": bool(args.get("get_full_documents", True)),
+            "doc_content_chars_max": int(args.get("doc_content_chars_max", 4000)),
+            "load_all_available_meta": bool(args.get("load_all_available_meta", False)),
+            "continue_on_failure": bool(args.get("continue_on_failure", True)),
+        }
+        retriever = ArxivRetriever(**retriever_args)
 
-        return await BaseRag.query_retriever(retriever, query)
+        # Repeated queries with the same arguments are answered from the shared query cache
+        cache_scope: str = f"arxiv:{json.dumps(retriever_args, sort_keys=True)}"
+        return await BaseRag.query_retriever(retriever, query, cache_scope=cache_scope)
@@ -14,37 +14,104 @@
 #
 # END COPYRIGHT
 
+# pylint: disable=too-many-lines
+
 import asyncio
+import hashlib
 import logging
 import os
 import re
+import time
+import weakref
 from abc import ABC
 from abc import abstractmethod
 from dataclasses import dataclass
 from typing import Any
+from typing import AsyncIterator
+from typing import Callable
+from typing import Dict
+from typing import FrozenSet
 from typing import List
 from typing import Literal
 from typing import Optional
+from typing import Set
+from typing import Tuple
 
 # pylint: disable=import-error
+import tiktoken
 from asyncpg import InvalidCatalogNameError
 from asyncpg import InvalidPasswordError
 from langchain_community.vectorstores import InMemoryVectorStore
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
+from langchain_core.retrievers import BaseRetriever
 from langchain_core.vectorstores import VectorStore
-from langchain_core.vectorstores.base import VectorStoreRetriever
 from langchain_openai import OpenAIEmbeddings
 from langchain_postgres import PGEngine
 from langchain_postgres import PGVectorStore
+from langchain_postgres.v2.indexes import BaseIndex
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from sqlalchemy.exc import ProgrammingError
 
+from coded_tools.tools.rag.bm25_index import Bm25Index
+from coded_tools.tools.rag.bm25_index import keyword_index_path
+from coded_tools.tools.rag.cache_paths import get_rag_cache_dir
+from coded_tools.tools.rag.cached_embeddings import CachedEmbeddings
+from coded_tools.tools.rag.chunking import DEFAULT_CHUNK_OVERLAP
+from coded_tools.tools.rag.chunking import DEFAULT_CHUNK_SIZE
+from coded_tools.tools.rag.chunking import DEFAULT_CHUNKING_STRATEGY
+from coded_tools.tools.rag.chunking import DEFAULT_DEDUP_MODE
+from coded_tools.tools.rag.chunking import DUPLICATE_SOURCES_FIELD
+from coded_tools.tools.rag.chunking import ChunkDeduplicator
+from coded_tools.tools.rag.chunking import ChunkingEstimate
+from coded_tools.tools.rag.chunking import ChunkingSettings
+from coded_tools.tools.rag.embedding_scheduler import TIKTOKEN_ENCODING
+from coded_tools.tools.rag.embedding_scheduler import EmbeddingScheduler
+from coded_tools.tools.rag.embedding_scheduler import ScheduledEmbeddings
+from coded_tools.tools.rag.embedding_scheduler import find_scheduler
+from coded_tools.tools.rag.hybrid_retriever import HybridRetriever
+from coded_tools.tools.rag.ingestion_pipeline import IngestionPipeline
+from coded_tools.tools.rag.ingestion_pipeline import IngestionStats
+from coded_tools.tools.rag.ivf_vector_store import IvfVectorStore
+from coded_tools.tools.rag.metadata_index import MetadataIndex
+from coded_tools.tools.rag.metadata_index import filter_key
+from coded_tools.tools.rag.metadata_index import include_duplicate_sources
+from coded_tools.tools.rag.metadata_index import metadata_index_path
+from coded_tools.tools.rag.metadata_index import normalize_filter
+from coded_tools.tools.rag.metadata_index import restrict_to_chunks
+from coded_tools.tools.rag.numpy_vector_store import NPY_EXTENSION
+from coded_tools.tools.rag.numpy_vector_store import NumpyVectorStore
+from coded_tools.tools.rag.pg_bulk_loader import PgCopyWriter
+from coded_tools.tools.rag.pg_bulk_loader import VectorIndexSettings
+from coded_tools.tools.rag.pg_engine_registry import PGEngineRegistry
+from coded_tools.tools.rag.quantized_vector_store import QuantizedVectorStore
+from coded_tools.tools.rag.query_cache import SUB_SCOPE_SEPARATOR
+from coded_tools.tools.rag.query_cache import QueryCache
+from coded_tools.tools.rag.shared_vector_store import SharedVectorStoreDirectory
+from coded_tools.tools.rag.shared_vector_store import to_numpy_vector_store
+from coded_tools.tools.rag.source_manifest import SourceEntry
+from coded_tools.tools.rag.source_manifest import SourceManifest
+from coded_tools.tools.rag.source_manifest import hash_documents
+from coded_tools.tools.rag.source_manifest import make_chunk_id
+from coded_tools.tools.rag.source_manifest import probe_source_version
+from coded_tools.tools.rag.vector_retriever import VectorRetriever
+from coded_tools.tools.rag.vector_store_cache import VectorStoreCache
+from coded_tools.tools.rag.vector_store_cache import fingerprint_sources
+
 # Invalid file path character pattern
 INVALID_PATH_PATTERN = r"[<>:\"|?*\x00-\x1F]"
+# ".json" is the InMemoryVectorStore dump, ".npy" the memory-mapped NumpyVectorStore format
+VECTOR_STORE_EXTENSIONS = (".json", NPY_EXTENSION)
 DEFAULT_TABLE_NAME = "vectorstore"
 EMBEDDINGS_MODEL = "text-embedding-3-small"
 VECTOR_SIZE = 1536
+# Minimum number of seconds between two checks of the sources of an incrementally updated vector store
+INCREMENTAL_CHECK_INTERVAL_SECONDS = float(os.getenv("RAG_INCREMENTAL_CHECK_INTERVAL_SECONDS", "3600"))
+# Metadata fields indexed in new postgres tables so that filters on them do not scan the table,
+# overridable with a comma-separated RAG_PG_METADATA_INDEX_FIELDS
+PG_METADATA_INDEX_FIELDS = [field for field in os.getenv("RAG_PG_METADATA_INDEX_FIELDS", "source").split(",") if field]
+# Load new postgres tables with binary COPY rather than INSERT statements, unless RAG_PG_BULK_COPY is "false"
+PG_BULK_COPY = os.getenv("RAG_PG_BULK_COPY", "true").lower() == "true"
 
 logger = logging.getLogger(__name__)
 
@@ -72,11 +139,47 @@ class BaseRag(ABC):
     Abstract Base Class for different types of RAG implementations.
     """
 
+    # pylint: disable=too-many-instance-attributes
+
     def __init__(self):
-        # Save the generated vector store as a JSON file if True
+        # Save the generated vector store to vector_store_path (".json" or ".npy") if True
         self.save_vector_store: bool = False
         self.abs_vector_store_path: Optional[str] = None
-        self.embeddings: Embeddings = OpenAIEmbeddings(model=EMBEDDINGS_MODEL, dimensions=VECTOR_SIZE)
+        # Identical chunks are embedded once and then served from the shared on-disk embedding cache.
+        # Cache misses are embedded in token-budgeted, rate-limited concurrent batches.
+        self.embeddings: Embeddings = CachedEmbeddings(
+            ScheduledEmbeddings(OpenAIEmbeddings(model=EMBEDDINGS_MODEL, dimensions=VECTOR_SIZE)),
+            model=EMBEDDINGS_MODEL,
+            dimensions=VECTOR_SIZE,
+        )
+        # Chunking parameters used by the text splitter, in tokens
+        self.chunk_size: int = DEFAULT_CHUNK_SIZE
+        self.chunk_overlap: int = DEFAULT_CHUNK_OVERLAP
+        # Split on paragraphs ("recursive") or on the sections of the document first ("structured")
+        self.chunking_strategy: str = DEFAULT_CHUNKING_STRATEGY
+        # Drop chunks duplicating an earlier one before embedding them: "none", "exact" or "near"
+        self.chunk_dedup: str = DEFAULT_DEDUP_MODE
+        # Share built in-memory vector stores across invocations through the process-wide cache
+        self.use_vector_store_cache: bool = True
+        # Re-index only new, changed or removed sources of a saved vector store or existing table
+        self.incremental_update: bool = False
+        # Search in-memory stores through an approximate nearest neighbour index, set by the "ann" vector store type
+        self.use_ann_index: bool = False
+        # Search in-memory stores over int8 or float16 codes rescored at full precision, set by the "quantized" type
+        self.use_quantized_store: bool = False
+        # Fuse BM25 keyword search with vector search, using a keyword index built over the same chunks at ingest time
+        self.hybrid_search: bool = False
+        # Publish in-memory stores once per host and memory-map them read-only in every server process
+        self.use_shared_store: bool = os.getenv("RAG_SHARED_VECTOR_STORES", "false").lower() == "true"
+
+    # Time of the last incremental check per manifest path, shared by all tool instances
+    _last_incremental_check: Dict[str, float] = {}
+    # Keyword index of each vector store built or loaded with hybrid search, shared by all tool instances
+    _keyword_indexes: "weakref.WeakKeyDictionary[VectorStore, Bm25Index]" = weakref.WeakKeyDictionary()
+    # Query cache scope of each vector store returned by generate_vector_store(), shared by all tool instances
+    _query_cache_scopes: "weakref.WeakKeyDictionary[VectorStore, str]" = weakref.WeakKeyDictionary()
+    # Metadata index of each vector store, resolving metadata filters to chunk ids, shared by all tool instances
+    _metadata_indexes: "weakref.WeakKeyDictionary[VectorStore, MetadataIndex]" = weakref.WeakKeyDictionary()
 
     @abstractmethod
     async def load_documents(self, loader_args: Any) -> List[Document]:
@@ -85,11 +188,34 @@ class BaseRag(ABC):
         """
         raise NotImplementedError
 
+    async def alazy_load_documents(self, loader_args: Any) -> AsyncIterator[List[Document]]:
+        """
+        Load documents in groups as they become available, so that splitting starts before every source is loaded.
+        Each group must hold all documents of the sources it contains.
+        Defaults to a single group with everything returned by load_documents().
+
+        :param loader_args: Arguments specific to the document loader
+        :return: Async iterator of document groups
+        """
+        yield await self.load_documents(loader_args)
+
+    async def build_vector_store(self, args: Dict[str, Any]) -> Optional[VectorStore]:
+        """
+        Configure the tool from its arguments and build or load its vector store without querying it,
+        e.g. to warm it up when the server starts. Subclasses that need more than their configured
+        arguments to locate their sources return None.
+
+        :param args: Tool arguments, as for async_invoke(). The query is not needed.
+        :return: The vector store, or None if it cannot be built from the arguments alone
+        """
+        # pylint: disable=unused-argument
+        return None
+
     def configure_vector_store_path(self, vector_store_path: Optional[str]):
         """
         Validate the vector store file path and set it as an absolute path.
 
-        :param vector_store_path: Relative or absolute path to the vector store JSON file.
+        :param vector_store_path: Relative or absolute path to the vector store ".json" or ".npy" file.
         :raises ValueError: If the path contains invalid characters or has an incorrect file extension.
         """
         if not vector_store_path:
@@ -101,9 +227,9 @@ class BaseRag(ABC):
             raise ValueError(f"Invalid vector_store_path: '{vector_store_path}'")
 
         # Check file extension
-        if not vector_store_path.endswith(".json"):
-            logger.error("vector_store_path must be a .json file, got: '%s'\n", vector_store_path)
-            raise ValueError(f"vector_store_path must be a .json file, got: '{vector_store_path}'")
+        if not vector_store_path.endswith(VECTOR_STORE_EXTENSIONS):
+            logger.error("vector_store_path must be a .json or .npy file, got: '%s'\n", vector_store_path)
+            raise ValueError(f"vector_store_path must be a .json or .npy file, got: '{vector_store_path}'")
 
         if os.path.isabs(vector_store_path):
             # It's already an absolute path — use it directly
@@ -113,11 +239,94 @@ class BaseRag(ABC):
             base_path: str = os.path.dirname(__file__)
             self.abs_vector_store_path = os.path.abspath(os.path.join(base_path, vector_store_path))
 
+    def configure_chunking(self, args: Dict[str, Any]):
+        """
+        Set the chunking settings given in the tool arguments, keeping the current ones for the others.
+
+        :param args: Tool arguments, with optional "chunk_size", "chunk_overlap", "chunking_strategy" and "chunk_dedup"
+        :raises ValueError: If a setting is out of range or unknown
+        """
+        settings = ChunkingSettings(
+            chunk_size=args.get("chunk_size", self.chunk_size),
+            chunk_overlap=args.get("chunk_overlap", self.chunk_overlap),
+            strategy=args.get("chunking_strategy", self.chunking_strategy),
+            dedup=args.get("chunk_dedup", self.chunk_dedup),
+        )
+        settings.validate()
+        self.chunk_size = settings.chunk_size
+        self.chunk_overlap = settings.chunk_overlap
+        self.chunking_strategy = settings.strategy
+        self.chunk_dedup = settings.dedup
+
+    def get_chunking_settings(self) -> ChunkingSettings:
+        """
+        :return: The current chunking settings
+        """
+        return ChunkingSettings(self.chunk_size, self.chunk_overlap, self.chunking_strategy, self.chunk_dedup)
+
+    def list_sources(self, loader_args: Any) -> Optional[List[str]]:
+        """
+        List the individual sources named by the loader arguments, for incremental updates.
+        Subclasses whose sources are only known after loading (e.g. a Confluence space) return None.
+
+        :param loader_args: Arguments specific to the document loader
+        :return: Source URLs or paths, or None if they cannot be listed up front
+        """
+        if isinstance(loader_args, dict) and isinstance(loader_args.get("urls"), list):
+            return list(dict.fromkeys(loader_args["urls"]))
+        return None
+
+    def loader_args_for_sources(self, loader_args: Any, sources: List[str]) -> Any:
+        """
+        :param loader_args: Arguments specific to the document loader
+        :param sources: Subset of list_sources(loader_args) to load
+        :return: Loader arguments restricted to the given sources
+        """
+        return {**loader_args, "urls": sources}
+
+    def get_index_params(self) -> Dict[str, Any]:
+        """
+        :return: Chunking and embedding parameters that every chunk of a vector store must share
+        """
+        index_params: Dict[str, Any] = {
+            "chunk_size": self.chunk_size,
+            "chunk_overlap": self.chunk_overlap,
+            "embedding_model": (
+                f"{getattr(self.embeddings, 'model', EMBEDDINGS_MODEL)}:"
+                f"{getattr(self.embeddings, 'dimensions', VECTOR_SIZE)}"
+            ),
+        }
+        # Only recorded when changed, so that stores built before these settings existed stay up to date
+        if self.chunking_strategy != DEFAULT_CHUNKING_STRATEGY:
+            index_params["chunking_strategy"] = self.chunking_strategy
+        if self.chunk_dedup != DEFAULT_DEDUP_MODE:
+            index_params["chunk_dedup"] = self.chunk_dedup
+        return index_params
+
+    def get_source_fingerprint(self, loader_args: Any) -> str:
+        """
+        Compute the key under which the vector store built from the given sources is cached.
+
+        :param loader_args: Arguments specific to the document loader
+        :return: Fingerprint of (loader type, store type, saved store, sources, chunking params, embedding model)
+        """
+        index_params: Dict[str, Any] = self.get_index_params()
+        chunk_params = {key: value for key, value in index_params.items() if key != "embedding_model"}
+        loader_key: str = f"{type(self).__name__}:{self._get_in_memory_store_class().__name__}"
+        if self.hybrid_search:
+            loader_key += ":hybrid"
+        # A tool loading or saving its own store file must not be handed the store of another one
+        if self.abs_vector_store_path:
+            loader_key += f":{self.abs_vector_store_path}"
+            if self.save_vector_store:
+                loader_key += ":saved"
+        return fingerprint_sources(loader_key, loader_args, chunk_params, index_params["embedding_model"])
+
     async def generate_vector_store(
         self,
         loader_args: Any,
         postgres_config: Optional[PostgresConfig] = None,
-        vector_store_type: Literal["in_memory", "postgres"] = "in_memory",
+        vector_store_type: Literal["in_memory", "ann", "quantized", "postgres"] = "in_memory",
     ) -> Optional[VectorStore]:
         """
         Asynchronously loads documents from a given data source, splits them into
@@ -125,36 +334,478 @@ class BaseRag(ABC):
 
         :param loader_args: Arguments specific to the document loader
         :param postgres_config: PostgreSQL configuration (required for postgres vector store)
-        :param vector_store_type: Type of vector store to create
+        :param vector_store_type: Type of vector store to create.
+            "ann" is an in-memory store searched through an approximate nearest neighbour index.
+            "quantized" is an in-memory store searched over compressed embeddings.
+            Both are saved only to a ".npy" vector_store_path.
         :return: Vector store containing the embedded document chunks
+        :raises ValueError: If postgres_config is missing for a postgres vector store,
+            or the vector store path of an "ann" or "quantized" store is not a ".npy" file
         """
 
         # If vector store type is unsupported, fallback to in-memory vector store
-        if vector_store_type not in {"in_memory", "postgres"}:
+        if vector_store_type not in {"in_memory", "ann", "quantized", "postgres"}:
             logger.warning(
-                "Received %s as 'vector_store_typ'. Available types are 'in_memory' and 'postgres'\n",
+                "Received %s as 'vector_store_typ'. "
+                "Available types are 'in_memory', 'ann', 'quantized' and 'postgres'\n",
                 vector_store_type,
             )
             vector_store_type = "in_memory"
 
+        self.use_ann_index = vector_store_type == "ann"
+        self.use_quantized_store = vector_store_type == "quantized"
+        if self.use_ann_index or self.use_quantized_store:
+            # Their indexes are saved next to a store in the binary format, which InMemoryVectorStore cannot load
+            if self.abs_vector_store_path and not self.abs_vector_store_path.endswith(NPY_EXTENSION):
+                logger.error(
+                    "vector_store_path must be a .npy file for '%s' vector stores, got: '%s'\n",
+                    vector_store_type,
+                    self.abs_vector_store_path,
+                )
+                raise ValueError(
+                    f"vector_store_path must be a .npy file for '{vector_store_type}' vector stores, "
+                    f"got: '{self.abs_vector_store_path}'"
+                )
+            vector_store_type = "in_memory"
+
         # Validate postgres config if needed
         if vector_store_type == "postgres" and postgres_config is None:
             raise ValueError("postgres_config is required when vector_store_type is 'postgres'\n")
 
+        # Reuse in-memory vector stores already built from the same sources in this process
+        vectorstore: Optional[VectorStore]
+        if vector_store_type == "in_memory" and self.use_vector_store_cache:
+            cache: VectorStoreCache = VectorStoreCache.get_shared()
+            fingerprint: str = self.get_source_fingerprint(loader_args)
+            manifest_path: Optional[str] = self._get_manifest_path(postgres_config, vector_store_type)
+            if manifest_path and self._incremental_check_due(manifest_path):
+                # Rebuild the cached store from the saved one so that changed sources are picked up
+                cache.invalidate(fingerprint)
+            vectorstore = await cache.get_or_build(
+                fingerprint, lambda: self._build_vector_store(loader_args, postgres_config, vector_store_type)
+            )
+            logger.info("Vector store cache stats: %s\n", cache.stats())
+        else:
+            vectorstore = await self._build_vector_store(loader_args, postgres_config, vector_store_type)
+
+        if vectorstore is not None:
+            scope: str = (
+                f"postgres:{self._get_table_key(postgres_config)}"
+                if vector_store_type == "postgres"
+                else self.get_source_fingerprint(loader_args)
+            )
+            self._register_query_cache_scope(vectorstore, scope)
+        return vectorstore
+
+    def _register_query_cache_scope(self, vectorstore: VectorStore, scope: str):
+        """
+        Scope the cached query results of a vector store, i.e. its source fingerprint or its postgres table.
+        A store seen for the first time under a scope replaces the store the cached results came from,
+        so they are dropped.
+        """
+        if self._query_cache_scopes.get(vectorstore) != scope:
+            QueryCache.get_shared().invalidate(scope)
+            self._query_cache_scopes[vectorstore] = scope
+
+    async def _build_vector_store(
+        self,
+        loader_args: Any,
+        postgres_config: Optional[PostgresConfig],
+        vector_store_type: Literal["in_memory", "postgres"],
+    ) -> Optional[VectorStore]:
+        """Load or create the vector store, or attach to the copy shared by the server processes of the host."""
+        if vector_store_type == "in_memory" and self.use_shared_store:
+            return await self._attach_or_publish_shared_store(loader_args)
+        return await self._load_or_create_vector_store(loader_args, postgres_config, vector_store_type)
+
+    async def _attach_or_publish_shared_store(self, loader_args: Any) -> Optional[VectorStore]:
+        """
+        Map the in-memory store of the sources published for all processes of the host, with its indexes.
+        If no process published it yet, load or create it as usual and publish it first.
+        """
+
+        async def publish(path: str) -> bool:
+            vectorstore: Optional[VectorStore] = await self._load_or_create_vector_store(
+                loader_args, None, "in_memory"
+            )
+            if vectorstore is None:
+                return False
+            self._save_keyword_index(vectorstore, keyword_index_path(path))
+            self._save_metadata_index(vectorstore, metadata_index_path(path))
+            if not isinstance(vectorstore, NumpyVectorStore):
+                vectorstore = to_numpy_vector_store(vectorstore)
+            vectorstore.dump(path)
+            return True
+
+        def attach(path: str) -> VectorStore:
+            store_class: type = self._get_in_memory_store_class()
+            if not issubclass(store_class, NumpyVectorStore):
+                store_class = NumpyVectorStore
+            vectorstore: VectorStore = store_class.load(path=path, embedding=self.embeddings)
+            if self.hybrid_search:
+                self._load_keyword_index(vectorstore, keyword_index_path(path))
+            self._load_metadata_index(vectorstore, metadata_index_path(path))
+            return vectorstore
+
+        shared_stores: SharedVectorStoreDirectory = SharedVectorStoreDirectory.get_shared()
+        return await shared_stores.get_or_publish(self.get_source_fingerprint(loader_args), publish, attach)
+
+    async def _load_or_create_vector_store(
+        self,
+        loader_args: Any,
+        postgres_config: Optional[PostgresConfig],
+        vector_store_type: Literal["in_memory", "postgres"],
+    ) -> Optional[VectorStore]:
+        """Load the saved vector store if there is one, otherwise build it from the sources and save it."""
+        manifest_path: Optional[str] = self._get_manifest_path(postgres_config, vector_store_type)
+
         # Try to load existing vector store for in-memory vector store
         if vector_store_type == "in_memory":
             existing_store = await self._load_existing_vector_store()
-            if existing_store:
+            if existing_store and not manifest_path:
                 return existing_store
+            if existing_store:
+                manifest: Optional[SourceManifest] = await self._update_incrementally(
+                    existing_store, loader_args, manifest_path, postgres_config
+                )
+                if manifest is not None:
+                    await self._save_vector_store(existing_store, vector_store_type)
+                    manifest.save(manifest_path)
+                    return existing_store
+
+        # Record the sources of an in-memory store so that later builds can update it incrementally
+        new_manifest: Optional[SourceManifest] = None
+        if manifest_path and vector_store_type == "in_memory":
+            new_manifest = SourceManifest(index_params=self.get_index_params())
 
         # Load and process documents
-        vectorstore = await self._create_new_vector_store(loader_args, postgres_config, vector_store_type)
+        vectorstore = await self._create_new_vector_store(
+            loader_args, postgres_config, vector_store_type, new_manifest
+        )
 
         # Save vector store if configured
         await self._save_vector_store(vectorstore, vector_store_type)
 
+        # The manifest describes the saved store, so it is written once the store is saved
+        if new_manifest is not None:
+            new_manifest.save(manifest_path)
+
         return vectorstore
 
+    def _get_manifest_path(
+        self, postgres_config: Optional[PostgresConfig], vector_store_type: Literal["in_memory", "postgres"]
+    ) -> Optional[str]:
+        """
+        :return: Path of the source manifest of the vector store,
+            or None if incremental updates are disabled or the store is not persisted
+        """
+        if not self.incremental_update:
+            return None
+
+        if vector_store_type == "postgres":
+            return os.path.join(get_rag_cache_dir("manifests"), self._get_table_key(postgres_config) + ".json")
+
+        if self.save_vector_store and self.abs_vector_store_path:
+            return SourceManifest.path_for(self.abs_vector_store_path)
+        return None
+
+    def _get_keyword_index_path(
+        self, postgres_config: Optional[PostgresConfig], vector_store_type: Literal["in_memory", "postgres"]
+    ) -> Optional[str]:
+        """
+        :return: Path of the BM25 keyword index of the vector store,
+            or None if hybrid search is disabled or the store has no path
+        """
+        if not self.hybrid_search:
+            return None
+
+        if vector_store_type == "postgres":
+            return os.path.join(get_rag_cache_dir("keyword_indexes"), self._get_table_key(postgres_config) + ".npz")
+
+        if self.abs_vector_store_path:
+            return keyword_index_path(self.abs_vector_store_path)
+        return None
+
+    def _get_metadata_index_path(
+        self, postgres_config: Optional[PostgresConfig], vector_store_type: Literal["in_memory", "postgres"]
+    ) -> Optional[str]:
+        """
+        :return: Path of the metadata index of the vector store, or None if the store has no path
+        """
+        if vector_store_type == "postgres":
+            return os.path.join(get_rag_cache_dir("metadata_indexes"), self._get_table_key(postgres_config) + ".json")
+
+        if self.abs_vector_store_path:
+            return metadata_index_path(self.abs_vector_store_path)
+        return None
+
+    @staticmethod
+    def _get_table_key(postgres_config: PostgresConfig) -> str:
+        """
+        :return: Hash identifying the postgres table, used to name the files kept for it in the cache directory
+        """
+        table_name: str = postgres_config.table_name or DEFAULT_TABLE_NAME
+        table_key: str = f"{postgres_config.host}:{postgres_config.port}/{postgres_config.database}/{table_name}"
+        return hashlib.sha256(table_key.encode("utf-8")).hexdigest()
+
+    def _load_keyword_index(self, vectorstore: VectorStore, path: Optional[str]):
+        """Load the keyword index saved for the vector store, unless hybrid search is disabled or it is loaded."""
+        if not path or vectorstore in self._keyword_indexes:
+            return
+        try:
+            self._keyword_indexes[vectorstore] = Bm25Index.load(path)
+            logger.info("Loaded keyword index from: %s\n", path)
+        except FileNotFoundError:
+            logger.warning(
+                "No keyword index at %s. Queries use vector search only until the vector store is rebuilt.\n", path
+            )
+
+    def _save_keyword_index(self, vectorstore: VectorStore, path: Optional[str]):
+        """Save the keyword index of the vector store, if it has one."""
+        keyword_index: Optional[Bm25Index] = self._keyword_indexes.get(vectorstore)
+        if not path or keyword_index is None:
+            return
+        try:
+            keyword_index.dump(path)
+            logger.info("Keyword index saved to: %s\n", path)
+        except OSError as os_error:
+            logger.error("Failed to save keyword index to %s: %s\n", path, os_error)
+
+    def _load_metadata_index(self, vectorstore: VectorStore, path: Optional[str]):
+        """Load the metadata index saved for the vector store, unless it is loaded or there is none."""
+        if not path or vectorstore in self._metadata_indexes:
+            return
+        try:
+            self._metadata_indexes[vectorstore] = MetadataIndex.load(path)
+            logger.info("Loaded metadata index from: %s\n", path)
+        except FileNotFoundError:
+            # In-memory stores are indexed on the first filtered query, postgres filters are applied by postgres
+            logger.info("No metadata index at %s\n", path)
+
+    def _save_metadata_index(self, vectorstore: VectorStore, path: Optional[str]):
+        """Save the metadata index of the vector store, if it has one."""
+        metadata_index: Optional[MetadataIndex] = self._metadata_indexes.get(vectorstore)
+        if not path or metadata_index is None:
+            return
+        try:
+            metadata_index.dump(path)
+            logger.info("Metadata index saved to: %s\n", path)
+        except OSError as os_error:
+            logger.error("Failed to save metadata index to %s: %s\n", path, os_error)
+
+    @classmethod
+    def _incremental_check_due(cls, manifest_path: str) -> bool:
+        """
+        Rate-limit checks of the sources, which probe every URL or file.
+
+        :param manifest_path: Manifest of the vector store to check
+        :return: True if the sources were not checked within the check interval; the check is then recorded
+        """
+        now: float = time.monotonic()
+        last_check: Optional[float] = cls._last_incremental_check.get(manifest_path)
+        if last_check is not None and now - last_check < INCREMENTAL_CHECK_INTERVAL_SECONDS:
+            return False
+        cls._last_incremental_check[manifest_path] = now
+        return True
+
+    # pylint: disable=too-many-locals
+    async def _update_incrementally(
+        self,
+        vectorstore: VectorStore,
+        loader_args: Any,
+        manifest_path: str,
+        postgres_config: Optional[PostgresConfig] = None,
+    ) -> Optional[SourceManifest]:
+        """
+        Bring an existing vector store up to date with its sources using the manifest of the last build.
+        Only sources whose version changed (or cannot be probed) are loaded, and only those whose
+        content hash changed are re-split and re-embedded. Chunks of changed and removed sources are deleted,
+        and the sources whose duplicate chunks were dropped for deleted chunks are indexed again.
+
+        :param vectorstore: Vector store built with incremental updates enabled
+        :param loader_args: Arguments specific to the document loader
+        :param manifest_path: Path of the manifest of the vector store
+        :param postgres_config: Configuration of the table, for a postgres vector store
+        :return: The updated manifest, or None if there is no usable manifest and the store must be rebuilt
+        """
+        manifest: Optional[SourceManifest] = SourceManifest.load(manifest_path)
+        if manifest is None or manifest.index_params != self.get_index_params():
+            logger.info("No manifest matching the index parameters at %s\n", manifest_path)
+            return None
+
+        docs_by_source, versions, current_sources = await self._load_changed_sources(manifest, loader_args)
+
+        # Removed sources and sources whose content changed
+        content_hashes: Dict[str, str] = {}
+        stale_sources: Set[str] = {source for source in manifest.sources if source not in current_sources}
+        for source, source_docs in docs_by_source.items():
+            entry: Optional[SourceEntry] = manifest.sources.get(source)
+            content_hashes[source] = hash_documents(source_docs)
+            if entry is not None and entry.content_hash == content_hashes[source]:
+                entry.version = versions.get(source)
+            elif entry is not None:
+                stale_sources.add(source)
+        dependents: Set[str] = manifest.find_dependents(stale_sources)
+        # Sources that cannot be listed were all loaded already
+        missing: List[str] = [
+            source
+            for source in self.list_sources(loader_args) or []
+            if source in dependents and source not in docs_by_source
+        ]
+        if missing:
+            loaded: List[Document] = await self.load_documents(self.loader_args_for_sources(loader_args, missing))
+            for source, source_docs in self._group_by_source(loaded).items():
+                docs_by_source[source] = source_docs
+                content_hashes[source] = hash_documents(source_docs)
+        stale_sources |= dependents
+
+        stale_ids: List[str] = []
+        # Kept chunks that stood in for duplicates of the stale sources
+        alias_ids: Set[str] = set()
+        for source in stale_sources:
+            entry = manifest.sources.pop(source)
+            stale_ids.extend(entry.chunk_ids)
+            alias_ids.update(entry.alias_ids)
+
+        deduplicator = ChunkDeduplicator(self.chunk_dedup)
+        new_chunks: List[Document] = []
+        for source, source_docs in docs_by_source.items():
+            if source in manifest.sources:
+                continue
+            chunks: List[Document] = deduplicator.filter(
+                self._split_source(source, source_docs, content_hashes[source])
+            )
+            manifest.record(
+                source, versions.get(source), content_hashes[source], chunks, deduplicator.aliases.get(source)
+            )
+            new_chunks.extend(chunks)
+        for chunk in new_chunks:
+            if chunk.id in deduplicator.duplicate_sources:
+                chunk.metadata[DUPLICATE_SOURCES_FIELD] = sorted(deduplicator.duplicate_sources[chunk.id])
+
+        await self._set_duplicate_sources(
+            vectorstore, manifest.duplicate_sources(alias_ids.difference(stale_ids)), postgres_config
+        )
+        await self._replace_chunks(vectorstore, stale_ids, new_chunks)
+        logger.info(
+            "Incremental update: %d sources loaded, %d chunks deleted, %d chunks added\n",
+            len(docs_by_source),
+            len(stale_ids),
+            len(new_chunks),
+        )
+        return manifest
+
+    async def _set_duplicate_sources(
+        self,
+        vectorstore: VectorStore,
+        duplicate_sources: Dict[str, List[str]],
+        postgres_config: Optional[PostgresConfig] = None,
+    ):
+        """
+        Record in the metadata of stored chunks the other sources whose duplicate chunks were dropped for them,
+        in the vector store and in its metadata index, so that filters on those sources match them too.
+
+        :param vectorstore: Vector store holding the chunks
+        :param duplicate_sources: Chunk id -> other sources it stands in for. An empty list clears them.
+        :param postgres_config: Configuration of the table, for a postgres vector store
+        """
+        if not duplicate_sources:
+            return
+        metadatas: Dict[str, Dict[str, Any]] = {
+            chunk_id: {DUPLICATE_SOURCES_FIELD: sorted(sources)} for chunk_id, sources in duplicate_sources.items()
+        }
+        if isinstance(vectorstore, PGVectorStore):
+            await PGEngineRegistry.get_shared().update_metadata(
+                postgres_config.connection_string, postgres_config.table_name or DEFAULT_TABLE_NAME, metadatas
+            )
+        elif isinstance(vectorstore, NumpyVectorStore):
+            vectorstore.update_metadata(metadatas)
+        elif isinstance(vectorstore, InMemoryVectorStore):
+            for chunk_id, fields in metadatas.items():
+                if chunk_id in vectorstore.store:
+                    vectorstore.store[chunk_id]["metadata"].update(fields)
+        metadata_index: Optional[MetadataIndex] = self._metadata_indexes.get(vectorstore)
+        if metadata_index is not None:
+            metadata_index.update(metadatas)
+
+    async def _replace_chunks(self, vectorstore: VectorStore, stale_ids: List[str], new_chunks: List[Document]):
+        """Delete stale chunks and add new ones, in the vector store and in its keyword and metadata indexes."""
+        if stale_ids:
+            await vectorstore.adelete(ids=stale_ids)
+        if new_chunks and isinstance(vectorstore, PGVectorStore):
+            # The table may be shared through the PGEngineRegistry with the embeddings of another tool
+            texts: List[str] = [chunk.page_content for chunk in new_chunks]
+            await vectorstore.aadd_embeddings(
+                texts,
+                await self.embeddings.aembed_documents(texts),
+                metadatas=[chunk.metadata for chunk in new_chunks],
+                ids=[chunk.id for chunk in new_chunks],
+            )
+        elif new_chunks:
+            await vectorstore.aadd_documents(new_chunks)
+        scope: Optional[str] = self._query_cache_scopes.get(vectorstore)
+        if scope is not None:
+            QueryCache.get_shared().invalidate(scope)
+        keyword_index: Optional[Bm25Index] = self._keyword_indexes.get(vectorstore)
+        if keyword_index is not None:
+            keyword_index.delete(stale_ids)
+            keyword_index.add([chunk.id for chunk in new_chunks], [chunk.page_content for chunk in new_chunks])
+        metadata_index: Optional[MetadataIndex] = self._metadata_indexes.get(vectorstore)
+        if metadata_index is not None:
+            metadata_index.delete(stale_ids)
+            metadata_index.add([chunk.id for chunk in new_chunks], [chunk.metadata for chunk in new_chunks])
+
+    async def _load_changed_sources(
+        self, manifest: SourceManifest, loader_args: Any
+    ) -> Tuple[Dict[str, List[Document]], Dict[str, Optional[str]], Set[str]]:
+        """
+        Load the sources whose version differs from the manifest, or all of them if they cannot be listed.
+
+        :param manifest: Manifest of the last build
+        :param loader_args: Arguments specific to the document loader
+        :return: Tuple of (loaded documents by source, probed versions by source, all current sources)
+        """
+        sources: Optional[List[str]] = self.list_sources(loader_args)
+        if sources is None:
+            docs_by_source = self._group_by_source(await self.load_documents(loader_args))
+            return docs_by_source, {}, set(docs_by_source)
+
+        versions: Dict[str, Optional[str]] = await self._probe_versions(sources)
+        to_load: List[str] = [
+            source
+            for source in sources
+            if versions[source] is None
+            or source not in manifest.sources
+            or manifest.sources[source].version != versions[source]
+        ]
+        docs: List[Document] = []
+        if to_load:
+            docs = await self.load_documents(self.loader_args_for_sources(loader_args, to_load))
+        docs_by_source: Dict[str, List[Document]] = self._group_by_source(docs)
+        return docs_by_source, versions, set(sources) | set(docs_by_source)
+
+    @staticmethod
+    async def _probe_versions(sources: List[str]) -> Dict[str, Optional[str]]:
+        """
+        :param sources: Source URLs or paths
+        :return: Dictionary of source to its current version, probed concurrently
+        """
+        versions: List[Optional[str]] = await asyncio.gather(
+            *(asyncio.to_thread(probe_source_version, source) for source in sources)
+        )
+        return dict(zip(sources, versions))
+
+    @staticmethod
+    def _group_by_source(docs: List[Document]) -> Dict[str, List[Document]]:
+        """
+        :param docs: Loaded documents
+        :return: Documents grouped by their "source" metadata, in load order
+        """
+        docs_by_source: Dict[str, List[Document]] = {}
+        for doc in docs:
+            docs_by_source.setdefault(str(doc.metadata.get("source", "")), []).append(doc)
+        return docs_by_source
+
     async def _load_existing_vector_store(self) -> Optional[VectorStore]:
         """Try to load existing vector store from file."""
 
@@ -162,10 +813,12 @@ class BaseRag(ABC):
             return None
 
         try:
-            vector_store: VectorStore = InMemoryVectorStore.load(
+            vector_store: VectorStore = self._get_in_memory_store_class().load(
                 path=self.abs_vector_store_path, embedding=self.embeddings
             )
             logger.info("Loaded vector store from: %s\n", self.abs_vector_store_path)
+            self._load_keyword_index(vector_store, self._get_keyword_index_path(None, "in_memory"))
+            self._load_metadata_index(vector_store, self._get_metadata_index_path(None, "in_memory"))
             return vector_store
         except FileNotFoundError:
             logger.info("Vector store not found at: %s. Creating from source.\n", self.abs_vector_store_path)
@@ -176,44 +829,231 @@ class BaseRag(ABC):
         loader_args: Any,
         postgres_config: Optional[PostgresConfig],
         vector_store_type: Literal["in_memory", "postgres"],
+        manifest: Optional[SourceManifest] = None,
     ) -> Optional[VectorStore]:
-        """Create a new vector store."""
+        """
+        Create a new vector store.
+        Postgres tables keep their own manifest, so the given manifest is only filled for in-memory stores.
+        """
 
         if vector_store_type == "in_memory":
-            return await self._create_in_memory_vector_store(loader_args)
+            return await self._create_in_memory_vector_store(loader_args, manifest)
 
         return await self._create_postgres_vector_store(loader_args, postgres_config)
 
-    async def _process_documents(self, loader_args: Any) -> List[Document]:
-        """Load and split documents"""
-        # Load documents and build the vector store
-        docs: List[Document] = await self.load_documents(loader_args)
+    def _get_text_splitter(self, settings: ChunkingSettings) -> RecursiveCharacterTextSplitter:
+        """
+        :param settings: Chunking settings
+        :return: Splitter that cuts documents into token-sized chunks for better embedding and retrieval
+        """
+        return RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+            encoding_name=TIKTOKEN_ENCODING,
+            chunk_size=settings.chunk_size,
+            chunk_overlap=settings.chunk_overlap,
+            separators=settings.separators,
+        )
 
-        # Split documents into smaller chunks for better embedding and retrieval
-        text_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(chunk_size=100, chunk_overlap=50)
+    def _get_token_counter(self) -> Callable[[str], int]:
+        """
+        :return: Function counting the tokens of a text, as the text splitter does
+        """
+        encoding = tiktoken.get_encoding(TIKTOKEN_ENCODING)
+        return lambda text: len(encoding.encode(text, disallowed_special=()))
 
-        doc_chunks: List[Document] = text_splitter.split_documents(docs)
-        logger.info("Processed %d document chunks\n", len(doc_chunks))
+    async def estimate_chunking(self, loader_args: Any, settings: List[ChunkingSettings]) -> List[ChunkingEstimate]:
+        """
+        Report how many chunks and tokens each chunking setting would embed, without embedding anything,
+        e.g. to weigh a smaller overlap or deduplication against the current settings.
+        The documents are loaded once, and splitting is not limited to the sources that changed.
 
-        return doc_chunks
+        :param loader_args: Arguments specific to the document loader
+        :param settings: Chunking settings to compare
+        :return: One estimate per setting, in order
+        :raises ValueError: If a setting is out of range or unknown
+        """
+        docs_by_source: Dict[str, List[Document]] = self._group_by_source(await self.load_documents(loader_args))
+        count_tokens: Callable[[str], int] = self._get_token_counter()
+        documents: int = sum(len(source_docs) for source_docs in docs_by_source.values())
+        document_tokens: int = sum(
+            count_tokens(doc.page_content) for source_docs in docs_by_source.values() for doc in source_docs
+        )
+
+        estimates: List[ChunkingEstimate] = []
+        for setting in settings:
+            setting.validate()
+            splitter: RecursiveCharacterTextSplitter = self._get_text_splitter(setting)
+            deduplicator = ChunkDeduplicator(setting.dedup)
+            chunks: List[Document] = []
+            for source_docs in docs_by_source.values():
+                chunks.extend(deduplicator.filter(splitter.split_documents(source_docs)))
+            estimate = ChunkingEstimate(
+                settings=setting,
+                documents=documents,
+                document_tokens=document_tokens,
+                chunks=len(chunks),
+                tokens=sum(count_tokens(chunk.page_content) for chunk in chunks),
+                duplicate_chunks=deduplicator.dropped,
+            )
+            logger.info("Chunking estimate: %s\n", estimate.to_dict())
+            estimates.append(estimate)
+        return estimates
+
+    def _split_source(self, source: str, source_docs: List[Document], content_hash: str) -> List[Document]:
+        """
+        Split the documents of one source into chunks whose ids are derived from the source content,
+        so that the chunks of a source can be found and replaced when it changes.
+
+        :param source: Source the documents were loaded from
+        :param source_docs: Documents of the source, in load order
+        :param content_hash: Content hash of the documents
+        :return: Chunks of the source
+        """
+        chunks: List[Document] = self._get_text_splitter(self.get_chunking_settings()).split_documents(source_docs)
+        for index, chunk in enumerate(chunks):
+            chunk.id = make_chunk_id(source, content_hash, index)
+        return chunks
 
-    async def _create_in_memory_vector_store(self, loader_args) -> VectorStore:
-        """Create an in-memory vector store."""
-        doc_chunks: List[Document] = await self._process_documents(loader_args)
+    async def _iter_chunks(
+        self, loader_args: Any, deduplicator: ChunkDeduplicator, manifest: Optional[SourceManifest] = None
+    ) -> AsyncIterator[List[Document]]:
+        """
+        Lazily load and split documents, one source at a time.
+
+        :param loader_args: Arguments specific to the document loader
+        :param deduplicator: Drops the chunks repeating a chunk of any source seen before
+        :param manifest: Manifest to record the sources and their chunks in, if incremental updates are enabled
+        :return: Async iterator of the chunks of each source
+        """
+        # Probe the source versions before loading, so a change during loading is picked up by the next update
+        versions: Dict[str, Optional[str]] = {}
+        sources: Optional[List[str]] = self.list_sources(loader_args)
+        if manifest is not None and sources:
+            versions = await self._probe_versions(sources)
+
+        async for docs in self.alazy_load_documents(loader_args):
+            for source, source_docs in self._group_by_source(docs).items():
+                content_hash: str = hash_documents(source_docs)
+                chunks: List[Document] = deduplicator.filter(self._split_source(source, source_docs, content_hash))
+                if manifest is not None:
+                    manifest.record(
+                        source, versions.get(source), content_hash, chunks, deduplicator.aliases.get(source)
+                    )
+                yield chunks
+
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+    async def _ingest(
+        self,
+        vectorstore: VectorStore,
+        loader_args: Any,
+        manifest: Optional[SourceManifest] = None,
+        writer: Optional[PgCopyWriter] = None,
+        postgres_config: Optional[PostgresConfig] = None,
+    ) -> VectorStore:
+        """
+        Stream the chunks of the sources into the vector store, embedding them in batches under a memory ceiling.
+        A chunk is stored before the later duplicates dropped for it are seen, so the sources of those
+        are added to its metadata once all the chunks are stored.
+
+        :param vectorstore: Empty vector store to fill
+        :param loader_args: Arguments specific to the document loader
+        :param manifest: Manifest to record the sources and their chunks in, if incremental updates are enabled
+        :param writer: Inserts the chunks into the table of the postgres vector store with COPY, if given
+        :param postgres_config: Configuration of the table, for a postgres vector store
+        :return: The filled vector store
+        """
+        deduplicator = ChunkDeduplicator(self.chunk_dedup)
+        chunk_groups: AsyncIterator[List[Document]] = self._iter_chunks(loader_args, deduplicator, manifest)
+        metadata_index = MetadataIndex()
+        chunk_groups = self._index_metadata(chunk_groups, metadata_index)
+        keyword_index: Optional[Bm25Index] = None
+        if self.hybrid_search:
+            keyword_index = Bm25Index()
+            chunk_groups = self._index_keywords(chunk_groups, keyword_index)
+
+        pipeline: IngestionPipeline = IngestionPipeline.from_env()
+        scheduler: Optional[EmbeddingScheduler] = find_scheduler(self.embeddings)
+        if scheduler is not None:
+            # Each batch is embedded by a separate scheduler call, whose requests only overlap each other,
+            # so the batches in flight together should fill the RAG_EMBEDDING_MAX_CONCURRENCY requests
+            texts_in_flight: int = scheduler.texts_in_flight(self.chunk_size)
+            pipeline.insert_batch_size = max(
+                pipeline.insert_batch_size, -(-texts_in_flight // max(1, pipeline.max_inserts_in_flight))
+            )
+        if writer is not None:
+            # Each batch is a single COPY, so larger batches are cheaper
+            pipeline.insert_batch_size = max(pipeline.insert_batch_size, writer.batch_size)
+        stats: IngestionStats = await pipeline.run(chunk_groups, writer or vectorstore)
+        logger.info("Processed %d document chunks\n", stats.chunks)
+        if deduplicator.dropped:
+            logger.info("Dropped %d duplicate chunks before embedding\n", deduplicator.dropped)
+        self._metadata_indexes[vectorstore] = metadata_index
+        await self._set_duplicate_sources(vectorstore, deduplicator.duplicate_sources, postgres_config)
+        if keyword_index is not None:
+            self._keyword_indexes[vectorstore] = keyword_index
+        return vectorstore
+
+    @staticmethod
+    async def _index_keywords(
+        chunk_groups: AsyncIterator[List[Document]], keyword_index: Bm25Index
+    ) -> AsyncIterator[List[Document]]:
+        """
+        :param chunk_groups: Async iterator of chunk lists
+        :param keyword_index: Index to add every chunk to as it passes through
+        :return: The same chunk lists
+        """
+        async for chunks in chunk_groups:
+            keyword_index.add([chunk.id for chunk in chunks], [chunk.page_content for chunk in chunks])
+            yield chunks
+
+    @staticmethod
+    async def _index_metadata(
+        chunk_groups: AsyncIterator[List[Document]], metadata_index: MetadataIndex
+    ) -> AsyncIterator[List[Document]]:
+        """
+        :param chunk_groups: Async iterator of chunk lists
+        :param metadata_index: Index to add the metadata of every chunk to as it passes through
+        :return: The same chunk lists
+        """
+        async for chunks in chunk_groups:
+            metadata_index.add([chunk.id for chunk in chunks], [chunk.metadata for chunk in chunks])
+            yield chunks
+
+    async def _create_in_memory_vector_store(
+        self, loader_args: Any, manifest: Optional[SourceManifest] = None
+    ) -> VectorStore:
+        """Create an in-memory vector store, recording its sources in the manifest if given."""
         logger.info("Creating in-memory vector store.")
-        return await InMemoryVectorStore.afrom_documents(
-            documents=doc_chunks,
-            embedding=self.embeddings,
-        )
+        return await self._ingest(self._get_in_memory_store_class()(embedding=self.embeddings), loader_args, manifest)
+
+    def _get_in_memory_store_class(self) -> type:
+        """
+        :return: IvfVectorStore for the "ann" vector store type,
+            QuantizedVectorStore for the "quantized" vector store type,
+            NumpyVectorStore when the vector store path uses the binary ".npy" format,
+            otherwise InMemoryVectorStore
+        """
+        if self.use_ann_index:
+            return IvfVectorStore
+        if self.use_quantized_store:
+            return QuantizedVectorStore
+        if self.abs_vector_store_path and self.abs_vector_store_path.endswith(NPY_EXTENSION):
+            return NumpyVectorStore
+        return InMemoryVectorStore
 
     async def _create_postgres_vector_store(
         self, loader_args: Any, postgres_config: PostgresConfig
     ) -> Optional[VectorStore]:
-        """Create a PostgreSQL vector store."""
-
-        # Create engine and table
-        pg_engine = PGEngine.from_connection_string(url=postgres_config.connection_string)
+        """
+        Create a PostgreSQL vector store, or open the existing table.
+        Engines, known tables and opened stores are shared across tools through the PGEngineRegistry,
+        so querying an existing table needs neither a new connection pool nor a schema check.
+        """
+        registry: PGEngineRegistry = PGEngineRegistry.get_shared()
+        connection_string: str = postgres_config.connection_string
         table_name: str = postgres_config.table_name or DEFAULT_TABLE_NAME
+        embedding_key: str = self.get_index_params()["embedding_model"]
+        manifest_path: Optional[str] = self._get_manifest_path(postgres_config, "postgres")
 
         logger.info(
             "PostgreSQL connection details:\n"
@@ -228,32 +1068,52 @@ class BaseRag(ABC):
         )
 
         try:
+            # Cached for RAG_PG_TABLE_TTL_SECONDS, so an opened store is mostly reused without any query
+            if await registry.table_exists(connection_string, table_name):
+                vectorstore: Optional[VectorStore] = registry.get_vector_store(
+                    connection_string, table_name, embedding_key
+                ) or await self._open_postgres_vector_store(postgres_config, table_name)
+                await self._update_postgres_vector_store(vectorstore, loader_args, postgres_config)
+                return vectorstore
+
             # Initiaize vector store table
+            pg_engine: PGEngine = registry.get_engine(connection_string)
             await pg_engine.ainit_vectorstore_table(
                 table_name=table_name,
                 vector_size=VECTOR_SIZE,
             )
+            await registry.create_metadata_indexes(connection_string, table_name, PG_METADATA_INDEX_FIELDS)
 
-            doc_chunks: List[Document] = await self._process_documents(loader_args)
+            manifest: Optional[SourceManifest] = None
+            if manifest_path:
+                manifest = SourceManifest(index_params=self.get_index_params())
 
             logger.info("Creating postgres vector store from documents.")
-            # Create vector store and load documents
-            return await PGVectorStore.afrom_documents(
-                documents=doc_chunks,
-                embedding=self.embeddings,
+            # Create vector store and stream the documents into it
+            index_settings: VectorIndexSettings = VectorIndexSettings.from_env()
+            vectorstore = await PGVectorStore.create(
                 engine=pg_engine,
                 table_name=table_name,
+                embedding_service=self.embeddings,
+                index_query_options=index_settings.query_options(),
             )
+            writer: Optional[PgCopyWriter] = None
+            if PG_BULK_COPY:
+                writer = PgCopyWriter(registry, connection_string, table_name, self.embeddings)
+            await self._ingest(vectorstore, loader_args, manifest, writer, postgres_config)
+            await self._finish_postgres_load(vectorstore, connection_string, table_name, index_settings)
+            if manifest is not None:
+                manifest.save(manifest_path)
+            self._save_keyword_index(vectorstore, self._get_keyword_index_path(postgres_config, "postgres"))
+            self._save_metadata_index(vectorstore, self._get_metadata_index_path(postgres_config, "postgres"))
+            registry.put_vector_store(connection_string, table_name, embedding_key, vectorstore)
+            return vectorstore
 
         except ProgrammingError:
-            # Table already exists. Create vector store from it.
-            logger.info("Table %s already exists.\n", table_name)
-            logger.info("Creating postgres vector store from existing table.\n")
-            return await PGVectorStore.create(
-                engine=pg_engine,
-                table_name=table_name,
-                embedding_service=self.embeddings,
-            )
+            # Table was created by another process since it was checked. Create vector store from it.
+            vectorstore = await self._open_postgres_vector_store(postgres_config, table_name)
+            await self._update_postgres_vector_store(vectorstore, loader_args, postgres_config)
+            return vectorstore
 
         except OSError as os_error:
             # Fail to create vector store due to connection error
@@ -272,6 +1132,71 @@ class BaseRag(ABC):
             logger.error("Fail to create vector store due to invalid DB name. %s\n", invalid_catalog_error)
             return None
 
+    @staticmethod
+    async def _finish_postgres_load(
+        vectorstore: PGVectorStore, connection_string: str, table_name: str, index_settings: VectorIndexSettings
+    ):
+        """
+        Refresh the planner statistics of a newly loaded table, then build its ANN index if one is configured.
+        ANALYZE runs first, since the number of IVFFlat lists is derived from the row count it records.
+        """
+        rows: int = await PGEngineRegistry.get_shared().analyze(connection_string, table_name)
+        index: Optional[BaseIndex] = index_settings.make_index(rows)
+        if index is None:
+            logger.info("Analyzed table %s with %d rows. No vector index configured.\n", table_name, rows)
+            return
+        started_at: float = time.monotonic()
+        await vectorstore.aapply_vector_index(index)
+        logger.info(
+            "Built %s index on table %s with %d rows in %.1fs\n",
+            index.index_type,
+            table_name,
+            rows,
+            time.monotonic() - started_at,
+        )
+
+    async def _open_postgres_vector_store(self, postgres_config: PostgresConfig, table_name: str) -> VectorStore:
+        """Create a vector store on an existing table and keep it in the registry for later calls."""
+        registry: PGEngineRegistry = PGEngineRegistry.get_shared()
+        logger.info("Table %s already exists.\n", table_name)
+        logger.info("Creating postgres vector store from existing table.\n")
+        vectorstore: VectorStore = await PGVectorStore.create(
+            engine=registry.get_engine(postgres_config.connection_string),
+            table_name=table_name,
+            embedding_service=self.embeddings,
+            index_query_options=VectorIndexSettings.from_env().query_options(),
+        )
+        registry.put_vector_store(
+            postgres_config.connection_string, table_name, self.get_index_params()["embedding_model"], vectorstore
+        )
+        return vectorstore
+
+    async def _update_postgres_vector_store(
+        self, vectorstore: VectorStore, loader_args: Any, postgres_config: PostgresConfig
+    ):
+        """Load the indexes of an existing table, and apply an incremental update to it if one is due."""
+        keyword_index_file: Optional[str] = self._get_keyword_index_path(postgres_config, "postgres")
+        self._load_keyword_index(vectorstore, keyword_index_file)
+        metadata_index_file: Optional[str] = self._get_metadata_index_path(postgres_config, "postgres")
+        self._load_metadata_index(vectorstore, metadata_index_file)
+
+        manifest_path: Optional[str] = self._get_manifest_path(postgres_config, "postgres")
+        if not manifest_path or not self._incremental_check_due(manifest_path):
+            return
+        updated_manifest: Optional[SourceManifest] = await self._update_incrementally(
+            vectorstore, loader_args, manifest_path, postgres_config
+        )
+        if updated_manifest is not None:
+            updated_manifest.save(manifest_path)
+            self._save_keyword_index(vectorstore, keyword_index_file)
+            self._save_metadata_index(vectorstore, metadata_index_file)
+        else:
+            # The chunks already in the table are unknown, so they cannot be replaced safely
+            logger.warning(
+                "Table %s was not built with incremental updates. Drop it to rebuild it with a manifest.\n",
+                postgres_config.table_name or DEFAULT_TABLE_NAME,
+            )
+
     async def _save_vector_store(self, vectorstore: VectorStore, vector_store_type: Literal["in_memory", "postgres"]):
         """Save vector store to file if configured."""
         should_save: bool = self.save_vector_store and self.abs_vector_store_path and vector_store_type == "in_memory"
@@ -283,37 +1208,130 @@ class BaseRag(ABC):
             os.makedirs(os.path.dirname(self.abs_vector_store_path), exist_ok=True)
             vectorstore.dump(path=self.abs_vector_store_path)
             logger.info("Vector store saved to: %s\n", self.abs_vector_store_path)
+            self._save_keyword_index(vectorstore, self._get_keyword_index_path(None, vector_store_type))
+            self._save_metadata_index(vectorstore, self._get_metadata_index_path(None, vector_store_type))
         except OSError as os_error:
             logger.error("Failed to save vector store to %s: %s\n", self.abs_vector_store_path, os_error)
 
-    async def query_vectorstore(self, vectorstore: VectorStore, query: str) -> str:
+    async def query_vectorstore(
+        self, vectorstore: VectorStore, query: str, metadata_filter: Optional[Dict[str, Any]] = None
+    ) -> str:
         """
         Query the given vector store using the provided query string
         and return the combined content of retrieved documents.
 
         :param vectorstore: The in-memory vector store to query
         :param query: The user query to search for relevant documents
+        :param metadata_filter: Only retrieve chunks whose metadata match this filter, e.g. {"source": url}.
+            See coded_tools.tools.rag.metadata_index for the syntax.
         :return: Concatenated text content of the retrieved documents
         """
+        if metadata_filter:
+            try:
+                metadata_filter = normalize_filter(metadata_filter)
+            except ValueError as filter_error:
+                logger.error("Invalid filter: %s\n", filter_error)
+                return f"❌ Invalid 'filter': {filter_error}"
+
         try:
-            # Create a retriever interface from the vector store
-            retriever: VectorStoreRetriever = vectorstore.as_retriever()
+            # Create a retriever interface from the vector store, fused with keyword search if it has an index
+            keyword_index: Optional[Bm25Index] = None
+            if self.hybrid_search and vectorstore is not None:
+                keyword_index = self._keyword_indexes.get(vectorstore)
+            cache_scope: Optional[str] = self._query_cache_scopes.get(vectorstore)
 
-            return await self.query_retriever(retriever, query)
+            search_kwargs: Dict[str, Any] = {}
+            chunk_ids: Optional[FrozenSet[str]] = None
+            if metadata_filter and vectorstore is not None:
+                vectorstore, search_kwargs, chunk_ids = self._filter_vector_store(vectorstore, metadata_filter)
+                if chunk_ids is None:
+                    # The keyword side cannot be restricted to the matching chunks
+                    keyword_index = None
+                if cache_scope is not None:
+                    cache_scope += SUB_SCOPE_SEPARATOR + filter_key(metadata_filter)
+            if cache_scope is not None and keyword_index is not None:
+                # A postgres table is shared by the tools querying it with and without hybrid search,
+                # whose results differ. Sub-scoped, so they are dropped along with the dense results.
+                cache_scope += SUB_SCOPE_SEPARATOR + "hybrid"
+
+            # Queries are embedded with the embeddings of this tool, since a store shared across tools
+            # keeps those of the tool that built it, which may be bound to an event loop closed since
+            retriever: BaseRetriever = (
+                HybridRetriever.from_env(vectorstore, keyword_index, search_kwargs, chunk_ids, self.embeddings)
+                if keyword_index is not None
+                else VectorRetriever(vectorstore=vectorstore, embeddings=self.embeddings, search_kwargs=search_kwargs)
+            )
+
+            return await self.query_retriever(retriever, query, cache_scope=cache_scope, embeddings=self.embeddings)
 
         except AttributeError:
             return "Failed to create vector store. Please check the log for more information.\n"
 
+        except ProgrammingError as programming_error:
+            # E.g. the table was dropped by another process. Checked again, and recreated, on the next call.
+            logger.error("Failed to query the postgres vector store: %s\n", programming_error)
+            PGEngineRegistry.get_shared().invalidate_store(vectorstore)
+            return "Failed to query the vector store. Please check the log for more information.\n"
+
+    def _filter_vector_store(
+        self, vectorstore: VectorStore, metadata_filter: Dict[str, Any]
+    ) -> Tuple[VectorStore, Dict[str, Any], Optional[FrozenSet[str]]]:
+        """
+        Restrict the similarity searches of a vector store to the chunks matching a metadata filter.
+        Postgres applies the filter as a WHERE clause. In-memory stores only score the chunks selected
+        by their metadata index, which is built on the first filtered query if it was not saved with the store.
+
+        :param vectorstore: Vector store to search
+        :param metadata_filter: Normalized metadata filter
+        :return: Tuple of (vector store to search, search keyword arguments, ids of the matching chunks).
+            The ids are None if the store has no metadata index, e.g. a postgres table built before indexing.
+        """
+        metadata_index: Optional[MetadataIndex] = self._metadata_indexes.get(vectorstore)
+        if isinstance(vectorstore, PGVectorStore):
+            chunk_ids: Optional[FrozenSet[str]] = (
+                metadata_index.select(metadata_filter) if metadata_index is not None else None
+            )
+            return vectorstore, {"filter": include_duplicate_sources(metadata_filter)}, chunk_ids
+
+        if metadata_index is None:
+            metadata_index = MetadataIndex.from_vector_store(vectorstore)
+            if metadata_index is None:
+                # Leave the filter to stores with their own filtering
+                return vectorstore, {"filter": metadata_filter}, None
+            self._metadata_indexes[vectorstore] = metadata_index
+        chunk_ids = metadata_index.select(metadata_filter)
+        logger.info("%d of %d chunks match the filter\n", len(chunk_ids), len(metadata_index))
+        restricted_store, search_kwargs = restrict_to_chunks(vectorstore, chunk_ids)
+        return restricted_store, search_kwargs, chunk_ids
+
     @staticmethod
-    async def query_retriever(retriever: Any, query: str) -> str:
+    async def query_retriever(
+        retriever: Any, query: str, cache_scope: Optional[str] = None, embeddings: Optional[Embeddings] = None
+    ) -> str:
         """
         Query the retriever with the given query string and return the results.
 
         :param retriever: The retriever interface to query
         :param query: The user query to search for relevant documents
+        :param cache_scope: Scope of the results in the shared query cache, e.g. the fingerprint of the vector store.
+            Results are not cached if None.
+        :param embeddings: Embeddings the retriever embeds queries with. If given, a query that misses the cache
+            is also matched against the cached queries of the scope by embedding similarity.
         :return: Concatenated text content of the retrieved documents
         """
+        query_cache: QueryCache = QueryCache.get_shared()
+        use_cache: bool = cache_scope is not None and query_cache.enabled
+        query_vector: Optional[List[float]] = None
         try:
+            if use_cache:
+                cached: Optional[str] = query_cache.get(cache_scope, query)
+                if cached is None and embeddings is not None and query_cache.matches_similar:
+                    query_vector = await embeddings.aembed_query(query)
+                    cached = query_cache.get_similar(cache_scope, query_vector)
+                if cached is not None:
+                    logger.info("Query cache hit. Stats: %s\n", query_cache.stats())
+                    return cached
+
             # Perform an asynchronous similarity search
             results: List[Document] = await retriever.ainvoke(query)
 
@@ -321,7 +1339,11 @@ class BaseRag(ABC):
                 logger.info("Retrieval completed!\n")
 
             # Concatenate the content of all retrieved documents
-            return "\n\n".join(doc.page_content for doc in results)
+            result: str = "\n\n".join(doc.page_content for doc in results)
+            # Empty results of remote retrievers may be transient failures, so they are retrieved again
+            if use_cache and results:
+                query_cache.put(cache_scope, query, result, query_vector)
+            return result
 
         except asyncio.TimeoutError as e:
             return f"Timed out while querying retriever: {e}"
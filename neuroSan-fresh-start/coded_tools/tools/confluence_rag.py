@@ -20,6 +20,7 @@ import inspect
 import logging
 import os
 from typing import Any
+from typing import AsyncIterator
 from typing import Dict
 from typing import List
 
@@ -49,6 +50,7 @@ class ConfluenceRag(CodedTool, BaseRag):
 
         :param args: Dictionary containing:
           "query": search string
+          "filter": only search pages whose metadata match this filter, e.g. {"title": "Onboarding"}
 
         :param sly_data: A dictionary whose keys are defined by the agent
             hierarchy, but whose values are meant to be kept out of the
@@ -108,11 +110,23 @@ class ConfluenceRag(CodedTool, BaseRag):
         # Configure the vector store path
         self.configure_vector_store_path(args.get("vector_store_path"))
 
+        # Re-index only new, changed or removed sources of the saved vector store or existing table if True
+        self.incremental_update = args.get("incremental_update", False)
+
+        # Fuse BM25 keyword search with vector search if True
+        self.hybrid_search = args.get("hybrid_search", False)
+
+        # Share the in-memory vector store with the other server processes of the host if True
+        self.use_shared_store = args.get("shared_store", self.use_shared_store)
+
+        # Chunk size and overlap, splitting strategy and deduplication of the chunks
+        self.configure_chunking(args)
+
         # Prepare the vector store
         vectorstore = await self.generate_vector_store(loader_args=loader_args)
 
         # Run the query against the vector store
-        return await self.query_vectorstore(vectorstore, query)
+        return await self.query_vectorstore(vectorstore, query, args.get("filter"))
 
     async def load_documents(self, loader_args: Dict[str, Any]) -> List[Document]:
         """
@@ -121,16 +135,25 @@ class ConfluenceRag(CodedTool, BaseRag):
         :param loader_args: Dictionary containing 'url', 'space_key', and/or 'page_ids' of the Confluence pages to load
         :return: List of loaded Confluence pages
         """
-        url = loader_args.get("url")
         docs: List[Document] = []
+        async for page_docs in self.alazy_load_documents(loader_args):
+            docs.extend(page_docs)
+        return docs
+
+    async def alazy_load_documents(self, loader_args: Dict[str, Any]) -> AsyncIterator[List[Document]]:
+        """
+        Load Confluence pages one at a time, so that large spaces do not have to fit in memory.
+
+        :param loader_args: Dictionary containing 'url', 'space_key', and/or 'page_ids' of the Confluence pages to load
+        :return: Async iterator of single-page document lists
+        """
+        url = loader_args.get("url")
         try:
             loader = ConfluenceLoader(**loader_args)
-            docs = await loader.aload()
+            async for doc in loader.alazy_load():
+                yield [doc]
             logger.info("Successfully loaded Confluence pages from %s", url)
         except HTTPError as http_error:
             logger.error("HTTP error while loading from %s: %s", url, http_error)
-            return []
         except ApiPermissionError as api_error:
             logger.error("API Permission error while loading from %s: %s", url, api_error)
-
-        return docs
@@ -17,17 +17,19 @@
 import logging
 import os
 from typing import Any
+from typing import AsyncIterator
 
 from langchain_core.documents import Document
 from langchain_core.vectorstores import VectorStore
 
 # pylint: disable=import-error
-from langchain_docling import DoclingLoader
 from neuro_san.interfaces.coded_tool import CodedTool
-from requests.exceptions import HTTPError
 
 from coded_tools.tools.base_rag import BaseRag
 from coded_tools.tools.base_rag import PostgresConfig
+from coded_tools.tools.rag.parallel_loader import ParallelDocumentLoader
+from coded_tools.tools.rag.parallel_loader import parse_with_docling
+from coded_tools.tools.rag.parsed_document_cache import ParsedDocumentCache
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -49,6 +51,11 @@ class DoclingRag(CodedTool, BaseRag):
           "urls": list of pdf files
           "save_vector_store": save to JSON file if True
           "vector_store_path": relative path to this file
+          "incremental_update": re-index only changed sources of an existing vector store if True
+          "hybrid_search": combine keyword and vector search if True
+          "shared_store": map one in-memory vector store shared by all server processes if True
+          "chunk_size", "chunk_overlap", "chunking_strategy", "chunk_dedup": how documents are chunked
+          "filter": only search chunks whose metadata match this filter, e.g. {"source": url}
 
         :param sly_data: A dictionary whose keys are defined by the agent
             hierarchy, but whose values are meant to be kept out of the
@@ -76,6 +83,21 @@ class DoclingRag(CodedTool, BaseRag):
         if not urls:
             return "❌ Missing required input: 'urls'."
 
+        # Prepare the vector store
+        vector_store: VectorStore = await self.build_vector_store(args)
+
+        # Run the query against the vector store
+        return await self.query_vectorstore(vector_store, query, args.get("filter"))
+
+    async def build_vector_store(self, args: dict[str, Any]) -> VectorStore | None:
+        """
+        Configure the tool from its arguments and build or load the vector store of the given URLs.
+
+        :param args: Tool arguments, as for async_invoke(). The query is not needed.
+        :return: Vector store of the URLs
+        """
+        urls: list[str] = args.get("urls", [])
+
         # Vector store type
         vector_store_type: str = args.get("vector_store_type", "in_memory")
 
@@ -85,6 +107,18 @@ class DoclingRag(CodedTool, BaseRag):
         # Configure the vector store path
         self.configure_vector_store_path(args.get("vector_store_path"))
 
+        # Re-index only new, changed or removed sources of the saved vector store or existing table if True
+        self.incremental_update = args.get("incremental_update", False)
+
+        # Fuse BM25 keyword search with vector search if True
+        self.hybrid_search = args.get("hybrid_search", False)
+
+        # Share the in-memory vector store with the other server processes of the host if True
+        self.use_shared_store = args.get("shared_store", self.use_shared_store)
+
+        # Chunk size and overlap, splitting strategy and deduplication of the chunks
+        self.configure_chunking(args)
+
         # For PostgreSQL vector store
         if vector_store_type == "postgres":
             postgres_config = PostgresConfig(
@@ -98,14 +132,11 @@ class DoclingRag(CodedTool, BaseRag):
         else:
             postgres_config = None
 
-        # Prepare the vector store
-        vector_store: VectorStore = await self.generate_vector_store(
+        # Build, load or reuse the vector store
+        return await self.generate_vector_store(
             loader_args={"urls": urls}, postgres_config=postgres_config, vector_store_type=vector_store_type
         )
 
-        # Run the query against the vector store
-        return await self.query_vectorstore(vector_store, query)
-
     async def load_documents(self, loader_args: dict[str, Any]) -> list[Document]:
         """
         Load documents from URLs.
@@ -114,18 +145,20 @@ class DoclingRag(CodedTool, BaseRag):
         :return: List of loaded documents
         """
         docs: list[Document] = []
-        urls: list[str] = loader_args.get("urls", [])
+        async for file_docs in self.alazy_load_documents(loader_args):
+            docs.extend(file_docs)
+        return docs
 
-        loader = DoclingLoader(file_path=urls)
-        async for doc in loader.alazy_load():
-            try:
-                docs.append(doc)
-                logger.info("Successfully loaded PDF file from %s", doc.metadata.get("source", "unknown source"))
-            except HTTPError as http_e:
-                logger.error("HTTP error occurred: %s", http_e)
-            except FileNotFoundError as fnf_e:
-                logger.error("File not found: %s", fnf_e)
-            except ValueError as val_e:
-                logger.error("Value error: %s", val_e)
+    async def alazy_load_documents(self, loader_args: dict[str, Any]) -> AsyncIterator[list[Document]]:
+        """
+        Download files concurrently and convert them with Docling in the shared process pool.
+        A file that fails or times out is logged and skipped.
+        Files converted before are read from the parsed document cache.
 
-        return docs
+        :param loader_args: Dictionary containing 'urls' (list of file URLs)
+        :return: Async iterator of the documents of each file, in completion order
+        """
+        urls: list[str] = loader_args.get("urls", [])
+        loader = ParallelDocumentLoader(parse_with_docling, cache=ParsedDocumentCache.get_shared())
+        async for _, file_docs in loader.aload(urls):
+            yield file_docs
@@ -19,16 +19,20 @@
 import logging
 import os
 from typing import Any
+from typing import AsyncIterator
 from typing import Dict
 from typing import List
+from typing import Optional
 
-from langchain_community.document_loaders import PyMuPDFLoader
 from langchain_core.documents import Document
 from langchain_core.vectorstores import VectorStore
 from neuro_san.interfaces.coded_tool import CodedTool
 
 from coded_tools.tools.base_rag import BaseRag
 from coded_tools.tools.base_rag import PostgresConfig
+from coded_tools.tools.rag.parallel_loader import ParallelDocumentLoader
+from coded_tools.tools.rag.parallel_loader import parse_pdf
+from coded_tools.tools.rag.parsed_document_cache import ParsedDocumentCache
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -48,6 +52,11 @@ class PdfRag(CodedTool, BaseRag):
           "urls": list of pdf files
           "save_vector_store": save to JSON file if True
           "vector_store_path": relative path to this file
+          "incremental_update": re-index only changed sources of an existing vector store if True
+          "hybrid_search": combine keyword and vector search if True
+          "shared_store": map one in-memory vector store shared by all server processes if True
+          "chunk_size", "chunk_overlap", "chunking_strategy", "chunk_dedup": how documents are chunked
+          "filter": only search chunks whose metadata match this filter, e.g. {"source": url}
 
         :param sly_data: A dictionary whose keys are defined by the agent
             hierarchy, but whose values are meant to be kept out of the
@@ -75,6 +84,21 @@ class PdfRag(CodedTool, BaseRag):
         if not urls:
             return "❌ Missing required input: 'urls'."
 
+        # Prepare the vector store
+        vector_store: VectorStore = await self.build_vector_store(args)
+
+        # Run the query against the vector store
+        return await self.query_vectorstore(vector_store, query, args.get("filter"))
+
+    async def build_vector_store(self, args: Dict[str, Any]) -> Optional[VectorStore]:
+        """
+        Configure the tool from its arguments and build or load the vector store of the given URLs.
+
+        :param args: Tool arguments, as for async_invoke(). The query is not needed.
+        :return: Vector store of the URLs
+        """
+        urls: List[str] = args.get("urls", [])
+
         # Vector store type
         vector_store_type: str = args.get("vector_store_type", "in_memory")
 
@@ -84,6 +108,18 @@ class PdfRag(CodedTool, BaseRag):
         # Configure the vector store path
         self.configure_vector_store_path(args.get("vector_store_path"))
 
+        # Re-index only new, changed or removed sources of the saved vector store or existing table if True
+        self.incremental_update = args.get("incremental_update", False)
+
+        # Fuse BM25 keyword search with vector search if True
+        self.hybrid_search = args.get("hybrid_search", False)
+
+        # Share the in-memory vector store with the other server processes of the host if True
+        self.use_shared_store = args.get("shared_store", self.use_shared_store)
+
+        # Chunk size and overlap, splitting strategy and deduplication of the chunks
+        self.configure_chunking(args)
+
         # For PostgreSQL vector store
         if vector_store_type == "postgres":
             postgres_config = PostgresConfig(
@@ -97,14 +133,11 @@ class PdfRag(CodedTool, BaseRag):
         else:
             postgres_config = None
 
-        # Prepare the vector store
-        vector_store: VectorStore = await self.generate_vector_store(
+        # Build, load or reuse the vector store
+        return await self.generate_vector_store(
             loader_args={"urls": urls}, postgres_config=postgres_config, vector_store_type=vector_store_type
         )
 
-        # Run the query against the vector store
-        return await self.query_vectorstore(vector_store, query)
-
     async def load_documents(self, loader_args: Dict[str, Any]) -> List[Document]:
         """
         Load PDF documents from URLs.
@@ -113,17 +146,20 @@ class PdfRag(CodedTool, BaseRag):
         :return: List of loaded PDF documents
         """
         docs: List[Document] = []
-        urls: List[str] = loader_args.get("urls", [])
+        async for pdf_docs in self.alazy_load_documents(loader_args):
+            docs.extend(pdf_docs)
+        return docs
 
-        for url in urls:
-            try:
-                loader = PyMuPDFLoader(file_path=url)
-                doc: List[Document] = await loader.aload()
-                docs.extend(doc)
-                logger.info("Successfully loaded PDF file from %s", url)
-            except FileNotFoundError:
-                logger.error("File not found: %s", url)
-            except ValueError as e:
-                logger.error("Invalid file path or unsupported input: %s – %s", url, e)
+    async def alazy_load_documents(self, loader_args: Dict[str, Any]) -> AsyncIterator[List[Document]]:
+        """
+        Download PDFs concurrently and parse them with PyMuPDF in the shared process pool.
+        A PDF that fails or times out is logged and skipped.
+        PDFs parsed before are read from the parsed document cache.
 
-        return docs
+        :param loader_args: Dictionary containing 'urls' (list of PDF file URLs)
+        :return: Async iterator of the pages of each PDF, in completion order
+        """
+        urls: List[str] = loader_args.get("urls", [])
+        loader = ParallelDocumentLoader(parse_pdf, cache=ParsedDocumentCache.get_shared())
+        async for _, pdf_docs in loader.aload(urls):
+            yield pdf_docs
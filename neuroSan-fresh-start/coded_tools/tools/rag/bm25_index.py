@@ -0,0 +1,265 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+BM25 keyword index over the chunks of a vector store, for exact matches of codes, SKUs and error strings.
+
+The index is an inverted file: for every term, the chunks containing it and the term frequency in each.
+It is saved as a single ".npz" file holding the postings in compressed sparse row layout.
+"""
+
+import json
+import math
+import os
+import re
+import threading
+from array import array
+from collections import Counter
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# pylint: disable=import-error
+import numpy as np
+
+BM25_SUFFIX = ".bm25.npz"
+# Standard BM25 parameters: term frequency saturation and document length normalization
+DEFAULT_K1 = 1.2
+DEFAULT_B = 0.75
+
+# Words, numbers and compounds such as "POL-2024-17", "E_CONN_RESET" or "v1.2.3"
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[-_./:][a-z0-9]+)*")
+COMPOUND_SEPARATORS = re.compile(r"[-_./:]")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercase the text and split it into terms. A compound is kept whole so that it matches exactly,
+    and its parts are added so that a query for one part still finds it.
+
+    :param text: Chunk or query text
+    :return: Terms, with repetitions
+    """
+    terms: List[str] = []
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        terms.append(token)
+        if COMPOUND_SEPARATORS.search(token):
+            terms.extend(COMPOUND_SEPARATORS.split(token))
+    return terms
+
+
+def keyword_index_path(vector_store_path: str) -> str:
+    """
+    :param vector_store_path: Path of a saved vector store, e.g. "store.json" or "store.npy"
+    :return: Path of the keyword index saved next to it
+    """
+    return os.path.splitext(vector_store_path)[0] + BM25_SUFFIX
+
+
+class Bm25Index:
+    """
+    Mutable BM25 index keyed by chunk id. Each term's postings are two int32 arrays (chunk numbers and
+    term frequencies), so the index takes a few bytes per term occurrence rather than Python objects.
+    Deleted chunks are masked out and dropped from the postings when the index is saved.
+    Searches copy what they read under a lock and score outside of it, so chunks can be added while other
+    threads search.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, k1: float = DEFAULT_K1, b: float = DEFAULT_B):
+        """
+        :param k1: Term frequency saturation
+        :param b: Strength of the document length normalization
+        """
+        self.k1: float = k1
+        self.b: float = b
+        # Chunk number -> chunk id, None once deleted
+        self._chunk_ids: List[Optional[str]] = []
+        self._chunk_lengths: array = array("i")
+        # 1 for every chunk number still in the index, so deleted chunks can be masked out with NumPy
+        self._alive: bytearray = bytearray()
+        self._id_to_number: Dict[str, int] = {}
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._total_length: int = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._id_to_number)
+
+    def add(self, chunk_ids: Iterable[str], texts: Iterable[str]) -> None:
+        """
+        Index chunks. Re-adding an indexed id replaces it.
+
+        :param chunk_ids: Ids of the chunks, as stored in the vector store
+        :param texts: Texts of the chunks
+        """
+        chunk_ids = list(chunk_ids)
+        # Terms are counted before taking the lock, which is only held to append them
+        counted: List[Tuple[str, int, Counter]] = [
+            (chunk_id, len(terms), Counter(terms)) for chunk_id, terms in zip(chunk_ids, map(tokenize, texts))
+        ]
+        with self._lock:
+            self._delete_locked([chunk_id for chunk_id in chunk_ids if chunk_id in self._id_to_number])
+            for chunk_id, length, term_counts in counted:
+                number: int = len(self._chunk_ids)
+                self._chunk_ids.append(chunk_id)
+                self._chunk_lengths.append(length)
+                self._alive.append(1)
+                self._id_to_number[chunk_id] = number
+                self._total_length += length
+                for term, frequency in term_counts.items():
+                    numbers, frequencies = self._postings.setdefault(term, (array("i"), array("i")))
+                    numbers.append(number)
+                    frequencies.append(frequency)
+
+    def delete(self, chunk_ids: Iterable[str]) -> None:
+        """
+        :param chunk_ids: Ids of the chunks to remove. Unknown ids are ignored.
+        """
+        with self._lock:
+            self._delete_locked(chunk_ids)
+
+    def _delete_locked(self, chunk_ids: Iterable[str]) -> None:
+        """
+        Remove chunks. Called with the lock held.
+
+        :param chunk_ids: Ids of the chunks to remove. Unknown ids are ignored.
+        """
+        for chunk_id in chunk_ids:
+            number: Optional[int] = self._id_to_number.pop(chunk_id, None)
+            if number is not None:
+                self._chunk_ids[number] = None
+                self._alive[number] = 0
+                self._total_length -= self._chunk_lengths[number]
+
+    # pylint: disable=too-many-locals
+    def search(self, query: str, k: int, chunk_ids: Optional[Iterable[str]] = None) -> List[Tuple[str, float]]:
+        """
+        :param query: Query text
+        :param k: Number of results
+        :param chunk_ids: Ids of the chunks to search, e.g. those matching a metadata filter. Defaults to all chunks.
+        :return: List of (chunk id, BM25 score) pairs, best first. Chunks sharing no term with the query are omitted.
+        """
+        query_terms: List[str] = list(set(tokenize(query)))
+        with self._lock:
+            if not self._id_to_number or k <= 0:
+                return []
+            chunk_count: int = len(self._id_to_number)
+            average_length: float = max(self._total_length / chunk_count, 1.0)
+            lengths: np.ndarray = np.array(self._chunk_lengths, dtype=np.int32)
+            alive: np.ndarray = np.array(self._alive, dtype=np.bool_)
+            # Other chunks still count in the document frequencies, so their scores are only masked out at the end
+            candidates: np.ndarray = alive
+            if chunk_ids is not None:
+                candidates = np.zeros(len(alive), dtype=np.bool_)
+                candidates[
+                    [self._id_to_number[chunk_id] for chunk_id in chunk_ids if chunk_id in self._id_to_number]
+                ] = True
+            postings: List[Tuple[np.ndarray, np.ndarray]] = [
+                (np.array(self._postings[term][0], dtype=np.int32), np.array(self._postings[term][1], dtype=np.int32))
+                for term in query_terms
+                if term in self._postings
+            ]
+
+        length_norm: np.ndarray = self.k1 * (1.0 - self.b + self.b * lengths / average_length)
+        scores: np.ndarray = np.zeros(len(alive), dtype=np.float32)
+        for numbers, frequencies in postings:
+            # Postings of deleted chunks stay until the index is saved, so they are left out of the document frequency
+            frequency_in_chunks: int = int(np.count_nonzero(alive[numbers]))
+            idf: float = math.log(1.0 + (chunk_count - frequency_in_chunks + 0.5) / (frequency_in_chunks + 0.5))
+            scores[numbers] += idf * frequencies * (self.k1 + 1.0) / (frequencies + length_norm[numbers])
+
+        live: np.ndarray = np.flatnonzero((scores > 0) & candidates)
+        if len(live) == 0:
+            return []
+        best: np.ndarray = live[np.argsort(-scores[live], kind="stable")[:k]]
+        with self._lock:
+            found: List[Tuple[Optional[str], float]] = [
+                (self._chunk_ids[number], float(scores[number])) for number in best
+            ]
+        # Chunks deleted since the snapshot are left out
+        return [(chunk_id, score) for chunk_id, score in found if chunk_id is not None]
+
+    # pylint: disable=too-many-locals
+    def dump(self, path: str) -> None:
+        """
+        Save the index without its deleted chunks. The file is written to a temporary name and renamed into place.
+
+        :param path: Path of the ".npz" file
+        """
+        with self._lock:
+            renumber: np.ndarray = np.full(len(self._chunk_ids), -1, dtype=np.int32)
+            live: List[int] = [number for number, chunk_id in enumerate(self._chunk_ids) if chunk_id is not None]
+            renumber[live] = np.arange(len(live), dtype=np.int32)
+            live_chunk_ids: List[str] = [self._chunk_ids[number] for number in live]
+            chunk_lengths: np.ndarray = np.array(self._chunk_lengths, dtype=np.int32)[live]
+
+            terms: List[str] = []
+            offsets: List[int] = [0]
+            numbers_parts: List[np.ndarray] = []
+            frequencies_parts: List[np.ndarray] = []
+            for term, (numbers, frequencies) in self._postings.items():
+                new_numbers: np.ndarray = renumber[np.array(numbers, dtype=np.int32)]
+                keep: np.ndarray = new_numbers >= 0
+                if not keep.any():
+                    continue
+                terms.append(term)
+                numbers_parts.append(new_numbers[keep])
+                frequencies_parts.append(np.array(frequencies, dtype=np.int32)[keep])
+                offsets.append(offsets[-1] + int(keep.sum()))
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path + ".tmp", "wb") as index_file:
+            np.savez(
+                index_file,
+                params=np.asarray([self.k1, self.b]),
+                chunk_ids=np.frombuffer(json.dumps(live_chunk_ids).encode("utf-8"), np.uint8),
+                terms=np.frombuffer(json.dumps(terms).encode("utf-8"), np.uint8),
+                chunk_lengths=chunk_lengths,
+                offsets=np.asarray(offsets, dtype=np.int64),
+                numbers=np.concatenate(numbers_parts) if numbers_parts else np.zeros(0, np.int32),
+                frequencies=np.concatenate(frequencies_parts) if frequencies_parts else np.zeros(0, np.int32),
+            )
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def load(cls, path: str) -> "Bm25Index":
+        """
+        :param path: Path of a file saved with dump()
+        :return: The loaded index
+        :raises FileNotFoundError: If there is no index at the path
+        """
+        with np.load(path) as saved:
+            k1, b = (float(value) for value in np.asarray(saved["params"]))
+            index = cls(k1=k1, b=b)
+            index._chunk_ids = json.loads(np.asarray(saved["chunk_ids"]).tobytes())
+            index._chunk_lengths = array("i", np.asarray(saved["chunk_lengths"], dtype=np.int32).tobytes())
+            offsets: np.ndarray = np.asarray(saved["offsets"])
+            numbers: np.ndarray = np.asarray(saved["numbers"], dtype=np.int32)
+            frequencies: np.ndarray = np.asarray(saved["frequencies"], dtype=np.int32)
+            for position, term in enumerate(json.loads(np.asarray(saved["terms"]).tobytes())):
+                start, end = offsets[position], offsets[position + 1]
+                index._postings[term] = (
+                    array("i", numbers[start:end].tobytes()),
+                    array("i", frequencies[start:end].tobytes()),
+                )
+        index._alive = bytearray(b"\x01" * len(index._chunk_ids))
+        index._id_to_number = {chunk_id: number for number, chunk_id in enumerate(index._chunk_ids)}
+        index._total_length = int(sum(index._chunk_lengths))
+        return index
@@ -0,0 +1,35 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Location of the on-disk caches shared by the RAG tools."""
+
+import os
+
+DEFAULT_RAG_CACHE_DIR = os.path.join("~", ".cache", "neuro-san-studio", "rag")
+
+
+def get_rag_cache_dir(subdir: str = "") -> str:
+    """
+    Return (and create) a directory under the RAG cache root.
+    The root defaults to ~/.cache/neuro-san-studio/rag and can be changed with RAG_CACHE_DIR.
+
+    :param subdir: Optional sub-directory for a specific cache
+    :return: Absolute path of the directory
+    """
+    root: str = os.path.expanduser(os.getenv("RAG_CACHE_DIR", DEFAULT_RAG_CACHE_DIR))
+    path: str = os.path.abspath(os.path.join(root, subdir))
+    os.makedirs(path, exist_ok=True)
+    return path
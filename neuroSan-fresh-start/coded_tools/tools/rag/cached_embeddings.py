@@ -0,0 +1,282 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Content-addressed, SQLite-backed embedding cache shared by all RAG tools.
+
+Vectors are keyed by embedding model, dimensions and the sha256 of the chunk text, so rebuilding a store over mostly
+unchanged documents costs almost no embedding calls. The database is "embeddings.sqlite" in the RAG cache directory,
+or RAG_EMBEDDING_CACHE_PATH.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# pylint: disable=import-error
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from coded_tools.tools.rag.cache_paths import get_rag_cache_dir
+
+EMBEDDING_CACHE_FILE = "embeddings.sqlite"
+# SQLite limits the number of host parameters per statement, so look up keys in batches
+LOOKUP_BATCH_SIZE = 500
+# Number of recent query embeddings kept in memory per CachedEmbeddings instance
+QUERY_MEMO_SIZE = 256
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingStore:
+    """
+    Thread-safe SQLite table of float32 embedding vectors keyed by (model, dimensions, sha256(text)).
+    One store is shared per database file within the process.
+    """
+
+    _shared: Dict[str, "EmbeddingStore"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, db_path: str):
+        """
+        :param db_path: Path of the SQLite database file. Created if missing.
+        """
+        self.db_path: str = db_path
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "model TEXT NOT NULL, dimensions INTEGER NOT NULL, text_hash TEXT NOT NULL, vector BLOB NOT NULL, "
+            "PRIMARY KEY (model, dimensions, text_hash)) WITHOUT ROWID"
+        )
+        self._connection.commit()
+
+    @classmethod
+    def get_shared(cls, db_path: Optional[str] = None) -> "EmbeddingStore":
+        """
+        :param db_path: Database file. Defaults to embeddings.sqlite in the RAG cache directory.
+        :return: The process-wide store for that file
+        """
+        db_path = os.path.abspath(db_path or os.path.join(get_rag_cache_dir(), EMBEDDING_CACHE_FILE))
+        with cls._shared_lock:
+            store = cls._shared.get(db_path)
+            if store is None:
+                store = cls(db_path)
+                cls._shared[db_path] = store
+            return store
+
+    def get_many(self, model: str, dimensions: int, text_hashes: List[str]) -> Dict[str, List[float]]:
+        """
+        Look up cached vectors.
+
+        :param model: Embedding model name
+        :param dimensions: Embedding dimensions
+        :param text_hashes: sha256 hex digests of the texts
+        :return: Dictionary of text hash to vector, for the hashes that are cached
+        """
+        found: Dict[str, List[float]] = {}
+        unique_hashes: List[str] = list(dict.fromkeys(text_hashes))
+        with self._lock:
+            for start in range(0, len(unique_hashes), LOOKUP_BATCH_SIZE):
+                batch = unique_hashes[start : start + LOOKUP_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._connection.execute(
+                    "SELECT text_hash, vector FROM embeddings "
+                    f"WHERE model = ? AND dimensions = ? AND text_hash IN ({placeholders})",
+                    [model, dimensions, *batch],
+                ).fetchall()
+                for text_hash, blob in rows:
+                    found[text_hash] = np.frombuffer(blob, dtype=np.float32).tolist()
+        return found
+
+    def put_many(self, model: str, dimensions: int, vectors: Dict[str, List[float]]) -> None:
+        """
+        Store vectors.
+
+        :param model: Embedding model name
+        :param dimensions: Embedding dimensions
+        :param vectors: Dictionary of text hash to vector
+        """
+        rows = [
+            (model, dimensions, text_hash, np.asarray(vector, dtype=np.float32).tobytes())
+            for text_hash, vector in vectors.items()
+        ]
+        with self._lock:
+            self._connection.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?)", rows)
+            self._connection.commit()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that serves document embeddings from a persistent content-addressed cache
+    and only calls the underlying model for texts it has never seen.
+    The most recent query embeddings are kept in memory, so a query embedded for the query cache
+    is not embedded again by the retriever.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        underlying: Embeddings,
+        model: str,
+        dimensions: int,
+        store: Optional[EmbeddingStore] = None,
+    ):
+        """
+        :param underlying: Embeddings implementation used on cache misses
+        :param model: Embedding model name, part of the cache key
+        :param dimensions: Embedding dimensions, part of the cache key
+        :param store: Backing store. Defaults to the shared store in the RAG cache directory.
+        """
+        self.underlying: Embeddings = underlying
+        self.model: str = model
+        self.dimensions: int = dimensions
+        self.store: Optional[EmbeddingStore] = store
+        if self.store is None:
+            try:
+                self.store = EmbeddingStore.get_shared(os.getenv("RAG_EMBEDDING_CACHE_PATH"))
+            except (OSError, sqlite3.Error) as error:
+                logger.warning("Embedding cache unavailable, embedding without cache: %s\n", error)
+        self.hits: int = 0
+        self.misses: int = 0
+        self._query_vectors: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._query_lock = threading.Lock()
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        """
+        :param text: Chunk text
+        :return: sha256 hex digest of the UTF-8 encoded text
+        """
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _split_hits(self, texts: List[str]) -> Tuple[List[str], Dict[str, List[float]], Dict[str, str]]:
+        """
+        Look up the texts in the cache.
+
+        :param texts: Texts to embed
+        :return: Tuple of (text hashes, cached vectors by hash, unique texts to embed by hash)
+        """
+        text_hashes: List[str] = [self.hash_text(text) for text in texts]
+        cached: Dict[str, List[float]] = {}
+        if self.store is not None:
+            cached = self.store.get_many(self.model, self.dimensions, text_hashes)
+        missing: Dict[str, str] = {}
+        for text_hash, text in zip(text_hashes, texts):
+            if text_hash not in cached:
+                missing.setdefault(text_hash, text)
+        self.hits += sum(1 for text_hash in text_hashes if text_hash in cached)
+        self.misses += len(missing)
+        return text_hashes, cached, missing
+
+    def _merge(
+        self,
+        text_hashes: List[str],
+        cached: Dict[str, List[float]],
+        missing: Dict[str, str],
+        vectors: List[List[float]],
+    ) -> List[List[float]]:
+        """Store newly embedded vectors and return all vectors in input order."""
+        # Round new vectors to float32 like the stored ones, so results do not depend on cache hits
+        new_vectors: Dict[str, List[float]] = {
+            text_hash: np.asarray(vector, dtype=np.float32).tolist() for text_hash, vector in zip(missing, vectors)
+        }
+        if new_vectors and self.store is not None:
+            self.store.put_many(self.model, self.dimensions, new_vectors)
+        cached.update(new_vectors)
+        return [cached[text_hash] for text_hash in text_hashes]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed documents, serving previously seen texts from the cache.
+
+        :param texts: Texts to embed
+        :return: One vector per text
+        """
+        text_hashes, cached, missing = self._split_hits(texts)
+        vectors: List[List[float]] = []
+        if missing:
+            vectors = self.underlying.embed_documents(list(missing.values()))
+        return self._merge(text_hashes, cached, missing, vectors)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Asynchronously embed documents, serving previously seen texts from the cache.
+
+        :param texts: Texts to embed
+        :return: One vector per text
+        """
+        text_hashes, cached, missing = await asyncio.to_thread(self._split_hits, texts)
+        vectors: List[List[float]] = []
+        if missing:
+            vectors = await self.underlying.aembed_documents(list(missing.values()))
+        return await asyncio.to_thread(self._merge, text_hashes, cached, missing, vectors)
+
+    def _get_query_vector(self, text: str) -> Optional[List[float]]:
+        """
+        :param text: Query text
+        :return: The remembered embedding of the query, or None
+        """
+        with self._query_lock:
+            vector: Optional[List[float]] = self._query_vectors.get(text)
+            if vector is not None:
+                self._query_vectors.move_to_end(text)
+            return vector
+
+    def _put_query_vector(self, text: str, vector: List[float]) -> None:
+        """
+        :param text: Query text
+        :param vector: Embedding of the query, remembered until QUERY_MEMO_SIZE newer queries were embedded
+        """
+        with self._query_lock:
+            self._query_vectors[text] = vector
+            self._query_vectors.move_to_end(text)
+            while len(self._query_vectors) > QUERY_MEMO_SIZE:
+                self._query_vectors.popitem(last=False)
+
+    def embed_query(self, text: str) -> List[float]:
+        """
+        :param text: Query text
+        :return: Query vector from the underlying model, or from memory if the query was embedded recently
+        """
+        vector: Optional[List[float]] = self._get_query_vector(text)
+        if vector is None:
+            vector = self.underlying.embed_query(text)
+            self._put_query_vector(text, vector)
+        return vector
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """
+        :param text: Query text
+        :return: Query vector from the underlying model, or from memory if the query was embedded recently
+        """
+        vector: Optional[List[float]] = self._get_query_vector(text)
+        if vector is None:
+            vector = await self.underlying.aembed_query(text)
+            self._put_query_vector(text, vector)
+        return vector
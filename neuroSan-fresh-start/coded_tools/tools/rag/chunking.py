@@ -0,0 +1,253 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Chunking settings of the RAG tools, and the deduplication of chunks before they are embedded.
+
+Strategies:
+    "recursive"   split on paragraphs, then lines, then words, as RecursiveCharacterTextSplitter does by default
+    "structured"  split on markdown headings first, then paragraphs, lines and sentences, so that chunks
+                  follow the sections of the document
+
+Deduplication modes:
+    "none"   embed every chunk
+    "exact"  drop chunks whose text, with whitespace collapsed, was already seen, e.g. repeated page footers
+    "near"   also drop chunks whose simhash is within a few bits of one already seen, e.g. site navigation
+             that differs by a highlighted link or a page number
+Duplicates are dropped across all the sources of a build. A kept chunk lists the other sources whose copies of it
+were dropped in its "duplicate_sources" metadata, which filters on "source" also match. An incremental update only
+deduplicates the sources it indexes again against each other.
+
+estimate_chunking() of the RAG tools reports the chunks and tokens each setting would embed, and their cost at
+RAG_EMBEDDING_PRICE_PER_MILLION_TOKENS (default 0.02 USD).
+"""
+
+import hashlib
+import os
+import re
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# pylint: disable=import-error
+import numpy as np
+from langchain_core.documents import Document
+
+DEFAULT_CHUNK_SIZE = 100
+DEFAULT_CHUNK_OVERLAP = 50
+CHUNKING_STRATEGIES = ("recursive", "structured")
+DEDUP_MODES = ("none", "exact", "near")
+DEFAULT_CHUNKING_STRATEGY = "recursive"
+DEFAULT_DEDUP_MODE = "none"
+STRUCTURED_SEPARATORS = ["\n# ", "\n## ", "\n### ", "\n#### ", "\n\n", "\n", ". ", " ", ""]
+SIMHASH_BITS = 64
+# Chunks whose simhashes differ by at most this many bits are near duplicates
+NEAR_DUPLICATE_MAX_DISTANCE = 3
+# Simhashes are bucketed by each of their bands. Two simhashes within NEAR_DUPLICATE_MAX_DISTANCE bits
+# have at least one identical band, since there are more bands than differing bits.
+SIMHASH_BANDS = NEAR_DUPLICATE_MAX_DISTANCE + 1
+SHINGLE_WORDS = 3
+# Metadata field of a kept chunk listing the other sources whose copies of it were dropped
+DUPLICATE_SOURCES_FIELD = "duplicate_sources"
+# Price of embedding a million tokens with the default embedding model, overridable with
+# RAG_EMBEDDING_PRICE_PER_MILLION_TOKENS
+EMBEDDING_PRICE_PER_MILLION_TOKENS = float(os.getenv("RAG_EMBEDDING_PRICE_PER_MILLION_TOKENS", "0.02"))
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+WORD_PATTERN = re.compile(r"\w+")
+
+
+@dataclass(frozen=True)
+class ChunkingSettings:
+    """How the documents of a vector store are cut into chunks, and which chunks are embedded."""
+
+    # Chunk size and overlap, in tokens
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+    chunk_overlap: int = DEFAULT_CHUNK_OVERLAP
+    # One of CHUNKING_STRATEGIES
+    strategy: str = DEFAULT_CHUNKING_STRATEGY
+    # One of DEDUP_MODES
+    dedup: str = DEFAULT_DEDUP_MODE
+
+    def validate(self) -> None:
+        """
+        :raises ValueError: If a setting is out of range or unknown
+        """
+        if not isinstance(self.chunk_size, int) or self.chunk_size <= 0:
+            raise ValueError(f"chunk_size must be a positive integer, got: {self.chunk_size!r}")
+        if not isinstance(self.chunk_overlap, int) or not 0 <= self.chunk_overlap < self.chunk_size:
+            raise ValueError(f"chunk_overlap must be an integer from 0 to chunk_size - 1, got: {self.chunk_overlap!r}")
+        if self.strategy not in CHUNKING_STRATEGIES:
+            raise ValueError(
+                f"chunking_strategy must be one of {', '.join(CHUNKING_STRATEGIES)}, got: {self.strategy!r}"
+            )
+        if self.dedup not in DEDUP_MODES:
+            raise ValueError(f"chunk_dedup must be one of {', '.join(DEDUP_MODES)}, got: {self.dedup!r}")
+
+    @property
+    def separators(self) -> Optional[List[str]]:
+        """
+        :return: Separators of the text splitter, or None for its defaults
+        """
+        return STRUCTURED_SEPARATORS if self.strategy == "structured" else None
+
+
+class ChunkDeduplicator:
+    """
+    Drops the chunks already seen by this deduplicator, keeping the first occurrence, across all the sources
+    it filters. A chunk dropped as a copy of a chunk of another source is recorded against the kept one:
+    duplicate_sources lists, per kept chunk id, the other sources it stands in for, and aliases lists, per source,
+    the ids of the kept chunks standing in for its dropped ones. The RAG tools save the former in the metadata of
+    the kept chunks, so that filters on those sources still match them, and the latter in the source manifest,
+    so that the sources relying on a deleted chunk are indexed again.
+    """
+
+    def __init__(self, mode: str = DEFAULT_DEDUP_MODE, max_distance: int = NEAR_DUPLICATE_MAX_DISTANCE):
+        """
+        :param mode: One of DEDUP_MODES
+        :param max_distance: Largest number of differing simhash bits between near duplicates,
+            at most NEAR_DUPLICATE_MAX_DISTANCE
+        """
+        self.mode: str = mode
+        self.max_distance: int = min(max_distance, NEAR_DUPLICATE_MAX_DISTANCE)
+        self.dropped: int = 0
+        self.duplicate_sources: Dict[str, List[str]] = {}
+        self.aliases: Dict[str, List[str]] = {}
+        # sha256 of the normalized text -> (id, source) of the kept chunk
+        self._originals: Dict[bytes, Tuple[Optional[str], str]] = {}
+        # (band index, band value) -> (simhash, id, source) of the kept chunks having that band
+        self._bands: Dict[Tuple[int, int], List[Tuple[int, Optional[str], str]]] = {}
+
+    def filter(self, chunks: List[Document]) -> List[Document]:
+        """
+        :param chunks: Chunks in order, with their "source" metadata and, to be recorded as originals, their ids
+        :return: Chunks that are not duplicates of a chunk seen before, in order
+        """
+        if self.mode == "none":
+            return chunks
+        kept: List[Document] = []
+        for chunk in chunks:
+            source: str = str(chunk.metadata.get("source", ""))
+            original: Optional[Tuple[Optional[str], str]] = self.find_original(chunk.page_content, chunk.id, source)
+            if original is None:
+                kept.append(chunk)
+                continue
+            self.dropped += 1
+            original_id, original_source = original
+            # A source repeating its own chunk keeps the content either way
+            if original_id is not None and original_source != source:
+                sources: List[str] = self.duplicate_sources.setdefault(original_id, [])
+                if source not in sources:
+                    sources.append(source)
+                alias_ids: List[str] = self.aliases.setdefault(source, [])
+                if original_id not in alias_ids:
+                    alias_ids.append(original_id)
+        return kept
+
+    def find_original(
+        self, text: str, chunk_id: Optional[str] = None, source: str = ""
+    ) -> Optional[Tuple[Optional[str], str]]:
+        """
+        Check a text against the texts seen so far, and remember it if it is new.
+
+        :param text: Text of a chunk
+        :param chunk_id: Id of the chunk, if any
+        :param source: Source of the chunk
+        :return: (id, source) of the chunk the text duplicates, or None if it duplicates none
+        """
+        normalized: str = WHITESPACE_PATTERN.sub(" ", text).strip()
+        digest: bytes = hashlib.sha256(normalized.encode("utf-8")).digest()
+        original: Optional[Tuple[Optional[str], str]] = self._originals.get(digest)
+        if original is not None:
+            return original
+        self._originals[digest] = (chunk_id, source)
+        if self.mode != "near":
+            return None
+
+        fingerprint: int = simhash(normalized)
+        bands: List[Tuple[int, int]] = self._split_bands(fingerprint)
+        for band in bands:
+            for other, other_id, other_source in self._bands.get(band, ()):
+                if (fingerprint ^ other).bit_count() <= self.max_distance:
+                    return other_id, other_source
+        for band in bands:
+            self._bands.setdefault(band, []).append((fingerprint, chunk_id, source))
+        return None
+
+    @staticmethod
+    def _split_bands(fingerprint: int) -> List[Tuple[int, int]]:
+        """
+        :return: (band index, band value) of each band of the simhash
+        """
+        width: int = SIMHASH_BITS // SIMHASH_BANDS
+        mask: int = (1 << width) - 1
+        return [(band, (fingerprint >> (band * width)) & mask) for band in range(SIMHASH_BANDS)]
+
+
+def simhash(text: str) -> int:
+    """
+    :param text: Text to fingerprint
+    :return: 64-bit simhash of the lowercased word shingles of the text. Similar texts have close simhashes.
+    """
+    words: List[str] = WORD_PATTERN.findall(text.lower())
+    shingles: List[str] = [
+        " ".join(words[start : start + SHINGLE_WORDS]) for start in range(max(len(words) - SHINGLE_WORDS + 1, 1))
+    ]
+    digests: bytes = b"".join(
+        hashlib.blake2b(shingle.encode("utf-8"), digest_size=SIMHASH_BITS // 8).digest() for shingle in shingles
+    )
+    # One row of bits per shingle, most significant first, voted on column by column
+    bits: np.ndarray = np.unpackbits(np.frombuffer(digests, dtype=np.uint8).reshape(len(shingles), -1), axis=1)
+    majority: np.ndarray = 2 * bits.sum(axis=0, dtype=np.int64) > len(shingles)
+    return int.from_bytes(np.packbits(majority).tobytes(), "big")
+
+
+@dataclass
+class ChunkingEstimate:
+    """What building a vector store with some chunking settings would embed."""
+
+    settings: ChunkingSettings
+    # Number of loaded documents, e.g. PDF pages, and of their tokens
+    documents: int
+    document_tokens: int
+    # Chunks that would be embedded, after deduplication, and their tokens
+    chunks: int
+    tokens: int
+    # Chunks dropped as duplicates
+    duplicate_chunks: int
+
+    @property
+    def embedding_cost(self) -> float:
+        """
+        :return: Estimated cost of embedding the chunks, in USD, at EMBEDDING_PRICE_PER_MILLION_TOKENS
+        """
+        return self.tokens * EMBEDDING_PRICE_PER_MILLION_TOKENS / 1_000_000
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        :return: The estimate as a JSON-serializable dictionary
+        """
+        return {
+            **asdict(self),
+            "settings": asdict(self.settings),
+            "embedding_cost": self.embedding_cost,
+            # Tokens embedded per token of the documents, i.e. the cost of the overlap
+            "token_ratio": self.tokens / self.document_tokens if self.document_tokens else 0.0,
+        }
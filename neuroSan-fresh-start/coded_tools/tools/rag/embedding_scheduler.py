@@ -0,0 +1,403 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Token-budgeted, rate-limited and concurrent batching of document embedding requests.
+
+Configured with:
+    RAG_EMBEDDING_MAX_BATCH_TOKENS    tokens per request, counted with the splitter's tiktoken encoding (50000)
+    RAG_EMBEDDING_MAX_BATCH_SIZE      texts per request (1000)
+    RAG_EMBEDDING_MAX_CONCURRENCY     requests in flight (4). The ingestion batches are sized to fill them.
+    RAG_EMBEDDING_TOKENS_PER_MINUTE   account limit to stay under, none by default
+Rate-limited batches are retried on their own with jittered exponential backoff. Progress is logged.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+# pylint: disable=import-error
+import tiktoken
+from langchain_core.embeddings import Embeddings
+
+# tiktoken encoding shared with the text splitter, so chunk sizes and batch budgets are counted alike
+TIKTOKEN_ENCODING = "gpt2"
+# Defaults, overridable with the RAG_EMBEDDING_* environment variables read in EmbeddingScheduler.from_env()
+DEFAULT_MAX_BATCH_TOKENS = 50_000
+DEFAULT_MAX_BATCH_SIZE = 1000
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_RETRIES = 6
+# Exponential backoff bounds, in seconds, for retrying rate-limited batches
+BASE_RETRY_DELAY_SECONDS = 1.0
+MAX_RETRY_DELAY_SECONDS = 60.0
+# Minimum number of seconds between two progress log lines of one ingest
+PROGRESS_LOG_INTERVAL_SECONDS = 5.0
+HTTP_TOO_MANY_REQUESTS = 429
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EmbeddingBatch:
+    """A contiguous slice of the texts to embed, sent to the model in one request."""
+
+    start: int
+    end: int
+    tokens: int
+
+
+@dataclass
+class EmbeddingProgress:
+    """Progress and throughput of one embedding run."""
+
+    total_chunks: int
+    total_tokens: int
+    started_at: float
+    done_chunks: int = 0
+    done_tokens: int = 0
+    retries: int = 0
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """:return: Seconds since the run started"""
+        return max(time.monotonic() - self.started_at, 1e-9)
+
+    @property
+    def chunks_per_second(self) -> float:
+        """:return: Embedded chunks per second so far"""
+        return self.done_chunks / self.elapsed_seconds
+
+    @property
+    def tokens_per_second(self) -> float:
+        """:return: Embedded tokens per second so far"""
+        return self.done_tokens / self.elapsed_seconds
+
+
+class TokenBucket:
+    """
+    Thread-safe tokens-per-minute budget. Callers reserve tokens up front and sleep off any deficit,
+    so concurrent batches, even on different event loops, never exceed the budget together.
+    """
+
+    _shared: Dict[int, "TokenBucket"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, tokens_per_minute: int):
+        """
+        :param tokens_per_minute: Sustained budget, which is also the burst capacity
+        """
+        self.capacity: float = float(tokens_per_minute)
+        self.rate: float = tokens_per_minute / 60.0
+        self._available: float = self.capacity
+        self._updated: float = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_shared(cls, tokens_per_minute: int) -> "TokenBucket":
+        """
+        :param tokens_per_minute: Budget of the bucket
+        :return: The process-wide bucket for that budget, since rate limits apply per API key rather than per tool
+        """
+        with cls._shared_lock:
+            bucket = cls._shared.get(tokens_per_minute)
+            if bucket is None:
+                bucket = cls(tokens_per_minute)
+                cls._shared[tokens_per_minute] = bucket
+            return bucket
+
+    def reserve(self, tokens: int) -> float:
+        """
+        Take tokens from the bucket, possibly going into debt.
+
+        :param tokens: Tokens about to be sent. Requests larger than the capacity are charged the capacity.
+        :return: Seconds to wait before sending them
+        """
+        with self._lock:
+            now: float = time.monotonic()
+            self._available = min(self.capacity, self._available + (now - self._updated) * self.rate)
+            self._updated = now
+            self._available -= min(float(tokens), self.capacity)
+            if self._available >= 0:
+                return 0.0
+            return -self._available / self.rate
+
+    async def acquire(self, tokens: int) -> None:
+        """
+        Wait until the tokens fit in the budget.
+
+        :param tokens: Tokens about to be sent
+        """
+        delay: float = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """
+    :param error: Exception raised by an embeddings client
+    :return: True if it is an HTTP 429, e.g. openai.RateLimitError
+    """
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    return status_code == HTTP_TOO_MANY_REQUESTS
+
+
+def get_retry_after(error: BaseException) -> Optional[float]:
+    """
+    :param error: Rate limit exception
+    :return: Seconds requested by the Retry-After header, if any
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class EmbeddingScheduler:
+    """
+    Embeds many texts through an Embeddings client by packing them into batches bounded by token count,
+    keeping a fixed number of batches in flight, honoring a tokens-per-minute budget and retrying
+    rate-limited batches with jittered exponential backoff. Only the failing batch is retried.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+    def __init__(
+        self,
+        max_batch_tokens: int = DEFAULT_MAX_BATCH_TOKENS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        tokens_per_minute: Optional[int] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        token_counter: Optional[Callable[[str], int]] = None,
+    ):
+        """
+        :param max_batch_tokens: Maximum tokens per request. A single longer text is sent on its own.
+        :param max_batch_size: Maximum texts per request
+        :param max_concurrency: Maximum requests in flight
+        :param tokens_per_minute: Token budget shared by all schedulers with the same budget, or None for no limit
+        :param max_retries: Retries of a rate-limited batch before giving up
+        :param token_counter: Function counting the tokens of a text. Defaults to the splitter's tiktoken encoding.
+        """
+        self.max_batch_tokens: int = max_batch_tokens
+        self.max_batch_size: int = max_batch_size
+        self.max_concurrency: int = max_concurrency
+        self.bucket: Optional[TokenBucket] = TokenBucket.get_shared(tokens_per_minute) if tokens_per_minute else None
+        self.max_retries: int = max_retries
+        self.base_retry_delay: float = BASE_RETRY_DELAY_SECONDS
+        self.progress_callback: Optional[Callable[[EmbeddingProgress], None]] = None
+        self._token_counter: Optional[Callable[[str], int]] = token_counter
+
+    @classmethod
+    def from_env(cls) -> "EmbeddingScheduler":
+        """
+        :return: Scheduler configured by the RAG_EMBEDDING_MAX_BATCH_TOKENS, RAG_EMBEDDING_MAX_BATCH_SIZE,
+            RAG_EMBEDDING_MAX_CONCURRENCY and RAG_EMBEDDING_TOKENS_PER_MINUTE environment variables
+        """
+        tokens_per_minute: int = int(os.getenv("RAG_EMBEDDING_TOKENS_PER_MINUTE", "0"))
+        return cls(
+            max_batch_tokens=int(os.getenv("RAG_EMBEDDING_MAX_BATCH_TOKENS", str(DEFAULT_MAX_BATCH_TOKENS))),
+            max_batch_size=int(os.getenv("RAG_EMBEDDING_MAX_BATCH_SIZE", str(DEFAULT_MAX_BATCH_SIZE))),
+            max_concurrency=int(os.getenv("RAG_EMBEDDING_MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY))),
+            tokens_per_minute=tokens_per_minute or None,
+        )
+
+    def count_tokens(self, text: str) -> int:
+        """
+        :param text: Text to embed
+        :return: Number of tokens in the text
+        """
+        if self._token_counter is None:
+            encoding = tiktoken.get_encoding(TIKTOKEN_ENCODING)
+            self._token_counter = lambda value: len(encoding.encode(value, disallowed_special=()))
+        return self._token_counter(text)
+
+    def texts_in_flight(self, text_tokens: int) -> int:
+        """
+        :param text_tokens: Typical tokens per text, e.g. the chunk size
+        :return: Texts needed to keep max_concurrency full requests in flight
+        """
+        texts_per_batch: int = min(self.max_batch_size, max(1, self.max_batch_tokens // max(1, text_tokens)))
+        return self.max_concurrency * texts_per_batch
+
+    def pack(self, texts: List[str]) -> List[EmbeddingBatch]:
+        """
+        Greedily pack consecutive texts into batches within the token and size limits.
+
+        :param texts: Texts to embed
+        :return: Batches covering all texts in order
+        """
+        batches: List[EmbeddingBatch] = []
+        start: int = 0
+        tokens: int = 0
+        for index, text in enumerate(texts):
+            text_tokens: int = self.count_tokens(text)
+            full: bool = tokens + text_tokens > self.max_batch_tokens or index - start >= self.max_batch_size
+            if index > start and full:
+                batches.append(EmbeddingBatch(start=start, end=index, tokens=tokens))
+                start, tokens = index, 0
+            tokens += text_tokens
+        if start < len(texts):
+            batches.append(EmbeddingBatch(start=start, end=len(texts), tokens=tokens))
+        return batches
+
+    async def aembed_documents(self, embeddings: Embeddings, texts: List[str]) -> List[List[float]]:
+        """
+        Embed the texts in scheduled batches.
+
+        :param embeddings: Client used for each batch
+        :param texts: Texts to embed
+        :return: One vector per text, in input order
+        """
+        batches: List[EmbeddingBatch] = self.pack(texts)
+        progress = EmbeddingProgress(
+            total_chunks=len(texts), total_tokens=sum(batch.tokens for batch in batches), started_at=time.monotonic()
+        )
+        vectors: List[Optional[List[float]]] = [None] * len(texts)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        last_log: List[float] = [progress.started_at]
+
+        async def run_batch(batch: EmbeddingBatch) -> None:
+            async with semaphore:
+                batch_vectors = await self._embed_batch(embeddings, texts[batch.start : batch.end], batch, progress)
+            vectors[batch.start : batch.end] = batch_vectors
+            progress.done_chunks += batch.end - batch.start
+            progress.done_tokens += batch.tokens
+            if self.progress_callback is not None:
+                self.progress_callback(progress)
+            now: float = time.monotonic()
+            if now - last_log[0] >= PROGRESS_LOG_INTERVAL_SECONDS or progress.done_chunks == progress.total_chunks:
+                last_log[0] = now
+                self._log_progress(progress)
+
+        tasks = [asyncio.ensure_future(run_batch(batch)) for batch in batches]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return vectors
+
+    async def _embed_batch(
+        self, embeddings: Embeddings, texts: List[str], batch: EmbeddingBatch, progress: EmbeddingProgress
+    ) -> List[List[float]]:
+        """Send one batch, waiting for the token budget and retrying it while it is rate limited."""
+        attempt: int = 0
+        while True:
+            if self.bucket is not None:
+                await self.bucket.acquire(batch.tokens)
+            try:
+                return await embeddings.aembed_documents(texts)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                if not is_rate_limit_error(error) or attempt >= self.max_retries:
+                    raise
+                # Full jitter keeps concurrent batches from retrying in lockstep
+                delay: float = random.uniform(0, min(MAX_RETRY_DELAY_SECONDS, self.base_retry_delay * 2**attempt))
+                delay = max(delay, get_retry_after(error) or 0.0)
+                attempt += 1
+                progress.retries += 1
+                logger.warning(
+                    "Embedding batch of %d chunks rate limited, retry %d/%d in %.1fs\n",
+                    len(texts),
+                    attempt,
+                    self.max_retries,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+
+    @staticmethod
+    def _log_progress(progress: EmbeddingProgress) -> None:
+        logger.info(
+            "Embedded %d/%d chunks (%d/%d tokens) in %.1fs: %.1f chunks/s, %.0f tokens/s, %d retries\n",
+            progress.done_chunks,
+            progress.total_chunks,
+            progress.done_tokens,
+            progress.total_tokens,
+            progress.elapsed_seconds,
+            progress.chunks_per_second,
+            progress.tokens_per_second,
+            progress.retries,
+        )
+
+
+class ScheduledEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that routes asynchronous document embedding through an EmbeddingScheduler,
+    so any vector store's afrom_documents/aadd_documents gets batching, concurrency and rate limiting.
+    Synchronous calls and query embeddings are passed through unchanged.
+    """
+
+    def __init__(self, underlying: Embeddings, scheduler: Optional[EmbeddingScheduler] = None):
+        """
+        :param underlying: Embeddings client used for each batch
+        :param scheduler: Scheduler to use. Defaults to one configured from the environment.
+        """
+        self.underlying: Embeddings = underlying
+        self.scheduler: EmbeddingScheduler = scheduler or EmbeddingScheduler.from_env()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        :param texts: Texts to embed
+        :return: Vectors from the underlying model
+        """
+        return self.underlying.embed_documents(texts)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        :param texts: Texts to embed
+        :return: One vector per text, embedded in scheduled batches
+        """
+        if not texts:
+            return []
+        return await self.scheduler.aembed_documents(self.underlying, texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        """
+        :param text: Query text
+        :return: Query vector from the underlying model
+        """
+        return self.underlying.embed_query(text)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """
+        :param text: Query text
+        :return: Query vector from the underlying model
+        """
+        return await self.underlying.aembed_query(text)
+
+
+def find_scheduler(embeddings: Embeddings) -> Optional[EmbeddingScheduler]:
+    """
+    :param embeddings: Embeddings, possibly wrapping ScheduledEmbeddings, e.g. in CachedEmbeddings
+    :return: Scheduler of the ScheduledEmbeddings found, if any
+    """
+    while embeddings is not None:
+        if isinstance(embeddings, ScheduledEmbeddings):
+            return embeddings.scheduler
+        embeddings = getattr(embeddings, "underlying", None)
+    return None
@@ -0,0 +1,273 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+On-disk cache of downloaded RAG sources, revalidated with conditional GETs.
+
+Each URL is stored as two files named after the sha256 of the URL:
+    <hash><extension>    the response body, keeping the URL's extension so that parsers can detect the format
+    <hash>.meta.json     the URL, ETag, Last-Modified and time of the last download or revalidation
+
+Shared by the RAG tools in the "http" directory of the RAG cache. Configured with RAG_HTTP_CACHE_MAX_AGE_SECONDS
+(default 3600) and RAG_HTTP_CACHE_MAX_BYTES (default 1 GiB, 0 disables the cache).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Dict
+from typing import Optional
+from urllib.parse import urlparse
+
+# pylint: disable=import-error
+import requests
+
+from coded_tools.tools.rag.cache_paths import get_rag_cache_dir
+
+HTTP_CACHE_DIR = "http"
+META_SUFFIX = ".meta.json"
+# Defaults, overridable with RAG_HTTP_CACHE_MAX_BYTES (0 disables the cache) and RAG_HTTP_CACHE_MAX_AGE_SECONDS
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+DEFAULT_MAX_AGE_SECONDS = 3600.0
+# Bodies fetched this recently are not evicted, so that callers of fetch() can still open them
+DEFAULT_EVICTION_GRACE_SECONDS = 60.0
+DOWNLOAD_TIMEOUT_SECONDS = 60
+DOWNLOAD_CHUNK_BYTES = 1024 * 1024
+# Extensions longer than this are not kept, since they are unlikely to be file formats
+MAX_EXTENSION_LENGTH = 8
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """What is known about the cached body of a URL."""
+
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    # time.time() of the last download or successful revalidation
+    checked_at: float
+
+
+class HttpCache:
+    """
+    Thread-safe cache of response bodies keyed by URL and bounded by a disk budget.
+
+    A body younger than max_age_seconds is served without a request. An older one is revalidated
+    with If-None-Match / If-Modified-Since, so an unchanged source costs a 304 instead of a download.
+    If revalidation fails, the stale body is served and a warning logged. The least recently used
+    bodies are deleted when the budget is exceeded, except those fetched within eviction_grace_seconds
+    and those acquired and not yet released.
+    """
+
+    _shared: Optional["HttpCache"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+        eviction_grace_seconds: float = DEFAULT_EVICTION_GRACE_SECONDS,
+    ):
+        """
+        :param cache_dir: Directory of the cached bodies. Created if missing.
+        :param max_bytes: Disk budget for all bodies combined. 0 disables the cache.
+        :param max_age_seconds: Time during which a body is served without revalidation
+        :param eviction_grace_seconds: Time after a fetch during which a body is not evicted
+        """
+        self.cache_dir: str = cache_dir
+        self.max_bytes: int = max_bytes
+        self.max_age_seconds: float = max_age_seconds
+        self.eviction_grace_seconds: float = eviction_grace_seconds
+        os.makedirs(cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        # One lock per URL, so that concurrent fetches of the same URL download it once
+        self._url_locks: Dict[str, threading.Lock] = {}
+        # Number of callers reading each acquired body
+        self._readers: Dict[str, int] = {}
+
+    @classmethod
+    def get_shared(cls) -> "HttpCache":
+        """
+        :return: The process-wide cache in the http directory of the RAG cache, created on first use
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                max_bytes = int(os.getenv("RAG_HTTP_CACHE_MAX_BYTES", str(DEFAULT_MAX_BYTES)))
+                max_age_seconds = float(os.getenv("RAG_HTTP_CACHE_MAX_AGE_SECONDS", str(DEFAULT_MAX_AGE_SECONDS)))
+                cls._shared = cls(get_rag_cache_dir(HTTP_CACHE_DIR), max_bytes, max_age_seconds)
+            return cls._shared
+
+    @property
+    def enabled(self) -> bool:
+        """
+        :return: True if bodies are kept on disk
+        """
+        return self.max_bytes > 0
+
+    def fetch(self, url: str) -> str:
+        """
+        Return the cached body of a URL, downloading or revalidating it first if needed. Blocking.
+
+        :param url: http or https URL
+        :return: Path of the cached body. It stays valid until evicted, which does not happen within
+            eviction_grace_seconds. Use acquire() to read it for longer. Callers must not delete it.
+        """
+        key: str = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        with self._lock:
+            url_lock: threading.Lock = self._url_locks.setdefault(key, threading.Lock())
+        with url_lock:
+            return self._fetch_locked(url, key)
+
+    def acquire(self, url: str) -> str:
+        """
+        Fetch a URL like fetch(), keeping its body from eviction until it is released. Blocking.
+
+        :param url: http or https URL
+        :return: Path of the cached body, to pass to release() once read
+        """
+        body_path: str = self.fetch(url)
+        with self._lock:
+            self._readers[body_path] = self._readers.get(body_path, 0) + 1
+        return body_path
+
+    def release(self, body_path: str) -> None:
+        """
+        :param body_path: Path returned by acquire(), whose body may be evicted again once all its readers released it
+        """
+        with self._lock:
+            readers: int = self._readers.pop(body_path, 0) - 1
+            if readers > 0:
+                self._readers[body_path] = readers
+
+    def _fetch_locked(self, url: str, key: str) -> str:
+        """Fetch a URL while holding its lock."""
+        body_path: str = os.path.join(self.cache_dir, key + self._extension(url))
+        meta_path: str = os.path.join(self.cache_dir, key + META_SUFFIX)
+        cached: Optional[CachedResponse] = self._read_meta(meta_path) if os.path.exists(body_path) else None
+        if cached is not None and time.time() - cached.checked_at < self.max_age_seconds:
+            os.utime(body_path)
+            return body_path
+
+        downloaded: bool = False
+        headers: Dict[str, str] = {}
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached is not None and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+        try:
+            with requests.get(url, headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT_SECONDS) as response:
+                if cached is not None and response.status_code == 304:
+                    cached.checked_at = time.time()
+                    os.utime(body_path)
+                    logger.info("%s has not changed since it was cached\n", url)
+                else:
+                    response.raise_for_status()
+                    self._write_body(response, body_path)
+                    downloaded = True
+                    cached = CachedResponse(
+                        url=url,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                        checked_at=time.time(),
+                    )
+                    logger.info("Downloaded %s into the HTTP cache\n", url)
+        except requests.RequestException as error:
+            if cached is None:
+                raise
+            logger.warning("Could not revalidate %s, using the cached copy: %s\n", url, error)
+            os.utime(body_path)
+            return body_path
+
+        self._write_meta(meta_path, cached)
+        if downloaded:
+            self._evict(keep=body_path)
+        return body_path
+
+    @staticmethod
+    def _extension(url: str) -> str:
+        extension: str = os.path.splitext(urlparse(url).path)[1]
+        return extension if len(extension) <= MAX_EXTENSION_LENGTH else ""
+
+    @staticmethod
+    def _read_meta(meta_path: str) -> Optional[CachedResponse]:
+        try:
+            with open(meta_path, encoding="utf-8") as meta_file:
+                return CachedResponse(**json.load(meta_file))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    @staticmethod
+    def _write_meta(meta_path: str, cached: CachedResponse) -> None:
+        with open(meta_path + ".tmp", "w", encoding="utf-8") as meta_file:
+            json.dump(asdict(cached), meta_file)
+        os.replace(meta_path + ".tmp", meta_path)
+
+    @staticmethod
+    def _write_body(response: requests.Response, body_path: str) -> None:
+        """Stream a response into the body file, replacing it atomically once complete."""
+        temp_path: str = f"{body_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, "wb") as body_file:
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, body_file, DOWNLOAD_CHUNK_BYTES)
+            os.replace(temp_path, body_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _evict(self, keep: str) -> None:
+        """
+        Delete the least recently used bodies and their metadata until the cache fits in its budget,
+        skipping those fetched within eviction_grace_seconds or acquired.
+
+        :param keep: Path of the body just downloaded, which is kept even if it alone exceeds the budget
+        """
+        with self._lock:
+            now: float = time.time()
+            bodies = []
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith((META_SUFFIX, ".tmp")):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                bodies.append((stat.st_mtime, stat.st_size, entry.path))
+            bodies.sort()
+
+            total_bytes: int = sum(size for _, size, _ in bodies)
+            for modified_at, size, path in bodies:
+                if total_bytes <= self.max_bytes:
+                    break
+                # A body's modification time is set whenever it is fetched
+                recent: bool = now - modified_at < self.eviction_grace_seconds
+                if path == keep or recent or path in self._readers:
+                    continue
+                key: str = os.path.splitext(os.path.basename(path))[0]
+                for stale_path in [path, os.path.join(self.cache_dir, key + META_SUFFIX)]:
+                    if os.path.exists(stale_path):
+                        os.remove(stale_path)
+                total_bytes -= size
+                logger.info("Evicted %s from the HTTP cache\n", path)
@@ -0,0 +1,164 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Retriever fusing dense vector search and BM25 keyword search with reciprocal rank fusion.
+
+Both searches return their RAG_HYBRID_FETCH_K best chunks (default 20), fused with RAG_HYBRID_RRF_K (default 60).
+The keyword index is built during ingestion and saved next to the vector store as "<name>.bm25.npz"; postgres tables
+keep theirs in the "keyword_indexes" directory of the RAG cache. A store without one is searched by vector only.
+"""
+
+import asyncio
+import os
+from typing import Any
+from typing import Dict
+from typing import FrozenSet
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+# pylint: disable=import-error
+from langchain_core.callbacks import AsyncCallbackManagerForRetrieverRun
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.vectorstores import VectorStore
+
+from coded_tools.tools.rag.bm25_index import Bm25Index
+
+# Defaults, overridable with RAG_HYBRID_FETCH_K and RAG_HYBRID_RRF_K
+DEFAULT_FETCH_K = 20
+DEFAULT_RRF_K = 60
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[str]], rrf_k: int = DEFAULT_RRF_K) -> List[str]:
+    """
+    Merge rankings by summing 1 / (rrf_k + rank) over the rankings each id appears in.
+    Only ranks are used, so BM25 scores and cosine similarities need no common scale.
+
+    :param rankings: Lists of ids, best first
+    :param rrf_k: Damping constant; larger values flatten the advantage of top ranks
+    :return: Ids ordered by fused score, best first
+    """
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, item in enumerate(ranking):
+            scores[item] = scores.get(item, 0.0) + 1.0 / (rrf_k + rank + 1)
+    return sorted(scores, key=lambda item: -scores[item])
+
+
+class HybridRetriever(BaseRetriever):
+    """
+    Retrieves fetch_k chunks by vector similarity and fetch_k chunks by BM25, and returns the k best after fusion.
+    Exact terms such as policy codes or error strings are found by the keyword side even when their
+    embeddings are not close to the query, so a small k suffices.
+    A metadata filter restricts the vector side through search_kwargs and the keyword side through chunk_ids.
+    Queries are embedded with embeddings if given, else with the embeddings of the vector store.
+    """
+
+    vectorstore: VectorStore
+    keyword_index: Bm25Index
+    k: int = 4
+    fetch_k: int = DEFAULT_FETCH_K
+    rrf_k: int = DEFAULT_RRF_K
+    # Keyword arguments of the similarity searches, e.g. a filter
+    search_kwargs: Dict[str, Any] = {}
+    # Chunks the keyword search is restricted to, or None to search all of them
+    chunk_ids: Optional[FrozenSet[str]] = None
+    # Embeddings of the querying tool, see VectorRetriever
+    embeddings: Optional[Embeddings] = None
+
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+    @classmethod
+    def from_env(
+        cls,
+        vectorstore: VectorStore,
+        keyword_index: Bm25Index,
+        search_kwargs: Optional[Dict[str, Any]] = None,
+        chunk_ids: Optional[FrozenSet[str]] = None,
+        embeddings: Optional[Embeddings] = None,
+    ) -> "HybridRetriever":
+        """
+        :param vectorstore: Vector store holding the chunks
+        :param keyword_index: BM25 index over the same chunks
+        :param search_kwargs: Keyword arguments of the similarity searches, e.g. a filter
+        :param chunk_ids: Chunks the keyword search is restricted to, or None to search all of them
+        :param embeddings: Embeddings to embed queries with, by default those of the vector store
+        :return: Retriever configured by the RAG_HYBRID_FETCH_K and RAG_HYBRID_RRF_K environment variables
+        """
+        return cls(
+            vectorstore=vectorstore,
+            keyword_index=keyword_index,
+            search_kwargs=search_kwargs or {},
+            chunk_ids=chunk_ids,
+            embeddings=embeddings,
+            fetch_k=int(os.getenv("RAG_HYBRID_FETCH_K", str(DEFAULT_FETCH_K))),
+            rrf_k=int(os.getenv("RAG_HYBRID_RRF_K", str(DEFAULT_RRF_K))),
+        )
+
+    def _get_relevant_documents(self, query: str, *, run_manager: CallbackManagerForRetrieverRun) -> List[Document]:
+        dense: List[Document] = (
+            self.vectorstore.similarity_search_by_vector(
+                self.embeddings.embed_query(query), k=self.fetch_k, **self.search_kwargs
+            )
+            if self.embeddings is not None
+            else self.vectorstore.similarity_search(query, k=self.fetch_k, **self.search_kwargs)
+        )
+        keyword_results: List[Tuple[str, float]] = self.keyword_index.search(query, self.fetch_k, self.chunk_ids)
+        fused_ids, found = self._fuse(dense, keyword_results)
+        missing: List[str] = [chunk_id for chunk_id in fused_ids if chunk_id not in found]
+        if missing:
+            found.update((doc.id, doc) for doc in self.vectorstore.get_by_ids(missing))
+        return [found[chunk_id] for chunk_id in fused_ids if chunk_id in found]
+
+    async def _aget_relevant_documents(
+        self, query: str, *, run_manager: AsyncCallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        dense, keyword_results = await asyncio.gather(
+            self._adense_search(query),
+            asyncio.to_thread(self.keyword_index.search, query, self.fetch_k, self.chunk_ids),
+        )
+        fused_ids, found = self._fuse(dense, keyword_results)
+        missing: List[str] = [chunk_id for chunk_id in fused_ids if chunk_id not in found]
+        if missing:
+            found.update((doc.id, doc) for doc in await self.vectorstore.aget_by_ids(missing))
+        return [found[chunk_id] for chunk_id in fused_ids if chunk_id in found]
+
+    async def _adense_search(self, query: str) -> List[Document]:
+        """
+        :param query: The user query
+        :return: The fetch_k documents most similar to the query, best first
+        """
+        if self.embeddings is None:
+            return await self.vectorstore.asimilarity_search(query, k=self.fetch_k, **self.search_kwargs)
+        query_vector: List[float] = await self.embeddings.aembed_query(query)
+        return await self.vectorstore.asimilarity_search_by_vector(query_vector, k=self.fetch_k, **self.search_kwargs)
+
+    def _fuse(
+        self, dense: List[Document], keyword_results: List[Tuple[str, float]]
+    ) -> Tuple[List[str], Dict[str, Document]]:
+        """
+        :param dense: Documents found by vector similarity, best first
+        :param keyword_results: (chunk id, score) pairs found by BM25, best first
+        :return: Tuple of (the k best chunk ids after fusion, documents already fetched by id).
+            Chunks found only by BM25 still have to be fetched from the vector store.
+        """
+        rankings: List[List[str]] = [[doc.id for doc in dense], [chunk_id for chunk_id, _ in keyword_results]]
+        return reciprocal_rank_fusion(rankings, self.rrf_k)[: self.k], {doc.id: doc for doc in dense}
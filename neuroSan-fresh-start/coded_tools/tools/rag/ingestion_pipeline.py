@@ -0,0 +1,207 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Streaming load -> split -> embed -> insert pipeline with backpressure and a memory ceiling.
+
+Chunks are embedded and inserted in batches of RAG_INGEST_BATCH_SIZE (default 256), RAG_INGEST_MAX_INSERTS at a time
+(default 2). The chunks held by the pipeline are capped by RAG_INGEST_MAX_MEMORY_BYTES (default 256 MiB); once the cap
+is reached, loading pauses until inserted batches free memory.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# pylint: disable=import-error
+from langchain_core.documents import Document
+from langchain_core.vectorstores import VectorStore
+
+# Defaults, overridable with RAG_INGEST_MAX_MEMORY_BYTES, RAG_INGEST_BATCH_SIZE and RAG_INGEST_MAX_INSERTS
+DEFAULT_MAX_MEMORY_BYTES = 256 * 1024 * 1024
+DEFAULT_INSERT_BATCH_SIZE = 256
+DEFAULT_MAX_INSERTS_IN_FLIGHT = 2
+# Rough per-chunk cost on top of its text and metadata: the Document object and its embedding while in flight
+CHUNK_OVERHEAD_BYTES = 1536 * 8 + 512
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_chunk_bytes(chunk: Document) -> int:
+    """
+    :param chunk: Chunk waiting to be embedded and inserted
+    :return: Approximate memory held for it by the pipeline
+    """
+    return len(chunk.page_content) + len(str(chunk.metadata)) + CHUNK_OVERHEAD_BYTES
+
+
+class MemoryBudget:
+    """
+    Asynchronous byte budget. Acquiring waits until the bytes fit under the ceiling,
+    except that a single item is always admitted when nothing else is held, so oversized items cannot deadlock.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        :param max_bytes: Ceiling on the bytes held at once
+        """
+        self.max_bytes: int = max_bytes
+        self.in_use: int = 0
+        self.peak: int = 0
+        self._condition = asyncio.Condition()
+
+    def fits(self, num_bytes: int) -> bool:
+        """
+        :param num_bytes: Bytes about to be held
+        :return: True if acquiring them would not wait
+        """
+        return self.in_use == 0 or self.in_use + num_bytes <= self.max_bytes
+
+    async def acquire(self, num_bytes: int) -> None:
+        """
+        :param num_bytes: Bytes about to be held
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.fits(num_bytes))
+            self.in_use += num_bytes
+            self.peak = max(self.peak, self.in_use)
+
+    async def release(self, num_bytes: int) -> None:
+        """
+        :param num_bytes: Bytes no longer held
+        """
+        async with self._condition:
+            self.in_use -= num_bytes
+            self._condition.notify_all()
+
+
+@dataclass
+class IngestionStats:
+    """Outcome of one pipeline run."""
+
+    chunks: int = 0
+    batches: int = 0
+    peak_bytes: int = 0
+    seconds: float = 0.0
+
+
+class IngestionPipeline:
+    """
+    Streams chunks from an async iterator into a vector store in batches.
+    Loading and splitting happen lazily inside the iterator, which is only advanced while the chunks held by the
+    pipeline fit under the memory ceiling; a bounded queue of batches sits between that producer and the
+    workers that embed and insert them. Peak memory therefore depends on the ceiling, not on the corpus size.
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+        insert_batch_size: int = DEFAULT_INSERT_BATCH_SIZE,
+        max_inserts_in_flight: int = DEFAULT_MAX_INSERTS_IN_FLIGHT,
+    ):
+        """
+        :param max_memory_bytes: Ceiling on the estimated bytes of the chunks held by the pipeline
+        :param insert_batch_size: Chunks per aadd_documents() call
+        :param max_inserts_in_flight: Concurrent aadd_documents() calls
+        """
+        self.max_memory_bytes: int = max_memory_bytes
+        self.insert_batch_size: int = insert_batch_size
+        self.max_inserts_in_flight: int = max_inserts_in_flight
+
+    @classmethod
+    def from_env(cls) -> "IngestionPipeline":
+        """
+        :return: Pipeline configured by the RAG_INGEST_MAX_MEMORY_BYTES, RAG_INGEST_BATCH_SIZE
+            and RAG_INGEST_MAX_INSERTS environment variables
+        """
+        return cls(
+            max_memory_bytes=int(os.getenv("RAG_INGEST_MAX_MEMORY_BYTES", str(DEFAULT_MAX_MEMORY_BYTES))),
+            insert_batch_size=int(os.getenv("RAG_INGEST_BATCH_SIZE", str(DEFAULT_INSERT_BATCH_SIZE))),
+            max_inserts_in_flight=int(os.getenv("RAG_INGEST_MAX_INSERTS", str(DEFAULT_MAX_INSERTS_IN_FLIGHT))),
+        )
+
+    async def run(self, chunk_groups: AsyncIterator[List[Document]], vectorstore: VectorStore) -> IngestionStats:
+        """
+        Embed and insert every chunk produced by the iterator.
+
+        :param chunk_groups: Async iterator of chunk lists, e.g. the chunks of one source at a time
+        :param vectorstore: Store to insert into. Its embeddings are used for the chunks.
+        :return: Statistics of the run
+        """
+        started_at: float = time.monotonic()
+        budget = MemoryBudget(self.max_memory_bytes)
+        queue: "asyncio.Queue[Optional[Tuple[List[Document], int]]]" = asyncio.Queue(
+            maxsize=self.max_inserts_in_flight
+        )
+        stats = IngestionStats()
+
+        async def produce() -> None:
+            batch: List[Document] = []
+            batch_bytes: int = 0
+            async for chunks in chunk_groups:
+                for chunk in chunks:
+                    chunk_bytes: int = estimate_chunk_bytes(chunk)
+                    if batch and not budget.fits(chunk_bytes):
+                        # Hand over the partial batch, otherwise the budget it holds would never be released
+                        await queue.put((batch, batch_bytes))
+                        batch, batch_bytes = [], 0
+                    await budget.acquire(chunk_bytes)
+                    batch.append(chunk)
+                    batch_bytes += chunk_bytes
+                    if len(batch) >= self.insert_batch_size:
+                        await queue.put((batch, batch_bytes))
+                        batch, batch_bytes = [], 0
+            if batch:
+                await queue.put((batch, batch_bytes))
+            for _ in range(self.max_inserts_in_flight):
+                await queue.put(None)
+
+        async def consume() -> None:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                batch, batch_bytes = item
+                await vectorstore.aadd_documents(batch)
+                await budget.release(batch_bytes)
+                stats.chunks += len(batch)
+                stats.batches += 1
+
+        tasks = [asyncio.ensure_future(produce())]
+        tasks.extend(asyncio.ensure_future(consume()) for _ in range(self.max_inserts_in_flight))
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        stats.peak_bytes = budget.peak
+        stats.seconds = time.monotonic() - started_at
+        logger.info(
+            "Ingested %d chunks in %d batches in %.1fs, peak pipeline memory %.1f MiB\n",
+            stats.chunks,
+            stats.batches,
+            stats.seconds,
+            stats.peak_bytes / (1024 * 1024),
+        )
+        return stats
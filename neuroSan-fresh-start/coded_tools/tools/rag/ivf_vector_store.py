@@ -0,0 +1,269 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Approximate nearest neighbour search over a NumpyVectorStore with an inverted file (IVF) index.
+
+The rows are clustered with spherical k-means; a query is compared with the cluster centroids
+and only the rows of the n_probe closest clusters are scored exactly. The index is saved next to the matrix:
+    store.ivf.npz        centroids and the cluster of every row
+
+Used by the "ann" vector store type. Configured with RAG_ANN_NLIST, the number of clusters (default: the square root
+of the number of rows), RAG_ANN_NPROBE, the clusters scored per query (default 16, higher for better recall), and
+RAG_ANN_MIN_ROWS, under which stores are searched exactly (default 4096). Compare with exact search with
+`python -m benchmarks.ann_benchmark`.
+"""
+
+import logging
+import math
+import os
+import threading
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+# pylint: disable=import-error
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from coded_tools.tools.rag.numpy_vector_store import NORM_EPSILON
+from coded_tools.tools.rag.numpy_vector_store import NumpyVectorStore
+from coded_tools.tools.rag.numpy_vector_store import sidecar_path
+
+IVF_SUFFIX = ".ivf.npz"
+# Defaults, overridable with RAG_ANN_NLIST, RAG_ANN_NPROBE and RAG_ANN_MIN_ROWS
+DEFAULT_N_PROBE = 16
+DEFAULT_MIN_ROWS = 4096
+# k-means settings: training uses a sample of the rows, which is enough to place the centroids
+KMEANS_ITERATIONS = 10
+TRAINING_ROWS_PER_LIST = 32
+MAX_TRAINING_ROWS = 65536
+# Rows scored per matrix product when assigning rows to clusters, to bound temporary memory
+ASSIGN_BLOCK_ROWS = 16384
+# The centroids are retrained once the store has grown this much since training
+RETRAIN_GROWTH_FACTOR = 4
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """
+    :param vectors: float32 matrix
+    :return: Copy of the matrix with unit-length rows
+    """
+    return vectors / (np.linalg.norm(vectors, axis=1, keepdims=True) + NORM_EPSILON)
+
+
+class IvfVectorStore(NumpyVectorStore):
+    """
+    NumpyVectorStore searched through an IVF index instead of a full scan.
+    n_probe trades recall for latency: probing more clusters scores more rows.
+    Stores smaller than min_rows are searched exactly, where a full scan is already fast.
+
+    The index is built lazily on the first search, rows added later are assigned to the existing clusters,
+    and the clusters are retrained once the store has grown by RETRAIN_GROWTH_FACTOR since training.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        embedding: Embeddings,
+        n_lists: Optional[int] = None,
+        n_probe: Optional[int] = None,
+        min_rows: Optional[int] = None,
+    ):
+        """
+        :param embedding: Embeddings used for queries and for texts added later
+        :param n_lists: Number of clusters. Defaults to RAG_ANN_NLIST, or the square root of the number of rows.
+        :param n_probe: Clusters scored per query. Defaults to RAG_ANN_NPROBE.
+        :param min_rows: Smallest store searched through the index. Defaults to RAG_ANN_MIN_ROWS.
+        """
+        super().__init__(embedding=embedding)
+        self.n_lists: int = n_lists or int(os.getenv("RAG_ANN_NLIST", "0"))
+        self.n_probe: int = n_probe or int(os.getenv("RAG_ANN_NPROBE", str(DEFAULT_N_PROBE)))
+        self.min_rows: int = (
+            min_rows if min_rows is not None else int(os.getenv("RAG_ANN_MIN_ROWS", str(DEFAULT_MIN_ROWS)))
+        )
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments: np.ndarray = np.zeros(0, dtype=np.int32)
+        self._trained_rows: int = 0
+        # Rows of each cluster, concatenated in cluster order, and where each cluster starts
+        self._list_rows: np.ndarray = np.zeros(0, dtype=np.int64)
+        self._list_offsets: np.ndarray = np.zeros(1, dtype=np.int64)
+        self._index_stale: bool = True
+        self._index_lock = threading.Lock()
+
+    # ---------- search ----------
+    def search_rows(
+        self, query_vector: Sequence[float], k: int, n_probe: Optional[int] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        Approximate top-k cosine similarity search.
+
+        :param query_vector: Query embedding
+        :param k: Number of results
+        :param n_probe: Clusters to score for this query. Defaults to the store's n_probe.
+        :return: List of (row, similarity) pairs, best first
+        """
+        if len(self) == 0 or k <= 0 or not self._ensure_index():
+            return self.exact_search_rows(query_vector, k)
+
+        query: np.ndarray = np.asarray(query_vector, dtype=np.float32)
+        probed: int = min(n_probe or self.n_probe, len(self._centroids))
+        closest: np.ndarray = np.argpartition(-(self._centroids @ query), probed - 1)[:probed]
+        # Sorted rows are gathered from the matrix in memory order
+        candidates: np.ndarray = np.sort(
+            np.concatenate(
+                [self._list_rows[self._list_offsets[cluster] : self._list_offsets[cluster + 1]] for cluster in closest]
+            )
+        )
+        if len(candidates) < k:
+            return self.exact_search_rows(query_vector, k)
+
+        scores: np.ndarray = (self._matrix[candidates] @ query) / (
+            self._norms[candidates] * np.linalg.norm(query) + NORM_EPSILON
+        )
+        return self._top_k(scores, candidates, k)
+
+    def exact_search_rows(self, query_vector: Sequence[float], k: int) -> List[Tuple[int, float]]:
+        """
+        Full scan, as done by NumpyVectorStore. Used for small stores and as ground truth for recall.
+
+        :param query_vector: Query embedding
+        :param k: Number of results
+        :return: List of (row, similarity) pairs, best first
+        """
+        return super().search_rows(query_vector, k)
+
+    def similarity_search_with_score_by_vector(
+        self, embedding: List[float], k: int = 4, **kwargs: Any
+    ) -> List[Tuple[Document, float]]:
+        """
+        :param embedding: Query embedding
+        :param k: Number of results
+        :param kwargs: May contain n_probe to override the store's recall/latency trade-off for this query
+            or filter, chunk ids to restrict an exact search to
+        :return: List of (document, cosine similarity) pairs, best first
+        """
+        if kwargs.get("filter") is not None:
+            return super().similarity_search_with_score_by_vector(embedding, k, **kwargs)
+        rows: List[Tuple[int, float]] = self.search_rows(embedding, k, kwargs.get("n_probe"))
+        return [(self._row_to_document(row), score) for row, score in rows]
+
+    # ---------- index ----------
+    def build_index(self) -> None:
+        """Train the clusters on the current rows and assign every row, instead of waiting for the first search."""
+        with self._index_lock:
+            self._train()
+            self._assign()
+
+    def _ensure_index(self) -> bool:
+        """
+        :return: True if the store is large enough to be searched through the index, which is then up to date
+        """
+        if len(self) < self.min_rows:
+            return False
+        with self._index_lock:
+            if self._centroids is None or len(self) > RETRAIN_GROWTH_FACTOR * self._trained_rows:
+                self._train()
+            if self._index_stale:
+                self._assign()
+        return True
+
+    def _train(self) -> None:
+        """Place the centroids with spherical k-means over a sample of the rows."""
+        rows: int = len(self)
+        n_lists: int = min(self.n_lists or max(1, int(math.sqrt(rows))), rows)
+        rng = np.random.default_rng(0)
+        sample_size: int = min(rows, max(n_lists * TRAINING_ROWS_PER_LIST, n_lists), MAX_TRAINING_ROWS)
+        sample: np.ndarray = normalize_rows(np.asarray(self._matrix[np.sort(rng.choice(rows, sample_size, False))]))
+
+        centroids: np.ndarray = sample[rng.choice(sample_size, n_lists, replace=False)].copy()
+        for _ in range(KMEANS_ITERATIONS):
+            labels: np.ndarray = np.argmax(sample @ centroids.T, axis=1)
+            sums: np.ndarray = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            empty: np.ndarray = np.bincount(labels, minlength=n_lists) == 0
+            # Re-seed empty clusters with random sample rows so that every cluster stays useful
+            sums[empty] = sample[rng.choice(sample_size, int(empty.sum()))]
+            centroids = normalize_rows(sums)
+
+        self._centroids = centroids.astype(np.float32)
+        self._trained_rows = rows
+        # Assignments to the previous clusters are meaningless, so every row is assigned again
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._index_stale = True
+        logger.info("Trained IVF index with %d clusters on %d of %d rows\n", n_lists, sample_size, rows)
+
+    def _assign(self) -> None:
+        """Assign the rows not assigned yet to their closest cluster and rebuild the cluster lists."""
+        rows: int = len(self)
+        start: int = len(self._assignments) if len(self._assignments) <= rows else 0
+        assignments: np.ndarray = np.empty(rows, dtype=np.int32)
+        assignments[:start] = self._assignments[:start]
+        for block in range(start, rows, ASSIGN_BLOCK_ROWS):
+            end: int = min(block + ASSIGN_BLOCK_ROWS, rows)
+            # The row norms do not change which centroid scores highest, so raw rows are compared
+            assignments[block:end] = np.argmax(np.asarray(self._matrix[block:end]) @ self._centroids.T, axis=1)
+
+        self._assignments = assignments
+        self._list_rows = np.argsort(assignments, kind="stable")
+        self._list_offsets = np.zeros(len(self._centroids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignments, minlength=len(self._centroids)), out=self._list_offsets[1:])
+        self._index_stale = False
+
+    def _on_rows_changed(self) -> None:
+        self._index_stale = True
+
+    def delete(self, ids: Optional[Sequence[str]] = None, **kwargs: Any) -> Optional[bool]:
+        deleted: Optional[bool] = super().delete(ids, **kwargs)
+        if deleted:
+            # Rows moved, so every row is reassigned to the existing clusters on the next search
+            self._assignments = np.zeros(0, dtype=np.int32)
+        return deleted
+
+    # ---------- persistence ----------
+    def _dump_extra(self, path: str) -> None:
+        if len(self) >= self.min_rows:
+            self._ensure_index()
+        if self._centroids is None:
+            return
+        ivf_path: str = sidecar_path(path, IVF_SUFFIX)
+        with open(ivf_path + ".tmp", "wb") as ivf_file:
+            np.savez(
+                ivf_file,
+                centroids=self._centroids,
+                assignments=self._assignments,
+                trained_rows=np.asarray(self._trained_rows),
+            )
+        os.replace(ivf_path + ".tmp", ivf_path)
+
+    def _load_extra(self, path: str) -> None:
+        ivf_path: str = sidecar_path(path, IVF_SUFFIX)
+        if not os.path.exists(ivf_path):
+            return
+        with np.load(ivf_path) as ivf:
+            if len(ivf["assignments"]) != len(self):
+                logger.warning("Ignoring IVF index %s that does not match the store. It will be rebuilt.\n", ivf_path)
+                return
+            self._centroids = ivf["centroids"]
+            self._assignments = ivf["assignments"]
+            self._trained_rows = int(ivf["trained_rows"])
+        self._assign()
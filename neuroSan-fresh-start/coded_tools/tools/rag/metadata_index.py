@@ -0,0 +1,412 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Metadata filters for RAG queries, and the per-field index that resolves them to chunk ids
+so that only the matching chunks are scored.
+
+Filters use the syntax of langchain-postgres, so the same filter is pushed down to postgres as a WHERE clause:
+    {"source": "https://example.com/a.pdf"}                   equality
+    {"source": ["a.pdf", "b.pdf"]}                             any of the values, i.e. {"$in": [...]}
+    {"page": {"$gte": 3, "$lte": 7}, "space_key": "DAI"}       operators, all conditions must hold
+    {"$or": [{"source": "a.pdf"}, {"page": {"$lt": 2}}]}       "$and" and "$or" of filters
+Supported operators are $eq, $ne, $lt, $lte, $gt, $gte, $in, $nin and $between.
+As in postgres, chunks without the field never match, not even "$ne" or "$nin".
+
+Values are compared as postgres compares metadata->>'field': the stored value as JSON text, cast to the type of
+the filter value. {"page": 3} and {"page": "3"} both match a page stored as 3 or "3", a string filter compares
+text, so {"page": {"$gt": "10"}} matches page 9, and {"flag": 1} does not match a flag stored as true.
+A value that postgres could not cast, which fails the whole query there, never matches here.
+
+A chunk kept in place of duplicate chunks of other sources lists them in its "duplicate_sources" metadata, and
+"source" equality filters match it for those sources too: the index looks the sources up in that list as well,
+and postgres filters are extended with include_duplicate_sources(). "$ne" and "$nin" on "source" only consider
+the source of a chunk.
+
+In-memory stores save their index next to them as "<name>.metadata.json". New postgres tables get an index on the
+"source" field, or on the comma-separated fields of RAG_PG_METADATA_INDEX_FIELDS.
+"""
+
+import json
+import os
+from operator import ge
+from operator import gt
+from operator import le
+from operator import lt
+from operator import ne
+from typing import Any
+from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+# pylint: disable=import-error
+from langchain_core.vectorstores import InMemoryVectorStore
+from langchain_core.vectorstores import VectorStore
+
+from coded_tools.tools.rag.chunking import DUPLICATE_SOURCES_FIELD
+from coded_tools.tools.rag.numpy_vector_store import NumpyVectorStore
+
+METADATA_INDEX_SUFFIX = ".metadata.json"
+METADATA_INDEX_FORMAT_VERSION = 1
+LOGICAL_OPERATORS = ("$and", "$or")
+FIELD_OPERATORS = ("$eq", "$ne", "$lt", "$lte", "$gt", "$gte", "$in", "$nin", "$between")
+COMPARISONS = {
+    "$ne": ne,
+    "$lt": lt,
+    "$lte": le,
+    "$gt": gt,
+    "$gte": ge,
+}
+# Metadata values of these types are indexed. Other values, e.g. lists, cannot be filtered on.
+SCALAR_TYPES = (str, int, float, bool)
+SOURCE_FIELD = "source"
+# Characters escaped in a LIKE pattern, with the default escape character first
+LIKE_SPECIAL_CHARACTERS = ("\\", "%", "_")
+# Text accepted by a postgres cast to BOOLEAN, lowercased
+BOOLEAN_TEXTS = {
+    "t": True,
+    "true": True,
+    "y": True,
+    "yes": True,
+    "on": True,
+    "1": True,
+    "f": False,
+    "false": False,
+    "n": False,
+    "no": False,
+    "off": False,
+    "0": False,
+}
+
+
+def metadata_index_path(vector_store_path: str) -> str:
+    """
+    :param vector_store_path: Path of a saved vector store, e.g. "store.json" or "store.npy"
+    :return: Path of the metadata index saved next to it
+    """
+    return os.path.splitext(vector_store_path)[0] + METADATA_INDEX_SUFFIX
+
+
+def normalize_filter(metadata_filter: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate a filter and rewrite it with a single operator per field condition, as postgres expects.
+
+    :param metadata_filter: Filter as given in the tool arguments
+    :return: Equivalent filter made of {"$and": [...]}, {"$or": [...]} and {field: {operator: value}} conditions
+    :raises ValueError: If the filter is malformed or uses an unsupported operator
+    """
+    if not isinstance(metadata_filter, dict) or not metadata_filter:
+        raise ValueError(f"A filter must be a non-empty dictionary, got: {metadata_filter!r}")
+
+    conditions: List[Dict[str, Any]] = []
+    for key, value in metadata_filter.items():
+        if key in LOGICAL_OPERATORS:
+            if not isinstance(value, list) or not value:
+                raise ValueError(f"'{key}' expects a non-empty list of filters, got: {value!r}")
+            conditions.append({key: [normalize_filter(sub_filter) for sub_filter in value]})
+        elif key.startswith("$"):
+            raise ValueError(f"Unsupported filter operator '{key}'. Expected a field, '$and' or '$or'.")
+        else:
+            conditions.extend(_normalize_field(key, value))
+    return conditions[0] if len(conditions) == 1 else {"$and": conditions}
+
+
+def _normalize_field(field: str, value: Any) -> List[Dict[str, Any]]:
+    """
+    :param field: Metadata field
+    :param value: Scalar, list of scalars or dictionary of operators
+    :return: One {field: {operator: value}} condition per operator
+    """
+    if not field.isidentifier():
+        raise ValueError(f"Invalid filter field '{field}'. Fields must be top-level metadata keys.")
+    if isinstance(value, list):
+        value = {"$in": value}
+    elif not isinstance(value, dict):
+        value = {"$eq": value}
+    if not value:
+        raise ValueError(f"No condition given for filter field '{field}'")
+
+    conditions: List[Dict[str, Any]] = []
+    for operator, operand in value.items():
+        if operator not in FIELD_OPERATORS:
+            raise ValueError(
+                f"Unsupported filter operator '{operator}'. Expected one of: {', '.join(FIELD_OPERATORS)}"
+            )
+        operands: List[Any] = operand if isinstance(operand, list) else [operand]
+        if operator in ("$in", "$nin") and (not isinstance(operand, list) or not operand):
+            raise ValueError(f"'{operator}' of '{field}' expects a non-empty list, got: {operand!r}")
+        if operator == "$between" and (not isinstance(operand, list) or len(operand) != 2):
+            raise ValueError(f"'$between' of '{field}' expects a [low, high] list, got: {operand!r}")
+        if operator not in ("$in", "$nin", "$between") and isinstance(operand, list):
+            raise ValueError(f"'{operator}' of '{field}' expects a single value, got: {operand!r}")
+        if not all(isinstance(item, SCALAR_TYPES) for item in operands):
+            raise ValueError(f"Filter values of '{field}' must be strings, numbers or booleans, got: {operand!r}")
+        conditions.append({field: {operator: operand}})
+    return conditions
+
+
+def as_text(value: Any) -> str:
+    """
+    :param value: Scalar metadata value
+    :return: Its text in postgres, as given by metadata->>'field'
+    """
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def cast_text(text: str, value_type: type) -> Any:
+    """
+    :param text: Text of a metadata value, see as_text()
+    :param value_type: Type of the filter value it is compared to
+    :return: The text cast to that type, as by postgres
+    :raises ValueError: If postgres could not cast the text either
+    """
+    if value_type is str:
+        return text
+    if value_type is bool:
+        if text.strip().lower() not in BOOLEAN_TEXTS:
+            raise ValueError(f"invalid input syntax for type boolean: {text!r}")
+        return BOOLEAN_TEXTS[text.strip().lower()]
+    return value_type(text)
+
+
+def include_duplicate_sources(metadata_filter: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extend the "source" equality conditions of a filter pushed down to postgres, so that they also match the chunks
+    whose "duplicate_sources" list the source. Postgres keeps the list as JSON text, which is matched with LIKE.
+
+    :param metadata_filter: Filter normalized with normalize_filter()
+    :return: Equivalent filter for the chunks of the sources, including the chunks kept in place of theirs
+    """
+    key, value = next(iter(metadata_filter.items()))
+    if key in LOGICAL_OPERATORS:
+        return {key: [include_duplicate_sources(sub_filter) for sub_filter in value]}
+    operator, operand = next(iter(value.items()))
+    if key != SOURCE_FIELD or operator not in ("$eq", "$in"):
+        return metadata_filter
+    sources: List[Any] = operand if operator == "$in" else [operand]
+    conditions: List[Dict[str, Any]] = [
+        {DUPLICATE_SOURCES_FIELD: {"$like": f"%{escape_like(json.dumps(source, ensure_ascii=False))}%"}}
+        for source in sources
+        if isinstance(source, str)
+    ]
+    return {"$or": [metadata_filter, *conditions]} if conditions else metadata_filter
+
+
+def escape_like(text: str) -> str:
+    """
+    :param text: Text to match literally
+    :return: The text with the special characters of a LIKE pattern escaped
+    """
+    for character in LIKE_SPECIAL_CHARACTERS:
+        text = text.replace(character, "\\" + character)
+    return text
+
+
+def filter_key(metadata_filter: Dict[str, Any]) -> str:
+    """
+    :param metadata_filter: Normalized filter
+    :return: Canonical text of the filter, e.g. to scope cached results
+    """
+    return json.dumps(metadata_filter, sort_keys=True, separators=(",", ":"))
+
+
+class MetadataIndex:
+    """
+    Inverted index of the scalar metadata of the chunks of a vector store: field -> value text -> chunk ids.
+    A filter is resolved from the distinct values of the fields it names, never by scanning chunks,
+    so a search restricted to its result only scores the matching chunks.
+    """
+
+    def __init__(self):
+        self._fields: Dict[str, Dict[str, Set[str]]] = {}
+        # Chunk id -> indexed metadata, to remove a chunk from the value sets it is in
+        self._chunks: Dict[str, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def add(self, chunk_ids: Iterable[str], metadatas: Iterable[Dict[str, Any]]) -> None:
+        """
+        Index chunks. Re-adding an indexed id replaces it.
+
+        :param chunk_ids: Ids of the chunks, as stored in the vector store
+        :param metadatas: Metadata of the chunks
+        """
+        for chunk_id, metadata in zip(chunk_ids, metadatas):
+            self.delete([chunk_id])
+            indexed: Dict[str, Any] = {
+                field: value for field, value in (metadata or {}).items() if isinstance(value, SCALAR_TYPES)
+            }
+            duplicate_sources: Any = (metadata or {}).get(DUPLICATE_SOURCES_FIELD)
+            if isinstance(duplicate_sources, list) and duplicate_sources:
+                indexed[DUPLICATE_SOURCES_FIELD] = [str(source) for source in duplicate_sources]
+            self._chunks[chunk_id] = indexed
+            for field, text in self._iter_values(indexed):
+                self._fields.setdefault(field, {}).setdefault(text, set()).add(chunk_id)
+
+    def update(self, metadatas: Dict[str, Dict[str, Any]]) -> None:
+        """
+        :param metadatas: Chunk id -> metadata fields to set. Unknown ids are ignored.
+        """
+        for chunk_id, fields in metadatas.items():
+            if chunk_id in self._chunks:
+                self.add([chunk_id], [{**self._chunks[chunk_id], **fields}])
+
+    def delete(self, chunk_ids: Iterable[str]) -> None:
+        """
+        :param chunk_ids: Ids of the chunks to remove. Unknown ids are ignored.
+        """
+        for chunk_id in chunk_ids:
+            for field, text in self._iter_values(self._chunks.pop(chunk_id, {})):
+                values: Dict[str, Set[str]] = self._fields[field]
+                values[text].discard(chunk_id)
+                if not values[text]:
+                    del values[text]
+                if not values:
+                    del self._fields[field]
+
+    @staticmethod
+    def _iter_values(indexed: Dict[str, Any]) -> Iterable[Tuple[str, str]]:
+        """
+        :param indexed: Indexed metadata of a chunk
+        :return: (field, value text) under which the chunk is indexed, once per duplicate source
+        """
+        for field, value in indexed.items():
+            if field == DUPLICATE_SOURCES_FIELD:
+                for source in value:
+                    yield field, source
+            else:
+                yield field, as_text(value)
+
+    def select(self, metadata_filter: Dict[str, Any]) -> FrozenSet[str]:
+        """
+        :param metadata_filter: Filter normalized with normalize_filter()
+        :return: Ids of the chunks matching the filter
+        """
+        key, value = next(iter(metadata_filter.items()))
+        if key == "$and":
+            # Intersect the smallest sets first
+            selections: List[FrozenSet[str]] = sorted((self.select(sub) for sub in value), key=len)
+            return frozenset.intersection(*selections)
+        if key == "$or":
+            return frozenset().union(*(self.select(sub) for sub in value))
+
+        operator, operand = next(iter(value.items()))
+        values: Dict[str, Set[str]] = self._fields.get(key, {})
+        # Strings are compared as text, so they are looked up directly
+        if operator in ("$eq", "$in") and isinstance(operand if operator == "$eq" else operand[0], str):
+            items: List[str] = [operand] if operator == "$eq" else operand
+            selected: FrozenSet[str] = frozenset().union(*(values.get(item, ()) for item in items))
+            if key == SOURCE_FIELD:
+                duplicates: Dict[str, Set[str]] = self._fields.get(DUPLICATE_SOURCES_FIELD, {})
+                selected = selected.union(*(duplicates.get(item, ()) for item in items))
+            return selected
+        return frozenset().union(
+            *(chunk_ids for text, chunk_ids in values.items() if self._compare(text, operator, operand))
+        )
+
+    @staticmethod
+    def _compare(text: str, operator: str, operand: Any) -> bool:
+        """
+        :param text: Text of a value of the field
+        :return: True if the value, cast to the type of the operand, or of its first item, satisfies the condition.
+            Values that cannot be cast never do.
+        """
+        try:
+            if operator in ("$in", "$nin", "$between"):
+                field_value: Any = cast_text(text, type(operand[0]))
+            else:
+                field_value = cast_text(text, type(operand))
+            if operator == "$eq":
+                return field_value == operand
+            if operator == "$in":
+                return field_value in operand
+            if operator == "$nin":
+                return field_value not in operand
+            if operator == "$between":
+                return operand[0] <= field_value <= operand[1]
+            return COMPARISONS[operator](field_value, operand)
+        except (TypeError, ValueError):
+            return False
+
+    @classmethod
+    def from_vector_store(cls, vectorstore: VectorStore) -> Optional["MetadataIndex"]:
+        """
+        Index the chunks of an in-memory vector store, e.g. one saved before metadata indexes existed.
+
+        :param vectorstore: InMemoryVectorStore or NumpyVectorStore
+        :return: The index, or None if the chunks of the store cannot be listed
+        """
+        records: Iterable[Tuple[str, Dict[str, Any]]]
+        if isinstance(vectorstore, NumpyVectorStore):
+            records = vectorstore.iter_metadata()
+        elif isinstance(vectorstore, InMemoryVectorStore):
+            records = ((chunk_id, entry["metadata"]) for chunk_id, entry in vectorstore.store.items())
+        else:
+            return None
+        index = cls()
+        for chunk_id, metadata in records:
+            index.add([chunk_id], [metadata])
+        return index
+
+    def dump(self, path: str) -> None:
+        """
+        Save the indexed metadata of every chunk. The file is written to a temporary name and renamed into place.
+
+        :param path: Path of the ".json" file
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path + ".tmp", "w", encoding="utf-8") as index_file:
+            json.dump({"version": METADATA_INDEX_FORMAT_VERSION, "chunks": self._chunks}, index_file)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def load(cls, path: str) -> "MetadataIndex":
+        """
+        :param path: Path of a file saved with dump()
+        :return: The loaded index
+        :raises FileNotFoundError: If there is no index at the path
+        """
+        with open(path, encoding="utf-8") as index_file:
+            saved: Dict[str, Any] = json.load(index_file)
+        index = cls()
+        if saved.get("version") == METADATA_INDEX_FORMAT_VERSION:
+            for chunk_id, metadata in saved["chunks"].items():
+                index.add([chunk_id], [metadata])
+        return index
+
+
+def restrict_to_chunks(vectorstore: VectorStore, chunk_ids: FrozenSet[str]) -> Tuple[VectorStore, Dict[str, Any]]:
+    """
+    :param vectorstore: In-memory vector store
+    :param chunk_ids: Chunks to search
+    :return: Tuple of (vector store, search keyword arguments) whose similarity searches only score the given chunks
+    """
+    if isinstance(vectorstore, NumpyVectorStore):
+        return vectorstore, {"filter": chunk_ids}
+    if isinstance(vectorstore, InMemoryVectorStore):
+        # A view sharing the entries of the matching chunks, since the filter function of
+        # InMemoryVectorStore would be called on every chunk of the store
+        subset = InMemoryVectorStore(embedding=vectorstore.embedding)
+        subset.store = {
+            chunk_id: vectorstore.store[chunk_id] for chunk_id in chunk_ids if chunk_id in vectorstore.store
+        }
+        return subset, {}
+    return vectorstore, {"filter": lambda doc: doc.id in chunk_ids}
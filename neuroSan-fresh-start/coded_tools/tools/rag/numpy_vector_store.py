@@ -0,0 +1,469 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Vector store backed by a contiguous float32 NumPy matrix with a binary, memory-mappable on-disk format.
+
+A store saved to "store.npy" is made of:
+    store.npy            float32 matrix of shape (num_chunks, dimensions)
+    store.norms.npy      float32 L2 norm of every row, so loading never has to scan the matrix
+    store.offsets.npy    int64 byte offsets (num_chunks + 1) of each record in the records file
+    store.records.jsonl  one JSON record {"id", "text", "metadata"} per chunk, in row order
+"""
+
+import asyncio
+import json
+import logging
+import mmap
+import os
+import uuid
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+# pylint: disable=import-error
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+NPY_EXTENSION = ".npy"
+NORMS_SUFFIX = ".norms.npy"
+OFFSETS_SUFFIX = ".offsets.npy"
+RECORDS_SUFFIX = ".records.jsonl"
+# Guards against division by zero for all-zero vectors
+NORM_EPSILON = 1e-12
+
+logger = logging.getLogger(__name__)
+
+
+def sidecar_path(path: str, suffix: str) -> str:
+    """
+    :param path: Path of the ".npy" matrix file
+    :param suffix: Sidecar suffix, e.g. ".norms.npy"
+    :return: Path of the sidecar file stored next to the matrix
+    """
+    base: str = path[: -len(NPY_EXTENSION)] if path.endswith(NPY_EXTENSION) else path
+    return base + suffix
+
+
+class RecordFile:
+    """
+    Read-only, memory-mapped view of a records sidecar.
+    Records are decoded lazily, so only the rows actually returned by a search are parsed.
+    """
+
+    def __init__(self, path: str, offsets: np.ndarray):
+        """
+        :param path: Path of the JSONL records file
+        :param offsets: Byte offsets of the records, one more than the number of records
+        """
+        self.path: str = path
+        self.offsets: np.ndarray = offsets
+        self.size_bytes: int = os.path.getsize(path)
+        self._mmap: Optional[mmap.mmap] = None
+        if self.size_bytes > 0:
+            with open(path, "rb") as records_file:
+                self._mmap = mmap.mmap(records_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        return max(len(self.offsets) - 1, 0)
+
+    def __getitem__(self, row: int) -> Dict[str, Any]:
+        start, end = int(self.offsets[row]), int(self.offsets[row + 1])
+        return json.loads(self._mmap[start:end])
+
+
+class NumpyVectorStore(VectorStore):
+    """
+    Exact cosine-similarity vector store over a float32 matrix.
+    Top-k search is a single matrix-vector product followed by np.argpartition.
+    Stores loaded from disk keep the matrix memory-mapped read-only; adding or deleting
+    chunks afterwards copies it into regular memory.
+    """
+
+    # pylint: disable=too-many-public-methods
+
+    def __init__(self, embedding: Embeddings):
+        """
+        :param embedding: Embeddings used for queries and for texts added later
+        """
+        self.embedding: Embeddings = embedding
+        self._matrix: np.ndarray = np.zeros((0, 0), dtype=np.float32)
+        self._norms: np.ndarray = np.zeros(0, dtype=np.float32)
+        self._records: Sequence[Dict[str, Any]] = []
+        self._id_to_row: Optional[Dict[str, int]] = None
+        # Over-allocated arrays whose leading rows are _matrix and _norms, so repeated adds grow them amortized
+        self._matrix_buffer: Optional[np.ndarray] = None
+        self._norms_buffer: Optional[np.ndarray] = None
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self.embedding
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        :return: Approximate memory footprint of the matrix, norms and records
+        """
+        if isinstance(self._records, RecordFile):
+            records_bytes = self._records.size_bytes
+        else:
+            records_bytes = sum(len(record["text"]) + 256 for record in self._records)
+        matrix: np.ndarray = self._matrix if self._matrix_buffer is None else self._matrix_buffer
+        norms: np.ndarray = self._norms if self._norms_buffer is None else self._norms_buffer
+        return int(matrix.nbytes + norms.nbytes + records_bytes)
+
+    # ---------- writes ----------
+    def add_embeddings(
+        self,
+        texts: Sequence[str],
+        embeddings: Sequence[Sequence[float]],
+        metadatas: Optional[Sequence[Dict[str, Any]]] = None,
+        ids: Optional[Sequence[Optional[str]]] = None,
+    ) -> List[str]:
+        """
+        Add chunks whose embeddings were already computed.
+
+        :param texts: Chunk texts
+        :param embeddings: One vector per text
+        :param metadatas: Optional metadata per text
+        :param ids: Optional ids per text. Missing ids are generated.
+        :return: Ids of the added chunks
+        """
+        if not texts:
+            return []
+        if len(embeddings) != len(texts):
+            raise ValueError(f"Got {len(embeddings)} embeddings for {len(texts)} texts.")
+
+        metadatas = metadatas or [{} for _ in texts]
+        ids_: List[str] = [chunk_id or str(uuid.uuid4()) for chunk_id in (ids or [None] * len(texts))]
+        vectors: np.ndarray = np.asarray(embeddings, dtype=np.float32)
+
+        # Re-adding an existing id replaces it
+        self.delete([chunk_id for chunk_id in ids_ if chunk_id in self._get_id_to_row()])
+
+        records: List[Dict[str, Any]] = self._materialize_records()
+        id_to_row: Dict[str, int] = self._get_id_to_row()
+        for chunk_id, text, metadata in zip(ids_, texts, metadatas):
+            id_to_row[chunk_id] = len(records)
+            records.append({"id": chunk_id, "text": text, "metadata": dict(metadata)})
+
+        self._append_rows(vectors)
+        self._on_rows_changed()
+        return ids_
+
+    def add_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: Optional[List[dict]] = None,
+        *,
+        ids: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> List[str]:
+        texts = list(texts)
+        return self.add_embeddings(texts, self.embedding.embed_documents(texts), metadatas, ids)
+
+    async def aadd_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: Optional[List[dict]] = None,
+        *,
+        ids: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> List[str]:
+        texts = list(texts)
+        vectors: List[List[float]] = await self.embedding.aembed_documents(texts)
+        return self.add_embeddings(texts, vectors, metadatas, ids)
+
+    def delete(self, ids: Optional[Sequence[str]] = None, **kwargs: Any) -> Optional[bool]:
+        if not ids:
+            return None
+        id_to_row: Dict[str, int] = self._get_id_to_row()
+        rows_to_drop = {id_to_row[chunk_id] for chunk_id in ids if chunk_id in id_to_row}
+        if not rows_to_drop:
+            return False
+
+        keep: np.ndarray = np.ones(len(self._records), dtype=bool)
+        keep[list(rows_to_drop)] = False
+        records: List[Dict[str, Any]] = self._materialize_records()
+        self._records = [record for row, record in enumerate(records) if keep[row]]
+        self._matrix = np.ascontiguousarray(self._matrix[keep])
+        self._norms = np.ascontiguousarray(self._norms[keep])
+        self._matrix_buffer = None
+        self._norms_buffer = None
+        self._id_to_row = None
+        self._on_rows_changed()
+        return True
+
+    async def adelete(self, ids: Optional[Sequence[str]] = None, **kwargs: Any) -> Optional[bool]:
+        return self.delete(ids, **kwargs)
+
+    def update_metadata(self, metadatas: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Set metadata fields of stored chunks without re-embedding them.
+
+        :param metadatas: Chunk id -> metadata fields to set. Unknown ids are ignored.
+        """
+        id_to_row: Dict[str, int] = self._get_id_to_row()
+        records: List[Dict[str, Any]] = self._materialize_records()
+        for chunk_id, fields in metadatas.items():
+            if chunk_id in id_to_row:
+                records[id_to_row[chunk_id]]["metadata"].update(fields)
+
+    def get_by_ids(self, ids: Sequence[str], /) -> List[Document]:
+        id_to_row: Dict[str, int] = self._get_id_to_row()
+        return [self._row_to_document(id_to_row[chunk_id]) for chunk_id in ids if chunk_id in id_to_row]
+
+    # ---------- search ----------
+    def search_rows(self, query_vector: Sequence[float], k: int) -> List[Tuple[int, float]]:
+        """
+        Exact top-k cosine similarity search.
+
+        :param query_vector: Query embedding
+        :param k: Number of results
+        :return: List of (row, similarity) pairs, best first
+        """
+        if len(self._records) == 0 or k <= 0:
+            return []
+        query: np.ndarray = np.asarray(query_vector, dtype=np.float32)
+        scores: np.ndarray = (self._matrix @ query) / (self._norms * np.linalg.norm(query) + NORM_EPSILON)
+        return self._top_k(scores, np.arange(len(scores)), k)
+
+    def search_chunks(
+        self, query_vector: Sequence[float], chunk_ids: Iterable[str], k: int
+    ) -> List[Tuple[int, float]]:
+        """
+        Exact top-k cosine similarity search over the given chunks only, e.g. those matching a metadata filter.
+
+        :param query_vector: Query embedding
+        :param chunk_ids: Ids of the chunks to score. Unknown ids are ignored.
+        :param k: Number of results
+        :return: List of (row, similarity) pairs, best first
+        """
+        id_to_row: Dict[str, int] = self._get_id_to_row()
+        # Sorted rows are gathered from the matrix in memory order
+        rows: np.ndarray = np.sort(
+            np.fromiter((id_to_row[chunk_id] for chunk_id in chunk_ids if chunk_id in id_to_row), dtype=np.int64)
+        )
+        if len(rows) == 0 or k <= 0:
+            return []
+        query: np.ndarray = np.asarray(query_vector, dtype=np.float32)
+        scores: np.ndarray = (np.asarray(self._matrix[rows]) @ query) / (
+            self._norms[rows] * np.linalg.norm(query) + NORM_EPSILON
+        )
+        return self._top_k(scores, rows, k)
+
+    @staticmethod
+    def _top_k(scores: np.ndarray, rows: np.ndarray, k: int) -> List[Tuple[int, float]]:
+        """
+        :param scores: Similarity per candidate
+        :param rows: Row number per candidate
+        :param k: Number of results
+        :return: The k best (row, score) pairs, best first
+        """
+        if len(scores) == 0:
+            return []
+        k = min(k, len(scores))
+        best: np.ndarray = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best])]
+        return [(int(rows[i]), float(scores[i])) for i in best]
+
+    def similarity_search_with_score_by_vector(
+        self, embedding: List[float], k: int = 4, **kwargs: Any
+    ) -> List[Tuple[Document, float]]:
+        """
+        :param embedding: Query embedding
+        :param k: Number of results
+        :param kwargs: May contain filter, a collection of chunk ids to restrict an exact search to
+        :return: List of (document, cosine similarity) pairs, best first
+        """
+        chunk_ids: Optional[Iterable[str]] = kwargs.get("filter")
+        rows: List[Tuple[int, float]] = (
+            self.search_rows(embedding, k) if chunk_ids is None else self.search_chunks(embedding, chunk_ids, k)
+        )
+        return [(self._row_to_document(row), score) for row, score in rows]
+
+    def similarity_search_by_vector(self, embedding: List[float], k: int = 4, **kwargs: Any) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score_by_vector(embedding, k, **kwargs)]
+
+    # pylint: disable=arguments-differ
+    def similarity_search_with_score(self, query: str, k: int = 4, **kwargs: Any) -> List[Tuple[Document, float]]:
+        return self.similarity_search_with_score_by_vector(self.embedding.embed_query(query), k, **kwargs)
+
+    def similarity_search(self, query: str, k: int = 4, **kwargs: Any) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score(query, k, **kwargs)]
+
+    # pylint: disable=arguments-differ
+    async def asimilarity_search_with_score(
+        self, query: str, k: int = 4, **kwargs: Any
+    ) -> List[Tuple[Document, float]]:
+        query_vector: List[float] = await self.embedding.aembed_query(query)
+        # Large matrix products release the GIL, so keep them off the event loop
+        return await asyncio.to_thread(self.similarity_search_with_score_by_vector, query_vector, k, **kwargs)
+
+    async def asimilarity_search(self, query: str, k: int = 4, **kwargs: Any) -> List[Document]:
+        return [doc for doc, _ in await self.asimilarity_search_with_score(query, k, **kwargs)]
+
+    async def asimilarity_search_by_vector(self, embedding: List[float], k: int = 4, **kwargs: Any) -> List[Document]:
+        return await asyncio.to_thread(self.similarity_search_by_vector, embedding, k, **kwargs)
+
+    def _select_relevance_score_fn(self) -> Callable[[float], float]:
+        # Map cosine similarity from [-1, 1] to [0, 1]
+        return lambda score: (score + 1.0) / 2.0
+
+    # ---------- construction ----------
+    @classmethod
+    def from_texts(
+        cls,
+        texts: List[str],
+        embedding: Embeddings,
+        metadatas: Optional[List[dict]] = None,
+        *,
+        ids: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> "NumpyVectorStore":
+        store = cls(embedding=embedding, **kwargs)
+        store.add_texts(texts, metadatas, ids=ids)
+        return store
+
+    @classmethod
+    async def afrom_texts(
+        cls,
+        texts: List[str],
+        embedding: Embeddings,
+        metadatas: Optional[List[dict]] = None,
+        *,
+        ids: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> "NumpyVectorStore":
+        store = cls(embedding=embedding, **kwargs)
+        await store.aadd_texts(texts, metadatas, ids=ids)
+        return store
+
+    # ---------- persistence ----------
+    def dump(self, path: str) -> None:
+        """
+        Save the store in the binary format described in the module docstring.
+        Every file is written to a temporary name first and then renamed into place.
+
+        :param path: Path of the ".npy" matrix file
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        offsets: List[int] = [0]
+        records_path: str = sidecar_path(path, RECORDS_SUFFIX)
+        with open(records_path + ".tmp", "wb") as records_file:
+            for row in range(len(self._records)):  # pylint: disable=consider-using-enumerate
+                line: bytes = (json.dumps(self._records[row], ensure_ascii=False, default=str) + "\n").encode("utf-8")
+                records_file.write(line)
+                offsets.append(offsets[-1] + len(line))
+
+        arrays = {
+            path: np.ascontiguousarray(self._matrix, dtype=np.float32),
+            sidecar_path(path, NORMS_SUFFIX): np.ascontiguousarray(self._norms, dtype=np.float32),
+            sidecar_path(path, OFFSETS_SUFFIX): np.asarray(offsets, dtype=np.int64),
+        }
+        for array_path, array in arrays.items():
+            with open(array_path + ".tmp", "wb") as array_file:
+                np.save(array_file, array)
+
+        for final_path in [*arrays.keys(), records_path]:
+            os.replace(final_path + ".tmp", final_path)
+        self._dump_extra(path)
+
+    @classmethod
+    def load(cls, path: str, embedding: Embeddings, mmap_mode: Optional[str] = "r", **kwargs: Any):
+        """
+        Load a store saved with dump(). By default the matrix is memory-mapped read-only without copying.
+
+        :param path: Path of the ".npy" matrix file
+        :param embedding: Embeddings used for queries
+        :param mmap_mode: Passed to np.load. None reads the matrix into memory.
+        :return: The loaded vector store
+        :raises FileNotFoundError: If the matrix or one of its sidecars is missing
+        """
+        store = cls(embedding=embedding, **kwargs)
+        store._matrix = np.load(path, mmap_mode=mmap_mode)
+        store._norms = np.load(sidecar_path(path, NORMS_SUFFIX), mmap_mode=mmap_mode)
+        offsets: np.ndarray = np.load(sidecar_path(path, OFFSETS_SUFFIX))
+        store._records = RecordFile(sidecar_path(path, RECORDS_SUFFIX), offsets)
+        store._load_extra(path)
+        logger.info("Mapped %d chunks from %s\n", len(store), path)
+        return store
+
+    def iter_metadata(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        :return: Iterator of the (chunk id, metadata) of every chunk, in row order
+        """
+        # Memory-mapped records are decoded one at a time
+        for row in range(len(self)):
+            record: Dict[str, Any] = self._records[row]
+            yield record["id"], record["metadata"]
+
+    def _dump_extra(self, path: str) -> None:
+        """Hook for subclasses that persist additional sidecars next to the matrix."""
+
+    def _load_extra(self, path: str) -> None:
+        """Hook for subclasses that load additional sidecars saved by _dump_extra()."""
+
+    def _on_rows_changed(self) -> None:
+        """Hook for subclasses that keep derived structures in sync with the matrix rows."""
+
+    # ---------- helpers ----------
+    def _append_rows(self, vectors: np.ndarray) -> None:
+        """
+        Append vectors to the matrix, doubling the backing buffers when they are full
+        so that ingesting in many small batches does not copy the whole matrix every time.
+        """
+        rows: int = len(self._norms)
+        needed: int = rows + len(vectors)
+        if self._matrix_buffer is None or len(self._matrix_buffer) < needed:
+            capacity: int = max(needed, 2 * rows)
+            self._matrix_buffer = np.empty((capacity, vectors.shape[1]), dtype=np.float32)
+            self._norms_buffer = np.empty(capacity, dtype=np.float32)
+            if rows:
+                self._matrix_buffer[:rows] = self._matrix
+                self._norms_buffer[:rows] = self._norms
+        self._matrix_buffer[rows:needed] = vectors
+        self._norms_buffer[rows:needed] = np.linalg.norm(vectors, axis=1)
+        self._matrix = self._matrix_buffer[:needed]
+        self._norms = self._norms_buffer[:needed]
+
+    def _materialize_records(self) -> List[Dict[str, Any]]:
+        """Turn memory-mapped records into a mutable list before modifying the store."""
+        if not isinstance(self._records, list):
+            self._records = [self._records[row] for row in range(len(self._records))]
+        return self._records
+
+    def _get_id_to_row(self) -> Dict[str, int]:
+        """Lazily build the id to row mapping, which is only needed for updates and lookups by id."""
+        if self._id_to_row is None:
+            self._id_to_row = {self._records[row]["id"]: row for row in range(len(self._records))}
+        return self._id_to_row
+
+    def _row_to_document(self, row: int) -> Document:
+        record: Dict[str, Any] = self._records[row]
+        return Document(id=record["id"], page_content=record["text"], metadata=record["metadata"])
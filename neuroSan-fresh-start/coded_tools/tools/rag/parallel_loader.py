@@ -0,0 +1,280 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Concurrent download and multi-process parsing of documents, streamed back as each one completes.
+
+Configured with RAG_LOAD_CONCURRENCY, the documents loading at once (default 8), RAG_PARSE_WORKERS, the processes of
+the parse pool shared by the RAG tools (default one per CPU), and RAG_DOCUMENT_TIMEOUT_SECONDS, the time allowed to
+load each document (default 300). A document that fails or times out is logged and skipped.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from typing import Any
+from typing import AsyncIterator
+from typing import Callable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from urllib.parse import urlparse
+
+# pylint: disable=import-error
+import requests
+from langchain_core.documents import Document
+
+from coded_tools.tools.rag.http_cache import HttpCache
+from coded_tools.tools.rag.parsed_document_cache import ParsedDocumentCache
+from coded_tools.tools.rag.parsed_document_cache import hash_file
+
+# Defaults, overridable with RAG_LOAD_CONCURRENCY, RAG_PARSE_WORKERS and RAG_DOCUMENT_TIMEOUT_SECONDS
+DEFAULT_LOAD_CONCURRENCY = 8
+DEFAULT_DOCUMENT_TIMEOUT_SECONDS = 300.0
+DOWNLOAD_TIMEOUT_SECONDS = 60
+DOWNLOAD_CHUNK_BYTES = 1024 * 1024
+
+logger = logging.getLogger(__name__)
+
+# Docling converter of the current worker process, created on first use because loading its models is slow
+_DOCLING_CONVERTER: Any = None
+
+
+def parse_pdf(path: str, source: str) -> List[Document]:
+    """
+    Parse a PDF with PyMuPDF. Runs in a worker process.
+
+    :param path: Local file to parse
+    :param source: URL or path to report as the documents' source
+    :return: One document per page
+    """
+    # pylint: disable=import-outside-toplevel
+    from langchain_community.document_loaders import PyMuPDFLoader
+
+    docs: List[Document] = PyMuPDFLoader(file_path=path).load()
+    for doc in docs:
+        doc.metadata["source"] = source
+        doc.metadata["file_path"] = source
+    return docs
+
+
+def parse_with_docling(path: str, source: str) -> List[Document]:
+    """
+    Convert a document with Docling, reusing one converter per worker process. Runs in a worker process.
+
+    :param path: Local file to convert
+    :param source: URL or path to report as the documents' source
+    :return: Chunks produced by the Docling loader
+    """
+    # pylint: disable=import-outside-toplevel
+    # pylint: disable=global-statement
+    from docling.document_converter import DocumentConverter
+    from langchain_docling import DoclingLoader
+
+    global _DOCLING_CONVERTER
+    if _DOCLING_CONVERTER is None:
+        _DOCLING_CONVERTER = DocumentConverter()
+
+    docs: List[Document] = DoclingLoader(file_path=path, converter=_DOCLING_CONVERTER).load()
+    for doc in docs:
+        doc.metadata["source"] = source
+    return docs
+
+
+def is_remote(source: str) -> bool:
+    """
+    :param source: URL or file path
+    :return: True if the source has to be downloaded
+    """
+    return urlparse(source).scheme in ("http", "https")
+
+
+def download_to_temp_file(url: str) -> str:
+    """
+    Download a URL into a temporary file, keeping its extension so that parsers can detect the format.
+
+    :param url: URL to download
+    :return: Path of the temporary file. The caller deletes it.
+    """
+    suffix: str = os.path.splitext(urlparse(url).path)[1]
+    with requests.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT_SECONDS) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as temp_file:
+            shutil.copyfileobj(response.raw, temp_file, DOWNLOAD_CHUNK_BYTES)
+            return temp_file.name
+
+
+class ParallelDocumentLoader:
+    """
+    Loads many documents with bounded concurrency: downloads run on threads from asyncio,
+    and parsing runs in a process pool shared by all RAG tools in the process.
+    Remote sources are read through the shared HttpCache unless it is disabled.
+    Each document has its own timeout, a failing document is logged and skipped,
+    and documents are yielded in completion order.
+
+    With a ParsedDocumentCache, a file whose content was already parsed by the same parse function
+    is read back from the cache instead of being parsed again.
+
+    A timed-out parse cannot be interrupted inside its worker; the worker finishes it in the background
+    while the loader moves on, so the timeout bounds the latency of an ingest rather than its CPU use.
+    """
+
+    _shared_pool: Optional[ProcessPoolExecutor] = None
+    _shared_lock = threading.Lock()
+
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+    def __init__(
+        self,
+        parse: Callable[[str, str], List[Document]],
+        max_concurrency: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+        executor: Optional[Executor] = None,
+        cache: Optional[ParsedDocumentCache] = None,
+    ):
+        """
+        :param parse: Picklable top-level function (local path, source) -> documents, run in the executor
+        :param max_concurrency: Maximum documents downloaded or parsed at once. Defaults to RAG_LOAD_CONCURRENCY.
+        :param timeout_seconds: Time allowed per document. Defaults to RAG_DOCUMENT_TIMEOUT_SECONDS.
+        :param executor: Executor for parsing. Defaults to the shared process pool.
+        :param cache: Cache of parsed documents, or None to always parse
+        """
+        self.parse: Callable[[str, str], List[Document]] = parse
+        self.max_concurrency: int = max_concurrency or int(
+            os.getenv("RAG_LOAD_CONCURRENCY", str(DEFAULT_LOAD_CONCURRENCY))
+        )
+        self.timeout_seconds: float = timeout_seconds or float(
+            os.getenv("RAG_DOCUMENT_TIMEOUT_SECONDS", str(DEFAULT_DOCUMENT_TIMEOUT_SECONDS))
+        )
+        self.executor: Optional[Executor] = executor
+        self.cache: Optional[ParsedDocumentCache] = cache if cache is not None and cache.enabled else None
+
+    @classmethod
+    def get_shared_pool(cls) -> ProcessPoolExecutor:
+        """
+        :return: The process-wide parsing pool, sized by RAG_PARSE_WORKERS (default: number of CPUs).
+            Its workers are started with forkserver where available, else with spawn.
+        """
+        with cls._shared_lock:
+            if cls._shared_pool is None:
+                workers: Optional[int] = int(os.getenv("RAG_PARSE_WORKERS", "0")) or None
+                # The server runs threads and event loops whose locks a forked worker could inherit held,
+                # so workers are started from a clean process
+                start_method: str = (
+                    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                )
+                cls._shared_pool = ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context(start_method)
+                )
+            return cls._shared_pool
+
+    @classmethod
+    def _reset_shared_pool(cls, broken_pool: Executor) -> None:
+        """Replace the shared pool after a worker died, e.g. on a crash in a native parser."""
+        with cls._shared_lock:
+            if cls._shared_pool is broken_pool:
+                cls._shared_pool = None
+        broken_pool.shutdown(wait=False, cancel_futures=True)
+
+    async def aload(self, sources: List[str]) -> AsyncIterator[Tuple[str, List[Document]]]:
+        """
+        Load the sources concurrently. At most max_concurrency sources are loading or waiting to be consumed,
+        so a slow consumer holds back further downloads instead of letting parsed documents pile up.
+
+        :param sources: URLs or file paths
+        :return: Async iterator of (source, documents) in completion order. Failed sources are skipped.
+        """
+
+        async def load_one(source: str) -> Tuple[str, Optional[List[Document]]]:
+            try:
+                return source, await asyncio.wait_for(self._load_source(source), self.timeout_seconds)
+            except asyncio.TimeoutError:
+                logger.error("Timed out after %.0fs loading %s\n", self.timeout_seconds, source)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                logger.error("Failed to load %s: %s\n", source, error)
+            return source, None
+
+        remaining: Iterator[str] = iter(sources)
+        pending: Set[asyncio.Future] = set()
+        try:
+            while True:
+                for source in islice(remaining, self.max_concurrency - len(pending)):
+                    pending.add(asyncio.ensure_future(load_one(source)))
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    source, docs = task.result()
+                    if docs is not None:
+                        logger.info("Successfully loaded %d documents from %s\n", len(docs), source)
+                        yield source, docs
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _load_source(self, source: str) -> List[Document]:
+        """Download the source if needed, then read its documents from the cache or parse them in the executor."""
+        path: str = source
+        temporary: bool = False
+        # Cache the body was acquired from, which keeps it from eviction by other downloads until it is released
+        acquired_from: Optional[HttpCache] = None
+        if is_remote(source):
+            http_cache: HttpCache = HttpCache.get_shared()
+            if http_cache.enabled:
+                path = await asyncio.to_thread(http_cache.acquire, source)
+                acquired_from = http_cache
+            else:
+                path = await asyncio.to_thread(download_to_temp_file, source)
+                temporary = True
+        try:
+            if self.cache is None:
+                return await self._parse(path, source)
+
+            parser: str = f"{self.parse.__module__}.{self.parse.__qualname__}"
+            key: str = self.cache.make_key(parser, await asyncio.to_thread(hash_file, path))
+            docs: Optional[List[Document]] = await asyncio.to_thread(self.cache.get, key, source)
+            if docs is not None:
+                logger.info("Read %d parsed documents of %s from the cache\n", len(docs), source)
+                return docs
+            docs = await self._parse(path, source)
+            await asyncio.to_thread(self.cache.put, key, source, docs)
+            return docs
+        finally:
+            if temporary:
+                os.remove(path)
+            if acquired_from is not None:
+                acquired_from.release(path)
+
+    async def _parse(self, path: str, source: str) -> List[Document]:
+        """Run the parse function in the executor, replacing the shared pool if a worker died."""
+        executor: Executor = self.executor or self.get_shared_pool()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, self.parse, path, source)
+        except BrokenProcessPool:
+            if self.executor is None:
+                self._reset_shared_pool(executor)
+            raise
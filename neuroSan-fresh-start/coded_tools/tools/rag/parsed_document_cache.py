@@ -0,0 +1,220 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Content-addressed on-disk cache of parsed documents, so that rebuilding a vector store
+with other chunking parameters or another embedding model does not parse its files again.
+
+Used for parsed PDFs and the documents converted by the Docling tool, in the "parsed_documents" directory of the RAG
+cache, and bounded by RAG_PARSED_CACHE_MAX_BYTES (default 2 GiB, 0 disables it).
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+# pylint: disable=import-error
+from langchain_core.documents import Document
+
+from coded_tools.tools.rag.cache_paths import get_rag_cache_dir
+
+PARSED_DOCUMENTS_DIR = "parsed_documents"
+ENTRY_SUFFIX = ".json.gz"
+# Default disk budget (2 GiB), overridable with RAG_PARSED_CACHE_MAX_BYTES. 0 disables the cache.
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024 * 1024
+# Part of every key, so that entries written before a change to the parsers or to the entry format are ignored
+CACHE_FORMAT_VERSION = 1
+HASH_CHUNK_BYTES = 1024 * 1024
+COMPRESS_LEVEL = 6
+
+logger = logging.getLogger(__name__)
+
+
+def hash_file(path: str) -> str:
+    """
+    :param path: Local file
+    :return: sha256 hex digest of the file content
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as content:
+        for block in iter(lambda: content.read(HASH_CHUNK_BYTES), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ParsedDocumentCache:
+    """
+    Gzip-compressed JSON files of parsed documents keyed by (parser, sha256 of the file content),
+    so the same file is parsed once whatever its URL. Metadata values equal to the source the file
+    was parsed from are replaced with the source being loaded when an entry is read.
+
+    The files are kept under a disk budget by deleting the least recently used ones, using their
+    modification time, which a hit refreshes. Several processes may share the directory: entries
+    are written atomically and every process enforces the budget on the files it finds.
+    """
+
+    _shared: Optional["ParsedDocumentCache"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        :param cache_dir: Directory of the entries. Created if missing.
+        :param max_bytes: Disk budget for all entries combined. 0 disables the cache.
+        """
+        self.cache_dir: str = cache_dir
+        self.max_bytes: int = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        # Bytes on disk, measured on the first write and rescanned when the budget seems exceeded
+        self._total_bytes: Optional[int] = None
+
+    @classmethod
+    def get_shared(cls) -> "ParsedDocumentCache":
+        """
+        :return: The process-wide cache in the parsed_documents directory of the RAG cache, created on first use
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                max_bytes = int(os.getenv("RAG_PARSED_CACHE_MAX_BYTES", str(DEFAULT_MAX_BYTES)))
+                cls._shared = cls(get_rag_cache_dir(PARSED_DOCUMENTS_DIR), max_bytes=max_bytes)
+            return cls._shared
+
+    @property
+    def enabled(self) -> bool:
+        """
+        :return: True if entries are read and written
+        """
+        return self.max_bytes > 0
+
+    @staticmethod
+    def make_key(parser: str, content_hash: str) -> str:
+        """
+        :param parser: Qualified name of the parse function
+        :param content_hash: sha256 hex digest of the parsed file
+        :return: Key of the entry
+        """
+        return hashlib.sha256(f"{CACHE_FORMAT_VERSION}:{parser}:{content_hash}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str, source: str) -> Optional[List[Document]]:
+        """
+        Read the documents of an entry.
+
+        :param key: Key of the entry
+        :param source: URL or path being loaded, reported as the documents' source
+        :return: The documents, or None on a miss
+        """
+        if not self.enabled:
+            return None
+        path: str = self._entry_path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as entry_file:
+                payload: Dict[str, Any] = json.load(entry_file)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError) as error:
+            logger.warning("Ignoring unreadable parsed document cache entry %s: %s\n", path, error)
+            self._remove(path)
+            return None
+
+        cached_source: str = payload["source"]
+        return [
+            Document(
+                page_content=doc["page_content"],
+                metadata={
+                    name: source if value == cached_source else value for name, value in doc["metadata"].items()
+                },
+            )
+            for doc in payload["documents"]
+        ]
+
+    def put(self, key: str, source: str, docs: List[Document]) -> None:
+        """
+        Write an entry, then delete least recently used entries if the cache is over budget.
+
+        :param key: Key of the entry
+        :param source: URL or path the documents were parsed from
+        :param docs: Parsed documents
+        """
+        if not self.enabled:
+            return
+        payload: Dict[str, Any] = {
+            "source": source,
+            "documents": [{"page_content": doc.page_content, "metadata": doc.metadata} for doc in docs],
+        }
+        data: bytes = gzip.compress(json.dumps(payload, default=str).encode("utf-8"), COMPRESS_LEVEL)
+        if len(data) > self.max_bytes:
+            logger.info("Parsed documents of %s (%d bytes) exceed the cache budget. Not caching.\n", source, len(data))
+            return
+
+        path: str = self._entry_path(key)
+        temp_path: str = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as entry_file:
+            entry_file.write(data)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_bytes()
+            else:
+                self._total_bytes += len(data)
+            if self._total_bytes > self.max_bytes:
+                self._evict_locked()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ENTRY_SUFFIX)
+
+    def _scan_bytes(self) -> int:
+        """
+        :return: Bytes taken by the entries currently on disk
+        """
+        return sum(entry.stat().st_size for entry in os.scandir(self.cache_dir) if entry.name.endswith(ENTRY_SUFFIX))
+
+    def _evict_locked(self) -> None:
+        """Delete the least recently used entries until the cache fits in its budget. Called with the lock held."""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(ENTRY_SUFFIX):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+
+        self._total_bytes = sum(size for _, size, _ in entries)
+        evicted: int = 0
+        for _, size, path in entries:
+            if self._total_bytes <= self.max_bytes:
+                break
+            self._remove(path)
+            self._total_bytes -= size
+            evicted += 1
+        logger.info("Evicted %d parsed document cache entries.\n", evicted)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
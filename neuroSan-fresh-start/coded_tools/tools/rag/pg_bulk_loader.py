@@ -0,0 +1,189 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Bulk loading of new Postgres vector store tables: chunks are inserted with binary COPY in large batches,
+then the table gets an optional pgvector ANN index and fresh planner statistics.
+
+Chunks are copied RAG_PG_COPY_BATCH_SIZE at a time (default 2000); RAG_PG_BULK_COPY=false inserts them through
+langchain-postgres instead. RAG_PG_VECTOR_INDEX is "none" (default, every query scans the table), "hnsw", tuned with
+RAG_PG_HNSW_M (16), RAG_PG_HNSW_EF_CONSTRUCTION (64) and RAG_PG_HNSW_EF_SEARCH (40), or "ivfflat", with
+RAG_PG_IVFFLAT_LISTS lists (one per 1000 rows, or the square root of the rows above a million) searched with
+RAG_PG_IVFFLAT_PROBES (10). Existing tables are only searched with the configured query options.
+"""
+
+import json
+import logging
+import math
+import os
+import uuid
+from dataclasses import dataclass
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# pylint: disable=import-error
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_postgres.v2.indexes import BaseIndex
+from langchain_postgres.v2.indexes import HNSWIndex
+from langchain_postgres.v2.indexes import HNSWQueryOptions
+from langchain_postgres.v2.indexes import IVFFlatIndex
+from langchain_postgres.v2.indexes import IVFFlatQueryOptions
+from langchain_postgres.v2.indexes import QueryOptions
+
+from coded_tools.tools.rag.pg_engine_registry import DEFAULT_SCHEMA_NAME
+from coded_tools.tools.rag.pg_engine_registry import ID_COLUMN
+from coded_tools.tools.rag.pg_engine_registry import METADATA_JSON_COLUMN
+from coded_tools.tools.rag.pg_engine_registry import PGEngineRegistry
+
+# Other columns of the tables created by PGEngine.ainit_vectorstore_table()
+CONTENT_COLUMN = "content"
+EMBEDDING_COLUMN = "embedding"
+# Chunks per COPY, overridable with RAG_PG_COPY_BATCH_SIZE
+COPY_BATCH_SIZE = int(os.getenv("RAG_PG_COPY_BATCH_SIZE", "2000"))
+# Defaults, overridable with the RAG_PG_VECTOR_INDEX, RAG_PG_HNSW_* and RAG_PG_IVFFLAT_* environment variables
+# read in VectorIndexSettings.from_env()
+VECTOR_INDEX_TYPES = ("none", "hnsw", "ivfflat")
+DEFAULT_HNSW_M = 16
+DEFAULT_HNSW_EF_CONSTRUCTION = 64
+DEFAULT_HNSW_EF_SEARCH = 40
+DEFAULT_IVFFLAT_PROBES = 10
+# Tables up to this many rows get rows / 1000 IVFFlat lists, larger ones sqrt(rows), as pgvector recommends
+IVFFLAT_SQRT_LISTS_ROWS = 1_000_000
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class VectorIndexSettings:
+    """ANN index built on the embedding column of a new table once it is loaded, and how it is searched."""
+
+    # One of VECTOR_INDEX_TYPES. Without an index, every query scans the whole table.
+    index_type: str = "none"
+    # HNSW graph degree and build-time candidate list size
+    hnsw_m: int = DEFAULT_HNSW_M
+    hnsw_ef_construction: int = DEFAULT_HNSW_EF_CONSTRUCTION
+    # HNSW query-time candidate list size: higher is slower and finds more of the true nearest chunks
+    hnsw_ef_search: int = DEFAULT_HNSW_EF_SEARCH
+    # IVFFlat clusters, or 0 to derive them from the number of rows
+    ivfflat_lists: int = 0
+    # IVFFlat clusters searched per query
+    ivfflat_probes: int = DEFAULT_IVFFLAT_PROBES
+
+    @classmethod
+    def from_env(cls) -> "VectorIndexSettings":
+        """
+        :return: Settings from RAG_PG_VECTOR_INDEX ("none", "hnsw" or "ivfflat"), RAG_PG_HNSW_M,
+            RAG_PG_HNSW_EF_CONSTRUCTION, RAG_PG_HNSW_EF_SEARCH, RAG_PG_IVFFLAT_LISTS and RAG_PG_IVFFLAT_PROBES
+        """
+        index_type: str = os.getenv("RAG_PG_VECTOR_INDEX", "none").lower()
+        if index_type not in VECTOR_INDEX_TYPES:
+            logger.warning(
+                "Unknown RAG_PG_VECTOR_INDEX %r. Expected one of: %s\n", index_type, ", ".join(VECTOR_INDEX_TYPES)
+            )
+            index_type = "none"
+        return cls(
+            index_type=index_type,
+            hnsw_m=int(os.getenv("RAG_PG_HNSW_M", str(DEFAULT_HNSW_M))),
+            hnsw_ef_construction=int(os.getenv("RAG_PG_HNSW_EF_CONSTRUCTION", str(DEFAULT_HNSW_EF_CONSTRUCTION))),
+            hnsw_ef_search=int(os.getenv("RAG_PG_HNSW_EF_SEARCH", str(DEFAULT_HNSW_EF_SEARCH))),
+            ivfflat_lists=int(os.getenv("RAG_PG_IVFFLAT_LISTS", "0")),
+            ivfflat_probes=int(os.getenv("RAG_PG_IVFFLAT_PROBES", str(DEFAULT_IVFFLAT_PROBES))),
+        )
+
+    def make_index(self, rows: int) -> Optional[BaseIndex]:
+        """
+        :param rows: Number of rows of the loaded table
+        :return: The index to build on the table, or None
+        """
+        if self.index_type == "hnsw":
+            return HNSWIndex(m=self.hnsw_m, ef_construction=self.hnsw_ef_construction)
+        if self.index_type == "ivfflat":
+            lists: int = self.ivfflat_lists
+            if lists <= 0:
+                lists = rows // 1000 if rows <= IVFFLAT_SQRT_LISTS_ROWS else int(math.sqrt(rows))
+            return IVFFlatIndex(lists=max(lists, 1))
+        return None
+
+    def query_options(self) -> Optional[QueryOptions]:
+        """
+        :return: Options set on the connection of each query, or None
+        """
+        if self.index_type == "hnsw":
+            return HNSWQueryOptions(ef_search=self.hnsw_ef_search)
+        if self.index_type == "ivfflat":
+            return IVFFlatQueryOptions(probes=self.ivfflat_probes)
+        return None
+
+
+class PgCopyWriter:
+    """
+    Embeds chunks and inserts them into a langchain-postgres table with binary COPY.
+    Stands in for the PGVectorStore in IngestionPipeline.run(), so that each batch of the pipeline is one COPY
+    rather than one INSERT per chunk. Only suitable for tables no other writer inserts the same ids into.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+    def __init__(
+        self,
+        registry: PGEngineRegistry,
+        connection_string: str,
+        table_name: str,
+        embeddings: Embeddings,
+        batch_size: int = COPY_BATCH_SIZE,
+        schema_name: str = DEFAULT_SCHEMA_NAME,
+    ):
+        """
+        :param registry: Registry holding the engine of the database
+        :param connection_string: SQLAlchemy asyncpg URL
+        :param table_name: Table created by PGEngine.ainit_vectorstore_table()
+        :param embeddings: Embeddings of the vector store on the table
+        :param batch_size: Chunks per COPY
+        :param schema_name: Schema of the table
+        """
+        self.registry: PGEngineRegistry = registry
+        self.connection_string: str = connection_string
+        self.table_name: str = table_name
+        self.embeddings: Embeddings = embeddings
+        self.batch_size: int = batch_size
+        self.schema_name: str = schema_name
+        self.rows: int = 0
+
+    async def aadd_documents(self, documents: List[Document], **_kwargs: Any) -> List[str]:
+        """
+        :param documents: Chunks to embed and insert. Chunks without an id get a random one.
+        :return: Ids of the inserted chunks
+        """
+        vectors: List[List[float]] = await self.embeddings.aembed_documents([doc.page_content for doc in documents])
+        ids: List[str] = [doc.id or str(uuid.uuid4()) for doc in documents]
+        records: List[Tuple[Any, ...]] = [
+            (chunk_id, doc.page_content, vector, json.dumps(doc.metadata))
+            for chunk_id, doc, vector in zip(ids, documents, vectors)
+        ]
+        await self.registry.copy_records(
+            self.connection_string,
+            self.table_name,
+            [ID_COLUMN, CONTENT_COLUMN, EMBEDDING_COLUMN, METADATA_JSON_COLUMN],
+            records,
+            self.schema_name,
+        )
+        self.rows += len(records)
+        return ids
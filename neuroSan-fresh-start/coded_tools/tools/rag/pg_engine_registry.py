@@ -0,0 +1,476 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Process-wide registry of pooled PGEngines, known tables and opened Postgres vector stores.
+
+Pools hold RAG_PG_POOL_SIZE connections (default 5), plus up to RAG_PG_MAX_OVERFLOW (default 10), replaced after
+RAG_PG_POOL_RECYCLE_SECONDS (default 1800). A table found to exist is trusted for RAG_PG_TABLE_TTL_SECONDS
+(default 300), or until a query fails on it, so a dropped table is recreated.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import TypeVar
+
+# pylint: disable=import-error
+from langchain_core.vectorstores import VectorStore
+from langchain_postgres import PGEngine
+from pgvector.asyncpg import register_vector
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# Pool defaults, overridable with RAG_PG_POOL_SIZE, RAG_PG_MAX_OVERFLOW and RAG_PG_POOL_RECYCLE_SECONDS
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 10
+DEFAULT_POOL_RECYCLE_SECONDS = 1800
+# Seconds for which a table found to exist is trusted, overridable with RAG_PG_TABLE_TTL_SECONDS
+DEFAULT_TABLE_TTL_SECONDS = 300
+DEFAULT_SCHEMA_NAME = "public"
+# Columns in which langchain-postgres keeps the id and the JSONB metadata of each chunk
+ID_COLUMN = "langchain_id"
+METADATA_JSON_COLUMN = "langchain_metadata"
+# Types whose binary codecs register_vector() installs, when the pgvector extension defines them
+PGVECTOR_TYPES = ("vector", "halfvec", "sparsevec")
+# langchain-postgres versions, from included to excluded, whose PGEngine internals run_on_connection() relies on
+SUPPORTED_LANGCHAIN_POSTGRES_VERSIONS = ((0, 0, 14), (0, 1, 0))
+LANGCHAIN_POSTGRES_REQUIREMENT = "langchain-postgres>=0.0.14,<0.1"
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def check_engine_internals(engine: PGEngine) -> None:
+    """
+    Check that the engine has the private members run_on_connection() uses.
+
+    :param engine: Engine to check
+    :raises RuntimeError: If the engine lacks those members
+    """
+    if not (hasattr(engine, "_run_as_async") and hasattr(engine, "_pool")):
+        raise RuntimeError(
+            f"PGEngine has no _run_as_async() or _pool, which the RAG tools need. "
+            f"Install {LANGCHAIN_POSTGRES_REQUIREMENT}"
+        )
+    warn_if_unsupported_version()
+
+
+@lru_cache(maxsize=1)
+def warn_if_unsupported_version() -> None:
+    """
+    Warn once if the installed langchain-postgres is outside SUPPORTED_LANGCHAIN_POSTGRES_VERSIONS.
+    """
+    try:
+        installed: str = version("langchain-postgres")
+    except PackageNotFoundError:
+        return
+    parts: Tuple[int, ...] = tuple(int(part) for part in installed.split(".")[:3] if part.isdigit())
+    lowest, highest = SUPPORTED_LANGCHAIN_POSTGRES_VERSIONS
+    if not lowest <= parts < highest:
+        logger.warning(
+            "langchain-postgres %s is untested with the RAG tools, which use PGEngine internals. Install %s\n",
+            installed,
+            LANGCHAIN_POSTGRES_REQUIREMENT,
+        )
+
+
+async def run_on_connection(engine: PGEngine, work: Callable[[AsyncConnection], Awaitable[T]]) -> T:
+    """
+    Run work with a pooled connection of the engine, on the engine's own event loop.
+    PGEngine exposes neither, so this is the only use of its private _pool and _run_as_async().
+
+    :param engine: Engine to run on
+    :param work: Coroutine function taking the connection
+    :return: The result of the work
+    """
+    check_engine_internals(engine)
+
+    async def run() -> T:
+        # pylint: disable=protected-access
+        async with engine._pool.connect() as connection:
+            return await work(connection)
+
+    # pylint: disable=protected-access
+    return await engine._run_as_async(run())
+
+
+class PGEngineRegistry:
+    """
+    Shares one pooled PGEngine per connection string across all Postgres-backed RAG tools in the process,
+    remembers which tables are known to exist, and keeps the vector stores opened on them,
+    so that querying an existing table costs no connection setup and no schema introspection.
+    A table found to exist is trusted for table_ttl_seconds, then checked again, so that a table dropped by
+    another process is noticed; the stores opened on a table found missing are forgotten.
+
+    PGEngine runs its queries on a background event loop, so engines and stores can be shared by
+    callers on any event loop or thread.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    _shared: Optional["PGEngineRegistry"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_overflow: int = DEFAULT_MAX_OVERFLOW,
+        pool_recycle_seconds: int = DEFAULT_POOL_RECYCLE_SECONDS,
+        table_ttl_seconds: float = DEFAULT_TABLE_TTL_SECONDS,
+    ):
+        """
+        :param pool_size: Connections kept open per engine
+        :param max_overflow: Extra connections an engine may open under load
+        :param pool_recycle_seconds: Age after which a pooled connection is replaced
+        :param table_ttl_seconds: Seconds for which a table found to exist is not checked again
+        """
+        self.pool_size: int = pool_size
+        self.max_overflow: int = max_overflow
+        self.pool_recycle_seconds: int = pool_recycle_seconds
+        self.table_ttl_seconds: float = table_ttl_seconds
+        self._engines: Dict[str, PGEngine] = {}
+        # Time at which each table was last known to exist
+        self._existing_tables: Dict[Tuple[str, str, str], float] = {}
+        self._stores: Dict[Tuple[str, str, str, str], VectorStore] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_shared(cls) -> "PGEngineRegistry":
+        """
+        :return: The process-wide registry, with pool sizes from RAG_PG_POOL_SIZE, RAG_PG_MAX_OVERFLOW
+            and RAG_PG_POOL_RECYCLE_SECONDS, and the table TTL from RAG_PG_TABLE_TTL_SECONDS
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(
+                    pool_size=int(os.getenv("RAG_PG_POOL_SIZE", str(DEFAULT_POOL_SIZE))),
+                    max_overflow=int(os.getenv("RAG_PG_MAX_OVERFLOW", str(DEFAULT_MAX_OVERFLOW))),
+                    pool_recycle_seconds=int(
+                        os.getenv("RAG_PG_POOL_RECYCLE_SECONDS", str(DEFAULT_POOL_RECYCLE_SECONDS))
+                    ),
+                    table_ttl_seconds=float(os.getenv("RAG_PG_TABLE_TTL_SECONDS", str(DEFAULT_TABLE_TTL_SECONDS))),
+                )
+            return cls._shared
+
+    def get_engine(self, connection_string: str) -> PGEngine:
+        """
+        :param connection_string: SQLAlchemy asyncpg URL, see PostgresConfig.connection_string
+        :return: The pooled engine for that database, created on first use
+        """
+        with self._lock:
+            engine: Optional[PGEngine] = self._engines.get(connection_string)
+            if engine is None:
+                engine = PGEngine.from_connection_string(
+                    url=connection_string,
+                    pool_size=self.pool_size,
+                    max_overflow=self.max_overflow,
+                    pool_recycle=self.pool_recycle_seconds,
+                    pool_pre_ping=True,
+                )
+                self._engines[connection_string] = engine
+            return engine
+
+    async def table_exists(
+        self, connection_string: str, table_name: str, schema_name: str = DEFAULT_SCHEMA_NAME
+    ) -> bool:
+        """
+        Check whether a table exists. Positive answers are cached for table_ttl_seconds; a missing table is checked
+        again next time, as another process may have created it meanwhile, and the stores opened on it are forgotten.
+
+        :param connection_string: SQLAlchemy asyncpg URL
+        :param table_name: Vector store table
+        :param schema_name: Schema of the table
+        :return: True if the table exists
+        """
+        key: Tuple[str, str, str] = (connection_string, schema_name, table_name)
+        with self._lock:
+            known_at: Optional[float] = self._existing_tables.get(key)
+        if known_at is not None and time.monotonic() - known_at < self.table_ttl_seconds:
+            return True
+
+        engine: PGEngine = self.get_engine(connection_string)
+        exists: bool = await run_on_connection(
+            engine, lambda connection: self._query_table_exists(connection, table_name, schema_name)
+        )
+        if exists:
+            self.mark_table_exists(connection_string, table_name, schema_name)
+        else:
+            self.invalidate(connection_string, table_name, schema_name)
+        return exists
+
+    @staticmethod
+    async def _query_table_exists(connection: AsyncConnection, table_name: str, schema_name: str) -> bool:
+        """Run the existence query on a pooled connection."""
+        result = await connection.execute(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM information_schema.tables "
+                "WHERE table_schema = :schema_name AND table_name = :table_name)"
+            ),
+            {"schema_name": schema_name, "table_name": table_name},
+        )
+        return bool(result.scalar())
+
+    async def create_metadata_indexes(
+        self,
+        connection_string: str,
+        table_name: str,
+        fields: Sequence[str],
+        schema_name: str = DEFAULT_SCHEMA_NAME,
+    ):
+        """
+        Index metadata fields of a vector store table, so that metadata filters pushed down as WHERE clauses
+        on them do not scan the table. langchain-postgres compares text values on metadata->>'field',
+        which is the indexed expression.
+
+        :param connection_string: SQLAlchemy asyncpg URL
+        :param table_name: Vector store table
+        :param fields: Top-level metadata fields to index
+        :param schema_name: Schema of the table
+        """
+        await run_on_connection(
+            self.get_engine(connection_string),
+            lambda connection: self._create_metadata_indexes(connection, table_name, fields, schema_name),
+        )
+
+    @staticmethod
+    async def _create_metadata_indexes(
+        connection: AsyncConnection, table_name: str, fields: Sequence[str], schema_name: str
+    ):
+        """Run the index creation on a pooled connection."""
+        for field in fields:
+            if not field.isidentifier():
+                logger.warning("Not indexing metadata field %r of %s, as it is not an identifier\n", field, table_name)
+                continue
+            await connection.execute(
+                text(
+                    f'CREATE INDEX IF NOT EXISTS "{table_name}_{field}_idx" '
+                    f'ON "{schema_name}"."{table_name}" (({METADATA_JSON_COLUMN}->>\'{field}\'))'
+                )
+            )
+        await connection.commit()
+
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+    async def copy_records(
+        self,
+        connection_string: str,
+        table_name: str,
+        columns: List[str],
+        records: List[Tuple[Any, ...]],
+        schema_name: str = DEFAULT_SCHEMA_NAME,
+    ):
+        """
+        Insert rows with a single binary COPY, which is much faster than INSERT statements for bulk loads.
+        Vectors are sent in the binary pgvector format.
+
+        :param connection_string: SQLAlchemy asyncpg URL
+        :param table_name: Vector store table
+        :param columns: Columns of the records, in order
+        :param records: Rows to insert
+        :param schema_name: Schema of the table
+        """
+        await run_on_connection(
+            self.get_engine(connection_string),
+            lambda connection: self._copy_records(connection, table_name, columns, records, schema_name),
+        )
+
+    @staticmethod
+    async def _copy_records(
+        connection: AsyncConnection,
+        table_name: str,
+        columns: List[str],
+        records: List[Tuple[Any, ...]],
+        schema_name: str,
+    ):
+        """
+        Run the COPY with the asyncpg connection under a pooled one.
+        The binary pgvector codecs are removed again before the connection goes back to the pool,
+        since langchain-postgres binds vectors as text, which they cannot encode.
+        """
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        try:
+            await register_vector(driver_connection)
+            await driver_connection.copy_records_to_table(
+                table_name, records=records, columns=columns, schema_name=schema_name
+            )
+        finally:
+            for type_name in PGVECTOR_TYPES:
+                try:
+                    await driver_connection.reset_type_codec(type_name)
+                except ValueError:
+                    # Not defined by the installed pgvector version
+                    pass
+
+    async def update_metadata(
+        self,
+        connection_string: str,
+        table_name: str,
+        metadatas: Dict[str, Dict[str, Any]],
+        schema_name: str = DEFAULT_SCHEMA_NAME,
+    ):
+        """
+        Set metadata fields of stored chunks without re-embedding them.
+
+        :param connection_string: SQLAlchemy asyncpg URL
+        :param table_name: Vector store table
+        :param metadatas: Chunk id -> metadata fields to set
+        :param schema_name: Schema of the table
+        """
+        if metadatas:
+            await run_on_connection(
+                self.get_engine(connection_string),
+                lambda connection: self._update_metadata(connection, table_name, metadatas, schema_name),
+            )
+
+    @staticmethod
+    async def _update_metadata(
+        connection: AsyncConnection, table_name: str, metadatas: Dict[str, Dict[str, Any]], schema_name: str
+    ):
+        """Merge the fields into the JSONB metadata on a pooled connection."""
+        await connection.execute(
+            text(
+                f'UPDATE "{schema_name}"."{table_name}" '
+                f"SET {METADATA_JSON_COLUMN} = "
+                f"COALESCE({METADATA_JSON_COLUMN}, '{{}}'::jsonb) || CAST(:fields AS JSONB) "
+                f"WHERE {ID_COLUMN} = CAST(:chunk_id AS UUID)"
+            ),
+            [
+                {"chunk_id": chunk_id, "fields": json.dumps(fields, ensure_ascii=False)}
+                for chunk_id, fields in metadatas.items()
+            ],
+        )
+        await connection.commit()
+
+    async def analyze(self, connection_string: str, table_name: str, schema_name: str = DEFAULT_SCHEMA_NAME) -> int:
+        """
+        Refresh the planner statistics of a table after a bulk load.
+
+        :param connection_string: SQLAlchemy asyncpg URL
+        :param table_name: Vector store table
+        :param schema_name: Schema of the table
+        :return: Number of rows of the table estimated by ANALYZE
+        """
+        return await run_on_connection(
+            self.get_engine(connection_string), lambda connection: self._analyze(connection, table_name, schema_name)
+        )
+
+    @staticmethod
+    async def _analyze(connection: AsyncConnection, table_name: str, schema_name: str) -> int:
+        """Run ANALYZE on a pooled connection."""
+        await connection.execute(text(f'ANALYZE "{schema_name}"."{table_name}"'))
+        await connection.commit()
+        result = await connection.execute(
+            text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:qualified_name)"),
+            {"qualified_name": f'"{schema_name}"."{table_name}"'},
+        )
+        return max(int(result.scalar() or 0), 0)
+
+    def mark_table_exists(self, connection_string: str, table_name: str, schema_name: str = DEFAULT_SCHEMA_NAME):
+        """
+        Record a table created by this process.
+
+        :param connection_string: SQLAlchemy asyncpg URL
+        :param table_name: Vector store table
+        :param schema_name: Schema of the table
+        """
+        with self._lock:
+            self._existing_tables[(connection_string, schema_name, table_name)] = time.monotonic()
+
+    def get_vector_store(
+        self, connection_string: str, table_name: str, embedding_key: str, schema_name: str = DEFAULT_SCHEMA_NAME
+    ) -> Optional[VectorStore]:
+        """
+        :param connection_string: SQLAlchemy asyncpg URL
+        :param table_name: Vector store table
+        :param embedding_key: Identifies the embedding model the store embeds queries with
+        :param schema_name: Schema of the table
+        :return: The vector store already opened on the table, if any. Check that the table exists first.
+        """
+        with self._lock:
+            return self._stores.get((connection_string, schema_name, table_name, embedding_key))
+
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+    def put_vector_store(
+        self,
+        connection_string: str,
+        table_name: str,
+        embedding_key: str,
+        vectorstore: VectorStore,
+        schema_name: str = DEFAULT_SCHEMA_NAME,
+    ):
+        """
+        Keep a vector store opened on a table for later calls.
+
+        :param connection_string: SQLAlchemy asyncpg URL
+        :param table_name: Vector store table
+        :param embedding_key: Identifies the embedding model the store embeds queries with
+        :param vectorstore: The opened store
+        :param schema_name: Schema of the table
+        """
+        with self._lock:
+            self._stores[(connection_string, schema_name, table_name, embedding_key)] = vectorstore
+            self._existing_tables[(connection_string, schema_name, table_name)] = time.monotonic()
+
+    def invalidate_store(self, vectorstore: VectorStore):
+        """
+        Forget what is known about the table of an opened vector store, e.g. after a query found it missing.
+
+        :param vectorstore: A store kept with put_vector_store()
+        """
+        with self._lock:
+            keys = [key for key, store in self._stores.items() if store is vectorstore]
+        for connection_string, schema_name, table_name, _ in keys:
+            self.invalidate(connection_string, table_name, schema_name)
+
+    def invalidate(self, connection_string: str, table_name: str, schema_name: str = DEFAULT_SCHEMA_NAME):
+        """
+        Forget what is known about a table, e.g. after it was dropped.
+
+        :param connection_string: SQLAlchemy asyncpg URL
+        :param table_name: Vector store table
+        :param schema_name: Schema of the table
+        """
+        with self._lock:
+            self._existing_tables.pop((connection_string, schema_name, table_name), None)
+            for key in [key for key in self._stores if key[:3] == (connection_string, schema_name, table_name)]:
+                del self._stores[key]
+
+    async def aclose(self):
+        """Dispose of every engine's connection pool and forget all tables and stores."""
+        with self._lock:
+            engines = list(self._engines.values())
+            self._engines.clear()
+            self._existing_tables.clear()
+            self._stores.clear()
+        for engine in engines:
+            await engine.close()
@@ -0,0 +1,243 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+NumpyVectorStore that searches a compressed copy of its matrix and rescores the best candidates at full precision.
+
+Every row is normalized to unit length and stored either as float16, or as int8 codes with one float32 scale per row.
+The full-precision matrix stays in the ".npy" file and is memory-mapped, so only the rows being rescored are read.
+The codes are saved next to the matrix:
+    store.quant.npz      codes, scales and the quantization dtype
+
+Used by the "quantized" vector store type. RAG_QUANTIZED_DTYPE is "int8" (default, a quarter of the float32 size) or
+"float16" (half the size, better recall, slower to scan). RAG_QUANTIZED_RESCORE candidates per result are rescored
+(default 4, 0 skips rescoring). Compare with the other stores with `python -m benchmarks.quantization_benchmark`.
+"""
+
+import logging
+import os
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+# pylint: disable=import-error
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from coded_tools.tools.rag.numpy_vector_store import NORM_EPSILON
+from coded_tools.tools.rag.numpy_vector_store import NumpyVectorStore
+from coded_tools.tools.rag.numpy_vector_store import sidecar_path
+
+QUANT_SUFFIX = ".quant.npz"
+QUANTIZED_DTYPES = ("int8", "float16")
+# Defaults, overridable with RAG_QUANTIZED_DTYPE and RAG_QUANTIZED_RESCORE
+DEFAULT_DTYPE = "int8"
+DEFAULT_RESCORE_FACTOR = 4
+# Rows decoded per matrix product when scoring the codes, small enough to stay in the CPU cache until they are scored
+SCORE_BLOCK_ROWS = 1024
+# Rows of a loaded matrix quantized at a time, to bound temporary memory
+QUANTIZE_BLOCK_ROWS = 16384
+INT8_MAX = 127.0
+
+logger = logging.getLogger(__name__)
+
+
+class QuantizedVectorStore(NumpyVectorStore):
+    """
+    Two-stage cosine-similarity search: the compressed rows are scored first, then the
+    k * rescore_factor best candidates are rescored with their full-precision rows.
+    int8 codes take a quarter of the float32 matrix, float16 half of it with better recall.
+    A rescore_factor of 0 skips rescoring, so the full-precision matrix is never read after quantization.
+
+    The matrix is re-mapped from disk after the store is saved, so a saved or loaded store keeps only
+    the codes in memory. Adding or deleting chunks copies the matrix back into memory until the next save.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, embedding: Embeddings, dtype: Optional[str] = None, rescore_factor: Optional[int] = None):
+        """
+        :param embedding: Embeddings used for queries and for texts added later
+        :param dtype: "int8" or "float16". Defaults to RAG_QUANTIZED_DTYPE.
+        :param rescore_factor: Candidates rescored per result. Defaults to RAG_QUANTIZED_RESCORE.
+        """
+        super().__init__(embedding=embedding)
+        self.dtype: str = dtype or os.getenv("RAG_QUANTIZED_DTYPE", DEFAULT_DTYPE)
+        if self.dtype not in QUANTIZED_DTYPES:
+            raise ValueError(f"Unsupported quantization dtype {self.dtype!r}. Use one of {QUANTIZED_DTYPES}.")
+        self.rescore_factor: int = (
+            rescore_factor
+            if rescore_factor is not None
+            else int(os.getenv("RAG_QUANTIZED_RESCORE", str(DEFAULT_RESCORE_FACTOR)))
+        )
+        self._codes: np.ndarray = np.zeros((0, 0), dtype=self.dtype)
+        self._scales: np.ndarray = np.zeros(0, dtype=np.float32)
+        # Over-allocated arrays whose leading rows are _codes and _scales, grown like the matrix buffers
+        self._codes_buffer: Optional[np.ndarray] = None
+        self._scales_buffer: Optional[np.ndarray] = None
+
+    @property
+    def nbytes(self) -> int:
+        """
+        :return: Approximate memory footprint of the codes, norms and records, plus the matrix unless it is mapped
+        """
+        codes: np.ndarray = self._codes if self._codes_buffer is None else self._codes_buffer
+        scales: np.ndarray = self._scales if self._scales_buffer is None else self._scales_buffer
+        total: int = super().nbytes + codes.nbytes + scales.nbytes
+        if isinstance(self._matrix, np.memmap):
+            total -= self._matrix.nbytes
+        return int(total)
+
+    # ---------- search ----------
+    def search_rows(
+        self, query_vector: Sequence[float], k: int, rescore_factor: Optional[int] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        Approximate top-k cosine similarity search over the codes, rescored at full precision.
+
+        :param query_vector: Query embedding
+        :param k: Number of results
+        :param rescore_factor: Candidates rescored per result for this query. Defaults to the store's rescore_factor.
+        :return: List of (row, similarity) pairs, best first
+        """
+        if len(self) == 0 or k <= 0:
+            return []
+        query: np.ndarray = np.asarray(query_vector, dtype=np.float32)
+        query = query / (np.linalg.norm(query) + NORM_EPSILON)
+        factor: int = self.rescore_factor if rescore_factor is None else rescore_factor
+        if factor <= 0:
+            return self._top_k(self._approximate_scores(query), np.arange(len(self)), k)
+
+        shortlist: List[Tuple[int, float]] = self._top_k(
+            self._approximate_scores(query), np.arange(len(self)), k * factor
+        )
+        # Sorted rows are gathered from the memory-mapped matrix in file order
+        candidates: np.ndarray = np.sort(np.asarray([row for row, _ in shortlist], dtype=np.int64))
+        scores: np.ndarray = (np.asarray(self._matrix[candidates]) @ query) / (self._norms[candidates] + NORM_EPSILON)
+        return self._top_k(scores, candidates, k)
+
+    def exact_search_rows(self, query_vector: Sequence[float], k: int) -> List[Tuple[int, float]]:
+        """
+        Full scan of the full-precision matrix, as done by NumpyVectorStore. Used as ground truth for recall.
+
+        :param query_vector: Query embedding
+        :param k: Number of results
+        :return: List of (row, similarity) pairs, best first
+        """
+        return super().search_rows(query_vector, k)
+
+    def similarity_search_with_score_by_vector(
+        self, embedding: List[float], k: int = 4, **kwargs: Any
+    ) -> List[Tuple[Document, float]]:
+        """
+        :param embedding: Query embedding
+        :param k: Number of results
+        :param kwargs: May contain rescore_factor to override the store's recall/latency trade-off for this query
+            or filter, chunk ids to restrict an exact search to
+        :return: List of (document, cosine similarity) pairs, best first
+        """
+        if kwargs.get("filter") is not None:
+            return super().similarity_search_with_score_by_vector(embedding, k, **kwargs)
+        rows: List[Tuple[int, float]] = self.search_rows(embedding, k, kwargs.get("rescore_factor"))
+        return [(self._row_to_document(row), score) for row, score in rows]
+
+    def _approximate_scores(self, query: np.ndarray) -> np.ndarray:
+        """
+        :param query: Unit-length query embedding
+        :return: Approximate cosine similarity of every row, decoded block by block
+        """
+        scores: np.ndarray = np.empty(len(self), dtype=np.float32)
+        decoded: np.ndarray = np.empty((min(SCORE_BLOCK_ROWS, len(self)), self._codes.shape[1]), dtype=np.float32)
+        for block in range(0, len(self), SCORE_BLOCK_ROWS):
+            end: int = min(block + SCORE_BLOCK_ROWS, len(self))
+            np.copyto(decoded[: end - block], self._codes[block:end], casting="unsafe")
+            scores[block:end] = decoded[: end - block] @ query
+        if self.dtype == "int8":
+            scores *= self._scales
+        return scores
+
+    # ---------- quantization ----------
+    def _quantize(self, vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :param vectors: float32 rows
+        :return: Tuple of (codes of the unit-length rows, scale per row). The scales are 1 for float16.
+        """
+        units: np.ndarray = vectors / (np.linalg.norm(vectors, axis=1, keepdims=True) + NORM_EPSILON)
+        if self.dtype == "float16":
+            return units.astype(np.float16), np.ones(len(units), dtype=np.float32)
+        scales: np.ndarray = (np.abs(units).max(axis=1, initial=0.0) / INT8_MAX).astype(np.float32)
+        codes: np.ndarray = np.rint(units / (scales[:, None] + NORM_EPSILON)).astype(np.int8)
+        return codes, scales
+
+    def _on_rows_changed(self) -> None:
+        rows: int = len(self._norms)
+        if len(self._scales) > rows:
+            # Rows were deleted and the remaining ones moved, so every row is quantized again
+            self._codes = np.zeros((0, 0), dtype=self.dtype)
+            self._scales = np.zeros(0, dtype=np.float32)
+            self._codes_buffer = None
+            self._scales_buffer = None
+        if len(self._scales) < rows:
+            self._append_codes(*self._quantize(np.asarray(self._matrix[len(self._scales) :], dtype=np.float32)))
+
+    def _append_codes(self, codes: np.ndarray, scales: np.ndarray) -> None:
+        """Append codes, doubling the backing buffers when they are full, like NumpyVectorStore._append_rows()."""
+        rows: int = len(self._scales)
+        needed: int = rows + len(codes)
+        if self._codes_buffer is None or len(self._codes_buffer) < needed:
+            capacity: int = max(needed, 2 * rows)
+            self._codes_buffer = np.empty((capacity, codes.shape[1]), dtype=self.dtype)
+            self._scales_buffer = np.empty(capacity, dtype=np.float32)
+            if rows:
+                self._codes_buffer[:rows] = self._codes
+                self._scales_buffer[:rows] = self._scales
+        self._codes_buffer[rows:needed] = codes
+        self._scales_buffer[rows:needed] = scales
+        self._codes = self._codes_buffer[:needed]
+        self._scales = self._scales_buffer[:needed]
+
+    # ---------- persistence ----------
+    def dump(self, path: str) -> None:
+        """
+        Save the store, then map its full-precision matrix from the saved file instead of keeping it in memory.
+
+        :param path: Path of the ".npy" matrix file
+        """
+        super().dump(path)
+        if len(self) > 0:
+            self._matrix = np.load(path, mmap_mode="r")
+            self._matrix_buffer = None
+
+    def _dump_extra(self, path: str) -> None:
+        quant_path: str = sidecar_path(path, QUANT_SUFFIX)
+        with open(quant_path + ".tmp", "wb") as quant_file:
+            np.savez(quant_file, codes=self._codes, scales=self._scales, dtype=np.asarray(self.dtype))
+        os.replace(quant_path + ".tmp", quant_path)
+
+    def _load_extra(self, path: str) -> None:
+        quant_path: str = sidecar_path(path, QUANT_SUFFIX)
+        if os.path.exists(quant_path):
+            with np.load(quant_path) as quant:
+                if str(quant["dtype"]) == self.dtype and len(quant["scales"]) == len(self):
+                    self._codes = quant["codes"]
+                    self._scales = quant["scales"]
+                    return
+            logger.info("Quantized codes at %s do not match the store. Quantizing it again.\n", quant_path)
+        for block in range(0, len(self), QUANTIZE_BLOCK_ROWS):
+            self._append_codes(*self._quantize(np.asarray(self._matrix[block : block + QUANTIZE_BLOCK_ROWS])))
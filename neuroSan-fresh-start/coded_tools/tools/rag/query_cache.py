@@ -0,0 +1,251 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Process-wide cache of retrieval results, matched exactly or by query embedding similarity.
+
+Results are kept for RAG_QUERY_CACHE_TTL_SECONDS (default 3600), up to RAG_QUERY_CACHE_MAX_ENTRIES in the process
+(default 2048, 0 disables the cache). Queries match if equal once lowercased without punctuation, or if their
+embeddings have a cosine similarity of at least RAG_QUERY_CACHE_SIMILARITY (default 0.92).
+"""
+
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+
+# pylint: disable=import-error
+import numpy as np
+
+# Defaults, overridable with RAG_QUERY_CACHE_MAX_ENTRIES, RAG_QUERY_CACHE_TTL_SECONDS and RAG_QUERY_CACHE_SIMILARITY
+DEFAULT_MAX_ENTRIES = 2048
+DEFAULT_TTL_SECONDS = 3600.0
+DEFAULT_SIMILARITY_THRESHOLD = 0.92
+# Separates a scope from a narrower scope within it, e.g. the results of a metadata filter, dropped along with it
+SUB_SCOPE_SEPARATOR = "|"
+
+NON_WORD_PATTERN = re.compile(r"[\W_]+")
+
+
+def normalize_query(query: str) -> str:
+    """
+    :param query: Query as typed by the user or the agent
+    :return: Lowercased query with punctuation and repeated whitespace collapsed, e.g. "carry on size limit"
+    """
+    return NON_WORD_PATTERN.sub(" ", query.lower()).strip()
+
+
+@dataclass
+class QueryCacheEntry:
+    """Retrieval result of one query, with the unit-length query embedding if it was computed."""
+
+    result: str
+    expires_at: float
+    vector: Optional[np.ndarray] = None
+
+
+class QueryCache:
+    """
+    Thread-safe LRU cache of retrieval results with a time to live.
+
+    Entries are scoped, e.g. to the fingerprint of a vector store or the settings of a remote retriever,
+    and a whole scope is dropped when its store changes. A query is first looked up by its normalized text,
+    then, if the caller has its embedding, by cosine similarity with the embeddings of the scope's cached queries.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    _shared: Optional["QueryCache"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ):
+        """
+        :param max_entries: Cached results kept over all scopes. 0 disables the cache.
+        :param ttl_seconds: Age after which a result is retrieved again
+        :param similarity_threshold: Smallest cosine similarity between query embeddings that counts as the same query.
+            Values above 1 disable similarity matching.
+        """
+        self.max_entries: int = max_entries
+        self.ttl_seconds: float = ttl_seconds
+        self.similarity_threshold: float = similarity_threshold
+        self._entries: "OrderedDict[Tuple[str, str], QueryCacheEntry]" = OrderedDict()
+        self._scopes: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self._hits: int = 0
+        self._similar_hits: int = 0
+        # Results that had to be retrieved, counted when they are cached
+        self._misses: int = 0
+
+    @classmethod
+    def get_shared(cls) -> "QueryCache":
+        """
+        :return: The process-wide cache, configured by RAG_QUERY_CACHE_MAX_ENTRIES, RAG_QUERY_CACHE_TTL_SECONDS
+            and RAG_QUERY_CACHE_SIMILARITY
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(
+                    max_entries=int(os.getenv("RAG_QUERY_CACHE_MAX_ENTRIES", str(DEFAULT_MAX_ENTRIES))),
+                    ttl_seconds=float(os.getenv("RAG_QUERY_CACHE_TTL_SECONDS", str(DEFAULT_TTL_SECONDS))),
+                    similarity_threshold=float(
+                        os.getenv("RAG_QUERY_CACHE_SIMILARITY", str(DEFAULT_SIMILARITY_THRESHOLD))
+                    ),
+                )
+            return cls._shared
+
+    @property
+    def enabled(self) -> bool:
+        """
+        :return: True if results are cached at all
+        """
+        return self.max_entries > 0
+
+    @property
+    def matches_similar(self) -> bool:
+        """
+        :return: True if get_similar() can match, so computing the query embedding for it is worthwhile
+        """
+        return self.enabled and self.similarity_threshold <= 1.0
+
+    def get(self, scope: str, query: str) -> Optional[str]:
+        """
+        :param scope: Scope of the result, e.g. a vector store fingerprint
+        :param query: Query text
+        :return: The cached result of the same normalized query, or None
+        """
+        with self._lock:
+            entry: Optional[QueryCacheEntry] = self._get_locked((scope, normalize_query(query)))
+            if entry is None:
+                return None
+            self._hits += 1
+            return entry.result
+
+    def get_similar(self, scope: str, query_vector: Sequence[float]) -> Optional[str]:
+        """
+        :param scope: Scope of the result
+        :param query_vector: Embedding of the query
+        :return: The cached result of the most similar query above the similarity threshold, or None
+        """
+        vector: np.ndarray = self._unit(query_vector)
+        with self._lock:
+            keys: List[Tuple[str, str]] = []
+            vectors: List[np.ndarray] = []
+            for normalized in list(self._scopes.get(scope, ())):
+                entry: Optional[QueryCacheEntry] = self._get_locked((scope, normalized), touch=False)
+                if entry is not None and entry.vector is not None and len(entry.vector) == len(vector):
+                    keys.append((scope, normalized))
+                    vectors.append(entry.vector)
+
+            if vectors:
+                similarities: np.ndarray = np.stack(vectors) @ vector
+                best: int = int(np.argmax(similarities))
+                if similarities[best] >= self.similarity_threshold:
+                    self._entries.move_to_end(keys[best])
+                    self._similar_hits += 1
+                    return self._entries[keys[best]].result
+            return None
+
+    def put(self, scope: str, query: str, result: str, query_vector: Optional[Sequence[float]] = None) -> None:
+        """
+        Cache a result, evicting the least recently used results beyond max_entries.
+
+        :param scope: Scope of the result
+        :param query: Query text
+        :param result: Retrieval result
+        :param query_vector: Embedding of the query, enabling similarity matches of later queries
+        """
+        if not self.enabled:
+            return
+        normalized: str = normalize_query(query)
+        entry = QueryCacheEntry(
+            result=result,
+            expires_at=time.monotonic() + self.ttl_seconds,
+            vector=None if query_vector is None else self._unit(query_vector),
+        )
+        with self._lock:
+            self._misses += 1
+            self._entries[(scope, normalized)] = entry
+            self._entries.move_to_end((scope, normalized))
+            self._scopes.setdefault(scope, set()).add(normalized)
+            while len(self._entries) > self.max_entries:
+                self._remove_locked(next(iter(self._entries)))
+
+    def invalidate(self, scope: str) -> None:
+        """
+        Drop every result of a scope and of its sub-scopes, e.g. after its vector store was rebuilt or updated.
+
+        :param scope: Scope to drop
+        """
+        with self._lock:
+            scopes: List[str] = [
+                other for other in self._scopes if other == scope or other.startswith(scope + SUB_SCOPE_SEPARATOR)
+            ]
+            for other in scopes:
+                for normalized in list(self._scopes.get(other, ())):
+                    self._remove_locked((other, normalized))
+
+    def stats(self) -> Dict[str, int]:
+        """
+        :return: Hit/miss counters and size of the cache
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "similar_hits": self._similar_hits,
+                "misses": self._misses,
+                "entries": len(self._entries),
+            }
+
+    def _get_locked(self, key: Tuple[str, str], touch: bool = True) -> Optional[QueryCacheEntry]:
+        """Return a live entry, dropping it if it expired. The caller must hold the lock."""
+        entry: Optional[QueryCacheEntry] = self._entries.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            self._remove_locked(key)
+            return None
+        if entry is not None and touch:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _remove_locked(self, key: Tuple[str, str]) -> None:
+        """Remove an entry from the cache and its scope. The caller must hold the lock."""
+        if self._entries.pop(key, None) is None:
+            return
+        scope, normalized = key
+        scope_keys: Set[str] = self._scopes.get(scope, set())
+        scope_keys.discard(normalized)
+        if not scope_keys:
+            self._scopes.pop(scope, None)
+
+    @staticmethod
+    def _unit(vector: Sequence[float]) -> np.ndarray:
+        """
+        :param vector: Embedding
+        :return: float32 copy scaled to unit length
+        """
+        array: np.ndarray = np.asarray(vector, dtype=np.float32)
+        return array / max(float(np.linalg.norm(array)), 1e-12)
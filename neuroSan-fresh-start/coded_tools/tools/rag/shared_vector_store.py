@@ -0,0 +1,179 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+In-memory vector stores shared by the server processes of a host through memory-mapped files.
+
+The first process that needs a store builds it and publishes it in the binary NumpyVectorStore format.
+Every process, the publisher included, then maps the published files read-only, so the host keeps a single
+copy of the embedding matrix and chunk records in its page cache however many processes search them.
+Put the directory on a tmpfs such as /dev/shm to keep the stores in shared memory rather than on disk.
+
+A store is published as "<fingerprint>.npy" and its sidecars, and is complete once "<fingerprint>.ready" exists.
+Publishers take an advisory lock on "<fingerprint>.lock", so each store is built once per host.
+
+Enabled by the "shared_store" tool argument, or RAG_SHARED_VECTOR_STORES=true for every tool. The stores are published
+in RAG_SHARED_STORE_DIR, by default the "shared_stores" directory of the RAG cache. A published store is a snapshot:
+delete its files to have it built again.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from typing import Awaitable
+from typing import Callable
+from typing import Optional
+
+# pylint: disable=import-error
+from langchain_core.vectorstores import InMemoryVectorStore
+from langchain_core.vectorstores import VectorStore
+
+from coded_tools.tools.rag.cache_paths import get_rag_cache_dir
+from coded_tools.tools.rag.numpy_vector_store import NPY_EXTENSION
+from coded_tools.tools.rag.numpy_vector_store import NumpyVectorStore
+
+try:
+    import fcntl
+except ModuleNotFoundError:
+    # Windows: concurrent publishers may build the same store, and the last one to finish wins
+    fcntl = None  # pylint: disable=invalid-name
+
+SHARED_STORES_DIR = "shared_stores"
+READY_SUFFIX = ".ready"
+LOCK_SUFFIX = ".lock"
+# Interval at which a process waiting for another one to publish a store checks the lock again
+LOCK_POLL_SECONDS = 0.2
+
+logger = logging.getLogger(__name__)
+
+
+def to_numpy_vector_store(vectorstore: InMemoryVectorStore) -> NumpyVectorStore:
+    """
+    :param vectorstore: InMemoryVectorStore to convert
+    :return: NumpyVectorStore holding the same chunks, which can be saved in the memory-mappable format
+    """
+    entries = list(vectorstore.store.values())
+    store = NumpyVectorStore(embedding=vectorstore.embedding)
+    store.add_embeddings(
+        [entry["text"] for entry in entries],
+        [entry["vector"] for entry in entries],
+        [entry["metadata"] for entry in entries],
+        [entry["id"] for entry in entries],
+    )
+    return store
+
+
+class SharedVectorStoreDirectory:
+    """
+    Directory of vector stores published for all processes of the host, keyed by the fingerprint of their sources.
+    Published stores are snapshots: a store is only built again once its files are deleted.
+    """
+
+    _shared: Optional["SharedVectorStoreDirectory"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, directory: str):
+        """
+        :param directory: Directory of the published stores. Created if missing.
+        """
+        self.directory: str = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def get_shared(cls) -> "SharedVectorStoreDirectory":
+        """
+        :return: The process-wide directory, RAG_SHARED_STORE_DIR or the shared_stores directory of the RAG cache
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                directory: Optional[str] = os.getenv("RAG_SHARED_STORE_DIR")
+                cls._shared = cls(os.path.expanduser(directory) if directory else get_rag_cache_dir(SHARED_STORES_DIR))
+            return cls._shared
+
+    def store_path(self, fingerprint: str) -> str:
+        """
+        :param fingerprint: Fingerprint of the sources of the store
+        :return: Path of the ".npy" matrix file of the published store
+        """
+        return os.path.join(self.directory, fingerprint + NPY_EXTENSION)
+
+    def is_published(self, fingerprint: str) -> bool:
+        """
+        :param fingerprint: Fingerprint of the sources of the store
+        :return: True if the store was completely published
+        """
+        return os.path.exists(os.path.join(self.directory, fingerprint + READY_SUFFIX))
+
+    async def get_or_publish(
+        self,
+        fingerprint: str,
+        publish: Callable[[str], Awaitable[bool]],
+        attach: Callable[[str], VectorStore],
+    ) -> Optional[VectorStore]:
+        """
+        Attach to a published store, publishing it first if no process did.
+
+        :param fingerprint: Fingerprint of the sources of the store
+        :param publish: Builds the store and saves it to the given ".npy" path. Returns False if it cannot be built.
+        :param attach: Maps the store saved at the given ".npy" path
+        :return: The attached store, or None if it could not be built
+        """
+        path: str = self.store_path(fingerprint)
+        if not self.is_published(fingerprint):
+            lock_fd: int = await self._lock(fingerprint)
+            try:
+                if self.is_published(fingerprint):
+                    logger.info("Vector store %s was published by another process\n", fingerprint)
+                elif await publish(path):
+                    with open(os.path.join(self.directory, fingerprint + READY_SUFFIX), "w", encoding="utf-8"):
+                        pass
+                    logger.info("Published vector store %s to %s\n", fingerprint, path)
+                else:
+                    return None
+            finally:
+                self._unlock(lock_fd)
+
+        vectorstore: VectorStore = attach(path)
+        logger.info("Attached to shared vector store %s\n", path)
+        return vectorstore
+
+    async def _lock(self, fingerprint: str) -> int:
+        """
+        Take the publishing lock of a store, polling so that the event loop is not blocked while another process
+        holds it. The lock is released by the OS if its holder dies.
+
+        :param fingerprint: Fingerprint of the sources of the store
+        :return: File descriptor holding the lock
+        """
+        lock_fd: int = os.open(os.path.join(self.directory, fingerprint + LOCK_SUFFIX), os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is None:
+            return lock_fd
+        while True:
+            try:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return lock_fd
+            except BlockingIOError:
+                await asyncio.sleep(LOCK_POLL_SECONDS)
+            except BaseException:
+                os.close(lock_fd)
+                raise
+
+    @staticmethod
+    def _unlock(lock_fd: int) -> None:
+        if fcntl is not None:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+        os.close(lock_fd)
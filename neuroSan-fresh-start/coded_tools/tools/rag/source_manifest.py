@@ -0,0 +1,237 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Per-source manifest used to re-index only the documents that changed since the last build.
+
+A saved vector store keeps its manifest next to it as "<name>.manifest.json"; postgres tables keep theirs in the
+"manifests" directory of the RAG cache. Per source, it records the ETag, Last-Modified or file mtime and size,
+a content hash of the loaded documents and the ids of their chunks. Unchanged sources are not downloaded again,
+changed ones are re-split and re-embedded, and the chunks of removed ones are deleted. Sources are checked at most
+once per RAG_INCREMENTAL_CHECK_INTERVAL_SECONDS (default 3600) per process. A store without a manifest, or built
+with other chunking or embedding parameters, is rebuilt from scratch.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import uuid
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+
+# pylint: disable=import-error
+import requests
+from langchain_core.documents import Document
+
+MANIFEST_SUFFIX = ".manifest.json"
+MANIFEST_VERSION = 1
+# Namespace for the deterministic chunk ids derived from (source, content hash, chunk index)
+CHUNK_ID_NAMESPACE = uuid.UUID("6f1c7a52-2c9e-4d0b-9f57-6d0c4a8b1e23")
+PROBE_TIMEOUT_SECONDS = 10
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SourceEntry:
+    """What was indexed for one source URL, file or page."""
+
+    # ETag, Last-Modified or file mtime/size observed when the source was indexed, if any
+    version: Optional[str]
+    # sha256 of the loaded documents of this source
+    content_hash: str
+    # Ids of the chunks derived from this source
+    chunk_ids: List[str] = field(default_factory=list)
+    # Ids of the chunks of other sources kept in place of the duplicate chunks of this source
+    alias_ids: List[str] = field(default_factory=list)
+
+
+@dataclass
+class SourceManifest:
+    """
+    Record of the sources behind a vector store and of the chunks derived from each of them.
+    The index parameters (chunking and embedding model) must match for an incremental update;
+    otherwise every chunk would be stale and the store is rebuilt.
+    """
+
+    index_params: Dict[str, Any]
+    sources: Dict[str, SourceEntry] = field(default_factory=dict)
+
+    @staticmethod
+    def path_for(vector_store_path: str) -> str:
+        """
+        :param vector_store_path: Path of a saved vector store
+        :return: Path of the manifest stored next to it
+        """
+        return os.path.splitext(vector_store_path)[0] + MANIFEST_SUFFIX
+
+    @classmethod
+    def load(cls, path: str) -> Optional["SourceManifest"]:
+        """
+        :param path: Manifest file
+        :return: The manifest, or None if it is missing or unreadable
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as manifest_file:
+                data: Dict[str, Any] = json.load(manifest_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as error:
+            logger.warning("Ignoring unreadable manifest %s: %s\n", path, error)
+            return None
+
+        if data.get("manifest_version") != MANIFEST_VERSION:
+            return None
+        sources = {source: SourceEntry(**entry) for source, entry in data.get("sources", {}).items()}
+        return cls(index_params=data.get("index_params", {}), sources=sources)
+
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+    def record(
+        self,
+        source: str,
+        version: Optional[str],
+        content_hash: str,
+        chunks: List[Document],
+        alias_ids: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Record the chunks indexed for a source, replacing any previous entry.
+
+        :param source: Source URL or path
+        :param version: Version probed before the source was loaded
+        :param content_hash: Content hash of the loaded documents
+        :param chunks: Chunks derived from the documents, with their ids set
+        :param alias_ids: Ids of the chunks of other sources kept in place of the duplicate chunks of the source
+        """
+        self.sources[source] = SourceEntry(
+            version=version,
+            content_hash=content_hash,
+            chunk_ids=[chunk.id for chunk in chunks],
+            alias_ids=list(alias_ids or []),
+        )
+
+    def find_dependents(self, sources: Set[str]) -> Set[str]:
+        """
+        Find the other sources whose duplicate chunks were dropped for chunks of the given sources,
+        or, in turn, for chunks of those dependent sources.
+
+        :param sources: Sources whose chunks are deleted
+        :return: The dependent sources, which must be indexed again
+        """
+        deleted_ids: Set[str] = set()
+        for source in sources:
+            if source in self.sources:
+                deleted_ids.update(self.sources[source].chunk_ids)
+        dependents: Set[str] = set()
+        found: bool = True
+        while found:
+            found = False
+            for source, entry in self.sources.items():
+                if source not in sources and source not in dependents and deleted_ids.intersection(entry.alias_ids):
+                    dependents.add(source)
+                    deleted_ids.update(entry.chunk_ids)
+                    found = True
+        return dependents
+
+    def duplicate_sources(self, chunk_ids: Set[str]) -> Dict[str, List[str]]:
+        """
+        :param chunk_ids: Ids of kept chunks
+        :return: For each of them, the sources whose duplicate chunks were dropped in its favour, sorted
+        """
+        duplicate_sources: Dict[str, List[str]] = {chunk_id: [] for chunk_id in chunk_ids}
+        for source, entry in sorted(self.sources.items()):
+            for chunk_id in entry.alias_ids:
+                if chunk_id in duplicate_sources:
+                    duplicate_sources[chunk_id].append(source)
+        return duplicate_sources
+
+    def save(self, path: str) -> None:
+        """
+        Atomically write the manifest.
+
+        :param path: Manifest file
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        data = {
+            "manifest_version": MANIFEST_VERSION,
+            "index_params": self.index_params,
+            "sources": {source: asdict(entry) for source, entry in self.sources.items()},
+        }
+        with open(path + ".tmp", "w", encoding="utf-8") as manifest_file:
+            json.dump(data, manifest_file, indent=2, sort_keys=True)
+        os.replace(path + ".tmp", path)
+        logger.info("Saved manifest of %d sources to %s\n", len(self.sources), path)
+
+
+def probe_source_version(source: str) -> Optional[str]:
+    """
+    Cheaply find out the current version of a source without downloading it.
+    Remote URLs are probed with a HEAD request for ETag/Last-Modified; local files use mtime and size.
+
+    :param source: URL or file path
+    :return: Version token, or None if the version cannot be determined
+    """
+    if source.startswith(("http://", "https://")):
+        try:
+            response = requests.head(source, allow_redirects=True, timeout=PROBE_TIMEOUT_SECONDS)
+        except requests.RequestException as error:
+            logger.info("Could not probe %s: %s\n", source, error)
+            return None
+        if not response.ok:
+            return None
+        etag: Optional[str] = response.headers.get("ETag")
+        last_modified: Optional[str] = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            return f"etag={etag};last-modified={last_modified}"
+        return None
+
+    try:
+        stat = os.stat(source)
+    except OSError:
+        return None
+    return f"mtime={stat.st_mtime_ns};size={stat.st_size}"
+
+
+def hash_documents(docs: List[Document]) -> str:
+    """
+    :param docs: Documents loaded from one source, in load order
+    :return: sha256 hex digest of their text and metadata
+    """
+    digest = hashlib.sha256()
+    for doc in docs:
+        digest.update(doc.page_content.encode("utf-8"))
+        digest.update(json.dumps(doc.metadata, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def make_chunk_id(source: str, content_hash: str, index: int) -> str:
+    """
+    Derive a stable chunk id, valid as a UUID for the Postgres id column.
+
+    :param source: Source the chunk was split from
+    :param content_hash: Content hash of that source
+    :param index: Position of the chunk within the source
+    :return: UUID string
+    """
+    return str(uuid.uuid5(CHUNK_ID_NAMESPACE, f"{source}\n{content_hash}\n{index}"))
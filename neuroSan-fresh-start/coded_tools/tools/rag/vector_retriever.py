@@ -0,0 +1,61 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Retriever embedding queries with the embeddings of the querying tool rather than those of the vector store."""
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+# pylint: disable=import-error
+from langchain_core.callbacks import AsyncCallbackManagerForRetrieverRun
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.vectorstores import VectorStore
+
+
+class VectorRetriever(BaseRetriever):
+    """
+    Retrieves the k chunks most similar to the query, embedding it with the given embeddings.
+    Vector stores shared across tools, e.g. through the VectorStoreCache or the PGEngineRegistry, keep the
+    embeddings of the tool that built them, whose HTTP client may be bound to an event loop that is closed since,
+    as with stores preloaded by the RAG warm-up. Searching by vector leaves those embeddings unused.
+    """
+
+    vectorstore: VectorStore
+    embeddings: Embeddings
+    # Keyword arguments of the similarity search, e.g. k or a filter
+    search_kwargs: Dict[str, Any] = {}
+
+    def _get_relevant_documents(self, query: str, *, run_manager: CallbackManagerForRetrieverRun) -> List[Document]:
+        query_vector: List[float] = self.embeddings.embed_query(query)
+        return self.vectorstore.similarity_search_by_vector(query_vector, **self._with_k(self.search_kwargs))
+
+    async def _aget_relevant_documents(
+        self, query: str, *, run_manager: AsyncCallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        query_vector: List[float] = await self.embeddings.aembed_query(query)
+        return await self.vectorstore.asimilarity_search_by_vector(query_vector, **self._with_k(self.search_kwargs))
+
+    @staticmethod
+    def _with_k(search_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        :param search_kwargs: Keyword arguments of the similarity search
+        :return: The same arguments with k, 4 by default as with VectorStore.as_retriever()
+        """
+        return {"k": 4, **search_kwargs}
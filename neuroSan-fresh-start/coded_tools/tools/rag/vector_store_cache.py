@@ -0,0 +1,314 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Process-wide cache of built vector stores keyed by a fingerprint of their sources.
+
+The fingerprint covers the tool, its sources, the chunking parameters and the embedding model, so that repeated
+queries over the same sources skip loading and embedding. Bounded by RAG_VECTOR_STORE_CACHE_MAX_BYTES (default 1 GiB).
+"""
+
+import asyncio
+import concurrent.futures
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import Optional
+
+# pylint: disable=import-error
+from langchain_community.vectorstores import InMemoryVectorStore
+from langchain_core.vectorstores import VectorStore
+
+# Default memory budget of the shared cache (1 GiB), overridable with RAG_VECTOR_STORE_CACHE_MAX_BYTES
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+# Rough cost of a Python float inside a list: the float object plus the list slot pointing at it
+PYTHON_FLOAT_BYTES = 32
+# Rough per-chunk overhead for the dict, id and metadata of an InMemoryVectorStore entry
+ENTRY_OVERHEAD_BYTES = 512
+# Size assumed for vector stores whose footprint cannot be estimated
+UNKNOWN_STORE_BYTES = 64 * 1024 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_loader_args(loader_args: Any) -> Any:
+    """
+    Normalize loader arguments so that equivalent inputs produce the same fingerprint.
+    Lists of strings (URLs, page ids, ...) are sorted and de-duplicated.
+
+    :param loader_args: Arguments passed to a document loader
+    :return: JSON-serializable normalized copy of the arguments
+    """
+    if isinstance(loader_args, dict):
+        return {str(key): _normalize_loader_args(value) for key, value in loader_args.items()}
+    if isinstance(loader_args, (list, tuple, set)):
+        values = [_normalize_loader_args(value) for value in loader_args]
+        if all(isinstance(value, str) for value in values):
+            return sorted(set(values))
+        return values
+    return loader_args
+
+
+def fingerprint_sources(loader_type: str, loader_args: Any, chunk_params: Dict[str, Any], embedding_model: str) -> str:
+    """
+    Compute a stable fingerprint for a vector store built from the given sources.
+
+    :param loader_type: Name of the loader implementation, e.g. "PdfRag"
+    :param loader_args: Arguments specific to the document loader (URLs, page ids, ...)
+    :param chunk_params: Parameters used to split the documents into chunks
+    :param embedding_model: Identifier of the embedding model and its dimensions
+    :return: Hex digest identifying the vector store
+    """
+    payload = {
+        "loader_type": loader_type,
+        "loader_args": _normalize_loader_args(loader_args),
+        "chunk_params": chunk_params,
+        "embedding_model": embedding_model,
+    }
+    serialized: str = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def estimate_vector_store_bytes(vectorstore: VectorStore) -> int:
+    """
+    Estimate the memory footprint of a vector store.
+
+    :param vectorstore: The vector store to measure
+    :return: Approximate size in bytes
+    """
+    nbytes: Optional[int] = getattr(vectorstore, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+
+    if isinstance(vectorstore, InMemoryVectorStore):
+        total = 0
+        for entry in vectorstore.store.values():
+            total += len(entry.get("vector") or []) * PYTHON_FLOAT_BYTES
+            total += len(entry.get("text") or "") + ENTRY_OVERHEAD_BYTES
+        return total
+
+    return UNKNOWN_STORE_BYTES
+
+
+class BuildAbandonedError(Exception):
+    """Set on an in-flight build whose owner was cancelled, so that one of its waiters takes the build over."""
+
+
+@dataclass
+class CacheEntry:
+    """A vector store held by the cache together with its estimated size."""
+
+    vectorstore: VectorStore
+    size_bytes: int
+
+
+class VectorStoreCache:
+    """
+    Thread-safe LRU cache of built vector stores, bounded by a memory budget.
+
+    Concurrent requests for the same fingerprint are coalesced so that only one
+    of them loads, splits and embeds the sources while the others wait for its result.
+    Waiters may live on different event loops, so in-flight builds are tracked with
+    concurrent.futures.Future objects rather than asyncio ones. When the request building
+    a store is cancelled, a waiting request builds it instead.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    _shared: Optional["VectorStoreCache"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        :param max_bytes: Memory budget for all cached vector stores combined
+        """
+        self.max_bytes: int = max_bytes
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._pending: Dict[str, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+        self._total_bytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._coalesced: int = 0
+        self._evictions: int = 0
+
+    @classmethod
+    def get_shared(cls) -> "VectorStoreCache":
+        """
+        :return: The process-wide cache instance, created on first use
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                max_bytes = int(os.getenv("RAG_VECTOR_STORE_CACHE_MAX_BYTES", str(DEFAULT_MAX_BYTES)))
+                cls._shared = cls(max_bytes=max_bytes)
+            return cls._shared
+
+    def get(self, key: str) -> Optional[VectorStore]:
+        """
+        Look up a vector store without building it.
+
+        :param key: Fingerprint of the vector store
+        :return: The cached vector store, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.vectorstore
+
+    def put(self, key: str, vectorstore: VectorStore) -> None:
+        """
+        Insert or replace a vector store, evicting least recently used entries to stay within budget.
+
+        :param key: Fingerprint of the vector store
+        :param vectorstore: The vector store to cache
+        """
+        size_bytes: int = estimate_vector_store_bytes(vectorstore)
+        if size_bytes > self.max_bytes:
+            logger.warning(
+                "Vector store %s (%d bytes) exceeds the cache budget of %d bytes. Not caching.\n",
+                key[:12],
+                size_bytes,
+                self.max_bytes,
+            )
+            return
+
+        with self._lock:
+            self._remove_locked(key)
+            self._entries[key] = CacheEntry(vectorstore=vectorstore, size_bytes=size_bytes)
+            self._total_bytes += size_bytes
+            while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+                evicted_key, _ = next(iter(self._entries.items()))
+                self._remove_locked(evicted_key)
+                self._evictions += 1
+                logger.info("Evicted vector store %s from cache.\n", evicted_key[:12])
+
+    def invalidate(self, key: str) -> None:
+        """
+        Drop a vector store from the cache, e.g. after its sources were re-indexed.
+
+        :param key: Fingerprint of the vector store
+        """
+        with self._lock:
+            self._remove_locked(key)
+
+    def clear(self) -> None:
+        """Drop every cached vector store and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+            self._hits = self._misses = self._coalesced = self._evictions = 0
+
+    async def get_or_build(
+        self, key: str, builder: Callable[[], Awaitable[Optional[VectorStore]]]
+    ) -> Optional[VectorStore]:
+        """
+        Return the cached vector store for the key, building it at most once if it is missing.
+
+        :param key: Fingerprint of the vector store
+        :param builder: Coroutine function that loads or creates the vector store
+        :return: The cached or newly built vector store. None results are returned but not cached.
+        """
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return entry.vectorstore
+
+                pending: Optional[concurrent.futures.Future] = self._pending.get(key)
+                is_owner: bool = pending is None
+                if is_owner:
+                    self._misses += 1
+                    pending = concurrent.futures.Future()
+                    self._pending[key] = pending
+                else:
+                    self._coalesced += 1
+
+            if is_owner:
+                return await self._build(key, builder, pending)
+
+            logger.info("Waiting for in-flight build of vector store %s.\n", key[:12])
+            try:
+                # Shielded, so that a cancelled waiter does not cancel the build the other waiters wait for
+                return await asyncio.shield(asyncio.wrap_future(pending))
+            except BuildAbandonedError:
+                # The owner of the build was cancelled: build the store, or wait for the waiter building it
+                continue
+
+    async def _build(
+        self, key: str, builder: Callable[[], Awaitable[Optional[VectorStore]]], pending: concurrent.futures.Future
+    ) -> Optional[VectorStore]:
+        """
+        Build a vector store and hand the result, or the error, to the requests waiting for it.
+
+        :param key: Fingerprint of the vector store
+        :param builder: Coroutine function that loads or creates the vector store
+        :param pending: Future the waiting requests wait on
+        :return: The newly built vector store
+        """
+        try:
+            vectorstore: Optional[VectorStore] = await builder()
+        except Exception as exception:
+            with self._lock:
+                self._pending.pop(key, None)
+            pending.set_exception(exception)
+            raise
+        except BaseException:
+            # Cancelled or interrupted: not a failure of the build, so one of the waiters retries it
+            with self._lock:
+                self._pending.pop(key, None)
+            pending.set_exception(BuildAbandonedError(key))
+            raise
+
+        if vectorstore is not None:
+            self.put(key, vectorstore)
+        with self._lock:
+            self._pending.pop(key, None)
+        pending.set_result(vectorstore)
+        return vectorstore
+
+    def stats(self) -> Dict[str, int]:
+        """
+        :return: Hit/miss counters and memory usage of the cache
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "coalesced": self._coalesced,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _remove_locked(self, key: str) -> None:
+        """Remove an entry and update the byte count. The caller must hold the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size_bytes
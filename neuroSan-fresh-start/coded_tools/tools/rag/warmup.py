@@ -0,0 +1,256 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Preloads the vector stores of the RAG tools of the served agent networks when the server starts,
+so that the first request to a RAG network does not pay for building or loading its store.
+
+Stores are built RAG_WARMUP_CONCURRENCY at a time (default 2). Set RAG_WARMUP_STATUS_FILE to have the progress written
+there as JSON, and RAG_WARMUP_ENABLED=false to turn the warm-up off.
+"""
+
+import asyncio
+import importlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+# Defaults, overridable with RAG_WARMUP_CONCURRENCY and RAG_WARMUP_STATUS_FILE
+DEFAULT_WARMUP_CONCURRENCY = 2
+DEFAULT_MANIFEST_FILE = os.path.join("registries", "manifest.hocon")
+DEFAULT_TOOLBOX_INFO_FILE = os.path.join("toolbox", "toolbox_info.hocon")
+# Package that class names of coded tools are relative to
+CODED_TOOLS_PACKAGE = "coded_tools"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WarmupTarget:
+    """A RAG tool of an agent network whose vector store can be built from its configured arguments."""
+
+    network: str
+    tool: str
+    class_name: str
+    args: Dict[str, Any]
+
+
+class RagWarmup:
+    """
+    Finds the RAG coded tools of the networks served from the manifest that are configured with
+    "urls" or a "vector_store_path", and builds or loads their in-memory vector stores into the shared
+    VectorStoreCache on a background thread, a few at a time. A store that fails is logged and skipped.
+
+    Progress is available from status() and wait(), and is also written as JSON to RAG_WARMUP_STATUS_FILE
+    if set, so that a readiness probe can wait for "state" to be "done".
+    Postgres stores are not preloaded, since their connection pools belong to the event loop that opens them.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    _shared: Optional["RagWarmup"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_concurrency: int = DEFAULT_WARMUP_CONCURRENCY, status_file: Optional[str] = None):
+        """
+        :param max_concurrency: Maximum vector stores built at once
+        :param status_file: File to write the status to after every change, if any
+        """
+        self.max_concurrency: int = max(1, max_concurrency)
+        self.status_file: Optional[str] = status_file
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._state: str = "pending"
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._stores: Dict[str, str] = {}
+
+    @classmethod
+    def get_shared(cls) -> "RagWarmup":
+        """
+        :return: The process-wide warm-up, created on first use
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                max_concurrency = int(os.getenv("RAG_WARMUP_CONCURRENCY", str(DEFAULT_WARMUP_CONCURRENCY)))
+                cls._shared = cls(max_concurrency, os.getenv("RAG_WARMUP_STATUS_FILE"))
+            return cls._shared
+
+    def start(self) -> None:
+        """Find the targets and preload them on a daemon thread. Does nothing if already started."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._state = "running"
+            self._started_at = time.time()
+            self._thread = threading.Thread(target=self._run, name="rag-warmup", daemon=True)
+        self._write_status()
+        self._thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        :param timeout: Seconds to wait, or None to wait until the warm-up is over
+        :return: True if the warm-up is over
+        """
+        return self._done.wait(timeout)
+
+    @property
+    def ready(self) -> bool:
+        """
+        :return: True once every target was preloaded or failed
+        """
+        return self._done.is_set()
+
+    def status(self) -> Dict[str, Any]:
+        """
+        :return: Dictionary with the state ("pending", "running" or "done"), the time taken
+            and the state of each store ("pending", "loading", "loaded", "skipped" or "failed")
+        """
+        with self._lock:
+            end: float = self._finished_at or time.time()
+            return {
+                "state": self._state,
+                "elapsed_seconds": round(end - self._started_at, 3) if self._started_at else 0.0,
+                "stores": dict(self._stores),
+            }
+
+    def find_targets(self, manifest_file: Optional[str] = None) -> List[WarmupTarget]:
+        """
+        :param manifest_file: Manifest of the served networks. Defaults to AGENT_MANIFEST_FILE.
+        :return: RAG tools of the served networks configured with "urls" or a "vector_store_path"
+        """
+        # pylint: disable=import-outside-toplevel
+        # pylint: disable=import-error
+        from neuro_san.internals.graph.persistence.registry_manifest_restorer import RegistryManifestRestorer
+        from neuro_san.internals.run_context.langchain.toolbox.toolbox_info_restorer import ToolboxInfoRestorer
+
+        manifest_file = manifest_file or os.getenv("AGENT_MANIFEST_FILE", DEFAULT_MANIFEST_FILE)
+        toolbox: Dict[str, Any] = ToolboxInfoRestorer().restore(
+            os.getenv("AGENT_TOOLBOX_INFO_FILE", DEFAULT_TOOLBOX_INFO_FILE)
+        )
+
+        targets: List[WarmupTarget] = []
+        for networks in RegistryManifestRestorer(manifest_files=manifest_file).restore().values():
+            for name, network in networks.items():
+                for spec in network.get_config().get("tools", []):
+                    args: Dict[str, Any] = dict(spec.get("args") or {})
+                    if not args.get("urls") and not args.get("vector_store_path"):
+                        continue
+                    toolbox_info: Dict[str, Any] = toolbox.get(spec.get("toolbox")) or {}
+                    class_name: Optional[str] = spec.get("class") or toolbox_info.get("class")
+                    if class_name and args.get("vector_store_type") != "postgres":
+                        targets.append(WarmupTarget(name, spec.get("name"), class_name, args))
+        return targets
+
+    def _run(self) -> None:
+        """Preload every target, then mark the warm-up as done."""
+        try:
+            targets: List[WarmupTarget] = self.find_targets()
+            with self._lock:
+                self._stores = {self._label(target): "pending" for target in targets}
+            self._write_status()
+            asyncio.run(self._preload_all(targets))
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            logger.error("RAG warm-up failed: %s\n", error)
+        finally:
+            with self._lock:
+                self._state = "done"
+                self._finished_at = time.time()
+            self._write_status()
+            self._done.set()
+            logger.info("RAG warm-up done: %s\n", self.status())
+
+    async def _preload_all(self, targets: List[WarmupTarget]) -> None:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def preload_bounded(target: WarmupTarget) -> None:
+            async with semaphore:
+                await self._preload(target)
+
+        await asyncio.gather(*(preload_bounded(target) for target in targets))
+
+    async def _preload(self, target: WarmupTarget) -> None:
+        """Build or load the vector store of one target, recording the outcome."""
+        # pylint: disable=import-outside-toplevel
+        from coded_tools.tools.base_rag import BaseRag
+
+        label: str = self._label(target)
+        self._set_store_state(label, "loading")
+        try:
+            tool_class: Optional[type] = self._import_class(target)
+            if tool_class is None or not issubclass(tool_class, BaseRag):
+                self._set_store_state(label, "skipped")
+                return
+            started_at: float = time.perf_counter()
+            vectorstore = await tool_class().build_vector_store(target.args)
+            if vectorstore is None:
+                self._set_store_state(label, "skipped")
+                return
+            logger.info("Preloaded the vector store of %s in %.2fs\n", label, time.perf_counter() - started_at)
+            self._set_store_state(label, "loaded")
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            logger.error("Failed to preload the vector store of %s: %s\n", label, error)
+            self._set_store_state(label, "failed")
+
+    @staticmethod
+    def _import_class(target: WarmupTarget) -> Optional[type]:
+        """
+        Import a coded tool class, whose name is relative either to the directory of its network
+        or to the coded tools package, as neuro-san resolves it.
+
+        :param target: Tool to import the class of
+        :return: The class, or None if it cannot be found
+        """
+        module_name, _, class_name = target.class_name.rpartition(".")
+        network_package: str = ".".join([CODED_TOOLS_PACKAGE, *target.network.split("/")])
+        for package in [network_package, CODED_TOOLS_PACKAGE]:
+            qualified_name: str = f"{package}.{module_name}"
+            try:
+                module = importlib.import_module(qualified_name)
+            except ModuleNotFoundError as error:
+                # Only a missing candidate module means "look elsewhere", not a missing dependency of the tool
+                if error.name and qualified_name.startswith(error.name):
+                    continue
+                raise
+            return getattr(module, class_name, None)
+        return None
+
+    @staticmethod
+    def _label(target: WarmupTarget) -> str:
+        return f"{target.network}/{target.tool}"
+
+    def _set_store_state(self, label: str, state: str) -> None:
+        with self._lock:
+            self._stores[label] = state
+        self._write_status()
+
+    def _write_status(self) -> None:
+        """Write the status to the status file, atomically, if one is configured."""
+        if not self.status_file:
+            return
+        try:
+            with open(self.status_file + ".tmp", "w", encoding="utf-8") as status_file:
+                json.dump(self.status(), status_file)
+            os.replace(self.status_file + ".tmp", self.status_file)
+        except OSError as error:
+            logger.warning("Could not write the RAG warm-up status to %s: %s\n", self.status_file, error)
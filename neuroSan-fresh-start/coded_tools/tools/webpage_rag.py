@@ -14,18 +14,22 @@
 #
 # END COPYRIGHT
 
+import asyncio
 import logging
 import os
 from typing import Any
+from typing import AsyncIterator
 
 from langchain_community.document_loaders import WebBaseLoader
 from langchain_core.documents import Document
 from langchain_core.vectorstores import VectorStore
 from neuro_san.interfaces.coded_tool import CodedTool
 from requests.exceptions import HTTPError
+from requests.exceptions import RequestException
 
 from coded_tools.tools.base_rag import BaseRag
 from coded_tools.tools.base_rag import PostgresConfig
+from coded_tools.tools.rag.http_cache import HttpCache
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -46,6 +50,11 @@ class WebpageRag(CodedTool, BaseRag):
           "urls": list of urls
           "save_vector_store": save to JSON file if True
           "vector_store_path": relative path to this file
+          "incremental_update": re-index only changed sources of an existing vector store if True
+          "hybrid_search": combine keyword and vector search if True
+          "shared_store": map one in-memory vector store shared by all server processes if True
+          "chunk_size", "chunk_overlap", "chunking_strategy", "chunk_dedup": how documents are chunked
+          "filter": only search chunks whose metadata match this filter, e.g. {"source": url}
 
         :param sly_data: A dictionary whose keys are defined by the agent
             hierarchy, but whose values are meant to be kept out of the
@@ -73,6 +82,21 @@ class WebpageRag(CodedTool, BaseRag):
         if not urls:
             return "❌ Missing required input: 'urls'."
 
+        # Prepare the vector store
+        vector_store: VectorStore = await self.build_vector_store(args)
+
+        # Run the query against the vector store
+        return await self.query_vectorstore(vector_store, query, args.get("filter"))
+
+    async def build_vector_store(self, args: dict[str, Any]) -> VectorStore | None:
+        """
+        Configure the tool from its arguments and build or load the vector store of the given URLs.
+
+        :param args: Tool arguments, as for async_invoke(). The query is not needed.
+        :return: Vector store of the URLs
+        """
+        urls: list[str] = args.get("urls", [])
+
         # Vector store type
         vector_store_type: str = args.get("vector_store_type", "in_memory")
 
@@ -82,6 +106,18 @@ class WebpageRag(CodedTool, BaseRag):
         # Configure the vector store path
         self.configure_vector_store_path(args.get("vector_store_path"))
 
+        # Re-index only new, changed or removed sources of the saved vector store or existing table if True
+        self.incremental_update = args.get("incremental_update", False)
+
+        # Fuse BM25 keyword search with vector search if True
+        self.hybrid_search = args.get("hybrid_search", False)
+
+        # Share the in-memory vector store with the other server processes of the host if True
+        self.use_shared_store = args.get("shared_store", self.use_shared_store)
+
+        # Chunk size and overlap, splitting strategy and deduplication of the chunks
+        self.configure_chunking(args)
+
         # For PostgreSQL vector store
         if vector_store_type == "postgres":
             postgres_config = PostgresConfig(
@@ -95,14 +131,11 @@ class WebpageRag(CodedTool, BaseRag):
         else:
             postgres_config = None
 
-        # Prepare the vector store
-        vector_store: VectorStore = await self.generate_vector_store(
+        # Build, load or reuse the vector store
+        return await self.generate_vector_store(
             loader_args={"urls": urls}, postgres_config=postgres_config, vector_store_type=vector_store_type
         )
 
-        # Run the query against the vector store
-        return await self.query_vectorstore(vector_store, query)
-
     async def load_documents(self, loader_args: dict[str, Any]) -> list[Document]:
         """
         Load documents from URLs.
@@ -111,18 +144,89 @@ class WebpageRag(CodedTool, BaseRag):
         :return: List of loaded documents
         """
         docs: list[Document] = []
+        async for page_docs in self.alazy_load_documents(loader_args):
+            docs.extend(page_docs)
+        return docs
+
+    async def alazy_load_documents(self, loader_args: dict[str, Any]) -> AsyncIterator[list[Document]]:
+        """
+        Load web pages one at a time. Pages are read through the shared HTTP cache unless it is disabled,
+        in which case they are fetched with WebBaseLoader.
+
+        :param loader_args: Dictionary containing 'urls' (list of file URLs)
+        :return: Async iterator of single-page document lists
+        """
         urls: list[str] = loader_args.get("urls", [])
 
-        loader = WebBaseLoader(web_path=urls)
-        async for doc in loader.alazy_load():
+        http_cache: HttpCache = HttpCache.get_shared()
+        if not http_cache.enabled:
+            async for page_docs in self._alazy_load_uncached(urls):
+                yield page_docs
+            return
+
+        for page in asyncio.as_completed([asyncio.to_thread(self._load_cached_page, http_cache, url) for url in urls]):
             try:
-                docs.append(doc)
-                logger.info("Successfully loaded PDF file from %s", doc.metadata.get("source", "unknown source"))
+                doc: Document = await page
             except HTTPError as http_e:
                 logger.error("HTTP error occurred: %s", http_e)
-            except FileNotFoundError as fnf_e:
-                logger.error("File not found: %s", fnf_e)
-            except ValueError as val_e:
-                logger.error("Value error: %s", val_e)
+                continue
+            except RequestException as request_e:
+                logger.error("Request failed: %s", request_e)
+                continue
+            except (OSError, ValueError) as read_e:
+                # The cached page could not be read or parsed
+                logger.error("Failed to read web page: %s", read_e)
+                continue
+            logger.info("Successfully loaded web page from %s", doc.metadata.get("source", "unknown source"))
+            yield [doc]
+
+    @staticmethod
+    def _load_cached_page(http_cache: HttpCache, url: str) -> Document:
+        """
+        Read a web page from the HTTP cache and extract its text and metadata the way WebBaseLoader does.
 
-        return docs
+        :param http_cache: Cache to fetch the page through
+        :param url: URL of the page
+        :return: Document of the page
+        :raises ValueError: If the page cannot be parsed
+        """
+        # pylint: disable=import-outside-toplevel
+        from bs4 import BeautifulSoup
+        from bs4.exceptions import ParserRejectedMarkup
+
+        page_path: str = http_cache.acquire(url)
+        try:
+            with open(page_path, "rb") as page_file:
+                soup = BeautifulSoup(page_file.read(), "html.parser")
+        except ParserRejectedMarkup as parse_e:
+            raise ValueError(f"Could not parse {url}: {parse_e}") from parse_e
+        finally:
+            http_cache.release(page_path)
+        metadata: dict[str, Any] = {"source": url}
+        if title := soup.find("title"):
+            metadata["title"] = title.get_text()
+        if description := soup.find("meta", attrs={"name": "description"}):
+            metadata["description"] = description.get("content", "No description found.")
+        if html := soup.find("html"):
+            metadata["language"] = html.get("lang", "No language found.")
+        return Document(page_content=soup.get_text(), metadata=metadata)
+
+    @staticmethod
+    async def _alazy_load_uncached(urls: list[str]) -> AsyncIterator[list[Document]]:
+        """
+        Fetch web pages with WebBaseLoader, bypassing the HTTP cache.
+
+        :param urls: URLs of the pages
+        :return: Async iterator of single-page document lists
+        """
+        loader = WebBaseLoader(web_path=urls)
+        try:
+            async for doc in loader.alazy_load():
+                logger.info("Successfully loaded web page from %s", doc.metadata.get("source", "unknown source"))
+                yield [doc]
+        except HTTPError as http_e:
+            logger.error("HTTP error occurred: %s", http_e)
+        except FileNotFoundError as fnf_e:
+            logger.error("File not found: %s", fnf_e)
+        except ValueError as val_e:
+            logger.error("Value error: %s", val_e)
@@ -14,6 +14,7 @@
 #
 # END COPYRIGHT
 
+import json
 import logging
 from typing import Any
 from typing import Dict
@@ -67,10 +68,13 @@ class WikipediaRag(CodedTool):
             return "❌ Missing required input: 'query'."
 
         # Initialize WikipediaRetriever with the provided arguments
-        retriever = WikipediaRetriever(
-            lang=str(args.get("lang", "en")),
-            top_k_results=int(args.get("top_k_results", 3)),
-            doc_content_chars_max=int(args.get("doc_content_chars_max", 4000)),
-        )
+        retriever_args: Dict[str, Any] = {
+            "lang": str(args.get("lang", "en")),
+            "top_k_results": int(args.get("top_k_results", 3)),
+            "doc_content_chars_max": int(args.get("doc_content_chars_max", 4000)),
+        }
+        retriever = WikipediaRetriever(**retriever_args)
 
-        return await BaseRag.query_retriever(retriever, query)
+        # Repeated queries with the same arguments are answered from the shared query cache
+        cache_scope: str = f"wikipedia:{json.dumps(retriever_args, sort_keys=True)}"
+        return await BaseRag.query_retriever(retriever, query, cache_scope=cache_scope)
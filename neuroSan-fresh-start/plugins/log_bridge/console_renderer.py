@@ -0,0 +1,176 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Console rendering of the lines drained by a ProcessLogBridge, on a thread of its own,
+so that draining never waits for the console.
+"""
+
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+
+from rich.logging import RichHandler
+
+logger = logging.getLogger(__name__)
+
+
+class PlainCapableRichHandler(RichHandler):
+    """
+    RichHandler that prints records logged with `extra={"plain": True}` as a single unformatted line,
+    which costs a fraction of laying them out in Rich's log table.
+    :extend: RichHandler
+    """
+
+    def emit(self, record):
+        """
+        :param record: A log record.
+        """
+        if not getattr(record, "plain", False):
+            super().emit(record)
+            return
+        try:
+            dt = datetime.fromtimestamp(record.created).astimezone()
+            self.console.out(
+                f"[{dt.strftime('%Y-%m-%d %H:%M:%S')} {dt.tzname()}] {record.levelname:<8} {self.format(record)}",
+                highlight=False,
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            self.handleError(record)
+
+
+class ConsoleRenderer:
+    """
+    Hands the lines queued by the draining threads to a render function, in order, on the renderer thread.
+    Lines are queued without waiting: when the queue is full, they are skipped, and the renderer notices
+    the gap in the line numbers of their stream. While `plain_backlog` or more lines are waiting,
+    they are rendered as plain one-line output, until half of them are done.
+    Optionally, an idle function is called whenever no line was queued for `idle_seconds`.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+
+    def __init__(
+        self,
+        render: Callable[[Dict[str, Any], Optional[str], int, bool, float], None],
+        queue_lines: int,
+        plain_backlog: int,
+        idle: Optional[Callable[[], None]] = None,
+        idle_seconds: Optional[float] = None,
+    ):
+        """
+        :param render: Called on the renderer thread with the per-stream state, the line or None at the end
+            of the stream, the number of lines of the stream skipped before it, whether to render it plain,
+            and the time it was read.
+        :param queue_lines (int): Lines waiting to be rendered at most.
+        :param plain_backlog (int): Waiting lines from which lines are rendered plain.
+        :param idle: Called on the renderer thread when no line was queued for `idle_seconds`, if given.
+        :param idle_seconds (float | None): Seconds without lines after which `idle` is called.
+        """
+        self._render = render
+        self._idle = idle
+        self._idle_seconds = idle_seconds if idle is not None else None
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_lines)
+        self._plain_backlog = plain_backlog
+        self.plain = False
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        # Lines rendered: "rich", "plain", and "skipped" when the queue was full
+        self.counts: Dict[str, int] = {"rich": 0, "plain": 0, "skipped": 0}
+
+    def start(self) -> None:
+        """
+        Start the renderer thread, unless it is running.
+        """
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="LogBridgeRenderer", daemon=True)
+                self._thread.start()
+
+    def put(self, state: Dict[str, Any], line: str) -> bool:
+        """
+        Queue a line for rendering without waiting, or skip it if the queue is full.
+        :param state (dict): The per-stream state, whose `"queued"` line number is advanced.
+        :param line (str): The raw, non-empty line.
+        :return bool: False if the line was skipped.
+        """
+        state["queued"] += 1
+        try:
+            self._queue.put_nowait((state, state["queued"], line, time.time()))
+        except queue.Full:
+            return False
+        return True
+
+    def end(self, state: Dict[str, Any]) -> None:
+        """
+        Queue the end of a stream. Waits for room in the queue, unlike lines:
+        this happens once per stream, after its last line.
+        :param state (dict): The per-stream state.
+        """
+        self._queue.put((state, state["queued"] + 1, None, time.time()))
+
+    def pending(self) -> bool:
+        """
+        :return bool: True if lines are waiting to be rendered.
+        """
+        return not self._queue.empty()
+
+    def _run(self) -> None:
+        """
+        Body of the renderer thread: render queued lines in order, for as long as the bridge exists.
+        """
+        while True:
+            try:
+                state, number, line, read_at = self._queue.get(timeout=self._idle_seconds)
+            except queue.Empty:
+                try:
+                    self._idle()
+                except Exception:  # pylint: disable=broad-exception-caught
+                    logger.exception("Failed to render while the console was idle")
+                continue
+            try:
+                skipped = number - state["rendered"] - 1
+                state["rendered"] = number
+                if skipped > 0:
+                    self.counts["skipped"] += skipped
+                if line is not None:
+                    self._update_plain_mode()
+                self._render(state, line, max(skipped, 0), self.plain, read_at)
+                if line is not None:
+                    self.counts["plain" if self.plain else "rich"] += 1
+            except Exception:  # pylint: disable=broad-exception-caught
+                # One unrenderable line must not stop the rendering of the others
+                logger.exception("Failed to render output of %s", state["logger"].name)
+
+    def _update_plain_mode(self) -> None:
+        """
+        Switch between rich and plain output according to the number of lines waiting to be rendered.
+        """
+        backlog = self._queue.qsize()
+        if not self.plain and backlog >= self._plain_backlog:
+            self.plain = True
+            logger.warning("Console is %d lines behind, rendering plain lines until it catches up", backlog)
+        elif self.plain and backlog <= self._plain_backlog // 2:
+            self.plain = False
+            logger.info("Console caught up, rendering rich lines again")
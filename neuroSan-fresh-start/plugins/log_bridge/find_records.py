@@ -0,0 +1,80 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Print the log records stored by the log bridge for a request, a user or a time window, as JSON lines.
+
+    python -m plugins.log_bridge.find_records --request-id 6f1c2a
+    python -m plugins.log_bridge.find_records --since 2025-06-10T14:00 --until 2025-06-10T14:15 --user-id alice
+
+Conditions are combined. Times without a time zone are local times.
+"""
+
+import json
+import os
+import sys
+from argparse import ArgumentParser
+from argparse import Namespace
+from datetime import datetime
+from typing import List
+from typing import Optional
+
+from plugins.log_bridge.record_sink import find_records
+
+DEFAULT_RECORDS_DIR = os.path.join("logs", "records")
+
+
+def parse_time(value: str) -> float:
+    """
+    :param value: ISO 8601 date and time, local if it has no time zone
+    :return: Seconds since the epoch
+    """
+    return datetime.fromisoformat(value).timestamp()
+
+
+def build_parser() -> ArgumentParser:
+    """
+    :return: Parser of the command line arguments
+    """
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--records-dir",
+        default=os.getenv("LOGBRIDGE_RECORDS_DIR") or DEFAULT_RECORDS_DIR,
+        help="Directory of the records, by default LOGBRIDGE_RECORDS_DIR or logs/records",
+    )
+    parser.add_argument("--request-id", help="request_id of the records")
+    parser.add_argument("--user-id", help="user_id of the records")
+    parser.add_argument("--since", type=parse_time, help="Earliest time of the records, e.g. 2025-06-10T14:00")
+    parser.add_argument("--until", type=parse_time, help="Latest time of the records, e.g. 2025-06-10T14:15:30")
+    parser.add_argument("--pretty", action="store_true", help="Indent the records rather than one per line")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
+    """Print the matching records."""
+    parser: ArgumentParser = build_parser()
+    args: Namespace = parser.parse_args(argv)
+    if args.request_id is None and args.user_id is None and args.since is None and args.until is None:
+        parser.error("give at least one of --request-id, --user-id, --since and --until")
+    if not os.path.isdir(args.records_dir):
+        parser.error(f"no records directory {args.records_dir}")
+
+    for record in find_records(args.records_dir, args.request_id, args.user_id, args.since, args.until):
+        sys.stdout.write(json.dumps(record, indent=2 if args.pretty else None, ensure_ascii=False) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Stateless scanning and parsing of the lines drained by a ProcessLogBridge:
+line classification, severity words, brace balance and JSON parsing.
+"""
+
+import json
+import re
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None  # pylint: disable=invalid-name
+
+JSON_BACKENDS = ("auto", "json", "orjson")
+
+# Line kinds of classify_line()
+TEXT, JSON, FRAGMENT = "text", "json", "fragment"
+
+LEVEL_WORD = re.compile(r"\b(DEBUG|INFO|WARNING|ERROR|CRITICAL|FATAL)\b", re.IGNORECASE)
+# Words of LEVEL_WORD, found with str.find() rather than the case-insensitive regex on plain text lines
+LEVEL_TOKENS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL", "FATAL")
+
+# Brace scanning of scan_braces(): the rest of a JSON string up to its closing quote, and the next
+# char outside strings that is not counted as is
+_STRING_REST = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*')
+_QUOTE_OR_ESCAPE = re.compile(r'["\\]')
+
+
+def classify_line(line: str) -> str:
+    """
+    Cheaply tell which lines are worth handing to the JSON parsers.
+    :param line (str): A non-empty text line.
+    :return str: One of:
+        - `JSON`: starts with `{`, or is a `[...]` array, so it may parse as a whole.
+        - `FRAGMENT`: has a `{` after some text, so it may hold a JSON object or start a multi-line one.
+        - `TEXT`: anything else, which can be neither.
+    Notes: Lone JSON scalars, e.g. `42` or `"ok"`, are plain text.
+    """
+    stripped = line.lstrip()
+    first = stripped[:1]
+    if first == "{":
+        return JSON
+    if "{" in line:
+        return FRAGMENT
+    if first == "[" and stripped.rstrip().endswith("]"):
+        return JSON
+    return TEXT
+
+
+def find_level_token(upper: str) -> Optional[str]:
+    """
+    Find the first severity word of a line, as `LEVEL_WORD` would, with one `str.find()` per word
+    instead of trying the regex at every position of the line.
+    :param upper (str): The upper-cased line.
+    :return str | None: The first whole-word token of `LEVEL_TOKENS`, or None.
+    """
+    first = len(upper)
+    found = None
+    for token in LEVEL_TOKENS:
+        start = upper.find(token)
+        while start != -1 and start < first:
+            end = start + len(token)
+            if not (start and _is_word_char(upper[start - 1])) and not (
+                end < len(upper) and _is_word_char(upper[end])
+            ):
+                first, found = start, token
+                break
+            start = upper.find(token, start + 1)
+    return found
+
+
+def _is_word_char(ch: str) -> bool:
+    """
+    :param ch (str): A character.
+    :return bool: True if `ch` matches the regex `\\w`, so a word boundary cannot be next to it.
+    """
+    return ch.isalnum() or ch == "_"
+
+
+def scan_braces(state: Dict[str, Any], line: str) -> None:
+    """
+    Add the net brace balance `{` minus `}` of the next line of a block to its balance, ignoring quoted strings.
+    The quote state carries over from the previous line, as in the joined block,
+    where a backslash ending a line escapes the line break.
+    Lines are scanned a string or an unquoted run at a time, with regular expressions and `str.count()`.
+    :param state (dict): Per-stream state, whose `"balance"` and `"in_string"` are updated.
+    :param line (str): The line added to the block.
+    """
+    balance = state["balance"]
+    in_string = state["in_string"]
+    pos = 0
+    end = len(line)
+    while pos < end:
+        if in_string:
+            # to the closing quote, or to a backslash ending the line
+            pos = _STRING_REST.match(line, pos).end()
+            in_string = pos == end or line[pos] != '"'
+            pos += 1
+            continue
+        special = _QUOTE_OR_ESCAPE.search(line, pos)
+        stop = special.start() if special else end
+        balance += line.count("{", pos, stop) - line.count("}", pos, stop)
+        if special is None:
+            break
+        in_string = special.group() == '"'
+        # skip the quote, or the backslash and the char it escapes
+        pos = stop + (1 if in_string else 2)
+    state["balance"] = balance
+    state["in_string"] = in_string
+
+
+def resolve_json_backend(json_backend: str) -> str:
+    """
+    :param json_backend (str): One of `JSON_BACKENDS`.
+    :return str: `"orjson"` or `"json"`, the backend to parse log lines with.
+    :raises ValueError: If the backend is unknown, or is "orjson" and orjson is not installed.
+    """
+    if json_backend not in JSON_BACKENDS:
+        raise ValueError(f"json_backend must be one of {', '.join(JSON_BACKENDS)}, got: {json_backend!r}")
+    if json_backend == "orjson" and orjson is None:
+        raise ValueError("json_backend is 'orjson' but orjson is not installed")
+    return "orjson" if json_backend != "json" and orjson is not None else "json"
+
+
+def loads_json(text: str, json_backend: str = "json") -> Any:
+    """
+    Parse JSON with a backend.
+    :param text (str): JSON text.
+    :param json_backend (str): `"orjson"` or `"json"`, as resolved by `resolve_json_backend()`.
+    :return Any: The parsed value.
+    :raises ValueError: If the text is not JSON.
+    Notes: orjson rejects NaN and infinities, so documents it rejects that may hold them
+        are parsed again with `json`. orjson also reads integers beyond 64 bits as floats,
+        which only affects how such values are displayed.
+    """
+    if json_backend == "orjson":
+        try:
+            return orjson.loads(text)  # pylint: disable=no-member
+        except orjson.JSONDecodeError:  # pylint: disable=no-member
+            if "NaN" not in text and "Infinity" not in text:
+                raise
+    return json.loads(text)
+
+
+def pretty_json(obj: Any) -> str:
+    """
+    Pretty-print a JSON object.
+    :param obj (Any): Any JSON-serializable object.
+    :return str: Indented JSON, or `str(obj)` on failure.
+    """
+    try:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return str(obj)
+
+
+def try_parse_json_fragment(text: str, strict: bool = True, loads=json.loads) -> Optional[Dict[str, Any]]:
+    """
+    Try to parse a JSON dictionary from a text line.
+    Attempts:
+        1. Full strict `json.loads(text)`, unless `strict` is False
+        2. Extract fragment between first `{` and last `}` and parse that.
+    :param text (str): Input line.
+    :param strict (bool): Whether the whole text may be JSON. False for text known not to start like JSON,
+        or when the text starting like JSON is also the fragment, to parse it only once.
+    :param loads (callable): JSON parser.
+    :return dict | None: Parsed JSON as a dictionary, or None if not parseable.
+    """
+    if not text:
+        return None
+    # strict
+    if strict:
+        try:
+            obj = loads(text)
+            return obj if isinstance(obj, dict) else {"message": obj}
+        except Exception:  # pylint: disable=broad-exception-caught
+            pass
+    # first {...}
+    s = text.find("{")
+    e = text.rfind("}")
+    if s != -1 and e != -1 and e > s:
+        frag = text[s : e + 1]
+        if strict and s == 0 and e == len(text) - 1:
+            # the fragment is the text itself, which did not parse
+            return None
+        try:
+            obj = loads(frag)
+            return obj if isinstance(obj, dict) else {"message": obj}
+        except Exception:  # pylint: disable=broad-exception-caught
+            return None
+    return None
+
+
+def lenient_inner_json_parse(val: Any, loads=json.loads) -> Optional[Any]:
+    """
+    Attempt lenient JSON parsing of a string containing nested JSON.
+    Strategy:
+        - If value is not a string, return None.
+        - If it doesn't begin with `{` or `[`, return None.
+        - Try strict `json.loads()`.
+        - Otherwise, clean escape sequences and attempt again.
+    :param val (Any): Possibly nested JSON-like string.
+    :param loads (callable): JSON parser.
+    :return Any | None: Parsed JSON object, or None if not parseable.
+    """
+    if not isinstance(val, str):
+        return None
+    s = val.strip()
+    if not s:
+        return None
+    if not (s.lstrip().startswith("{") or s.lstrip().startswith("[")):
+        return None
+    # strict
+    try:
+        return loads(s)
+    except Exception:  # pylint: disable=broad-exception-caught
+        pass
+    # mild cleanup: unescape \n \t \r and drop trailing commas
+    s2 = s.replace("\\r", "\r").replace("\\t", "\t").replace("\\n", "\n")
+    s2 = re.sub(r",\s*(?=[}\]])", "", s2)
+    s2 = re.sub(r"\n{3,}", "\n\n", s2)
+    try:
+        return loads(s2)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return None
@@ -0,0 +1,171 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Single-thread draining of the pipes of the processes attached to a ProcessLogBridge, for its "multiplexed" drain mode.
+"""
+
+import codecs
+import logging
+import os
+import selectors
+import threading
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# pylint: disable=too-few-public-methods
+class PipeMultiplexer:
+    """
+    Reads every pipe handed to it without blocking, in large chunks, on a single selector thread,
+    and splits the lines itself. The thread is started with the first pipe, and stops once every pipe
+    reached EOF and no new one is waiting to be registered.
+    """
+
+    READ_CHUNK_BYTES = 64 * 1024
+
+    def __init__(
+        self,
+        handle_line: Callable[[Dict[str, Any], str], None],
+        finish_stream: Callable[[Any, Dict[str, Any]], None],
+    ):
+        """
+        :param handle_line: Called on the multiplexer thread with the per-stream state and each line read.
+        :param finish_stream: Called on the multiplexer thread with a pipe and its state once the pipe reached EOF.
+        """
+        self._handle_line = handle_line
+        self._finish_stream = finish_stream
+        # Multiplexer thread, its selector and the pipe waking it up to register new streams.
+        # All three exist only while streams are being multiplexed, and are guarded by _lock.
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wakeup_fds: Optional[Tuple[int, int]] = None
+        self._pending_streams: List[Tuple[Any, Dict[str, Any]]] = []
+
+    def add(self, pipe, state: Dict[str, Any]) -> None:
+        """
+        Hand a pipe over to the multiplexer thread, starting the thread if no stream is being multiplexed.
+        Registration goes through the thread itself, woken up by a byte on its wakeup pipe,
+        so that the selector is only ever used by that thread.
+        :param pipe: stdout or stderr of a subprocess, opened in text mode and not read from yet.
+        :param state (dict): The per-stream state.
+        """
+        # The pipe's file descriptor is read directly, bypassing its (empty) text buffer
+        os.set_blocking(pipe.fileno(), False)
+        state["decoder"] = codecs.getincrementaldecoder(getattr(pipe, "encoding", None) or "utf-8")(errors="replace")
+        state["partial"] = ""
+        with self._lock:
+            self._pending_streams.append((pipe, state))
+            if self._thread is None:
+                self._selector = selectors.DefaultSelector()
+                self._wakeup_fds = os.pipe()
+                os.set_blocking(self._wakeup_fds[0], False)
+                self._selector.register(self._wakeup_fds[0], selectors.EVENT_READ)
+                self._thread = threading.Thread(target=self._run, name="LogBridgeMux", daemon=True)
+                self._thread.start()
+            os.write(self._wakeup_fds[1], b"\0")
+
+    def _run(self) -> None:
+        """
+        Body of the multiplexer thread: read whichever pipes are ready until all of them reached EOF
+        and no new stream is waiting to be registered, then release the selector and stop.
+        """
+        selector = self._selector
+        wakeup_fd = self._wakeup_fds[0]
+        while True:
+            for key, _ in selector.select():
+                if key.fd == wakeup_fd:
+                    self._register_pending_streams(selector, wakeup_fd)
+                    continue
+                try:
+                    self._read_pipe(selector, key)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    # One misbehaving stream must not stop the draining of the others
+                    logger.exception("Failed to handle output of %s", key.data[1]["logger"].name)
+            with self._lock:
+                if len(selector.get_map()) == 1 and not self._pending_streams:
+                    selector.close()
+                    os.close(self._wakeup_fds[0])
+                    os.close(self._wakeup_fds[1])
+                    self._selector = None
+                    self._wakeup_fds = None
+                    self._thread = None
+                    return
+
+    def _register_pending_streams(self, selector: selectors.BaseSelector, wakeup_fd: int) -> None:
+        """
+        Register the streams handed over by `add()` with the selector.
+        :param selector: The multiplexer's selector.
+        :param wakeup_fd (int): Read end of the wakeup pipe, to drain.
+        """
+        try:
+            while os.read(wakeup_fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        with self._lock:
+            pending, self._pending_streams = self._pending_streams, []
+        for pipe, state in pending:
+            selector.register(pipe.fileno(), selectors.EVENT_READ, (pipe, state))
+
+    def _read_pipe(self, selector: selectors.BaseSelector, key: selectors.SelectorKey) -> None:
+        """
+        Read one chunk from a ready pipe and handle the complete lines in it.
+        At EOF, the trailing partial line is handled and the stream is unregistered and closed.
+        :param selector: The multiplexer's selector.
+        :param key: Selector key of the pipe, whose data is `(pipe, state)`.
+        """
+        pipe, state = key.data
+        try:
+            data = os.read(key.fd, self.READ_CHUNK_BYTES)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        for line in self._split_chunk(state, data):
+            self._handle_line(state, line)
+        if not data:
+            selector.unregister(key.fd)
+            self._finish_stream(pipe, state)
+
+    @staticmethod
+    def _split_chunk(state: Dict[str, Any], data: bytes) -> List[str]:
+        """
+        Decode a chunk read from a pipe and split it into lines, as a text-mode pipe's readline() would:
+        "\n", "\r\n" and "\r" all end a line.
+        :param state (dict): The per-stream state, holding the decoder and the partial line of previous chunks.
+        :param data (bytes): The chunk, or `b""` at EOF.
+        :return list[str]: The lines completed by the chunk, without their line endings.
+            At EOF, this includes the last line even if it has no line ending.
+        """
+        text = state["partial"] + state["decoder"].decode(data, final=not data)
+        # Hold back a trailing "\r" until the next chunk tells whether it is the start of "\r\n"
+        held = "\r" if data and text.endswith("\r") else ""
+        if held:
+            text = text[:-1]
+        lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        state["partial"] = lines.pop() + held
+        if not data and state["partial"]:
+            lines.append(state["partial"])
+            state["partial"] = ""
+        return lines
@@ -16,10 +16,11 @@
 from __future__ import annotations
 
 import copy
-import json
 import logging
 import re
+import sys
 import threading
+from collections import deque
 from datetime import datetime
 from logging.handlers import TimedRotatingFileHandler
 from pathlib import Path
@@ -31,6 +32,23 @@ from rich.syntax import Syntax
 from rich.text import Text
 from rich.theme import Theme
 
+from plugins.log_bridge.console_renderer import ConsoleRenderer
+from plugins.log_bridge.console_renderer import PlainCapableRichHandler
+from plugins.log_bridge.line_parsing import FRAGMENT
+from plugins.log_bridge.line_parsing import JSON
+from plugins.log_bridge.line_parsing import TEXT
+from plugins.log_bridge.line_parsing import classify_line
+from plugins.log_bridge.line_parsing import find_level_token
+from plugins.log_bridge.line_parsing import lenient_inner_json_parse
+from plugins.log_bridge.line_parsing import loads_json
+from plugins.log_bridge.line_parsing import pretty_json
+from plugins.log_bridge.line_parsing import resolve_json_backend
+from plugins.log_bridge.line_parsing import scan_braces
+from plugins.log_bridge.line_parsing import try_parse_json_fragment
+from plugins.log_bridge.pipe_multiplexer import PipeMultiplexer
+from plugins.log_bridge.record_recorder import RecordRecorder
+from plugins.log_bridge.record_sink import RecordSink
+
 
 log_cfg = {
     # Refer rich guidelines for more options:
@@ -53,6 +71,30 @@ log_cfg = {
         "backupCount": 10,
         "fmt": "%(asctime)s | %(levelname)-8s | %(name)s:%(funcName)s:%(lineno)d - %(message)s",
     },
+    # JSON parser of log lines: "orjson" if installed and "auto", else the standard library "json"
+    "json_backend": "auto",
+    "render": {
+        # Lines waiting to be rendered on the console. When full, lines are only written to the process log file.
+        "queue_lines": 10000,
+        # From this many waiting lines, records are rendered as plain one-line output until half of them are done
+        "plain_backlog": 1000,
+    },
+    "records": {
+        # Directory where parsed JSON records are stored, indexed by request_id, user_id and time, or None.
+        # See plugins/log_bridge/record_sink.py and plugins/log_bridge/find_records.py.
+        "directory": None,
+        # Compressed size of a segment of records, from which a new one is started
+        "segment_bytes": 64 * 1024 * 1024,
+        # Oldest segments are deleted beyond this many, 0 keeps all of them
+        "max_segments": 50,
+        # Records compressed and indexed together at most
+        "block_records": 500,
+        # Seconds after which the records parsed so far are written, in a smaller block, so that they can be found
+        "flush_seconds": 2.0,
+        # Lines of a stream shed from the console, waiting to be parsed for records.
+        # When full, further shed lines are dropped from the records, and counted.
+        "queue_lines": 10000,
+    },
 }
 
 
@@ -65,10 +107,19 @@ class ProcessLogBridge:
     - Traceback text reflow + syntax-highlight (via Rich)
     - Tee raw lines to per-process log files
     - Multi-line JSON reassembly (brace-balanced)
+    - Pipes drained by two threads per process, or all multiplexed on one selector thread by a PipeMultiplexer
+    - Rendering on its own thread by a ConsoleRenderer, so that draining never waits for the console:
+      plain one-line output when it falls behind, and skipped lines when its queue is full
+    - Optionally, parsed JSON records stored in compressed segments indexed by request_id, user_id and time,
+      whatever the console shows, with the lines it skips kept by a RecordRecorder until they are parsed
     """
 
+    # pylint: disable=too-many-instance-attributes
+
     # ---------- constants ----------
-    _LEVEL_WORD = re.compile(r"\b(DEBUG|INFO|WARNING|ERROR|CRITICAL|FATAL)\b", re.IGNORECASE)
+    # "threads": one blocking readline() thread per pipe.
+    # "multiplexed": a single thread reads every pipe without blocking, in large chunks, and splits lines itself.
+    DRAIN_MODES = ("threads", "multiplexed")
     _MESSAGE_TYPE_TO_LEVEL: Dict[str, int] = {
         "trace": logging.DEBUG,
         "debug": logging.DEBUG,
@@ -91,7 +142,11 @@ class ProcessLogBridge:
 
     # ---------- construction ----------
     def __init__(
-        self, level: str = "INFO", runner_log_file: Optional[str] = None, config: Optional[Dict[str, Any]] = None
+        self,
+        level: str = "INFO",
+        runner_log_file: Optional[str] = None,
+        config: Optional[Dict[str, Any]] = None,
+        drain_mode: str = "threads",
     ):
         """
         Initialize the logging bridge.
@@ -107,13 +162,18 @@ class ProcessLogBridge:
             config (dict | None):
                 Optional override configuration that merges with
                 the built-in `log_cfg`. Supports overriding theme,
-                rich handler settings, and file handler settings.
+                rich handler settings, file handler settings, and the directory of stored records.
+            drain_mode (str):
+                One of `DRAIN_MODES`. Defaults to `"threads"`.
+                `"multiplexed"` falls back to threads on Windows, where pipes cannot be selected.
 
         Notes:
             - Creates a Rich console.
             - Reconfigures the root logger with rich + optional file handlers.
             - Initializes per-stream state storage for subprocess drains.
         """
+        if drain_mode not in self.DRAIN_MODES:
+            raise ValueError(f"drain_mode must be one of {', '.join(self.DRAIN_MODES)}, got: {drain_mode!r}")
         self.level_name = level.upper()
         self.runner_log_file = runner_log_file
         cfg = copy.deepcopy(log_cfg)
@@ -129,6 +189,8 @@ class ProcessLogBridge:
 
         self._time_style_key = cfg.get("time_style_key", "logging.time")
 
+        self.json_backend = resolve_json_backend(cfg.get("json_backend", "auto"))
+
         # rich console / handler
         theme = Theme(theme_styles)
         self.console: Console = Console(theme=theme)
@@ -146,25 +208,14 @@ class ProcessLogBridge:
         }
         rh_kwargs.update(cfg.get("rich", {}))
 
-        self.rich_handler: RichHandler = RichHandler(**rh_kwargs)
+        self.rich_handler: RichHandler = PlainCapableRichHandler(**rh_kwargs)
         self.rich_handler.setLevel(getattr(logging, self.level_name, logging.INFO))
         self.rich_handler.setFormatter(logging.Formatter("%(message)s"))
 
         # file handler (optional)
         self.file_handler: Optional[TimedRotatingFileHandler] = None
         if runner_log_file:
-            file_cfg = cfg.get("file", {})
-            when = file_cfg.get("when", "midnight")
-            backup_count = int(file_cfg.get("backupCount", 7))
-            encoding = file_cfg.get("encoding", "utf-8")
-            fmt = file_cfg.get("fmt", "%(asctime)s | %(levelname)-8s | %(name)s:%(funcName)s:%(lineno)d - %(message)s")
-            Path(runner_log_file).parent.mkdir(parents=True, exist_ok=True)
-            self.file_handler = TimedRotatingFileHandler(
-                runner_log_file, when=when, backupCount=backup_count, encoding=encoding
-            )
-            self.file_handler.setLevel(logging.DEBUG)
-            # keep tz-aware timestamps for file logs
-            self.file_handler.setFormatter(self._TZFormatter(fmt=fmt))
+            self.file_handler = self._make_file_handler(runner_log_file, cfg.get("file", {}))
 
         # root logger config
         root = logging.getLogger()
@@ -181,11 +232,52 @@ class ProcessLogBridge:
         # state keys: tee(TextIO), buffer(list[str]), balance(int), collecting(bool), logger(logging.Logger)
         self._streams: Dict[Tuple[str, str], Dict[str, Any]] = {}
 
+        self.drain_mode = drain_mode
+        if drain_mode == "multiplexed" and sys.platform == "win32":
+            self._logger.warning("Pipes cannot be multiplexed on Windows, draining them with threads")
+            self.drain_mode = "threads"
+        self._multiplexer: Optional[PipeMultiplexer] = None
+        if self.drain_mode == "multiplexed":
+            self._multiplexer = PipeMultiplexer(self._handle_line, self._finish_stream)
+        # Attached streams not yet drained to EOF
+        self._open_streams = 0
+        self._streams_drained = threading.Condition()
+
+        # Stores the JSON records parsed by the renderer thread, and keeps the lines skipped on the console
+        # until it parses them, so that records are stored whatever the console shows
+        records_cfg = {**log_cfg["records"], **cfg.get("records", {})}
+        self._recorder: Optional[RecordRecorder] = self._make_recorder(records_cfg)
+
+        # Renders the lines handed over by the draining threads, started with the first stream.
+        # With a recorder, it also parses the skipped lines of streams that fell silent, once idle.
+        render_cfg = {**log_cfg["render"], **cfg.get("render", {})}
+        self._renderer = ConsoleRenderer(
+            self._render_queued,
+            int(render_cfg["queue_lines"]),
+            int(render_cfg["plain_backlog"]),
+            idle=self._record_idle_streams if self._recorder is not None else None,
+            idle_seconds=float(records_cfg["flush_seconds"]),
+        )
+
+    @property
+    def render_counts(self) -> Dict[str, int]:
+        """
+        :return dict: Lines rendered by the renderer thread: "rich", "plain", and "skipped" when its queue was full.
+        """
+        return self._renderer.counts
+
+    @property
+    def record_sink(self) -> Optional[RecordSink]:
+        """
+        :return RecordSink | None: Store of the parsed JSON records, or None without a records directory.
+        """
+        return self._recorder.sink if self._recorder is not None else None
+
     # ---------- public API ----------
     def attach_process_logger(self, process, process_name: str, log_file: str) -> None:
         """
-        Drain stdout/stderr in background threads, pretty-print to terminal, mirror raw to file.
-        Spawns background threads that:
+        Drain stdout/stderr in the background, pretty-print to terminal, mirror raw to file.
+        In the background:
         - Continuously read from `process.stdout` and `process.stderr`.
         - Pretty-print parsed output to the console.
         - Mirror raw lines to the specified log file.
@@ -194,7 +286,8 @@ class ProcessLogBridge:
         :param process_name (str): Logical label for this process. Used as logger name prefix.
         :param log_file (str): File to write raw mirror logs to. Created if missing.
         Notes:
-            - Two threads are spawned: one for stdout, one for stderr.
+            - In "threads" mode, two threads are spawned: one for stdout, one for stderr.
+            - In "multiplexed" mode, both pipes are registered with the shared multiplexer thread.
             - Per-stream state (buffer, JSON reassembly, tee handle) is created.
         """
         Path(log_file).parent.mkdir(parents=True, exist_ok=True)
@@ -202,12 +295,78 @@ class ProcessLogBridge:
         tee_err = open(log_file, "a", encoding="utf-8")
         self._streams[(process_name, "STDOUT")] = self._make_stream_state(process_name, tee_out)
         self._streams[(process_name, "STDERR")] = self._make_stream_state(process_name, tee_err)
+        with self._streams_drained:
+            self._open_streams += 2
+        self._renderer.start()
+        if self._recorder is not None:
+            self._recorder.start()
+
+        if self._multiplexer is not None:
+            self._multiplexer.add(process.stdout, self._streams[(process_name, "STDOUT")])
+            self._multiplexer.add(process.stderr, self._streams[(process_name, "STDERR")])
+            return
 
         t_out = threading.Thread(target=self._drain_pipe, args=(process.stdout, process_name, "STDOUT"), daemon=True)
         t_err = threading.Thread(target=self._drain_pipe, args=(process.stderr, process_name, "STDERR"), daemon=True)
         t_out.start()
         t_err.start()
 
+    def wait_for_streams(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every attached pipe has been drained to EOF, its tee file closed and its lines rendered
+        and recorded.
+        :param timeout (float | None): Seconds to wait at most, or None to wait indefinitely.
+        :return bool: True if all streams were drained, False on timeout.
+        """
+        with self._streams_drained:
+            return self._streams_drained.wait_for(lambda: self._open_streams == 0, timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Wait for the attached pipes to be drained, then write the records not stored yet.
+        :param timeout (float | None): Seconds to wait for the pipes at most, or None to wait indefinitely.
+        """
+        self.wait_for_streams(timeout)
+        if self.record_sink is not None:
+            self.record_sink.flush()
+
+    # ---------- helpers: configuration ----------
+    def _make_file_handler(self, runner_log_file: str, file_cfg: Dict[str, Any]) -> TimedRotatingFileHandler:
+        """
+        :param runner_log_file (str): Path of the runner log file, its directory created if missing.
+        :param file_cfg (dict): The `"file"` section of the configuration.
+        :return TimedRotatingFileHandler: Handler writing every record to the runner log file.
+        """
+        when = file_cfg.get("when", "midnight")
+        backup_count = int(file_cfg.get("backupCount", 7))
+        encoding = file_cfg.get("encoding", "utf-8")
+        fmt = file_cfg.get("fmt", "%(asctime)s | %(levelname)-8s | %(name)s:%(funcName)s:%(lineno)d - %(message)s")
+        Path(runner_log_file).parent.mkdir(parents=True, exist_ok=True)
+        file_handler = TimedRotatingFileHandler(
+            runner_log_file, when=when, backupCount=backup_count, encoding=encoding
+        )
+        file_handler.setLevel(logging.DEBUG)
+        # keep tz-aware timestamps for file logs
+        file_handler.setFormatter(self._TZFormatter(fmt=fmt))
+        return file_handler
+
+    def _make_recorder(self, records_cfg: Dict[str, Any]) -> Optional[RecordRecorder]:
+        """
+        :param records_cfg (dict): The `"records"` section of the configuration.
+        :return RecordRecorder | None: Recorder of the parsed JSON records, or None without a directory.
+        """
+        if not records_cfg.get("directory"):
+            return None
+        sink = RecordSink(
+            records_cfg["directory"],
+            segment_bytes=int(records_cfg["segment_bytes"]),
+            max_segments=int(records_cfg["max_segments"]),
+            block_records=int(records_cfg["block_records"]),
+        )
+        return RecordRecorder(
+            sink, int(records_cfg["queue_lines"]), float(records_cfg["flush_seconds"]), self._META_REGEXES
+        )
+
     # ---------- helpers: logging/time ----------
     @classmethod
     def _now_local(cls) -> datetime:
@@ -251,15 +410,28 @@ class ProcessLogBridge:
                     - "tee": file handle for mirroring.
                     - "buffer": list used for multiline JSON reassembly.
                     - "balance": brace balance counter.
+                    - "in_string": whether the reassembled block ends inside a JSON string.
                     - "collecting": whether multi-line JSON parsing is active.
+                    - "echoed": whether the lines of the collected block are shown one by one, or not at all,
+                      rather than as a whole once collected. Only with a record sink.
                     - "logger": Python logger for this process's output.
+                    - "queued": number of the last line queued for rendering, by the draining thread.
+                    - "rendered": number of the last line rendered, by the renderer thread.
+                    - "read_at": time the line being rendered was read, the time of records with no "Timestamp".
+                    - "shed": with a record sink, the lines skipped on the console, kept by the RecordRecorder.
         """
         return {
             "tee": tee,
             "buffer": [],
             "balance": 0,
+            "in_string": False,
             "collecting": False,
+            "echoed": False,
             "logger": logging.getLogger(process_name),
+            "queued": 0,
+            "rendered": 0,
+            "read_at": 0.0,
+            "shed": deque(),
         }
 
     @staticmethod
@@ -307,82 +479,242 @@ class ProcessLogBridge:
             for line in iter(pipe.readline, ""):
                 self._handle_line(state, line.rstrip("\n"))
         finally:
-            try:
-                pipe.close()
-            except Exception:
-                pass
-            self._close_stream(state)
+            self._finish_stream(pipe, state)
+
+    def _finish_stream(self, pipe, state: Dict[str, Any]) -> None:
+        """
+        Close a drained pipe and its tee file, and tell the renderer that the stream ended.
+        The stream counts as drained once the renderer got there.
+        :param pipe: The pipe that reached EOF.
+        :param state (dict): The per-stream state.
+        """
+        try:
+            pipe.close()
+        except Exception:
+            pass
+        self._close_stream(state)
+        self._renderer.end(state)
 
     # ---------- line handling ----------
     def _handle_line(self, state: Dict[str, Any], line: str) -> None:
         """
-        Handle a single log line from a process.
+        Handle a single log line from a process, on the thread draining its pipe.
         Steps:
             1. Mirror raw line to tee file.
-            2. Attempt strict or fragmentary JSON parsing.
-            3. Otherwise apply multiline JSON reassembly logic.
-            4. If none apply, log as plain text.
+            2. Queue it for the renderer thread, without waiting: when the queue is full,
+               the line is skipped on the console, and the renderer notices the gap in line numbers.
+            3. With a record sink, hand a skipped line to the recorder, which keeps it without waiting
+               until the renderer parses it for its records.
         :param state (dict): The per-stream state dict.
         :param line (str): The raw line to process.
         """
+        # Mirror raw first
+        self._write_tee(state, line)
         if line == "":
-            self._write_tee(state, line)
             return
+        if not self._renderer.put(state, line) and self._recorder is not None:
+            self._recorder.shed(state, line)
 
-        # Mirror raw first
-        self._write_tee(state, line)
+    # ---------- rendering ----------
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+    def _render_queued(
+        self, state: Dict[str, Any], line: Optional[str], skipped: int, plain: bool, read_at: float
+    ) -> None:
+        """
+        Render a line handed over by the renderer thread.
+        :param state (dict): The per-stream state.
+        :param line (str | None): The raw, non-empty line, or None at the end of the stream.
+        :param skipped (int): Number of lines of the stream skipped before this one because the queue was full.
+        :param plain (bool): Whether to render the line as plain one-line output.
+        :param read_at (float): Time the line was read, in seconds since the epoch.
+        """
+        if skipped > 0:
+            if self._recorder is not None:
+                self._record_skipped(state, state["rendered"] - skipped, state["rendered"])
+            self._report_skipped(state, skipped, plain)
+        state["read_at"] = read_at
+        if line is None:
+            self._end_rendering(state)
+            return
+        self._render_line(state, line, plain)
 
-        # Single-line JSON?
-        obj = self._try_parse_json_fragment(line)
-        if obj is not None:
-            self._emit_json_block(state, obj)
+    def _record_skipped(self, state: Dict[str, Any], first: int, stop: int) -> None:
+        """
+        Parse the lines of a stream skipped on the console, in order, for their records only.
+        A record being reassembled when lines were dropped from the records lost them, so it is dropped too.
+        :param state (dict): The per-stream state.
+        :param first (int): Number of the first skipped line.
+        :param stop (int): Number of the line after the last skipped one.
+        """
+        previous = first - 1
+        for number, line, read_at in self._recorder.take_shed(state, first, stop):
+            if number != previous + 1:
+                self._drop_collected(state)
+            previous = number
+            state["read_at"] = read_at
+            self._render_line(state, line, shown=False)
+        if previous != stop - 1:
+            self._drop_collected(state)
+
+    def _record_idle_streams(self) -> None:
+        """
+        Parse the lines skipped on the console of streams that fell silent, once no line waits to be rendered,
+        so that their records are stored without waiting for the next line of the stream.
+        """
+        for state in list(self._streams.values()):
+            shed = state["shed"]
+            if not shed:
+                continue
+            stop = shed[-1][0] + 1
+            # A line queued before the last skipped one would be waiting, and must be rendered first
+            if self._renderer.pending():
+                return
+            skipped = stop - state["rendered"] - 1
+            first, state["rendered"] = state["rendered"] + 1, stop - 1
+            self._renderer.counts["skipped"] += skipped
+            self._record_skipped(state, first, stop)
+            self._report_skipped(state, skipped, self._renderer.plain)
+
+    def _report_skipped(self, state: Dict[str, Any], skipped: int, plain: bool) -> None:
+        """
+        Tell that lines of a stream were not rendered because the queue was full.
+        Without a record sink, a record being reassembled lost lines, so it is flushed as text.
+        :param state (dict): The per-stream state.
+        :param skipped (int): Number of lines not rendered.
+        :param plain (bool): Whether the console renders plain one-line output.
+        """
+        if state["collecting"] and self._recorder is None:
+            self._emit_collected(state, self._reasm_flush(state), plain=True)
+        log_file = getattr(state["tee"], "name", "its log file")
+        self._log(
+            state,
+            logging.WARNING,
+            f"{state['logger'].name} - {skipped} lines not shown while the console was overloaded, see {log_file}",
+            plain,
+        )
+
+    def _end_rendering(self, state: Dict[str, Any]) -> None:
+        """
+        Render what is left of an ended stream, and count the stream as drained.
+        :param state (dict): The per-stream state.
+        """
+        if state["collecting"]:
+            echoed = state["echoed"]
+            self._emit_collected(
+                state, self._reasm_flush(state), self._renderer.plain and self._recorder is None, quiet=echoed
+            )
+        with self._streams_drained:
+            self._open_streams -= 1
+            self._streams_drained.notify_all()
+
+    def _render_line(self, state: Dict[str, Any], line: str, plain: bool = False, shown: bool = True) -> None:
+        """
+        Render a single log line from a process, on the renderer thread.
+        Steps:
+            1. Classify the line, so that only JSON-looking lines outside a collected block reach the parsers.
+            2. Attempt strict or fragmentary JSON parsing.
+            3. Otherwise apply multiline JSON reassembly logic.
+            4. If none apply, log as plain text.
+        With a record sink, plain and skipped lines are still parsed, for their records:
+        a plain line is shown as is, and a collected block that is not shown as a whole is shown line by line.
+        :param state (dict): The per-stream state dict.
+        :param line (str): The raw, non-empty line.
+        :param plain (bool): Whether to log every line as is, on one line, without parsing it.
+        :param shown (bool): False for a line skipped on the console, only parsed for its records.
+        """
+        quiet = plain or not shown
+        if quiet and self._show_as_is(state, line, shown):
             return
 
+        # Single-line JSON?
+        kind = classify_line(line)
+        if state["collecting"] and (kind == FRAGMENT or line[0].isspace()):
+            # Part of the block being collected, like the nested objects of pretty-printed JSON.
+            # Only unindented JSON lines are records of their own.
+            kind = TEXT
+        if kind != TEXT:
+            obj = try_parse_json_fragment(line, strict=kind == JSON, loads=self._loads_json)
+            if obj is not None:
+                self._emit_json_block(state, obj, quiet)
+                return
+
         # Multi-line accumulation
         if not state["collecting"]:
-            if self._reasm_start_if_jsonish(state, line):
+            if kind != TEXT and self._reasm_start_if_jsonish(state, line):
+                state["echoed"] = quiet
                 if state["balance"] <= 0:  # closed on same line
                     block = self._reasm_flush(state)
-                    self._emit_collected(state, block)
+                    self._emit_collected(state, block, quiet=quiet)
                 return
             # Plain text fallback
-            self._emit_text_line(state, line)
+            if not quiet:
+                self._emit_text_line(state, line)
             return
 
         # we are collecting
+        if state["echoed"] and not quiet:
+            # The start of the block was shown line by line, and so is the rest of it
+            self._emit_text_line(state, line)
         self._reasm_add(state, line)
         if self._reasm_should_flush(state, line):
+            echoed = state["echoed"]
             block = self._reasm_flush(state)
-            self._emit_collected(state, block)
+            self._emit_collected(state, block, quiet=echoed)
+
+    def _show_as_is(self, state: Dict[str, Any], line: str, shown: bool) -> bool:
+        """
+        Show a plain line as is, or nothing of a skipped one, after what was not shown of the block being collected.
+        :param state (dict): The per-stream state.
+        :param line (str): The raw, non-empty line.
+        :param shown (bool): False for a line skipped on the console.
+        :return bool: True if the line is not parsed, without a record sink.
+        """
+        if self._recorder is None and state["collecting"]:
+            self._emit_collected(state, self._reasm_flush(state), plain=True)
+        else:
+            self._echo_collected(state)
+        if shown:
+            self._emit_text_line(state, line, plain=True)
+        return self._recorder is None
+
+    def _echo_collected(self, state: Dict[str, Any]) -> None:
+        """
+        Show the lines of the block being collected as one line of text, unless they were shown already,
+        and show the rest of the block line by line. Its record is still stored once the block is complete.
+        :param state (dict): The per-stream state.
+        """
+        if state["collecting"] and not state["echoed"]:
+            self._emit_text_line(state, " ".join(p.strip() for p in state["buffer"] if p.strip()), plain=True)
+            state["echoed"] = True
+
+    def _drop_collected(self, state: Dict[str, Any]) -> None:
+        """
+        Drop the block being collected, which lost lines, after showing what was not shown of it.
+        :param state (dict): The per-stream state.
+        """
+        self._echo_collected(state)
+        self._reasm_flush(state)
+
+    # ---------- json parsing ----------
+    def _loads_json(self, text: str) -> Any:
+        """
+        Parse JSON with the configured backend, see `loads_json()`.
+        :param text (str): JSON text.
+        :return Any: The parsed value.
+        :raises ValueError: If the text is not JSON.
+        """
+        return loads_json(text, self.json_backend)
 
     # ---------- reassembler (stateful, no extra classes) ----------
     @staticmethod
-    def _count_braces_outside_quotes(s: str) -> int:
-        """
-        Count net brace balance `{` minus `}` ignoring quoted strings.
-        :param s (str): A text line.
-        :return int: Net count (`+1` for `{`, `-1` for `}`), ignoring content inside double quotes.
-        """
-        depth = 0
-        in_str = False
-        esc = False
-        for ch in s:
-            if esc:
-                esc = False
-                continue
-            if ch == "\\":
-                esc = True
-                continue
-            if ch == '"':
-                in_str = not in_str
-                continue
-            if in_str:
-                continue
-            if ch == "{":
-                depth += 1
-            elif ch == "}":
-                depth -= 1
-        return depth
+    def _scan_braces(state: Dict[str, Any], line: str) -> None:
+        """
+        Add the net brace balance of the next line of a block to its balance, see `scan_braces()`.
+        :param state (dict): Per-stream state, whose `"balance"` and `"in_string"` are updated.
+        :param line (str): The line added to the block.
+        """
+        scan_braces(state, line)
 
     def _reasm_start_if_jsonish(self, state: Dict[str, Any], line: str) -> bool:
         """
@@ -393,7 +725,9 @@ class ProcessLogBridge:
         """
         if "{" in line:
             state["buffer"] = [line]
-            state["balance"] = self._count_braces_outside_quotes(line)
+            state["balance"] = 0
+            state["in_string"] = False
+            self._scan_braces(state, line)
             state["collecting"] = True
             return True
         return False
@@ -405,7 +739,7 @@ class ProcessLogBridge:
         :param line (str): The next line in the JSON block.
         """
         state["buffer"].append(line)
-        state["balance"] += self._count_braces_outside_quotes(line)
+        self._scan_braces(state, line)
 
     @staticmethod
     def _reasm_should_flush(state: Dict[str, Any], line: str) -> bool:
@@ -434,7 +768,9 @@ class ProcessLogBridge:
         text = "\n".join(state["buffer"]).strip()
         state["buffer"].clear()
         state["balance"] = 0
+        state["in_string"] = False
         state["collecting"] = False
+        state["echoed"] = False
         return text
 
     # ---------- severity ----------
@@ -461,90 +797,14 @@ class ProcessLogBridge:
         """
         if not line:
             return default
-        m = self._LEVEL_WORD.search(line)
-        if not m:
-            if "traceback" in line.lower():
+        upper = line.upper()
+        word = find_level_token(upper)
+        if word is None:
+            if "TRACEBACK" in upper:
                 return logging.ERROR
             return default
-        word = m.group(1).upper()
         return logging.CRITICAL if word == "FATAL" else getattr(logging, word, default)
 
-    # ---------- json helpers ----------
-    @staticmethod
-    def _pretty_json(obj: Any) -> str:
-        """
-        Pretty-print a JSON object.
-        :param obj (Any): Any JSON-serializable object.
-        :return str: Indented JSON, or `str(obj)` on failure.
-        """
-        try:
-            return json.dumps(obj, indent=2, ensure_ascii=False)
-        except Exception:
-            return str(obj)
-
-    @staticmethod
-    def _try_parse_json_fragment(text: str) -> Optional[Dict[str, Any]]:
-        """
-        Try to parse a JSON dictionary from a text line.
-        Attempts:
-            1. Full strict `json.loads(text)`
-            2. Extract fragment between first `{` and last `}` and parse that.
-        :param text (str): Input line.
-        :return dict | None: Parsed JSON as a dictionary, or None if not parseable.
-        """
-        if not text:
-            return None
-        # strict
-        try:
-            obj = json.loads(text)
-            return obj if isinstance(obj, dict) else {"message": obj}
-        except Exception:
-            pass
-        # first {...}
-        s = text.find("{")
-        e = text.rfind("}")
-        if s != -1 and e != -1 and e > s:
-            frag = text[s: e + 1]
-            try:
-                obj = json.loads(frag)
-                return obj if isinstance(obj, dict) else {"message": obj}
-            except Exception:
-                return None
-        return None
-
-    @staticmethod
-    def _lenient_inner_json_parse(val: Any) -> Optional[Any]:
-        """
-        Attempt lenient JSON parsing of a string containing nested JSON.
-        Strategy:
-            - If value is not a string, return None.
-            - If it doesn't begin with `{` or `[`, return None.
-            - Try strict `json.loads()`.
-            - Otherwise, clean escape sequences and attempt again.
-        :param val (Any): Possibly nested JSON-like string.
-        :return Any | None: Parsed JSON object, or None if not parseable.
-        """
-        if not isinstance(val, str):
-            return None
-        s = val.strip()
-        if not s:
-            return None
-        if not (s.lstrip().startswith("{") or s.lstrip().startswith("[")):
-            return None
-        # strict
-        try:
-            return json.loads(s)
-        except Exception:
-            pass
-        # mild cleanup: unescape \n \t \r and drop trailing commas
-        s2 = s.replace("\\r", "\r").replace("\\t", "\t").replace("\\n", "\n")
-        s2 = re.sub(r",\s*(?=[}\]])", "", s2)
-        s2 = re.sub(r"\n{3,}", "\n\n", s2)
-        try:
-            return json.loads(s2)
-        except Exception:
-            return None
-
     # ---------- special NeuroSan block ----------
     def _rebuild_neurosan_request_reporting(self, text_block: str) -> Optional[Dict[str, Any]]:
         """
@@ -562,7 +822,7 @@ class ProcessLogBridge:
             return None
         inner_src = "{" + m.group("inner").strip() + "}"
         try:
-            inner = json.loads(inner_src)
+            inner = self._loads_json(inner_src)
         except Exception:
             inner = inner_src
         out: Dict[str, Any] = {"message": inner}
@@ -625,29 +885,35 @@ class ProcessLogBridge:
         """
         return f"{process_name}:{source}" if source else process_name
 
-    def _emit_json_block(self, state: Dict[str, Any], record: Dict[str, Any]) -> None:
+    def _emit_json_block(self, state: Dict[str, Any], record: Dict[str, Any], quiet: bool = False) -> None:
         """
         Emit a fully parsed JSON record to the logger.
         Steps:
             1. Infer log level from `message_type`.
-            2. Build header including process name and optional source.
-            3. Parse nested JSON inside the `"message"` field (if present).
-            4. Pretty-print JSON.
-            5. If the message looks like traceback text, print a Rich-formatted traceback.
+            2. With a record sink, store the record.
+            3. Build header including process name and optional source.
+            4. Parse nested JSON inside the `"message"` field (if present).
+            5. Pretty-print JSON.
+            6. If the message looks like traceback text, print a Rich-formatted traceback.
         :param state (dict): Per-stream logging state.
         :param record (dict): Parsed JSON dictionary representing the log event.
+        :param quiet (bool): Whether to only store the record, its lines being shown as is or not at all.
         """
         level = self._infer_level_from_message_type(record)
+        if self._recorder is not None:
+            self._recorder.store(state, level, record)
+        if quiet:
+            return
         src = str(record.get("source") or "").strip() or None
         header = self._src_header(state["logger"].name, src)
 
         # Display copy
         display_rec = dict(record)
-        inner = self._lenient_inner_json_parse(display_rec.get("message"))
+        inner = lenient_inner_json_parse(display_rec.get("message"), loads=self._loads_json)
         if inner is not None:
             display_rec["message"] = inner
 
-        body = self._pretty_json(display_rec)
+        body = pretty_json(display_rec)
         self._log(state, level, header + "\n" + body)
 
         # If message was traceback-like text, pretty print after
@@ -656,60 +922,72 @@ class ProcessLogBridge:
             tb_text = self._normalize_traceback_str(msg)
             if self._looks_like_traceback(tb_text):
                 self._log(state, level, header + " (traceback)")
-                self.console.print(Syntax(tb_text, "pytb", word_wrap=False))
+                # Highlighting is only worth it when the console shows the level
+                if level >= self.rich_handler.level:
+                    self.console.print(Syntax(tb_text, "pytb", word_wrap=False))
 
-    def _emit_text_line(self, state: Dict[str, Any], line: str) -> None:
+    def _emit_text_line(self, state: Dict[str, Any], line: str, plain: bool = False) -> None:
         """
         Emit a plain text line to the logger.
         :param state (dict): Per-stream logging state.
         :param line (str): Raw log line.
+        :param plain (bool): Whether the console should print it as is rather than lay it out.
         Notes: Severity is inferred automatically via `_infer_level_from_text()`.
         """
         level = self._infer_level_from_text(line, logging.INFO)
         header = self._src_header(state["logger"].name, None)
-        self._log(state, level, header + " - " + line)
+        self._log(state, level, header + " - " + line, plain)
 
-    def _emit_collected(self, state: Dict[str, Any], block: str) -> None:
+    def _emit_collected(self, state: Dict[str, Any], block: str, plain: bool = False, quiet: bool = False) -> None:
         """
         Emit a reconstructed multiline block.
         Decision logic:
-            - If block parses as JSON → emit as JSON.
+            - If block parses as JSON → emit as JSON. Blocks are parsed once, from their first `{` to their last `}`,
+              unless they start with `[`.
             - If it matches NeuroSan request-reporting → rebuild + emit.
             - Otherwise → treat as text (flatten whitespace).
         :param state (dict): Per-stream state.
         :param block (str): Reassembled multiline block.
+        :param plain (bool): Whether to emit the block as flattened text without parsing it.
+        :param quiet (bool): Whether to only store its record, its lines being shown one by one or not at all.
         """
-        obj = self._try_parse_json_fragment(block)
+        if plain:
+            self._emit_text_line(state, " ".join(p.strip() for p in block.splitlines() if p.strip()), plain=True)
+            return
+        obj = try_parse_json_fragment(block, strict=block.startswith("["), loads=self._loads_json)
         if obj is not None:
-            self._emit_json_block(state, obj)
+            self._emit_json_block(state, obj, quiet)
             return
 
         rebuilt = self._rebuild_neurosan_request_reporting(block)
         if rebuilt is not None:
-            self._emit_json_block(state, rebuilt)
+            self._emit_json_block(state, rebuilt, quiet)
             return
 
-        flat = " ".join(p.strip() for p in block.splitlines() if p.strip())
-        self._emit_text_line(state, flat)
+        if not quiet:
+            flat = " ".join(p.strip() for p in block.splitlines() if p.strip())
+            self._emit_text_line(state, flat)
 
     # ---------- logging wrapper ----------
     @staticmethod
-    def _log(state: Dict[str, Any], level: int, msg: str) -> None:
+    def _log(state: Dict[str, Any], level: int, msg: str, plain: bool = False) -> None:
         """
         Log a message using the appropriate logger method.
         :param state (dict): Per-stream state containing a logger.
         :param level (int): Logging level constant.
         :param msg (str): Message to emit.
+        :param plain (bool): Whether the console should print it as is rather than lay it out.
         Notes: Calls the appropriate severity method (debug/info/warning/error/...).
         """
         lg = state["logger"]
+        extra = {"plain": True} if plain else None
         if level >= logging.CRITICAL:
-            lg.critical(msg)
+            lg.critical(msg, extra=extra)
         elif level >= logging.ERROR:
-            lg.error(msg)
+            lg.error(msg, extra=extra)
         elif level >= logging.WARNING:
-            lg.warning(msg)
+            lg.warning(msg, extra=extra)
         elif level >= logging.INFO:
-            lg.info(msg)
+            lg.info(msg, extra=extra)
         else:
-            lg.debug(msg)
+            lg.debug(msg, extra=extra)
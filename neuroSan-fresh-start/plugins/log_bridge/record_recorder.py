@@ -0,0 +1,154 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Storage of the JSON records parsed from the lines drained by a ProcessLogBridge, including the lines
+shed from its console, with the records written on a thread of their own.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Pattern
+from typing import Tuple
+
+from plugins.log_bridge.record_sink import RecordSink
+
+logger = logging.getLogger(__name__)
+
+
+class RecordRecorder:
+    """
+    Stores the records parsed by the renderer thread of a ProcessLogBridge, and keeps the lines it sheds
+    from its console until the renderer parses them for their records, so that records are stored
+    even when the console skips them.
+    Shed lines wait in a bounded per-stream queue, filled without waiting by the thread draining the stream:
+    once `shed_lines` are waiting, further ones are dropped, and counted when the renderer gets there.
+    The records parsed so far are written every `flush_seconds`, so that they can be found.
+    """
+
+    def __init__(self, sink: RecordSink, shed_lines: int, flush_seconds: float, meta_regexes: Dict[str, Pattern[str]]):
+        """
+        :param sink (RecordSink): Store of the parsed records.
+        :param shed_lines (int): Lines shed from the console waiting to be parsed at most, per stream.
+        :param flush_seconds (float): Seconds after which the records parsed so far are written.
+        :param meta_regexes (dict): Regular expressions of the fields stored next to the records,
+            by field name, finding their value in the `"message"` text of records that lack them.
+        """
+        self.sink = sink
+        self._meta_regexes = meta_regexes
+        self._shed_lines = shed_lines
+        self._flush_seconds = flush_seconds
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        # Shed lines dropped because their queue was full, counted on the renderer thread
+        self.dropped = 0
+
+    def start(self) -> None:
+        """
+        Start the thread writing the records, unless it is running.
+        """
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="LogBridgeRecorder", daemon=True)
+                self._thread.start()
+
+    def store(self, state: Dict[str, Any], level: int, record: Dict[str, Any]) -> None:
+        """
+        Append a parsed JSON record to the sink, with the fields of `meta_regexes` found in the record,
+        or else in its `"message"` text, next to it. The record is timed by its `"Timestamp"`, local if it has
+        no time zone, or else by the time its last line was read.
+        :param state (dict): The per-stream state.
+        :param level (int): Level the record is logged at.
+        :param record (dict): The parsed JSON record.
+        """
+        stored: Dict[str, Any] = {"process": state["logger"].name, "level": logging.getLevelName(level)}
+        message = record.get("message")
+        for f, rx in self._meta_regexes.items():
+            if record.get(f) is not None:
+                stored[f] = record[f]
+            elif isinstance(message, str):
+                mm = rx.search(message)
+                if mm:
+                    stored[f] = mm.group("val")
+        stored["record"] = record
+        self.sink.append(stored, self._parse_timestamp(stored.get("Timestamp")) or state["read_at"])
+
+    @staticmethod
+    def _parse_timestamp(value: Any) -> Optional[float]:
+        """
+        :param value: `"Timestamp"` of a record.
+        :return float | None: Seconds since the epoch, or None if the value is not an ISO 8601 date and time.
+        """
+        if not isinstance(value, str):
+            return None
+        try:
+            return datetime.fromisoformat(value.strip()).timestamp()
+        except ValueError:
+            return None
+
+    def shed(self, state: Dict[str, Any], line: str) -> None:
+        """
+        Keep a line the console skipped, without waiting, or drop it if `shed_lines` are waiting.
+        Called on the thread draining the stream.
+        :param state (dict): The per-stream state, whose `"queued"` number is the number of the line.
+        :param line (str): The raw, non-empty line.
+        """
+        shed = state["shed"]
+        if len(shed) < self._shed_lines:
+            shed.append((state["queued"], line, time.time()))
+
+    def take_shed(self, state: Dict[str, Any], first: int, stop: int) -> List[Tuple[int, str, float]]:
+        """
+        Take the shed lines of a stream numbered from `first` up to `stop`, and count the ones dropped.
+        Called on the renderer thread.
+        :param state (dict): The per-stream state.
+        :param first (int): Number of the first line the console skipped.
+        :param stop (int): Number of the line the console got after the skipped ones.
+        :return list: The `(number, line, read_at)` of the kept lines, in order.
+        """
+        shed = state["shed"]
+        lines = []
+        while shed and shed[0][0] < stop:
+            lines.append(shed.popleft())
+        dropped = stop - first - len(lines)
+        if dropped > 0:
+            self.dropped += dropped
+            logger.warning(
+                "%d lines of %s not recorded, more than %d lines were waiting (%d in total)",
+                dropped,
+                state["logger"].name,
+                self._shed_lines,
+                self.dropped,
+            )
+        return lines
+
+    def _run(self) -> None:
+        """
+        Body of the recorder thread: write the records parsed so far every `flush_seconds`,
+        for as long as the bridge exists.
+        """
+        while True:
+            time.sleep(self._flush_seconds)
+            try:
+                self.sink.flush()
+            except OSError:
+                logger.exception("Failed to write records to %s", self.sink.directory)
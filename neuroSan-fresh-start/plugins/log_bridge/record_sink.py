@@ -0,0 +1,234 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Structured store of the JSON records parsed by ProcessLogBridge, indexed so that the records of a request,
+a user or a time window are found without reading every log file.
+
+A directory of records holds numbered segments, each with a sidecar index:
+    segment-000001.jsonl.gz       one JSON record per line, in blocks compressed as separate gzip members
+    segment-000001.index.jsonl    one line per block: its offset and length in the segment, its number of records,
+                                  the time range of its records, and the request_ids and user_ids found in them
+A segment is a regular gzip file: `zcat segment-000001.jsonl.gz` prints all of its records.
+Only the blocks whose index line matches a query are read and decompressed.
+"""
+
+import gzip
+import json
+import os
+import re
+import threading
+from datetime import datetime
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".jsonl.gz"
+INDEX_SUFFIX = ".index.jsonl"
+SEGMENT_REGEX = re.compile(rf"^{SEGMENT_PREFIX}(\d+){re.escape(SEGMENT_SUFFIX)}$")
+# Fields of the records listed in the index lines of their blocks
+INDEXED_FIELDS = ("request_id", "user_id")
+
+
+class RecordSink:
+    """
+    Appends records to the current segment of a directory, a block of records at a time.
+    A block is written once it holds `block_records` records, or when flush() is called. Once the current segment
+    holds `segment_bytes` compressed bytes, a new one is started, and segments beyond `max_segments` are deleted,
+    oldest first. Safe to use from several threads.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    def __init__(
+        self, directory: str, segment_bytes: int = 64 * 1024 * 1024, max_segments: int = 50, block_records: int = 500
+    ):
+        """
+        :param directory: Directory of the segments, created if missing
+        :param segment_bytes: Compressed size from which a new segment is started
+        :param max_segments: Number of segments kept, or 0 to keep all of them
+        :param block_records: Records compressed, and indexed, together at most
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory: str = directory
+        self.segment_bytes: int = segment_bytes
+        self.max_segments: int = max_segments
+        self.block_records: int = block_records
+        self._lock = threading.Lock()
+        self._block: List[str] = []
+        self._block_times: List[float] = []
+        self._block_keys: Dict[str, Set[str]] = {field: set() for field in INDEXED_FIELDS}
+        # The first block starts a new segment, numbered on from the last one left by earlier runs
+        numbers: List[int] = [number for number, _, _ in list_segments(directory)]
+        self._segment_number: int = max(numbers, default=0)
+        self._segment_size: int = self.segment_bytes
+
+    def append(self, record: Dict[str, Any], timestamp: Optional[float] = None) -> None:
+        """
+        :param record: JSON-serializable record. Its request_id and user_id, if any, are indexed.
+        :param timestamp: Time of the record in seconds since the epoch, by default now.
+            Stored in the record as a local ISO 8601 "time".
+        """
+        moment: datetime = datetime.fromtimestamp(timestamp) if timestamp is not None else datetime.now()
+        line: str = json.dumps({"time": moment.astimezone().isoformat(), **record}, ensure_ascii=False, default=str)
+        with self._lock:
+            self._block.append(line)
+            self._block_times.append(moment.timestamp())
+            for field in INDEXED_FIELDS:
+                if record.get(field) is not None:
+                    self._block_keys[field].add(str(record[field]))
+            if len(self._block) >= self.block_records:
+                self._write_block()
+
+    def flush(self) -> None:
+        """
+        Write the records appended so far, so that they can be found.
+        """
+        with self._lock:
+            if self._block:
+                self._write_block()
+
+    def _write_block(self) -> None:
+        """
+        Compress the pending records as a gzip member at the end of the current segment, then index them.
+        Called with the lock held.
+        """
+        if self._segment_size >= self.segment_bytes:
+            self._start_segment()
+        data: bytes = gzip.compress(("\n".join(self._block) + "\n").encode("utf-8"), mtime=0)
+        segment_path, index_path = segment_paths(self.directory, self._segment_number)
+        with open(segment_path, "ab") as segment:
+            offset: int = segment.tell()
+            segment.write(data)
+        entry: Dict[str, Any] = {
+            "offset": offset,
+            "length": len(data),
+            "records": len(self._block),
+            "first": min(self._block_times),
+            "last": max(self._block_times),
+        }
+        for field in INDEXED_FIELDS:
+            entry[field] = sorted(self._block_keys[field])
+            self._block_keys[field].clear()
+        # The block is indexed once it is complete, so readers never see part of it
+        with open(index_path, "a", encoding="utf-8") as index:
+            index.write(json.dumps(entry) + "\n")
+        self._segment_size = offset + len(data)
+        self._block.clear()
+        self._block_times.clear()
+
+    def _start_segment(self) -> None:
+        """
+        Start a new segment, and delete the oldest ones beyond max_segments.
+        """
+        self._segment_number += 1
+        self._segment_size = 0
+        if self.max_segments <= 0:
+            return
+        segments: List[Tuple[int, str, str]] = list_segments(self.directory)
+        # The new segment does not exist yet, but counts
+        for _, segment_path, index_path in segments[: max(0, len(segments) + 1 - self.max_segments)]:
+            for path in (index_path, segment_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+
+def segment_paths(directory: str, number: int) -> Tuple[str, str]:
+    """
+    :param directory: Directory of the segments
+    :param number: Number of a segment
+    :return: Paths of the segment and of its index
+    """
+    name: str = f"{SEGMENT_PREFIX}{number:06d}"
+    return os.path.join(directory, name + SEGMENT_SUFFIX), os.path.join(directory, name + INDEX_SUFFIX)
+
+
+def list_segments(directory: str) -> List[Tuple[int, str, str]]:
+    """
+    :param directory: Directory of the segments
+    :return: Number, segment path and index path of every segment of the directory, oldest first
+    """
+    if not os.path.isdir(directory):
+        return []
+    numbers: List[int] = sorted(
+        int(match.group(1)) for match in map(SEGMENT_REGEX.match, os.listdir(directory)) if match
+    )
+    return [(number, *segment_paths(directory, number)) for number in numbers]
+
+
+def read_index(index_path: str) -> List[Dict[str, Any]]:
+    """
+    :param index_path: Index of a segment
+    :return: Index lines of the blocks of the segment, in order. An incomplete last line is ignored.
+    """
+    if not os.path.exists(index_path):
+        return []
+    entries: List[Dict[str, Any]] = []
+    with open(index_path, encoding="utf-8") as index:
+        for line in index:
+            if line.endswith("\n"):
+                entries.append(json.loads(line))
+    return entries
+
+
+# pylint: disable=too-many-arguments
+# pylint: disable=too-many-positional-arguments
+def find_records(
+    directory: str,
+    request_id: Optional[str] = None,
+    user_id: Optional[str] = None,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Find the records matching all of the given conditions, reading only the blocks whose index matches them.
+
+    :param directory: Directory of the segments
+    :param request_id: request_id of the records
+    :param user_id: user_id of the records
+    :param since: Earliest time of the records, in seconds since the epoch
+    :param until: Latest time of the records, in seconds since the epoch
+    :return: The records, oldest first
+    """
+    wanted: Dict[str, str] = {
+        field: value for field, value in (("request_id", request_id), ("user_id", user_id)) if value is not None
+    }
+    for _, segment_path, index_path in list_segments(directory):
+        entries: List[Dict[str, Any]] = [
+            entry
+            for entry in read_index(index_path)
+            if (since is None or entry["last"] >= since)
+            and (until is None or entry["first"] <= until)
+            and all(value in entry[field] for field, value in wanted.items())
+        ]
+        if not entries:
+            continue
+        with open(segment_path, "rb") as segment:
+            for entry in entries:
+                segment.seek(entry["offset"])
+                for line in gzip.decompress(segment.read(entry["length"])).decode("utf-8").splitlines():
+                    record: Dict[str, Any] = json.loads(line)
+                    if any(str(record.get(field)) != value for field, value in wanted.items()):
+                        continue
+                    if since is not None or until is not None:
+                        moment: float = datetime.fromisoformat(record["time"]).timestamp()
+                        if (since is not None and moment < since) or (until is not None and moment > until):
+                            continue
+                    yield record
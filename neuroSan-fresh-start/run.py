@@ -66,6 +66,8 @@ class NeuroSanRunner:
             "thinking_file": os.getenv("THINKING_FILE", self.thinking_file),
             "thinking_dir": os.getenv("THINKING_DIR", self.thinking_dir),
             "logbridge_enabled": os.getenv("LOGBRIDGE_ENABLED", "true"),
+            "logbridge_drain_mode": os.getenv("LOGBRIDGE_DRAIN_MODE", "threads"),
+            "logbridge_records_dir": os.getenv("LOGBRIDGE_RECORDS_DIR", ""),
             # Ensure all paths are resolved relative to `self.root_dir`
             "agent_manifest_file": os.getenv(
                 "AGENT_MANIFEST_FILE", os.path.join(self.root_dir, "registries", "manifest.hocon")
@@ -91,6 +93,8 @@ class NeuroSanRunner:
             self.log_bridge = ProcessLogBridge(
                 level=self.args.get("log_level", "info"),
                 runner_log_file=os.path.join(self.args["logs_dir"], "runner.log"),
+                drain_mode=self.args["logbridge_drain_mode"],
+                config={"records": {"directory": self.args["logbridge_records_dir"] or None}},
             )
         # Process references
         self.server_process = None
@@ -146,6 +150,21 @@ class NeuroSanRunner:
         parser.add_argument(
             "--log-level", type=str, default=self.args["log_level"], help="Log level for all processes"
         )
+        parser.add_argument(
+            "--logbridge-drain-mode",
+            type=str,
+            choices=ProcessLogBridge.DRAIN_MODES,
+            default=self.args["logbridge_drain_mode"],
+            help="How the log bridge reads the output of the processes: "
+            "two threads per process, or a single thread multiplexing all of them",
+        )
+        parser.add_argument(
+            "--logbridge-records-dir",
+            type=str,
+            default=self.args["logbridge_records_dir"],
+            help="Directory where the log bridge stores the JSON records of the processes, indexed by request_id, "
+            "user_id and time, for plugins.log_bridge.find_records. Empty to not store them",
+        )
         parser.add_argument(
             "--thinking-file", type=str, default=self.args["thinking_file"], help="Path to the agent thinking file"
         )
@@ -390,6 +409,10 @@ class NeuroSanRunner:
         # Stop Phoenix using the initializer
         self.phoenix_plugin.stop_phoenix_server()
 
+        if self.args.get("logbridge_enabled"):
+            # Store the last records of the stopped processes
+            self.log_bridge.close()
+
         sys.exit(0)
 
     def is_port_open(self, host: str, port: int, timeout=1.0) -> bool:
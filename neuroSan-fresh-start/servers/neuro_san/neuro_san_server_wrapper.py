@@ -31,6 +31,8 @@ class NeuroSanServerWrapper:
         """Initialize the plugins."""
         # Phoenix
         self.phoenix_enabled = os.getenv("PHOENIX_ENABLED", "false").lower() in ("true", "1", "yes", "on")
+        # Vector store warm-up of the RAG tools
+        self.rag_warmup_enabled = os.getenv("RAG_WARMUP_ENABLED", "true").lower() in ("true", "1", "yes", "on")
 
     def _init_phoenix(self):
         """Initialize Phoenix instrumentation if enabled."""
@@ -49,11 +51,28 @@ class NeuroSanServerWrapper:
         except Exception as e:  # pylint: disable=broad-exception-caught
             print(f"Warning: Phoenix initialization failed: {e}")
 
+    def _start_rag_warmup(self):
+        """Start preloading the vector stores of the served RAG tools in the background, if enabled."""
+        if not self.rag_warmup_enabled:
+            return
+
+        try:
+            # pylint: disable=import-outside-toplevel
+            from coded_tools.tools.rag.warmup import RagWarmup
+
+            print("Starting RAG vector store warm-up in the background...")
+            RagWarmup.get_shared().start()
+        except ImportError as e:
+            print(f"Warning: RAG warm-up unavailable: {e}")
+
     def run(self):
-        """Initialize Phoenix and run the server main loop."""
+        """Initialize Phoenix, start the RAG warm-up and run the server main loop."""
         # Initialize Phoenix before starting the server
         self._init_phoenix()
 
+        # Preload vector stores while the server starts, so that requests can be served meanwhile
+        self._start_rag_warmup()
+
         # Import and run the actual server main loop
         # Note: ServerMainLoop will parse sys.argv itself, so all command-line
         # arguments (--port, --http_port, etc.) are automatically passed through
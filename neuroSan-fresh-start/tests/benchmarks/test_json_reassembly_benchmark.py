@@ -0,0 +1,45 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import json
+from unittest import TestCase
+
+from benchmarks.json_reassembly_benchmark import build_parser
+from benchmarks.json_reassembly_benchmark import run_benchmark
+
+
+class TestJsonReassemblyBenchmark(TestCase):
+    """
+    Smoke tests for the multi-line JSON reassembly benchmark.
+    """
+
+    def test_small_run(self):
+        """
+        A tiny run should time the brace scans and the reassembly of both variants for every record size.
+        """
+        args = build_parser().parse_args(["--record-kb", "1", "4", "--total-kb", "8", "--repeats", "1"])
+        results = run_benchmark(args)
+
+        self.assertEqual(set(results["sizes"]), {"1", "4"})
+        self.assertEqual(results["sizes"]["4"]["records"], 2)
+        for size in results["sizes"].values():
+            self.assertEqual(
+                set(size["variants"]),
+                {"char_loop_scan", "incremental_scan", "char_loop_reassembly", "incremental_reassembly"},
+            )
+            for variant in size["variants"].values():
+                self.assertGreater(variant["mb_per_second"], 0)
+        json.dumps(results)
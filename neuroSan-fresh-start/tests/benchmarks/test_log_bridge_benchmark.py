@@ -0,0 +1,41 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import json
+from unittest import TestCase
+
+from benchmarks.log_bridge_benchmark import build_parser
+from benchmarks.log_bridge_benchmark import run_benchmark
+from plugins.log_bridge.process_log_bridge import ProcessLogBridge
+
+
+class TestLogBridgeBenchmark(TestCase):
+    """
+    Smoke tests for the log bridge benchmark.
+    """
+
+    def test_small_run_reports_every_drain_mode(self):
+        """
+        A tiny run should measure every drain mode, each of which should tee every line.
+        """
+        args = build_parser().parse_args(["--processes", "2", "--lines", "50", "--level", "CRITICAL"])
+        results = run_benchmark(args)
+
+        self.assertEqual(set(results["modes"]), set(ProcessLogBridge.DRAIN_MODES))
+        for measured in results["modes"].values():
+            self.assertEqual(measured["lines_teed"], 100)
+            self.assertGreater(measured["lines_per_second"], 0)
+        json.dumps(results)
@@ -0,0 +1,42 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import json
+from unittest import TestCase
+
+from benchmarks.log_line_benchmark import SAMPLE_LOG_FILE
+from benchmarks.log_line_benchmark import build_parser
+from benchmarks.log_line_benchmark import run_benchmark
+
+
+class TestLogLineBenchmark(TestCase):
+    """
+    Smoke tests for the log line handling benchmark.
+    """
+
+    def test_small_run_on_the_bundled_sample(self):
+        """
+        A tiny run over the bundled sample should time the baseline and the classified line handling.
+        """
+        args = build_parser().parse_args(["--log-file", SAMPLE_LOG_FILE, "--lines", "200", "--repeats", "1"])
+        results = run_benchmark(args)
+
+        self.assertEqual(results["lines"], 200)
+        self.assertTrue({"before", "classified_json"} <= set(results["variants"]))
+        self.assertEqual(set(results["distinct_line_kinds"]), {"text", "json", "fragment"})
+        for variant in results["variants"].values():
+            self.assertGreater(variant["us_per_line"], 0)
+        json.dumps(results)
@@ -0,0 +1,58 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import json
+from unittest import TestCase
+
+from benchmarks.rag_benchmark import STORE_VARIANTS
+from benchmarks.rag_benchmark import HashEmbeddings
+from benchmarks.rag_benchmark import build_parser
+from benchmarks.rag_benchmark import run_benchmark
+
+
+class TestRagBenchmark(TestCase):
+    """
+    Smoke tests for the offline RAG benchmark.
+    """
+
+    def test_hash_embeddings_are_deterministic(self):
+        """
+        The same text should get the same vector from separate instances, and shared words should make texts similar.
+        """
+        first = HashEmbeddings(16).embed_query("w1 w2 w3")
+        self.assertEqual(HashEmbeddings(16).embed_query("w1 w2 w3"), first)
+
+        embeddings = HashEmbeddings(64)
+        similar = sum(a * b for a, b in zip(embeddings.embed_query("w1 w2 w3 w4"), embeddings.embed_query("w1 w2 w3")))
+        unrelated = sum(a * b for a, b in zip(embeddings.embed_query("w5 w6 w7"), embeddings.embed_query("w1 w2 w3")))
+        self.assertGreater(similar, unrelated)
+
+    def test_small_run_reports_every_store(self):
+        """
+        A tiny run should measure every store variant and produce JSON-serializable results.
+        """
+        args = build_parser().parse_args(
+            ["--documents", "4", "--words-per-document", "300", "--dimensions", "16", "--queries", "5"]
+        )
+        results = asyncio.run(run_benchmark(args))
+
+        self.assertEqual(set(results["stores"]), set(STORE_VARIANTS))
+        self.assertGreater(results["corpus"]["chunks"], 4)
+        for store in results["stores"].values():
+            self.assertGreater(store["ingest_chunks_per_second"], 0)
+            self.assertLessEqual(store["query_ms_p50"], store["query_ms_p99"])
+        json.dumps(results)
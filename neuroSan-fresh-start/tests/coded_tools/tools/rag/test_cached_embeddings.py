@@ -0,0 +1,75 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import os
+import tempfile
+from typing import List
+from unittest import TestCase
+
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from coded_tools.tools.rag.cached_embeddings import CachedEmbeddings
+from coded_tools.tools.rag.cached_embeddings import EmbeddingStore
+
+
+class CountingEmbeddings(DeterministicFakeEmbedding):
+    """Fake embeddings that record every text sent to the model."""
+
+    embedded_texts: List[str] = []
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.embedded_texts.extend(texts)
+        return super().embed_documents(texts)
+
+
+class TestCachedEmbeddings(TestCase):
+    """
+    Unit tests for the CachedEmbeddings class.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.store = EmbeddingStore(os.path.join(self.temp_dir.name, "embeddings.sqlite"))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_only_unseen_texts_are_embedded(self):
+        """
+        Repeated and previously embedded texts should be served from the cache, in input order.
+        """
+        underlying = CountingEmbeddings(size=4, embedded_texts=[])
+        embeddings = CachedEmbeddings(underlying, model="fake", dimensions=4, store=self.store)
+
+        first = embeddings.embed_documents(["a", "b", "a"])
+        self.assertEqual(underlying.embedded_texts, ["a", "b"])
+        self.assertEqual(first[0], first[2])
+
+        second = asyncio.run(embeddings.aembed_documents(["b", "c"]))
+        self.assertEqual(underlying.embedded_texts, ["a", "b", "c"])
+        self.assertEqual(second[0], first[1])
+        self.assertEqual(embeddings.hits, 1)
+        self.assertEqual(embeddings.misses, 3)
+
+    def test_cache_is_keyed_by_model_and_dimensions(self):
+        """
+        The same text embedded with a different model should not be served from the cache.
+        """
+        underlying = CountingEmbeddings(size=4, embedded_texts=[])
+        CachedEmbeddings(underlying, model="fake", dimensions=4, store=self.store).embed_documents(["a"])
+        CachedEmbeddings(underlying, model="other", dimensions=4, store=self.store).embed_documents(["a"])
+        self.assertEqual(underlying.embedded_texts, ["a", "a"])
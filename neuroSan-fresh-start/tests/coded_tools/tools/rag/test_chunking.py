@@ -0,0 +1,164 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import os
+import tempfile
+from typing import List
+from unittest import TestCase
+
+from langchain_core.documents import Document
+
+from coded_tools.tools.rag.chunking import ChunkDeduplicator
+from coded_tools.tools.rag.chunking import ChunkingSettings
+from coded_tools.tools.rag.source_manifest import SourceManifest
+from tests.coded_tools.tools.rag.test_source_manifest import TextFileRag
+
+NAVIGATION = "Home | Flights | Baggage | Contact us | Sign in to manage your bookings and travel preferences"
+MENU = (
+    "Home Flights Baggage Contact us Sign in to manage your bookings and travel preferences Deals Destinations "
+    "Loyalty program Help center Accessibility Careers Press Investors Sustainability Gift cards Travel alerts"
+)
+FOOTER = "Copyright 2025 Example Airlines. All rights reserved. Terms of carriage apply to every ticket."
+PAGES = {
+    "baggage.txt": f"{NAVIGATION}\n\nCarry-on bags may not exceed 22 x 14 x 9 inches.\n\n{FOOTER}",
+    "pets.txt": f"{NAVIGATION}\n\nSmall pets may travel in the cabin in an approved carrier.\n\n{FOOTER}",
+    "fees.txt": f"{FOOTER}\n\nChecked bags cost 35 USD each.\n\n{FOOTER}",
+}
+
+
+class TestChunking(TestCase):
+    """
+    Unit tests for chunking settings, chunk deduplication and chunking estimates.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.paths: List[str] = []
+        for name, text in PAGES.items():
+            self.paths.append(os.path.join(self.temp_dir.name, name))
+            with open(self.paths[-1], "w", encoding="utf-8") as text_file:
+                text_file.write(text)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_deduplicator(self):
+        """
+        Exact duplicates should be dropped up to whitespace, and near duplicates only in "near" mode.
+        Copies dropped from other sources should be recorded against the kept chunk.
+        """
+        texts = [MENU, f"  {MENU}\n", f"{MENU} Cargo", FOOTER]
+        chunks = [Document(page_content=text) for text in texts]
+        self.assertEqual(ChunkDeduplicator("none").filter(chunks), chunks)
+
+        exact = ChunkDeduplicator("exact")
+        self.assertEqual([chunk.page_content for chunk in exact.filter(chunks)], [texts[0], texts[2], texts[3]])
+        self.assertEqual(exact.dropped, 1)
+
+        near = ChunkDeduplicator("near")
+        self.assertEqual([chunk.page_content for chunk in near.filter(chunks)], [texts[0], texts[3]])
+        self.assertEqual(near.dropped, 2)
+
+        sources = ChunkDeduplicator("exact")
+        first = [Document(id="a1", page_content=MENU, metadata={"source": "a"})]
+        second = [
+            Document(id="b1", page_content=MENU, metadata={"source": "b"}),
+            Document(id="b2", page_content=FOOTER, metadata={"source": "b"}),
+            Document(id="b3", page_content=FOOTER, metadata={"source": "b"}),
+        ]
+        self.assertEqual(sources.filter(first), first)
+        self.assertEqual(sources.filter(second), second[1:2])
+        self.assertEqual(sources.dropped, 2)
+        # A source repeating its own chunk is not its duplicate source
+        self.assertEqual(sources.duplicate_sources, {"a1": ["b"]})
+        self.assertEqual(sources.aliases, {"b": ["a1"]})
+
+    def test_settings(self):
+        """
+        Tool arguments should be validated, and recorded in the index parameters only when they are not defaults.
+        """
+        rag = TextFileRag()
+        default_params = rag.get_index_params()
+        for invalid in [
+            {"chunk_size": 0},
+            {"chunk_overlap": 100},
+            {"chunking_strategy": "semantic"},
+            {"chunk_dedup": 1},
+        ]:
+            with self.assertRaises(ValueError):
+                rag.configure_chunking(invalid)
+        self.assertEqual(rag.get_chunking_settings(), ChunkingSettings())
+
+        rag.configure_chunking({"chunk_overlap": 0, "chunking_strategy": "structured", "chunk_dedup": "near"})
+        self.assertEqual(rag.get_chunking_settings(), ChunkingSettings(100, 0, "structured", "near"))
+        self.assertEqual(
+            rag.get_index_params(),
+            {**default_params, "chunk_overlap": 0, "chunking_strategy": "structured", "chunk_dedup": "near"},
+        )
+
+    def test_duplicates_are_not_embedded(self):
+        """
+        Navigation and footers repeated across sources should be embedded once, and still be found by filters
+        on every source repeating them. The estimate should count the chunks and tokens each setting embeds.
+        """
+        rag = TextFileRag()
+        rag.use_vector_store_cache = False
+        rag.configure_chunking({"chunk_overlap": 0, "chunk_dedup": "exact"})
+        store = asyncio.run(rag.generate_vector_store(loader_args={"urls": self.paths}))
+        self.assertEqual(len(store.store), 5)
+        self.assertEqual(rag.embeddings.embedded_texts.count(FOOTER), 1)
+        footer = next(entry for entry in store.store.values() if entry["text"] == FOOTER)
+        self.assertEqual(footer["metadata"]["source"], self.paths[0])
+        self.assertEqual(footer["metadata"]["duplicate_sources"], sorted(self.paths[1:]))
+        for path in self.paths[1:]:
+            found = asyncio.run(rag.query_vectorstore(store, FOOTER, metadata_filter={"source": path}))
+            self.assertIn(FOOTER, found)
+        excluded = asyncio.run(
+            rag.query_vectorstore(store, FOOTER, metadata_filter={"source": {"$ne": self.paths[0]}})
+        )
+        self.assertNotIn(FOOTER, excluded)
+
+        settings = [ChunkingSettings(100, 50), ChunkingSettings(100, 0), ChunkingSettings(100, 0, dedup="exact")]
+        estimates = asyncio.run(rag.estimate_chunking({"urls": self.paths}, settings))
+        self.assertEqual([estimate.chunks for estimate in estimates], [9, 9, 5])
+        self.assertEqual([estimate.duplicate_chunks for estimate in estimates], [0, 0, 4])
+        self.assertEqual(estimates[0].document_tokens, sum(len(text) for text in PAGES.values()))
+        self.assertGreater(estimates[1].tokens, estimates[2].tokens)
+        self.assertEqual(estimates[2].to_dict()["settings"]["dedup"], "exact")
+
+    def test_removing_kept_chunks_reindexes_duplicates(self):
+        """
+        Removing the source whose chunks were kept for the duplicates of others should index those others again,
+        so that their navigation and footers are still found.
+        """
+        store_path = os.path.join(self.temp_dir.name, "store.npy")
+        for urls in [self.paths, self.paths[1:]]:
+            rag = TextFileRag()
+            rag.use_vector_store_cache = False
+            rag.incremental_update = True
+            rag.save_vector_store = True
+            rag.configure_vector_store_path(store_path)
+            rag.configure_chunking({"chunk_overlap": 0, "chunk_dedup": "exact"})
+            store = asyncio.run(rag.generate_vector_store(loader_args={"urls": urls}))
+
+        self.assertEqual(rag.loaded_sources, self.paths[1:])
+        self.assertEqual(len(store), 4)
+        manifest = SourceManifest.load(SourceManifest.path_for(store_path))
+        self.assertEqual(manifest.sources[self.paths[1]].alias_ids, [])
+        self.assertEqual(len(manifest.sources[self.paths[2]].alias_ids), 1)
+        found = asyncio.run(rag.query_vectorstore(store, FOOTER, metadata_filter={"source": self.paths[2]}))
+        self.assertIn(FOOTER, found)
@@ -0,0 +1,148 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import os
+import tempfile
+from typing import List
+from unittest import TestCase
+
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from coded_tools.tools.rag.embedding_scheduler import EmbeddingScheduler
+from coded_tools.tools.rag.embedding_scheduler import ScheduledEmbeddings
+from coded_tools.tools.rag.embedding_scheduler import TokenBucket
+from tests.coded_tools.tools.rag.test_source_manifest import TextFileRag
+
+TEXTS = [f"chunk {'word ' * (i % 5)}{i}" for i in range(40)]
+
+
+def count_words(text: str) -> int:
+    """Token counter for the tests, so no tiktoken encoding has to be downloaded."""
+    return len(text.split())
+
+
+class RateLimitError(Exception):
+    """Stand-in for openai.RateLimitError."""
+
+    status_code = 429
+
+
+class FlakyEmbeddings(DeterministicFakeEmbedding):
+    """Fake embeddings that rate-limit the first call for some texts and track concurrent calls."""
+
+    fail_once: List[str] = []
+    calls: List[List[str]] = []
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.calls.append(texts)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            for text in texts:
+                if text in self.fail_once:
+                    self.fail_once.remove(text)
+                    raise RateLimitError("429 Too Many Requests")
+            return self.embed_documents(texts)
+        finally:
+            self.in_flight -= 1
+
+
+class TestEmbeddingScheduler(TestCase):
+    """
+    Unit tests for the EmbeddingScheduler class.
+    """
+
+    def test_pack_respects_token_and_size_limits(self):
+        """
+        Batches should cover all texts in order without exceeding either limit.
+        """
+        scheduler = EmbeddingScheduler(max_batch_tokens=10, max_batch_size=4, token_counter=count_words)
+        batches = scheduler.pack(TEXTS + ["one very long text " * 5])
+
+        self.assertEqual(batches[0].start, 0)
+        self.assertEqual(batches[-1].end, len(TEXTS) + 1)
+        for previous, batch in zip(batches, batches[1:]):
+            self.assertEqual(previous.end, batch.start)
+        for batch in batches[:-1]:
+            self.assertLessEqual(batch.tokens, 10)
+            self.assertLessEqual(batch.end - batch.start, 4)
+        # A text over the token budget is sent on its own
+        self.assertEqual(batches[-1].end - batches[-1].start, 1)
+
+    def test_rate_limited_batches_are_retried_in_order(self):
+        """
+        Only the rate-limited batches should be re-sent, with results in input order and bounded concurrency.
+        """
+        embeddings = FlakyEmbeddings(size=8, fail_once=[TEXTS[3], TEXTS[30]], calls=[])
+        scheduler = EmbeddingScheduler(
+            max_batch_tokens=12, max_batch_size=5, max_concurrency=3, token_counter=count_words
+        )
+        scheduler.base_retry_delay = 0.01
+        progress = []
+        scheduler.progress_callback = progress.append
+
+        vectors = asyncio.run(scheduler.aembed_documents(embeddings, TEXTS))
+
+        self.assertEqual(vectors, embeddings.embed_documents(TEXTS))
+        self.assertEqual(len(embeddings.calls), len(scheduler.pack(TEXTS)) + 2)
+        self.assertLessEqual(embeddings.max_in_flight, 3)
+        self.assertEqual(progress[-1].done_chunks, len(TEXTS))
+        self.assertEqual(progress[-1].retries, 2)
+
+    def test_rate_limit_gives_up_after_max_retries(self):
+        """
+        A batch that stays rate limited should fail the run once its retries are exhausted.
+        """
+        embeddings = FlakyEmbeddings(size=8, fail_once=[TEXTS[0]] * 3, calls=[])
+        scheduler = EmbeddingScheduler(max_retries=1, token_counter=count_words)
+        scheduler.base_retry_delay = 0.01
+
+        with self.assertRaises(RateLimitError):
+            asyncio.run(scheduler.aembed_documents(embeddings, TEXTS[:2]))
+
+    def test_token_bucket_delays_over_budget(self):
+        """
+        Reservations beyond the per-minute budget should be told to wait for the refill.
+        """
+        bucket = TokenBucket(tokens_per_minute=600)
+        self.assertEqual(bucket.reserve(600), 0.0)
+        self.assertAlmostEqual(bucket.reserve(100), 10.0, delta=0.1)
+
+    def test_ingest_batches_fill_the_concurrency(self):
+        """
+        The ingestion batches should be large enough for the scheduler to keep max_concurrency requests in flight,
+        although each batch is embedded by a separate call.
+        """
+        embeddings = FlakyEmbeddings(size=8, fail_once=[], calls=[])
+        scheduler = EmbeddingScheduler(max_batch_size=300, max_concurrency=4, token_counter=count_words)
+        rag = TextFileRag()
+        rag.use_vector_store_cache = False
+        rag.embeddings = ScheduledEmbeddings(embeddings, scheduler)
+        rag.configure_chunking({"chunk_overlap": 0})
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "policies.txt")
+            with open(path, "w", encoding="utf-8") as text_file:
+                policies = [f"Policy {number} applies to every passenger on every flight." for number in range(1200)]
+                text_file.write("\n\n".join(policies))
+            store = asyncio.run(rag.generate_vector_store(loader_args={"urls": [path]}))
+
+        self.assertEqual(len(store.store), 1200)
+        self.assertEqual(max(len(texts) for texts in embeddings.calls), 300)
+        self.assertEqual(embeddings.max_in_flight, 4)
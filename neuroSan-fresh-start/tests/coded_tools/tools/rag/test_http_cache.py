@@ -0,0 +1,189 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from typing import Dict
+from typing import List
+from unittest import TestCase
+from unittest import mock
+
+import requests
+from langchain_core.documents import Document
+
+from coded_tools.tools.rag.http_cache import HttpCache
+from coded_tools.tools.rag.parallel_loader import ParallelDocumentLoader
+from coded_tools.tools.webpage_rag import WebpageRag
+
+
+class VersionedHandler(BaseHTTPRequestHandler):
+    """Serves the bodies of the server, with their version as ETag, and answers 304 to a matching If-None-Match."""
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Serve a body or a 304."""
+        bodies: Dict[str, bytes] = self.server.bodies
+        self.server.requests.append((self.path, self.headers.get("If-None-Match")))
+        if self.path not in bodies:
+            self.send_error(404)
+            return
+        etag: str = f'"{len(bodies[self.path])}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(bodies[self.path])))
+        self.end_headers()
+        self.wfile.write(bodies[self.path])
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Keep the test output quiet."""
+
+
+def read_text(path: str, source: str) -> List[Document]:
+    """Parse function returning the text of a file."""
+    with open(path, encoding="utf-8") as text_file:
+        return [Document(page_content=text_file.read(), metadata={"source": source})]
+
+
+class TestHttpCache(TestCase):
+    """
+    Unit tests for the HttpCache class and its use by ParallelDocumentLoader.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), VersionedHandler)
+        self.server.bodies = {"/doc.txt": b"first version"}
+        self.server.requests = []
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.temp_dir.cleanup()
+
+    def _read(self, path: str) -> bytes:
+        with open(path, "rb") as body_file:
+            return body_file.read()
+
+    def test_revalidation(self):
+        """
+        A fresh body should be served without a request, an expired one revalidated with its ETag,
+        a changed one downloaded again, and a stale one served when the server is unreachable.
+        """
+        url = self.base_url + "/doc.txt"
+        cache = HttpCache(self.temp_dir.name, max_age_seconds=60.0)
+        path = cache.fetch(url)
+        self.assertTrue(path.endswith(".txt"))
+        self.assertEqual(self._read(path), b"first version")
+        self.assertEqual(cache.fetch(url), path)
+        self.assertEqual(len(self.server.requests), 1)
+
+        cache.max_age_seconds = 0.0
+        self.assertEqual(cache.fetch(url), path)
+        self.assertEqual(self.server.requests[-1], ("/doc.txt", '"13"'))
+
+        self.server.bodies["/doc.txt"] = b"second, longer version"
+        self.assertEqual(self._read(cache.fetch(url)), b"second, longer version")
+        self.assertEqual(len(self.server.requests), 3)
+
+        with self.assertRaises(requests.HTTPError):
+            cache.fetch(self.base_url + "/missing.txt")
+
+        self.server.shutdown()
+        self.server.server_close()
+        self.assertEqual(self._read(cache.fetch(url)), b"second, longer version")
+
+    def test_budget_and_loader(self):
+        """
+        The least recently used bodies should be evicted over budget, and the loader should parse cached bodies
+        without deleting them.
+        """
+        for name in ["a", "b", "c"]:
+            self.server.bodies[f"/{name}.txt"] = name.encode("utf-8") * 100
+        cache = HttpCache(self.temp_dir.name, max_bytes=250, eviction_grace_seconds=0.0)
+        first = cache.fetch(self.base_url + "/a.txt")
+        time.sleep(0.01)
+        second = cache.fetch(self.base_url + "/b.txt")
+        time.sleep(0.01)
+        cache.fetch(self.base_url + "/a.txt")
+        time.sleep(0.01)
+        cache.fetch(self.base_url + "/c.txt")
+        self.assertTrue(os.path.exists(first))
+        self.assertFalse(os.path.exists(second))
+
+        with mock.patch.object(HttpCache, "_shared", cache), ThreadPoolExecutor(max_workers=2) as executor:
+            loader = ParallelDocumentLoader(read_text, executor=executor)
+            results = asyncio.run(self._collect(loader, [self.base_url + "/a.txt", self.base_url + "/missing.txt"]))
+        self.assertEqual([doc.page_content for doc in results], ["a" * 100])
+        self.assertEqual(results[0].metadata["source"], self.base_url + "/a.txt")
+        self.assertTrue(os.path.exists(first))
+
+    def test_bodies_in_use_are_not_evicted(self):
+        """
+        Bodies fetched within the grace period, or acquired and not released yet, should survive eviction.
+        """
+        for name in ["a", "b", "c", "d"]:
+            self.server.bodies[f"/{name}.txt"] = name.encode("utf-8") * 100
+        cache = HttpCache(self.temp_dir.name, max_bytes=250)
+        paths = [cache.fetch(self.base_url + f"/{name}.txt") for name in ["a", "b", "c"]]
+        self.assertTrue(all(os.path.exists(path) for path in paths))
+
+        cache.eviction_grace_seconds = 0.0
+        acquired = cache.acquire(self.base_url + "/a.txt")
+        os.utime(acquired, (0, 0))
+        cache.fetch(self.base_url + "/d.txt")
+        self.assertTrue(os.path.exists(acquired))
+        self.assertFalse(os.path.exists(paths[1]))
+
+        cache.release(acquired)
+        cache.max_age_seconds = 0.0
+        cache.fetch(self.base_url + "/b.txt")
+        self.assertFalse(os.path.exists(acquired))
+
+    def test_unreadable_pages_are_skipped(self):
+        """
+        A cached web page that cannot be read should be logged and skipped, and the other pages loaded.
+        """
+        self.server.bodies["/page.html"] = b"<html lang='en'><title>Baggage</title><p>Two bags</p></html>"
+        cache = HttpCache(self.temp_dir.name)
+        acquire = cache.acquire
+
+        def acquire_or_lose(url: str) -> str:
+            return os.path.join(self.temp_dir.name, "lost.html") if url.endswith("lost.html") else acquire(url)
+
+        with mock.patch.dict(os.environ, {"OPENAI_API_KEY": "test"}):
+            rag = WebpageRag()
+        with mock.patch.object(HttpCache, "_shared", cache), mock.patch.object(cache, "acquire", acquire_or_lose):
+            docs = asyncio.run(
+                rag.load_documents({"urls": [self.base_url + "/lost.html", self.base_url + "/page.html"]})
+            )
+
+        self.assertEqual([doc.metadata["title"] for doc in docs], ["Baggage"])
+
+    @staticmethod
+    async def _collect(loader: ParallelDocumentLoader, sources: List[str]) -> List[Document]:
+        return [doc async for _, docs in loader.aload(sources) for doc in docs]
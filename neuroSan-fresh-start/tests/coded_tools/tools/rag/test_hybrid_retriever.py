@@ -0,0 +1,126 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import os
+import tempfile
+import threading
+from unittest import TestCase
+
+from coded_tools.tools.rag.bm25_index import Bm25Index
+from coded_tools.tools.rag.bm25_index import keyword_index_path
+from coded_tools.tools.rag.bm25_index import tokenize
+from coded_tools.tools.rag.hybrid_retriever import reciprocal_rank_fusion
+from tests.coded_tools.tools.rag.test_source_manifest import TextFileRag
+
+FILLER = [f"General guidance on topic {i} for employees and managers alike." for i in range(30)]
+POLICY = "Travel expenses above the limit need approval under policy POL-2024-17."
+
+
+class TestHybridRetriever(TestCase):
+    """
+    Unit tests for BM25 keyword search and its fusion with vector search.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_bm25_ranks_exact_codes_first(self):
+        """
+        Compounds should match whole or by part, and deleted chunks should no longer be returned.
+        """
+        self.assertEqual(tokenize("See POL-2024-17."), ["see", "pol-2024-17", "pol", "2024", "17"])
+
+        index = Bm25Index()
+        index.add([str(i) for i in range(len(FILLER))] + ["policy"], FILLER + [POLICY])
+        self.assertEqual(index.search("what does pol-2024-17 say?", 3)[0][0], "policy")
+        self.assertEqual(index.search("no such words", 3), [])
+
+        index.delete(["policy"])
+        self.assertNotIn("policy", [chunk_id for chunk_id, _ in index.search("POL-2024-17", 3)])
+
+    def test_bm25_dump_and_load_round_trip(self):
+        """
+        A saved index should drop deleted chunks and rank like the original.
+        """
+        index = Bm25Index()
+        index.add([str(i) for i in range(len(FILLER))] + ["policy"], FILLER + [POLICY])
+        index.delete(["0", "1"])
+        path = os.path.join(self.temp_dir.name, "store.bm25.npz")
+        index.dump(path)
+
+        loaded = Bm25Index.load(path)
+        self.assertEqual(len(loaded), len(index))
+        for query in ["topic 7 employees", "POL-2024-17 approval", "guidance"]:
+            self.assertEqual(loaded.search(query, 5), index.search(query, 5))
+
+    def test_bm25_search_while_adding(self):
+        """
+        Searches running while other threads add and replace chunks should only return indexed chunks.
+        """
+        index = Bm25Index()
+        index.add(["policy"], [POLICY])
+        done = threading.Event()
+
+        def add_chunks():
+            for i in range(300):
+                index.add([str(i % 50), f"new {i}"], [FILLER[i % len(FILLER)], f"{POLICY} Revision {i}."])
+            done.set()
+
+        writer = threading.Thread(target=add_chunks)
+        writer.start()
+        while not done.is_set():
+            for chunk_id, score in index.search("POL-2024-17 revision topic", 10):
+                self.assertIsNotNone(chunk_id)
+                self.assertGreater(score, 0.0)
+        writer.join()
+        self.assertEqual(len(index), 351)
+        self.assertEqual(len(index.search("approval", 400)), 301)
+
+    def test_reciprocal_rank_fusion(self):
+        """
+        An item ranked well by both rankings should beat items found by only one of them.
+        """
+        self.assertEqual(reciprocal_rank_fusion([["a", "b", "c"], ["c", "b", "d"]]), ["c", "b", "a", "d"])
+
+    def test_hybrid_query_ranks_exact_code_first(self):
+        """
+        A query for a policy code should retrieve its chunk first through the saved keyword index.
+        """
+        paths = []
+        for i, text in enumerate(FILLER + [POLICY]):
+            paths.append(os.path.join(self.temp_dir.name, f"doc{i}.txt"))
+            with open(paths[-1], "w", encoding="utf-8") as text_file:
+                text_file.write(text)
+        store_path = os.path.join(self.temp_dir.name, "store.npy")
+
+        rag = TextFileRag()
+        rag.use_vector_store_cache = False
+        rag.hybrid_search = True
+        rag.save_vector_store = True
+        rag.configure_vector_store_path(store_path)
+        asyncio.run(rag.generate_vector_store(loader_args={"urls": paths}))
+        self.assertTrue(os.path.exists(keyword_index_path(store_path)))
+
+        loaded = TextFileRag()
+        loaded.hybrid_search = True
+        loaded.configure_vector_store_path(store_path)
+        store = asyncio.run(loaded._load_existing_vector_store())  # pylint: disable=protected-access
+
+        self.assertTrue(asyncio.run(loaded.query_vectorstore(store, "POL-2024-17")).startswith(POLICY))
@@ -0,0 +1,100 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+from typing import AsyncIterator
+from typing import List
+from unittest import TestCase
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.vectorstores import InMemoryVectorStore
+
+from coded_tools.tools.rag.ingestion_pipeline import IngestionPipeline
+from coded_tools.tools.rag.ingestion_pipeline import estimate_chunk_bytes
+
+
+class SlowVectorStore(InMemoryVectorStore):
+    """In-memory store with slow inserts, to let the producer run ahead if nothing holds it back."""
+
+    fail: bool = False
+
+    # pylint: disable=arguments-differ
+    async def aadd_documents(self, documents: List[Document], **kwargs) -> List[str]:
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("insert failed")
+        return await super().aadd_documents(documents, **kwargs)
+
+
+class TestIngestionPipeline(TestCase):
+    """
+    Unit tests for the IngestionPipeline class.
+    """
+
+    def setUp(self):
+        self.produced: int = 0
+
+    async def _chunk_groups(self, num_groups: int, group_size: int) -> AsyncIterator[List[Document]]:
+        for group in range(num_groups):
+            chunks = [
+                Document(id=f"{group}-{index}", page_content=f"chunk {index} of group {group}")
+                for index in range(group_size)
+            ]
+            self.produced += len(chunks)
+            yield chunks
+
+    def test_all_chunks_inserted_under_memory_ceiling(self):
+        """
+        Every chunk should reach the store while the pipeline never holds more than the ceiling.
+        """
+        store = SlowVectorStore(embedding=DeterministicFakeEmbedding(size=8))
+        chunk_bytes = estimate_chunk_bytes(Document(page_content="chunk 0 of group 0"))
+        ceiling = chunk_bytes * 12
+        pipeline = IngestionPipeline(max_memory_bytes=ceiling, insert_batch_size=5, max_inserts_in_flight=2)
+
+        stats = asyncio.run(pipeline.run(self._chunk_groups(num_groups=20, group_size=4), store))
+
+        self.assertEqual(stats.chunks, 80)
+        self.assertEqual(len(store.store), 80)
+        self.assertLessEqual(stats.peak_bytes, ceiling)
+
+    def test_producer_is_held_back_by_slow_inserts(self):
+        """
+        The loader should not be advanced far beyond what the store has absorbed.
+        """
+        store = SlowVectorStore(embedding=DeterministicFakeEmbedding(size=8))
+        pipeline = IngestionPipeline(max_memory_bytes=10**9, insert_batch_size=4, max_inserts_in_flight=1)
+        max_ahead: List[int] = [0]
+
+        async def watched_groups() -> AsyncIterator[List[Document]]:
+            async for chunks in self._chunk_groups(num_groups=30, group_size=4):
+                max_ahead[0] = max(max_ahead[0], self.produced - len(store.store))
+                yield chunks
+
+        asyncio.run(pipeline.run(watched_groups(), store))
+        # One batch inserting, one queued and one being filled
+        self.assertLessEqual(max_ahead[0], 4 * 3)
+
+    def test_insert_failure_stops_the_run(self):
+        """
+        A failing insert should propagate instead of leaving the pipeline waiting.
+        """
+        store = SlowVectorStore(embedding=DeterministicFakeEmbedding(size=8))
+        store.fail = True
+        pipeline = IngestionPipeline(max_memory_bytes=10**9, insert_batch_size=4, max_inserts_in_flight=2)
+        with self.assertRaises(RuntimeError):
+            asyncio.run(pipeline.run(self._chunk_groups(num_groups=30, group_size=4), store))
@@ -0,0 +1,131 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from benchmarks.ann_benchmark import make_embeddings
+from coded_tools.tools.rag.ivf_vector_store import IVF_SUFFIX
+from coded_tools.tools.rag.ivf_vector_store import IvfVectorStore
+from coded_tools.tools.rag.numpy_vector_store import sidecar_path
+from tests.coded_tools.tools.rag.test_source_manifest import TextFileRag
+
+ROWS = 3000
+DIMENSIONS = 32
+
+
+class TestIvfVectorStore(TestCase):
+    """
+    Unit tests for the IvfVectorStore class.
+    """
+
+    def setUp(self):
+        self.embedding = DeterministicFakeEmbedding(size=DIMENSIONS)
+        self.matrix = make_embeddings(ROWS, DIMENSIONS, topics=40, seed=0)
+        self.queries = make_embeddings(20, DIMENSIONS, topics=40, seed=1)
+        self.store = IvfVectorStore(embedding=self.embedding, n_probe=8, min_rows=100)
+        self.store.add_embeddings(
+            [f"chunk {row}" for row in range(ROWS)], self.matrix, ids=[str(row) for row in range(ROWS)]
+        )
+
+    def _recall(self, store: IvfVectorStore, n_probe: int) -> float:
+        hits = 0
+        for query in self.queries:
+            exact = {row for row, _ in store.exact_search_rows(query, 10)}
+            hits += len(exact & {row for row, _ in store.search_rows(query, 10, n_probe)})
+        return hits / (10 * len(self.queries))
+
+    def test_recall_grows_with_n_probe(self):
+        """
+        Probing more clusters should find more of the exact neighbours, and probing all of them should find all.
+        """
+        low = self._recall(self.store, 2)
+        high = self._recall(self.store, 16)
+
+        self.assertGreater(high, 0.9)
+        self.assertGreaterEqual(high, low)
+        self.assertEqual(self._recall(self.store, ROWS), 1.0)
+
+    def test_small_store_is_searched_exactly(self):
+        """
+        Below min_rows no index should be trained.
+        """
+        store = IvfVectorStore(embedding=self.embedding, min_rows=ROWS + 1)
+        store.add_embeddings(["a", "b"], self.matrix[:2])
+
+        self.assertEqual(store.search_rows(self.matrix[1], 1)[0][0], 1)
+        self.assertIsNone(store._centroids)  # pylint: disable=protected-access
+
+    def test_updates_are_searchable(self):
+        """
+        Rows added after the index was built should be found, and deleted rows should no longer be returned.
+        """
+        self.store.build_index()
+        new_vector = self.matrix[0] * -1.0
+        self.store.add_embeddings(["new"], [new_vector], ids=["new"])
+        self.assertEqual(self.store.similarity_search_by_vector(new_vector, k=1)[0].id, "new")
+
+        self.store.delete(["new", "5"])
+        results = self.store.similarity_search_by_vector(self.matrix[5], k=3, n_probe=ROWS)
+        self.assertNotIn("5", [doc.id for doc in results])
+        self.assertNotIn("new", [doc.id for doc in self.store.similarity_search_by_vector(new_vector, k=3)])
+
+    def test_growth_retrains_and_reassigns_every_row(self):
+        """
+        Once the store has grown enough to retrain the clusters, every row should be assigned to the new ones.
+        """
+        store = IvfVectorStore(embedding=self.embedding, n_probe=ROWS, min_rows=100)
+        store.add_embeddings([f"chunk {row}" for row in range(200)], self.matrix[:200])
+        store.build_index()
+        store.add_embeddings([f"chunk {row}" for row in range(200, ROWS)], self.matrix[200:])
+
+        for query in self.queries:
+            self.assertEqual(store.search_rows(query, 10), store.exact_search_rows(query, 10))
+        # pylint: disable=protected-access
+        self.assertEqual(store._trained_rows, ROWS)
+        np.testing.assert_array_equal(
+            store._assignments, np.argmax(np.asarray(store._matrix) @ store._centroids.T, axis=1)
+        )
+
+    def test_index_is_saved_and_loaded(self):
+        """
+        A loaded store should reuse the saved clusters and return the same results.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "store.npy")
+            self.store.dump(path)
+            self.assertTrue(os.path.exists(sidecar_path(path, IVF_SUFFIX)))
+
+            loaded = IvfVectorStore.load(path, self.embedding, n_probe=8, min_rows=100)
+            # pylint: disable=protected-access
+            np.testing.assert_array_equal(loaded._centroids, self.store._centroids)
+            for query in self.queries:
+                self.assertEqual(loaded.search_rows(query, 5), self.store.search_rows(query, 5))
+
+    def test_ann_store_requires_npy_path(self):
+        """
+        An "ann" store should refuse a JSON vector store path, which would be saved and loaded without its index.
+        """
+        rag = TextFileRag()
+        rag.configure_vector_store_path(os.path.join(tempfile.gettempdir(), "store.json"))
+        with self.assertRaisesRegex(ValueError, "must be a .npy file for 'ann'"):
+            asyncio.run(rag.generate_vector_store(loader_args={"urls": []}, vector_store_type="ann"))
+        self.assertEqual(rag.loaded_sources, [])
@@ -0,0 +1,168 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import os
+import tempfile
+from typing import List
+from unittest import TestCase
+from unittest import mock
+
+from langchain_postgres import PGVectorStore
+
+from coded_tools.tools.rag.metadata_index import MetadataIndex
+from coded_tools.tools.rag.metadata_index import metadata_index_path
+from coded_tools.tools.rag.metadata_index import normalize_filter
+from coded_tools.tools.rag.query_cache import QueryCache
+from tests.coded_tools.tools.rag.test_source_manifest import TextFileRag
+
+TEXTS = {
+    "baggage.txt": "Carry-on bags may not exceed 22 x 14 x 9 inches.",
+    "meals.txt": "Meals on flights over six hours are included in the fare.",
+    "pets.txt": "Small pets may travel in the cabin in an approved carrier.",
+}
+
+
+class TestMetadataIndex(TestCase):
+    """
+    Unit tests for the MetadataIndex class and metadata-filtered queries.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.query_cache_patch = mock.patch.object(QueryCache, "_shared", QueryCache())
+        self.query_cache_patch.start()
+
+    def tearDown(self):
+        self.query_cache_patch.stop()
+        self.temp_dir.cleanup()
+
+    def test_select(self):
+        """
+        Filters should select the chunks they match, deleted chunks should be dropped,
+        and the index should survive a round trip to disk.
+        """
+        index = MetadataIndex()
+        index.add(
+            [f"{source}-{page}" for source in "ab" for page in range(4)],
+            [{"source": source, "page": page, "tags": ["x"]} for source in "ab" for page in range(4)],
+        )
+
+        def select(metadata_filter) -> List[str]:
+            return sorted(index.select(normalize_filter(metadata_filter)))
+
+        self.assertEqual(select({"source": "a", "page": {"$gte": 1, "$lt": 3}}), ["a-1", "a-2"])
+        self.assertEqual(select({"source": ["b", "c"], "page": {"$between": [2, 9]}}), ["b-2", "b-3"])
+        either_filter = {"$or": [{"page": 0}, {"source": {"$ne": "a"}, "page": {"$nin": [1, 2]}}]}
+        self.assertEqual(select(either_filter), ["a-0", "b-0", "b-3"])
+        self.assertEqual(select({"page": {"$gt": "1"}}), ["a-2", "a-3", "b-2", "b-3"])
+        self.assertEqual(select({"tags": "x"}), [])
+
+        index.delete(["a-1", "unknown"])
+        self.assertEqual(select({"source": "a", "page": {"$lte": 1}}), ["a-0"])
+
+        path = metadata_index_path(os.path.join(self.temp_dir.name, "store.npy"))
+        index.dump(path)
+        self.assertEqual(MetadataIndex.load(path).select(normalize_filter({"page": 1})), {"b-1"})
+
+        for invalid in [{}, {"page": {"$like": "1%"}}, {"$not": {"page": 1}}, {"page": {"$in": 1}}, {"a.b": 1}]:
+            with self.assertRaises(ValueError):
+                normalize_filter(invalid)
+
+    def test_values_are_compared_as_in_postgres(self):
+        """
+        Stored values should be compared as their text cast to the type of the filter value, as postgres does,
+        rather than with Python equality.
+        """
+        index = MetadataIndex()
+        metadatas = [{"page": 3}, {"page": "3"}, {"page": 9}, {"page": "3.0"}, {"flag": True}, {"flag": 1}]
+        index.add([str(number) for number in range(len(metadatas))], metadatas)
+
+        def select(metadata_filter) -> List[str]:
+            return sorted(index.select(normalize_filter(metadata_filter)))
+
+        self.assertEqual(select({"page": 3}), ["0", "1"])
+        self.assertEqual(select({"page": "3"}), ["0", "1"])
+        self.assertEqual(select({"page": 3.0}), ["0", "1", "3"])
+        self.assertEqual(select({"page": {"$gt": "10"}}), ["0", "1", "2", "3"])
+        self.assertEqual(select({"page": {"$gt": 5}}), ["2"])
+        self.assertEqual(select({"page": {"$in": ["9", "3.0"]}}), ["2", "3"])
+        self.assertEqual(select({"flag": True}), ["4", "5"])
+        self.assertEqual(select({"flag": 1}), ["5"])
+
+    def test_filtered_queries(self):
+        """
+        Filtered queries should only return matching chunks, from built, loaded and hybrid stores,
+        and be cached apart from unfiltered ones. Postgres should get the filter pushed down, with
+        source conditions also matching the chunks kept for the duplicates of those sources.
+        """
+        paths: List[str] = []
+        for name, text in TEXTS.items():
+            paths.append(os.path.join(self.temp_dir.name, name))
+            with open(paths[-1], "w", encoding="utf-8") as text_file:
+                text_file.write(text)
+
+        # InMemoryVectorStore, and NumpyVectorStore searched with keywords too
+        for store_name, hybrid_search in [("store.json", False), ("store.npy", True)]:
+            store_path = os.path.join(self.temp_dir.name, store_name)
+            rag = TextFileRag()
+            rag.use_vector_store_cache = False
+            rag.hybrid_search = hybrid_search
+            rag.save_vector_store = True
+            rag.configure_vector_store_path(store_path)
+            store = asyncio.run(rag.generate_vector_store(loader_args={"urls": paths}))
+            result = asyncio.run(rag.query_vectorstore(store, "Can I bring my cat?", {"source": paths[2]}))
+            self.assertEqual(result, TEXTS["pets.txt"])
+            self.assertTrue(os.path.exists(metadata_index_path(store_path)))
+
+        # A store saved without its metadata index is indexed on the first filtered query
+        os.remove(metadata_index_path(store_path))
+        rag = TextFileRag()
+        rag.configure_vector_store_path(store_path)
+        store = asyncio.run(rag.generate_vector_store(loader_args={"urls": paths}))
+        meals_filter = {"source": {"$in": paths[:2]}, "$or": [{"source": paths[1]}]}
+        self.assertEqual(
+            asyncio.run(rag.query_vectorstore(store, "Is food served?", meals_filter)), TEXTS["meals.txt"]
+        )
+        self.assertEqual(len(asyncio.run(rag.query_vectorstore(store, "Is food served?")).split("\n\n")), 3)
+        self.assertEqual(asyncio.run(rag.query_vectorstore(store, "Is food served?", {"source": "missing"})), "")
+        self.assertTrue(
+            asyncio.run(rag.query_vectorstore(store, "Is food served?", {"page": {"$eq": [1]}})).startswith("❌")
+        )
+
+        postgres_store = mock.MagicMock(spec=PGVectorStore)
+        # pylint: disable=protected-access
+        _, search_kwargs, chunk_ids = rag._filter_vector_store(
+            postgres_store, normalize_filter({"source": ["a_100%.pdf", "b.pdf"], "page": 1})
+        )
+        self.assertEqual(
+            search_kwargs,
+            {
+                "filter": {
+                    "$and": [
+                        {
+                            "$or": [
+                                {"source": {"$in": ["a_100%.pdf", "b.pdf"]}},
+                                {"duplicate_sources": {"$like": '%"a\\_100\\%.pdf"%'}},
+                                {"duplicate_sources": {"$like": '%"b.pdf"%'}},
+                            ]
+                        },
+                        {"page": {"$eq": 1}},
+                    ]
+                }
+            },
+        )
+        self.assertIsNone(chunk_ids)
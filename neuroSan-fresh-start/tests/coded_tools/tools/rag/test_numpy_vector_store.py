@@ -0,0 +1,102 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from coded_tools.tools.rag.numpy_vector_store import NumpyVectorStore
+
+TEXTS = [f"chunk number {i}" for i in range(20)]
+
+
+class TestNumpyVectorStore(TestCase):
+    """
+    Unit tests for the NumpyVectorStore class.
+    """
+
+    def setUp(self):
+        self.embedding = DeterministicFakeEmbedding(size=16)
+        self.store = NumpyVectorStore.from_texts(
+            TEXTS, self.embedding, metadatas=[{"row": i} for i in range(len(TEXTS))]
+        )
+
+    def test_top_k_matches_brute_force(self):
+        """
+        The vectorized search should rank chunks exactly like a plain cosine scan.
+        """
+        vectors = np.asarray(self.embedding.embed_documents(TEXTS))
+        query = np.asarray(self.embedding.embed_query("query"))
+        cosine = vectors @ query / (np.linalg.norm(vectors, axis=1) * np.linalg.norm(query))
+        expected = [TEXTS[i] for i in np.argsort(-cosine)[:5]]
+
+        results = self.store.similarity_search("query", k=5)
+        self.assertEqual([doc.page_content for doc in results], expected)
+
+    def test_dump_and_mmap_load_round_trip(self):
+        """
+        A dumped store should load memory-mapped and return the same results and metadata.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "store.npy")
+            self.store.dump(path)
+            loaded = NumpyVectorStore.load(path, self.embedding)
+
+            self.assertIsInstance(loaded._matrix, np.memmap)  # pylint: disable=protected-access
+            self.assertEqual(len(loaded), len(TEXTS))
+            expected = self.store.similarity_search("query", k=3)
+            results = asyncio.run(loaded.asimilarity_search("query", k=3))
+            self.assertEqual([doc.id for doc in results], [doc.id for doc in expected])
+            self.assertEqual(results[0].metadata, expected[0].metadata)
+
+    def test_add_and_delete_after_load(self):
+        """
+        Chunks can be added to and deleted from a memory-mapped store.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "store.npy")
+            self.store.dump(path)
+            loaded = NumpyVectorStore.load(path, self.embedding)
+
+            ids = loaded.add_texts(["brand new chunk"], ids=["new"])
+            self.assertEqual(ids, ["new"])
+            self.assertEqual(loaded.similarity_search("brand new chunk", k=1)[0].id, "new")
+
+            # Re-adding an existing id replaces the chunk
+            loaded.add_texts(["replacement chunk"], ids=["new"])
+            self.assertEqual(len(loaded), len(TEXTS) + 1)
+            self.assertEqual(loaded.get_by_ids(["new"])[0].page_content, "replacement chunk")
+
+            self.assertTrue(loaded.delete(["new"]))
+            self.assertEqual(len(loaded), len(TEXTS))
+            self.assertEqual(loaded.get_by_ids(["new"]), [])
+
+    def test_incremental_adds_match_bulk_build(self):
+        """
+        Adding chunks in many small batches should give the same store as building it at once.
+        """
+        store = NumpyVectorStore(embedding=self.embedding)
+        for start in range(0, len(TEXTS), 3):
+            store.add_texts(TEXTS[start : start + 3], ids=[str(i) for i in range(start, min(start + 3, len(TEXTS)))])
+
+        self.assertEqual(len(store), len(TEXTS))
+        expected = self.store.similarity_search("query", k=5)
+        results = store.similarity_search("query", k=5)
+        self.assertEqual([doc.page_content for doc in results], [doc.page_content for doc in expected])
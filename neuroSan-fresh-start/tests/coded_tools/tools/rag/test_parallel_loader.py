@@ -0,0 +1,137 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import gzip
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from typing import List
+from typing import Tuple
+from unittest import TestCase
+
+import pymupdf
+from langchain_core.documents import Document
+
+from coded_tools.tools.rag.parallel_loader import ParallelDocumentLoader
+from coded_tools.tools.rag.parallel_loader import download_to_temp_file
+from coded_tools.tools.rag.parallel_loader import parse_pdf
+
+
+class GzipHandler(BaseHTTPRequestHandler):
+    """Serves a text gzip-compressed on the fly, as web servers do for clients accepting it."""
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Serve the compressed text."""
+        body: bytes = gzip.compress(b"plain text")
+        self.send_response(200)
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Keep the test output quiet."""
+
+
+def slow_parse(path: str, source: str) -> List[Document]:
+    """Parse function that takes longer for files named "slow"."""
+    if "slow" in path:
+        time.sleep(1)
+    return [Document(page_content=path, metadata={"source": source})]
+
+
+async def collect(loader: ParallelDocumentLoader, sources: List[str]) -> List[Tuple[str, List[Document]]]:
+    """Drain the loader into a list."""
+    return [result async for result in loader.aload(sources)]
+
+
+class TestParallelDocumentLoader(TestCase):
+    """
+    Unit tests for the ParallelDocumentLoader class.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write_pdf(self, name: str, pages: List[str]) -> str:
+        path = os.path.join(self.temp_dir.name, name)
+        pdf = pymupdf.open()
+        for text in pages:
+            pdf.new_page().insert_text((72, 72), text)
+        pdf.save(path)
+        pdf.close()
+        return path
+
+    def test_broken_pdf_is_isolated(self):
+        """
+        Every valid PDF should be parsed, and a broken one skipped without failing the rest.
+        The shared process pool should parse PDFs the same way.
+        """
+        first = self._write_pdf("first.pdf", ["alpha page one", "alpha page two"])
+        second = self._write_pdf("second.pdf", ["beta page"])
+        broken = os.path.join(self.temp_dir.name, "broken.pdf")
+        with open(broken, "wb") as broken_file:
+            broken_file.write(b"not a pdf")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = asyncio.run(
+                collect(ParallelDocumentLoader(parse_pdf, executor=executor), [first, broken, second])
+            )
+
+        docs_by_source = dict(results)
+        self.assertEqual(set(docs_by_source), {first, second})
+        self.assertEqual(len(docs_by_source[first]), 2)
+        self.assertIn("alpha page two", docs_by_source[first][1].page_content)
+        self.assertEqual(docs_by_source[second][0].metadata["source"], second)
+
+        results = asyncio.run(collect(ParallelDocumentLoader(parse_pdf), [second]))
+        self.assertIn("beta page", results[0][1][0].page_content)
+
+    def test_slow_document_times_out_and_results_stream(self):
+        """
+        A document over its timeout should be skipped while faster ones are yielded as soon as they finish.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            loader = ParallelDocumentLoader(slow_parse, timeout_seconds=0.3, executor=executor)
+            results = asyncio.run(collect(loader, ["slow.pdf", "fast.pdf"]))
+
+        self.assertEqual([source for source, _ in results], ["fast.pdf"])
+
+    def test_download_decodes_content_encoding(self):
+        """
+        A body sent with a Content-Encoding should be saved decoded.
+        """
+        server = ThreadingHTTPServer(("127.0.0.1", 0), GzipHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            path = download_to_temp_file(f"http://127.0.0.1:{server.server_port}/doc.txt")
+        finally:
+            server.shutdown()
+            server.server_close()
+        try:
+            with open(path, "rb") as text_file:
+                self.assertEqual(text_file.read(), b"plain text")
+            self.assertTrue(path.endswith(".txt"))
+        finally:
+            os.remove(path)
@@ -0,0 +1,123 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+from unittest import TestCase
+
+from langchain_core.documents import Document
+
+from coded_tools.tools.rag.parallel_loader import ParallelDocumentLoader
+from coded_tools.tools.rag.parsed_document_cache import ParsedDocumentCache
+from coded_tools.tools.rag.parsed_document_cache import hash_file
+
+PARSED_PATHS: List[str] = []
+
+
+def counting_parse(path: str, source: str) -> List[Document]:
+    """Parse function returning the file's lines and recording each call."""
+    PARSED_PATHS.append(path)
+    with open(path, encoding="utf-8") as text_file:
+        return [
+            Document(page_content=line, metadata={"source": source, "line": number, "parser": "counting"})
+            for number, line in enumerate(text_file.read().splitlines())
+        ]
+
+
+class TestParsedDocumentCache(TestCase):
+    """
+    Unit tests for the ParsedDocumentCache class and its use by ParallelDocumentLoader.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.cache_dir = os.path.join(self.temp_dir.name, "parsed")
+        PARSED_PATHS.clear()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write(self, name: str, text: str) -> str:
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, "w", encoding="utf-8") as text_file:
+            text_file.write(text)
+        return path
+
+    def test_same_content_is_parsed_once(self):
+        """
+        A file with the same content under another path should be read from the cache with its own source.
+        Changed content or another parser should be parsed again.
+        """
+        first = self._write("first.txt", "alpha\nbeta")
+        copy = self._write("copy.txt", "alpha\nbeta")
+        cache = ParsedDocumentCache(self.cache_dir)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            loader = ParallelDocumentLoader(counting_parse, executor=executor, cache=cache)
+            for source in [first, copy]:
+                results = asyncio.run(self._collect(loader, [source]))
+                self.assertEqual([doc.page_content for doc in results], ["alpha", "beta"])
+                self.assertEqual(results[1].metadata, {"source": source, "line": 1, "parser": "counting"})
+            self.assertEqual(PARSED_PATHS, [first])
+
+            self._write("first.txt", "gamma")
+            self.assertEqual(asyncio.run(self._collect(loader, [first]))[0].page_content, "gamma")
+            self.assertEqual(len(PARSED_PATHS), 2)
+
+            uncached = ParallelDocumentLoader(counting_parse, executor=executor)
+            asyncio.run(self._collect(uncached, [copy]))
+            self.assertEqual(len(PARSED_PATHS), 3)
+
+        self.assertNotEqual(
+            cache.make_key("parse_pdf", hash_file(copy)), cache.make_key("parse_docling", hash_file(copy))
+        )
+
+    def test_budget_evicts_least_recently_used(self):
+        """
+        Entries over the disk budget should be deleted least recently used first, and unreadable ones ignored.
+        """
+        docs = [Document(page_content=os.urandom(512).hex(), metadata={"source": "doc"})]
+        probe = ParsedDocumentCache(os.path.join(self.temp_dir.name, "probe"))
+        probe.put("probe", "doc", docs)
+        entry_bytes = os.path.getsize(os.path.join(probe.cache_dir, "probe.json.gz"))
+
+        cache = ParsedDocumentCache(self.cache_dir, max_bytes=int(2.5 * entry_bytes))
+        for key in ["a", "b"]:
+            cache.put(key, "doc", docs)
+            time.sleep(0.01)
+        self.assertIsNotNone(cache.get("a", "doc"))
+        time.sleep(0.01)
+        cache.put("c", "doc", docs)
+        self.assertIsNone(cache.get("b", "doc"))
+        self.assertIsNotNone(cache.get("a", "doc"))
+        self.assertIsNotNone(cache.get("c", "doc"))
+
+        with open(os.path.join(self.cache_dir, "c.json.gz"), "wb") as entry_file:
+            entry_file.write(b"not gzip")
+        self.assertIsNone(cache.get("c", "doc"))
+        self.assertFalse(os.path.exists(os.path.join(self.cache_dir, "c.json.gz")))
+
+        disabled = ParsedDocumentCache(self.cache_dir, max_bytes=0)
+        self.assertIsNone(disabled.get("a", "doc"))
+        self.assertIsNone(ParallelDocumentLoader(counting_parse, cache=disabled).cache)
+
+    @staticmethod
+    async def _collect(loader: ParallelDocumentLoader, sources: List[str]) -> List[Document]:
+        return [doc async for _, docs in loader.aload(sources) for doc in docs]
@@ -0,0 +1,197 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import json
+import os
+import tempfile
+import uuid
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+from unittest import TestCase
+from unittest import mock
+
+from langchain_postgres import PGVectorStore
+from langchain_postgres.v2.indexes import HNSWIndex
+from langchain_postgres.v2.indexes import IVFFlatIndex
+from langchain_postgres.v2.indexes import IVFFlatQueryOptions
+
+from coded_tools.tools.base_rag import PostgresConfig
+from coded_tools.tools.rag.pg_bulk_loader import VectorIndexSettings
+from coded_tools.tools.rag.pg_engine_registry import PGEngineRegistry
+from tests.coded_tools.tools.rag.test_source_manifest import TextFileRag
+
+CONFIG = PostgresConfig(
+    user="user", password="password", host="localhost", port="5432", database="rag", table_name="docs"
+)
+
+
+class CodecConnection:
+    """Stand-in for a pooled asyncpg connection, encoding vectors with the codecs set on it as asyncpg does."""
+
+    def __init__(self):
+        self.codecs: Dict[str, Callable[[Any], bytes]] = {}
+        self.rows: List[Tuple[Any, ...]] = []
+
+    async def set_type_codec(self, type_name: str, schema: str = "public", **kwargs: Any):
+        """Set the codec of a type. Only the vector type is defined."""
+        if type_name != "vector":
+            raise ValueError(f"unknown type: {schema}.{type_name}")
+        self.codecs[type_name] = kwargs["encoder"]
+
+    async def reset_type_codec(self, type_name: str, schema: str = "public"):
+        """Go back to the default codec of a type, which is text for vectors."""
+        if type_name != "vector":
+            raise ValueError(f"unknown type: {schema}.{type_name}")
+        self.codecs.pop(type_name, None)
+
+    async def copy_records_to_table(self, _table_name: str, records: List[Tuple[Any, ...]], **_kwargs: Any):
+        """Store the records, encoding their vectors."""
+        self.rows.extend((*record[:2], self._encode(record[2]), *record[3:]) for record in records)
+
+    async def fetch_similar(self, query_vector: str) -> List[Tuple[Any, ...]]:
+        """Bind the query vector as langchain-postgres does, as text."""
+        self._encode(query_vector)
+        return self.rows
+
+    def _encode(self, vector: Any) -> Any:
+        encoder = self.codecs.get("vector")
+        return encoder(vector) if encoder else vector
+
+
+class TestPgBulkLoader(TestCase):
+    """
+    Unit tests for bulk loading of Postgres tables, against an in-process stand-in for the database.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.registry = PGEngineRegistry()
+        self.copied: List[Tuple[str, List[str], List[Tuple[Any, ...]]]] = []
+        self.calls: List[str] = []
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    async def _copy_records(self, _connection_string, table_name, columns, records, _schema_name="public"):
+        self.calls.append("copy")
+        self.copied.append((table_name, columns, records))
+
+    async def _analyze(self, _connection_string, _table_name, _schema_name="public") -> int:
+        self.calls.append("analyze")
+        return sum(len(records) for _, _, records in self.copied)
+
+    def test_index_settings(self):
+        """
+        Settings should be read from the environment, and IVFFlat lists derived from the row count.
+        """
+        self.assertIsNone(VectorIndexSettings().make_index(10_000))
+        self.assertIsNone(VectorIndexSettings().query_options())
+        with mock.patch.dict(os.environ, {"RAG_PG_VECTOR_INDEX": "HNSW", "RAG_PG_HNSW_M": "32"}):
+            settings = VectorIndexSettings.from_env()
+        self.assertEqual(settings.make_index(10), HNSWIndex(m=32, ef_construction=64))
+        self.assertEqual(settings.query_options().ef_search, 40)
+
+        ivfflat = VectorIndexSettings(index_type="ivfflat")
+        self.assertEqual([ivfflat.make_index(rows).lists for rows in [10, 50_000, 4_000_000]], [1, 50, 2000])
+        self.assertEqual(VectorIndexSettings(index_type="ivfflat", ivfflat_lists=7).make_index(50_000).lists, 7)
+        with mock.patch.dict(os.environ, {"RAG_PG_VECTOR_INDEX": "diskann"}):
+            self.assertEqual(VectorIndexSettings.from_env().index_type, "none")
+
+    def test_bulk_load(self):
+        """
+        A new table should be loaded with COPY, then analyzed, then indexed, and searched with the index options.
+        """
+        paths: List[str] = []
+        for name, text in [("a.txt", "Carry-on bags may not exceed 22 x 14 x 9 inches."), ("b.txt", "Pets fly.")]:
+            paths.append(os.path.join(self.temp_dir.name, name))
+            with open(paths[-1], "w", encoding="utf-8") as text_file:
+                text_file.write(text)
+
+        store = mock.MagicMock(spec=PGVectorStore)
+        store.aapply_vector_index = mock.AsyncMock(side_effect=lambda index: self.calls.append("index"))
+        engine = mock.MagicMock()
+        engine.ainit_vectorstore_table = mock.AsyncMock()
+        rag = TextFileRag()
+        with mock.patch.object(PGEngineRegistry, "_shared", self.registry), mock.patch.object(
+            self.registry, "table_exists", mock.AsyncMock(return_value=False)
+        ), mock.patch.object(self.registry, "get_engine", return_value=engine), mock.patch.object(
+            self.registry, "create_metadata_indexes", mock.AsyncMock()
+        ), mock.patch.object(
+            self.registry, "copy_records", self._copy_records
+        ), mock.patch.object(
+            self.registry, "analyze", self._analyze
+        ), mock.patch.object(
+            PGVectorStore, "create", mock.AsyncMock(return_value=store)
+        ) as create, mock.patch.dict(
+            os.environ, {"RAG_PG_VECTOR_INDEX": "ivfflat"}
+        ):
+            # pylint: disable=protected-access
+            vectorstore = asyncio.run(rag._create_postgres_vector_store({"urls": paths}, CONFIG))
+
+        self.assertIs(vectorstore, store)
+        self.assertEqual(self.calls, ["copy", "analyze", "index"])
+        store.aadd_documents.assert_not_called()
+        self.assertEqual(create.call_args.kwargs["index_query_options"], IVFFlatQueryOptions(probes=10))
+        self.assertEqual(store.aapply_vector_index.call_args.args[0], IVFFlatIndex(lists=1))
+
+        self.assertEqual(self.copied[0][:2], ("docs", ["langchain_id", "content", "embedding", "langchain_metadata"]))
+        records = self.copied[0][2]
+        self.assertEqual(len(records), len(rag.embeddings.embedded_texts))
+        uuid.UUID(records[0][0])
+        self.assertIn(records[0][1], rag.embeddings.embedded_texts)
+        self.assertEqual(len(records[0][2]), 8)
+        self.assertEqual(json.loads(records[0][3]), {"source": paths[0]})
+
+    def test_copy_uses_binary_vectors(self):
+        """
+        Records should be sent with asyncpg's binary COPY once the pgvector codec is registered.
+        """
+        driver_connection = mock.AsyncMock()
+        connection = mock.MagicMock()
+        connection.get_raw_connection = mock.AsyncMock(
+            return_value=mock.MagicMock(driver_connection=driver_connection)
+        )
+        records = [("id", "text", [0.5, 1.0], "{}")]
+
+        # pylint: disable=protected-access
+        asyncio.run(PGEngineRegistry._copy_records(connection, "docs", ["a", "b", "c", "d"], records, "rag"))
+
+        self.assertEqual(driver_connection.set_type_codec.call_args_list[0].args, ("vector",))
+        self.assertEqual(driver_connection.set_type_codec.call_args_list[0].kwargs["format"], "binary")
+        driver_connection.copy_records_to_table.assert_awaited_once_with(
+            "docs", records=records, columns=["a", "b", "c", "d"], schema_name="rag"
+        )
+
+    def test_pooled_connection_is_searchable_after_copy(self):
+        """
+        The binary vector codec should not stay on the pooled connection, whose later searches bind vectors as text.
+        """
+        driver_connection = CodecConnection()
+        connection = mock.MagicMock()
+        connection.get_raw_connection = mock.AsyncMock(
+            return_value=mock.MagicMock(driver_connection=driver_connection)
+        )
+        records = [("id", "text", [0.5, 1.0], "{}")]
+
+        # pylint: disable=protected-access
+        asyncio.run(PGEngineRegistry._copy_records(connection, "docs", ["a", "b", "c", "d"], records, "rag"))
+
+        self.assertIsInstance(driver_connection.rows[0][2], bytes)
+        self.assertEqual(len(asyncio.run(driver_connection.fetch_similar("[0.1, 0.2]"))), 1)
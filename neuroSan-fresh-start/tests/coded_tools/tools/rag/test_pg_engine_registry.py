@@ -0,0 +1,170 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import os
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import List
+from unittest import TestCase
+from unittest import mock
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.vectorstores import InMemoryVectorStore
+from sqlalchemy.exc import ProgrammingError
+
+from coded_tools.tools.base_rag import BaseRag
+from coded_tools.tools.base_rag import PostgresConfig
+from coded_tools.tools.rag.pg_engine_registry import PGEngineRegistry
+from coded_tools.tools.rag.pg_engine_registry import check_engine_internals
+
+CONFIG = PostgresConfig(
+    user="user", password="password", host="localhost", port="5432", database="rag", table_name="docs"
+)
+
+
+class NoDocumentsRag(BaseRag):
+    """RAG whose documents must never be loaded."""
+
+    def __init__(self):
+        with mock.patch.dict(os.environ, {"OPENAI_API_KEY": "test"}):
+            super().__init__()
+
+    async def load_documents(self, loader_args: Dict[str, Any]) -> List[Document]:
+        raise AssertionError("Documents should not be loaded for an existing table")
+
+
+async def run_without_connection(_engine: Any, work: Callable[[Any], Awaitable[Any]]) -> Any:
+    """Stand-in for run_on_connection(), for work that does not use its connection."""
+    return await work(None)
+
+
+class DroppedTableStore(InMemoryVectorStore):
+    """Vector store whose table was dropped by another process."""
+
+    async def asimilarity_search_by_vector(self, embedding: List[float], k: int = 4, **kwargs: Any) -> List[Document]:
+        raise ProgrammingError("SELECT", {}, Exception('relation "docs" does not exist'))
+
+
+class TestPGEngineRegistry(TestCase):
+    """
+    Unit tests for the PGEngineRegistry class. None of them needs a running Postgres.
+    """
+
+    def setUp(self):
+        self.registry = PGEngineRegistry(pool_size=3, max_overflow=2)
+        self.existence_checks: List[str] = []
+
+    def tearDown(self):
+        asyncio.run(self.registry.aclose())
+
+    async def _fake_query(self, _connection: Any, table_name: str, _schema_name: str) -> bool:
+        self.existence_checks.append(table_name)
+        return table_name == "docs"
+
+    def test_engines_are_shared_and_pooled(self):
+        """
+        One engine with the configured pool should be created per connection string.
+        """
+        engine = self.registry.get_engine(CONFIG.connection_string)
+
+        self.assertIs(self.registry.get_engine(CONFIG.connection_string), engine)
+        self.assertIsNot(self.registry.get_engine(CONFIG.connection_string + "_other"), engine)
+        # pylint: disable=protected-access
+        self.assertEqual(engine._pool.pool.size(), 3)
+
+    def test_only_existing_tables_are_cached(self):
+        """
+        An existing table should be checked once; a missing one on every call, as it may be created meanwhile.
+        """
+        with mock.patch.object(PGEngineRegistry, "_query_table_exists", self._fake_query), mock.patch(
+            "coded_tools.tools.rag.pg_engine_registry.run_on_connection", run_without_connection
+        ):
+            for _ in range(3):
+                self.assertTrue(asyncio.run(self.registry.table_exists(CONFIG.connection_string, "docs")))
+                self.assertFalse(asyncio.run(self.registry.table_exists(CONFIG.connection_string, "missing")))
+
+            self.assertEqual(self.existence_checks, ["docs", "missing", "missing", "missing"])
+
+            self.registry.invalidate(CONFIG.connection_string, "docs")
+            asyncio.run(self.registry.table_exists(CONFIG.connection_string, "docs"))
+            self.assertEqual(self.existence_checks[-1], "docs")
+
+    def test_existing_table_is_queried_without_setup(self):
+        """
+        A store already opened on the table should be reused without loading documents or touching the database.
+        """
+        rag = NoDocumentsRag()
+        store = InMemoryVectorStore(embedding=DeterministicFakeEmbedding(size=8))
+        self.registry.put_vector_store(
+            CONFIG.connection_string, "docs", rag.get_index_params()["embedding_model"], store
+        )
+
+        with mock.patch.object(PGEngineRegistry, "get_shared", return_value=self.registry):
+            # pylint: disable=protected-access
+            vectorstore = asyncio.run(rag._create_postgres_vector_store({"urls": ["a.pdf"]}, CONFIG))
+
+        self.assertIs(vectorstore, store)
+        self.assertEqual(self.registry._engines, {})  # pylint: disable=protected-access
+
+    def test_existing_tables_are_checked_again_after_their_ttl(self):
+        """
+        A table known to exist should be checked again once its TTL has passed, and the stores opened on it
+        forgotten if it is gone.
+        """
+        registry = PGEngineRegistry(table_ttl_seconds=0)
+        store = InMemoryVectorStore(embedding=DeterministicFakeEmbedding(size=8))
+        registry.put_vector_store(CONFIG.connection_string, "dropped", "model", store)
+
+        with mock.patch.object(PGEngineRegistry, "_query_table_exists", self._fake_query), mock.patch(
+            "coded_tools.tools.rag.pg_engine_registry.run_on_connection", run_without_connection
+        ):
+            self.assertFalse(asyncio.run(registry.table_exists(CONFIG.connection_string, "dropped")))
+            self.assertTrue(asyncio.run(registry.table_exists(CONFIG.connection_string, "docs")))
+            self.assertTrue(asyncio.run(registry.table_exists(CONFIG.connection_string, "docs")))
+
+        self.assertEqual(self.existence_checks, ["dropped", "docs", "docs"])
+        self.assertIsNone(registry.get_vector_store(CONFIG.connection_string, "dropped", "model"))
+        asyncio.run(registry.aclose())
+
+    def test_failed_query_forgets_the_table(self):
+        """
+        A query failing on a table dropped behind the registry's back should make the next call check it again.
+        """
+        rag = NoDocumentsRag()
+        rag.embeddings = DeterministicFakeEmbedding(size=8)
+        store = DroppedTableStore(embedding=rag.embeddings)
+        embedding_key = rag.get_index_params()["embedding_model"]
+        self.registry.put_vector_store(CONFIG.connection_string, "docs", embedding_key, store)
+
+        with mock.patch.object(PGEngineRegistry, "get_shared", return_value=self.registry):
+            result = asyncio.run(rag.query_vectorstore(store, "baggage"))
+
+        self.assertIn("Failed to query", result)
+        self.assertIsNone(self.registry.get_vector_store(CONFIG.connection_string, "docs", embedding_key))
+        # pylint: disable=protected-access
+        self.assertEqual(self.registry._existing_tables, {})
+
+    def test_engine_internals_are_checked(self):
+        """
+        An engine without the private members the registry relies on should be reported clearly.
+        """
+        check_engine_internals(self.registry.get_engine(CONFIG.connection_string))
+        with self.assertRaises(RuntimeError):
+            check_engine_internals(object())
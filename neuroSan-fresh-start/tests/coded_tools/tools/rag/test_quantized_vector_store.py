@@ -0,0 +1,109 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from benchmarks.ann_benchmark import make_embeddings
+from coded_tools.tools.rag.numpy_vector_store import sidecar_path
+from coded_tools.tools.rag.quantized_vector_store import QUANT_SUFFIX
+from coded_tools.tools.rag.quantized_vector_store import QuantizedVectorStore
+
+ROWS = 2000
+DIMENSIONS = 64
+
+
+class TestQuantizedVectorStore(TestCase):
+    """
+    Unit tests for the QuantizedVectorStore class.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.embedding = DeterministicFakeEmbedding(size=DIMENSIONS)
+        self.matrix = make_embeddings(ROWS, DIMENSIONS, topics=40, seed=0)
+        self.queries = make_embeddings(20, DIMENSIONS, topics=40, seed=1)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _build(self, dtype: str) -> QuantizedVectorStore:
+        store = QuantizedVectorStore(embedding=self.embedding, dtype=dtype)
+        store.add_embeddings(
+            [f"chunk {row}" for row in range(ROWS)], self.matrix, ids=[str(row) for row in range(ROWS)]
+        )
+        return store
+
+    def _recall(self, store: QuantizedVectorStore, rescore_factor: int) -> float:
+        hits = 0
+        for query in self.queries:
+            exact = {row for row, _ in store.exact_search_rows(query, 10)}
+            hits += len(exact & {row for row, _ in store.search_rows(query, 10, rescore_factor)})
+        return hits / (10 * len(self.queries))
+
+    def test_rescoring_restores_recall(self):
+        """
+        Both dtypes should find most exact neighbours from the codes alone, and rescoring should return exact scores.
+        """
+        for dtype in ["int8", "float16"]:
+            store = self._build(dtype)
+            self.assertGreater(self._recall(store, 0), 0.8)
+            self.assertEqual(self._recall(store, 8), 1.0)
+
+            query = self.queries[0]
+            np.testing.assert_allclose(
+                [score for _, score in store.search_rows(query, 3)],
+                [score for _, score in store.exact_search_rows(query, 3)],
+                rtol=1e-5,
+            )
+
+    def test_updates_are_searchable(self):
+        """
+        Rows added later should be quantized, and deleted rows should no longer be returned.
+        """
+        store = self._build("int8")
+        new_vector = self.matrix[0] * -1.0
+        store.add_embeddings(["new"], [new_vector], ids=["new"])
+        self.assertEqual(store.similarity_search_by_vector(new_vector, k=1)[0].id, "new")
+
+        store.delete(["new", "5"])
+        self.assertNotIn("5", [doc.id for doc in store.similarity_search_by_vector(self.matrix[5], k=3)])
+        self.assertEqual(store.search_rows(self.matrix[6], 1)[0][0], 5)
+
+    def test_saved_store_keeps_only_codes_in_memory(self):
+        """
+        After saving, the matrix should be mapped from disk and a loaded store should reuse the saved codes.
+        """
+        store = self._build("int8")
+        in_memory_bytes = store.nbytes
+        path = os.path.join(self.temp_dir.name, "store.npy")
+        store.dump(path)
+        self.assertTrue(os.path.exists(sidecar_path(path, QUANT_SUFFIX)))
+        self.assertLess(store.nbytes, in_memory_bytes - self.matrix.nbytes // 2)
+
+        loaded = QuantizedVectorStore.load(path, self.embedding, dtype="int8")
+        for query in self.queries:
+            self.assertEqual(loaded.search_rows(query, 5), store.search_rows(query, 5))
+
+        requantized = QuantizedVectorStore.load(path, self.embedding, dtype="float16")
+        self.assertEqual(requantized.search_rows(self.queries[0], 5), store.search_rows(self.queries[0], 5))
+
+        with self.assertRaises(ValueError):
+            QuantizedVectorStore(embedding=self.embedding, dtype="int4")
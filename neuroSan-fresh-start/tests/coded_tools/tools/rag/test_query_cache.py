@@ -0,0 +1,165 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import os
+import tempfile
+from typing import List
+from unittest import TestCase
+from unittest import mock
+
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.retrievers import BaseRetriever
+
+from coded_tools.tools.base_rag import BaseRag
+from coded_tools.tools.rag.query_cache import QueryCache
+from coded_tools.tools.rag.query_cache import normalize_query
+from tests.coded_tools.tools.rag.test_source_manifest import TextFileRag
+
+
+class KeywordEmbeddings(Embeddings):
+    """Embeds a text by whether it mentions luggage, so paraphrases get the same vector."""
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return [1.0, 0.0] if "carry" in text.lower() else [0.0, 1.0]
+
+
+class CountingRetriever(BaseRetriever):
+    """Retriever returning fixed documents and counting its calls."""
+
+    results: List[Document]
+    calls: int = 0
+
+    def _get_relevant_documents(self, query: str, *, run_manager: CallbackManagerForRetrieverRun) -> List[Document]:
+        self.calls += 1
+        return self.results
+
+
+class TestQueryCache(TestCase):
+    """
+    Unit tests for the QueryCache class and its use by BaseRag.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.cache = QueryCache(max_entries=3, ttl_seconds=60.0, similarity_threshold=0.9)
+        self.shared_patch = mock.patch.object(QueryCache, "_shared", self.cache)
+        self.shared_patch.start()
+
+    def tearDown(self):
+        self.shared_patch.stop()
+        self.temp_dir.cleanup()
+
+    def test_exact_match_ttl_and_lru(self):
+        """
+        Queries differing in case and punctuation should share an entry, which expires and is evicted LRU first.
+        """
+        self.assertEqual(normalize_query("  What is the Carry-on size limit?"), "what is the carry on size limit")
+
+        self.cache.put("store", "carry-on size limit", "22 x 14 x 9 in")
+        self.assertEqual(self.cache.get("store", "Carry on size limit?"), "22 x 14 x 9 in")
+        self.assertIsNone(self.cache.get("other store", "carry-on size limit"))
+
+        for query in ["a", "b", "c"]:
+            self.cache.put("store", query, query)
+        self.assertIsNone(self.cache.get("store", "carry-on size limit"))
+
+        expiring = QueryCache(ttl_seconds=0.0)
+        expiring.put("store", "a", "a")
+        self.assertIsNone(expiring.get("store", "a"))
+        self.assertEqual(expiring.stats()["entries"], 0)
+
+    def test_similar_match_and_invalidate(self):
+        """
+        A query embedding close to a cached one should match within its scope until the scope is invalidated.
+        """
+        self.cache.put("store", "carry-on size limit", "22 x 14 x 9 in", query_vector=[1.0, 0.0])
+        self.cache.put("store", "pet policy", "pets fly in cabin", query_vector=[0.0, 1.0])
+
+        self.assertEqual(self.cache.get_similar("store", [0.95, 0.1]), "22 x 14 x 9 in")
+        self.assertIsNone(self.cache.get_similar("store", [0.7, 0.7]))
+        self.assertIsNone(self.cache.get_similar("other store", [1.0, 0.0]))
+
+        self.cache.invalidate("store")
+        self.assertIsNone(self.cache.get_similar("store", [1.0, 0.0]))
+        self.assertEqual(self.cache.stats()["entries"], 0)
+
+    def test_query_retriever_serves_paraphrases_from_cache(self):
+        """
+        A paraphrase should be answered without the retriever, and empty results should not be cached.
+        """
+        retriever = CountingRetriever(results=[Document(page_content="22 x 14 x 9 in")])
+        embeddings = KeywordEmbeddings()
+        for query in ["carry-on size limit", "What is the carry on size limit?"]:
+            result = asyncio.run(BaseRag.query_retriever(retriever, query, "store", embeddings))
+            self.assertEqual(result, "22 x 14 x 9 in")
+        self.assertEqual(retriever.calls, 1)
+        self.assertEqual(self.cache.stats()["similar_hits"], 1)
+
+        empty = CountingRetriever(results=[])
+        for _ in range(2):
+            asyncio.run(BaseRag.query_retriever(empty, "pet policy", "store"))
+        self.assertEqual(empty.calls, 2)
+
+        asyncio.run(BaseRag.query_retriever(retriever, "carry-on size limit"))
+        self.assertEqual(retriever.calls, 2)
+
+    def test_rebuilt_store_invalidates_results(self):
+        """
+        Results cached for a vector store should be dropped when a store is built again from the same sources.
+        """
+        path = os.path.join(self.temp_dir.name, "doc.txt")
+        with open(path, "w", encoding="utf-8") as text_file:
+            text_file.write("Carry-on bags may not exceed 22 x 14 x 9 inches.")
+
+        rag = TextFileRag()
+        rag.use_vector_store_cache = False
+        store = asyncio.run(rag.generate_vector_store(loader_args={"urls": [path]}))
+        first = asyncio.run(rag.query_vectorstore(store, "carry-on size limit"))
+        self.assertEqual(asyncio.run(rag.query_vectorstore(store, "Carry on size limit")), first)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+        asyncio.run(rag.generate_vector_store(loader_args={"urls": [path]}))
+        self.assertEqual(self.cache.stats()["entries"], 0)
+
+    def test_hybrid_and_dense_results_are_cached_apart(self):
+        """
+        Tools querying the same store with and without hybrid search, as they do a postgres table,
+        should not be served each other's results.
+        """
+        path = os.path.join(self.temp_dir.name, "doc.txt")
+        with open(path, "w", encoding="utf-8") as text_file:
+            text_file.write("Carry-on bags may not exceed 22 x 14 x 9 inches.")
+
+        rag = TextFileRag()
+        rag.use_vector_store_cache = False
+        rag.hybrid_search = True
+        store = asyncio.run(rag.generate_vector_store(loader_args={"urls": [path]}))
+        asyncio.run(rag.query_vectorstore(store, "carry-on size limit"))
+
+        rag.hybrid_search = False
+        asyncio.run(rag.query_vectorstore(store, "carry-on size limit"))
+        self.assertEqual(self.cache.stats()["hits"], 0)
+        self.assertEqual(self.cache.stats()["entries"], 2)
+
+        rag.hybrid_search = True
+        asyncio.run(rag.generate_vector_store(loader_args={"urls": [path]}))
+        self.assertEqual(self.cache.stats()["entries"], 0)
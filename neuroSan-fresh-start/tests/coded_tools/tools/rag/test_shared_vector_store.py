@@ -0,0 +1,110 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import os
+import tempfile
+import threading
+from typing import List
+from unittest import TestCase
+from unittest import mock
+
+import numpy as np
+
+from coded_tools.tools.rag.numpy_vector_store import NumpyVectorStore
+from coded_tools.tools.rag.query_cache import QueryCache
+from coded_tools.tools.rag.shared_vector_store import SharedVectorStoreDirectory
+from tests.coded_tools.tools.rag.test_source_manifest import TextFileRag
+
+TEXTS = {
+    "baggage.txt": "Carry-on bags may not exceed 22 x 14 x 9 inches.",
+    "pets.txt": "Small pets may travel in the cabin in an approved carrier.",
+}
+
+
+class TestSharedVectorStore(TestCase):
+    """
+    Unit tests for vector stores shared by the server processes of a host.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.shared_stores = SharedVectorStoreDirectory(os.path.join(self.temp_dir.name, "shared"))
+        self.shared_patch = mock.patch.object(SharedVectorStoreDirectory, "_shared", self.shared_stores)
+        self.shared_patch.start()
+        self.query_cache_patch = mock.patch.object(QueryCache, "_shared", QueryCache())
+        self.query_cache_patch.start()
+        self.paths: List[str] = []
+        for name, text in TEXTS.items():
+            self.paths.append(os.path.join(self.temp_dir.name, name))
+            with open(self.paths[-1], "w", encoding="utf-8") as text_file:
+                text_file.write(text)
+
+    def tearDown(self):
+        self.query_cache_patch.stop()
+        self.shared_patch.stop()
+        self.temp_dir.cleanup()
+
+    @staticmethod
+    def _new_rag() -> TextFileRag:
+        # Each instance stands for a server process, so none of them reuses the stores cached by another
+        rag = TextFileRag()
+        rag.use_vector_store_cache = False
+        rag.use_shared_store = True
+        rag.hybrid_search = True
+        return rag
+
+    def test_attach_without_loading(self):
+        """
+        A store published by one process should be mapped read-only by the next ones without loading the sources,
+        together with its keyword and metadata indexes.
+        """
+        publisher = self._new_rag()
+        published = asyncio.run(publisher.generate_vector_store(loader_args={"urls": self.paths}))
+        self.assertEqual(publisher.loaded_sources, self.paths)
+        self.assertIsInstance(published, NumpyVectorStore)
+
+        worker = self._new_rag()
+        store = asyncio.run(worker.generate_vector_store(loader_args={"urls": self.paths}))
+        self.assertEqual(worker.loaded_sources, [])
+        self.assertEqual(worker.embeddings.embedded_texts, [])
+        # pylint: disable=protected-access
+        self.assertIsInstance(store._matrix, np.memmap)
+        self.assertEqual(store._matrix.mode, "r")
+
+        result = asyncio.run(worker.query_vectorstore(store, "Can I bring my cat?", {"source": self.paths[1]}))
+        self.assertEqual(result, TEXTS["pets.txt"])
+        self.assertIn(store, worker._keyword_indexes)
+
+    def test_concurrent_publishers_load_once(self):
+        """
+        Processes starting together should wait for the one publishing the store rather than build it too.
+        """
+        rags: List[TextFileRag] = [self._new_rag() for _ in range(3)]
+        stores: List[NumpyVectorStore] = []
+
+        def start(rag: TextFileRag):
+            stores.append(asyncio.run(rag.generate_vector_store(loader_args={"urls": self.paths})))
+
+        threads = [threading.Thread(target=start, args=(rag,)) for rag in rags]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+
+        self.assertEqual(len(stores), 3)
+        self.assertEqual(sum(len(rag.loaded_sources) for rag in rags), len(self.paths))
+        self.assertTrue(all(len(store) == len(stores[0]) > 0 for store in stores))
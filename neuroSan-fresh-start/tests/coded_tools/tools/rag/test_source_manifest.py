@@ -0,0 +1,150 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import os
+import tempfile
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from unittest import TestCase
+from unittest import mock
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from coded_tools.tools.base_rag import BaseRag
+from coded_tools.tools.rag.chunking import ChunkingSettings
+from coded_tools.tools.rag.source_manifest import SourceManifest
+
+
+class CountingEmbeddings(DeterministicFakeEmbedding):
+    """Fake embeddings that record every text sent to the model."""
+
+    embedded_texts: List[str] = []
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.embedded_texts.extend(texts)
+        return super().embed_documents(texts)
+
+
+class TextFileRag(BaseRag):
+    """RAG over local text files that records which files were loaded."""
+
+    def __init__(self):
+        with mock.patch.dict(os.environ, {"OPENAI_API_KEY": "test"}):
+            super().__init__()
+        self.embeddings = CountingEmbeddings(size=8, embedded_texts=[])
+        self.loaded_sources: List[str] = []
+
+    def _get_text_splitter(self, settings: ChunkingSettings) -> RecursiveCharacterTextSplitter:
+        # Character-based splitting, so the tests do not download a tiktoken encoding
+        return RecursiveCharacterTextSplitter(
+            chunk_size=settings.chunk_size, chunk_overlap=settings.chunk_overlap, separators=settings.separators
+        )
+
+    def _get_token_counter(self) -> Callable[[str], int]:
+        return len
+
+    async def load_documents(self, loader_args: Dict[str, Any]) -> List[Document]:
+        docs: List[Document] = []
+        for path in loader_args["urls"]:
+            self.loaded_sources.append(path)
+            with open(path, "r", encoding="utf-8") as text_file:
+                docs.append(Document(page_content=text_file.read(), metadata={"source": path}))
+        return docs
+
+
+class TestSourceManifest(TestCase):
+    """
+    Unit tests for incremental re-indexing with a SourceManifest.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.store_path = os.path.join(self.temp_dir.name, "store.npy")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write(self, name: str, text: str, mtime: int) -> str:
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, "w", encoding="utf-8") as text_file:
+            text_file.write(text)
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def _build(self, urls: List[str]) -> TextFileRag:
+        rag = TextFileRag()
+        rag.use_vector_store_cache = False
+        rag.incremental_update = True
+        rag.save_vector_store = True
+        rag.configure_vector_store_path(self.store_path)
+        asyncio.run(rag.generate_vector_store(loader_args={"urls": urls}))
+        return rag
+
+    def test_only_changed_sources_are_reindexed(self):
+        """
+        Unchanged sources should be neither loaded nor embedded again, and stale chunks should be removed.
+        """
+        first = self._write("first.txt", "the first document", 1000)
+        second = self._write("second.txt", "the second document", 1000)
+        self._build([first, second])
+
+        second = self._write(
+            "second.txt",
+            "the second document, revised with enough text to need more than one chunk of splitting",
+            2000,
+        )
+        third = self._write("third.txt", "a third document", 1000)
+        rag = self._build([first, second, third])
+
+        self.assertEqual(rag.loaded_sources, [second, third])
+        self.assertNotIn("the first document", rag.embeddings.embedded_texts)
+
+        manifest = SourceManifest.load(SourceManifest.path_for(self.store_path))
+        expected_ids = {chunk_id for entry in manifest.sources.values() for chunk_id in entry.chunk_ids}
+        loaded = TextFileRag()
+        loaded.configure_vector_store_path(self.store_path)
+        store = asyncio.run(loaded._load_existing_vector_store())  # pylint: disable=protected-access
+        self.assertEqual({doc.id for doc in store.get_by_ids(sorted(expected_ids))}, expected_ids)
+        self.assertEqual(len(store), len(expected_ids))
+
+        # Dropping a source removes its chunks
+        rag = self._build([first, third])
+        self.assertEqual(rag.loaded_sources, [])
+        self.assertNotIn(second, SourceManifest.load(SourceManifest.path_for(self.store_path)).sources)
+
+    def test_changed_index_params_rebuild(self):
+        """
+        A manifest written with other chunking parameters should force a full rebuild.
+        """
+        first = self._write("first.txt", "the first document", 1000)
+        self._build([first])
+
+        rag = TextFileRag()
+        rag.use_vector_store_cache = False
+        rag.incremental_update = True
+        rag.save_vector_store = True
+        rag.chunk_size = 200
+        rag.configure_vector_store_path(self.store_path)
+        asyncio.run(rag.generate_vector_store(loader_args={"urls": [first]}))
+
+        self.assertEqual(rag.loaded_sources, [first])
+        manifest = SourceManifest.load(SourceManifest.path_for(self.store_path))
+        self.assertEqual(manifest.index_params["chunk_size"], 200)
@@ -0,0 +1,168 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import os
+import tempfile
+from unittest import TestCase
+from unittest import mock
+
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.vectorstores import InMemoryVectorStore
+
+from coded_tools.tools.rag.vector_store_cache import VectorStoreCache
+from coded_tools.tools.rag.vector_store_cache import estimate_vector_store_bytes
+from coded_tools.tools.rag.vector_store_cache import fingerprint_sources
+from tests.coded_tools.tools.rag.test_source_manifest import TextFileRag
+
+
+class TestVectorStoreCache(TestCase):
+    """
+    Unit tests for the VectorStoreCache class.
+    """
+
+    @staticmethod
+    def _make_store(num_texts: int) -> InMemoryVectorStore:
+        """Build a small in-memory vector store with fake embeddings."""
+        return InMemoryVectorStore.from_texts(
+            [f"text {i}" for i in range(num_texts)], embedding=DeterministicFakeEmbedding(size=8)
+        )
+
+    def test_fingerprint_ignores_url_order(self):
+        """
+        URLs given in a different order should map to the same vector store,
+        while different chunking parameters should not.
+        """
+        chunk_params = {"chunk_size": 100, "chunk_overlap": 50}
+        key_1 = fingerprint_sources("PdfRag", {"urls": ["b.pdf", "a.pdf"]}, chunk_params, "model:8")
+        key_2 = fingerprint_sources("PdfRag", {"urls": ["a.pdf", "b.pdf"]}, chunk_params, "model:8")
+        key_3 = fingerprint_sources("PdfRag", {"urls": ["a.pdf", "b.pdf"]}, {"chunk_size": 200}, "model:8")
+        self.assertEqual(key_1, key_2)
+        self.assertNotEqual(key_1, key_3)
+
+    def test_concurrent_builds_are_coalesced(self):
+        """
+        Concurrent requests for the same key should run the builder once and count hits afterwards.
+        """
+        cache = VectorStoreCache()
+        build_count = 0
+
+        async def builder():
+            nonlocal build_count
+            build_count += 1
+            await asyncio.sleep(0.01)
+            return self._make_store(2)
+
+        async def run():
+            stores = await asyncio.gather(*(cache.get_or_build("key", builder) for _ in range(5)))
+            stores.append(await cache.get_or_build("key", builder))
+            return stores
+
+        stores = asyncio.run(run())
+        self.assertEqual(build_count, 1)
+        self.assertTrue(all(store is stores[0] for store in stores))
+        stats = cache.stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["coalesced"], 4)
+        self.assertEqual(stats["hits"], 1)
+
+    def test_lru_eviction_by_memory_budget(self):
+        """
+        Inserting past the memory budget should evict the least recently used store.
+        """
+        store_size = estimate_vector_store_bytes(self._make_store(4))
+        cache = VectorStoreCache(max_bytes=store_size * 2)
+        cache.put("a", self._make_store(4))
+        cache.put("b", self._make_store(4))
+        # Touch "a" so that "b" becomes the least recently used entry
+        self.assertIsNotNone(cache.get("a"))
+        cache.put("c", self._make_store(4))
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_failed_build_is_not_cached(self):
+        """
+        A builder failure should propagate and leave the key buildable again.
+        """
+        cache = VectorStoreCache()
+
+        async def failing_builder():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            asyncio.run(cache.get_or_build("key", failing_builder))
+
+        async def builder():
+            return self._make_store(1)
+
+        self.assertIsNotNone(asyncio.run(cache.get_or_build("key", builder)))
+
+    def test_cancelled_owner_hands_the_build_to_a_waiter(self):
+        """
+        Cancelling the request building a store should not fail the requests waiting for it:
+        one of them should build the store instead. Cancelling a waiter should not affect the others.
+        """
+        cache = VectorStoreCache()
+        build_count = 0
+
+        async def builder():
+            nonlocal build_count
+            build_count += 1
+            await asyncio.sleep(0.05)
+            return self._make_store(2)
+
+        async def run():
+            owner = asyncio.create_task(cache.get_or_build("key", builder))
+            await asyncio.sleep(0.01)
+            waiters = [asyncio.create_task(cache.get_or_build("key", builder)) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            owner.cancel()
+            waiters[0].cancel()
+            return await asyncio.gather(owner, *waiters, return_exceptions=True)
+
+        owner_result, cancelled_waiter, *stores = asyncio.run(run())
+        self.assertIsInstance(owner_result, asyncio.CancelledError)
+        self.assertIsInstance(cancelled_waiter, asyncio.CancelledError)
+        self.assertEqual(build_count, 2)
+        self.assertIsInstance(stores[0], InMemoryVectorStore)
+        self.assertIs(stores[0], stores[1])
+        self.assertIs(cache.get("key"), stores[0])
+
+    def test_tools_with_their_own_store_files_are_not_shared(self):
+        """
+        A tool with the same sources as a cached one, but its own vector store path, should build and save its own
+        store rather than be handed the cached one.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir, mock.patch.object(
+            VectorStoreCache, "_shared", VectorStoreCache()
+        ):
+            source = os.path.join(temp_dir, "source.txt")
+            with open(source, "w", encoding="utf-8") as text_file:
+                text_file.write("the only document")
+
+            stores = []
+            for name in ("first.json", "second.json", "second.json"):
+                rag = TextFileRag()
+                rag.save_vector_store = True
+                rag.configure_vector_store_path(os.path.join(temp_dir, name))
+                stores.append(asyncio.run(rag.generate_vector_store(loader_args={"urls": [source]})))
+
+            self.assertTrue(os.path.exists(os.path.join(temp_dir, "second.json")))
+            self.assertIsNot(stores[0], stores[1])
+            self.assertIs(stores[1], stores[2])
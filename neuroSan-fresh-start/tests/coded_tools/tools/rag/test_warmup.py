@@ -0,0 +1,180 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import json
+import os
+import tempfile
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from unittest import TestCase
+from unittest import mock
+
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.vectorstores import VectorStore
+
+from coded_tools.tools.rag.vector_store_cache import VectorStoreCache
+from coded_tools.tools.rag.warmup import RagWarmup
+from coded_tools.tools.rag.warmup import WarmupTarget
+from tests.coded_tools.tools.rag.test_source_manifest import TextFileRag
+
+NETWORK = """
+{
+    "tools": [
+        {
+            "name": "front_man",
+            "function": {"description": "Answer with the retriever."},
+            "instructions": "Use the retriever.",
+            "tools": ["pdf_retriever", "unconfigured_retriever", "pg_retriever"]
+        },
+        {"name": "pdf_retriever", "toolbox": "pdf_rag", "args": {"urls": ["a.pdf"], "vector_store_type": "ann"}},
+        {"name": "unconfigured_retriever", "toolbox": "pdf_rag"},
+        {"name": "pg_retriever", "class": "rag.Rag", "args": {"urls": ["b.pdf"], "vector_store_type": "postgres"}}
+    ]
+}
+"""
+
+
+class LoopBoundEmbeddings(DeterministicFakeEmbedding):
+    """Fake embeddings whose client, like that of OpenAIEmbeddings, only works on the loop it was first used on."""
+
+    loop: Optional[Any] = None
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        self._check_loop()
+        return self.embed_documents(texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        self._check_loop()
+        return self.embed_query(text)
+
+    def _check_loop(self):
+        self.loop = self.loop or asyncio.get_running_loop()
+        if self.loop is not asyncio.get_running_loop():
+            raise RuntimeError("Event loop is closed")
+
+
+class WarmTextFileRag(TextFileRag):
+    """TextFileRag that can be preloaded from its arguments."""
+
+    def __init__(self):
+        super().__init__()
+        self.embeddings = LoopBoundEmbeddings(size=8)
+
+    async def build_vector_store(self, args: Dict[str, Any]) -> Optional[VectorStore]:
+        if args.get("fail"):
+            raise ValueError("broken source")
+        return await self.generate_vector_store(loader_args={"urls": args["urls"]})
+
+
+class TestRagWarmup(TestCase):
+    """
+    Unit tests for the RagWarmup class.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.cache = VectorStoreCache()
+        self.shared_patch = mock.patch.object(VectorStoreCache, "_shared", self.cache)
+        self.shared_patch.start()
+
+    def tearDown(self):
+        self.shared_patch.stop()
+        self.temp_dir.cleanup()
+
+    def test_find_targets(self):
+        """
+        Only served RAG tools configured with sources and not stored in Postgres should be warmed up.
+        """
+        with open(os.path.join(self.temp_dir.name, "network.hocon"), "w", encoding="utf-8") as network_file:
+            network_file.write(NETWORK)
+        manifest_path = os.path.join(self.temp_dir.name, "manifest.hocon")
+        with open(manifest_path, "w", encoding="utf-8") as manifest_file:
+            manifest_file.write('{"network.hocon": true}')
+
+        with mock.patch.dict(os.environ, {"AGENT_TOOLBOX_INFO_FILE": os.path.join("toolbox", "toolbox_info.hocon")}):
+            targets = RagWarmup().find_targets(manifest_path)
+        self.assertEqual(
+            targets,
+            [
+                WarmupTarget(
+                    "network", "pdf_retriever", "tools.pdf_rag.PdfRag", {"urls": ["a.pdf"], "vector_store_type": "ann"}
+                )
+            ],
+        )
+
+    def test_stores_are_preloaded_into_the_cache(self):
+        """
+        A preloaded store should be served from the cache, and failing or unknown tools reported in the status.
+        """
+        path = os.path.join(self.temp_dir.name, "doc.txt")
+        with open(path, "w", encoding="utf-8") as text_file:
+            text_file.write("Carry-on bags may not exceed 22 x 14 x 9 inches.")
+        targets = [
+            WarmupTarget("network", "retriever", "warm.WarmTextFileRag", {"urls": [path]}),
+            WarmupTarget("network", "broken", "warm.WarmTextFileRag", {"urls": [path], "fail": True}),
+            WarmupTarget("network", "unknown", "missing.Missing", {"urls": [path]}),
+        ]
+        status_file = os.path.join(self.temp_dir.name, "warmup.json")
+        warmup = RagWarmup(max_concurrency=2, status_file=status_file)
+
+        def import_class(target: WarmupTarget) -> Optional[type]:
+            return WarmTextFileRag if target.class_name.startswith("warm.") else None
+
+        with mock.patch.object(RagWarmup, "find_targets", return_value=targets), mock.patch.object(
+            RagWarmup, "_import_class", side_effect=import_class
+        ):
+            warmup.start()
+            self.assertTrue(warmup.wait(timeout=30))
+        self.assertTrue(warmup.ready)
+
+        with open(status_file, encoding="utf-8") as status:
+            self.assertEqual(
+                json.load(status)["stores"],
+                {"network/retriever": "loaded", "network/broken": "failed", "network/unknown": "skipped"},
+            )
+        self.assertEqual(warmup.status()["state"], "done")
+
+        rag = WarmTextFileRag()
+        asyncio.run(rag.build_vector_store({"urls": [path]}))
+        self.assertEqual(rag.loaded_sources, [])
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_preloaded_store_is_queried_from_another_loop(self):
+        """
+        A store preloaded on the loop of the warm-up should be queried with the embeddings of the querying tool.
+        """
+        path = os.path.join(self.temp_dir.name, "doc.txt")
+        with open(path, "w", encoding="utf-8") as text_file:
+            text_file.write("Carry-on bags may not exceed 22 x 14 x 9 inches.")
+        warmup = RagWarmup()
+        targets = [WarmupTarget("network", "retriever", "warm.WarmTextFileRag", {"urls": [path]})]
+        with mock.patch.object(RagWarmup, "find_targets", return_value=targets), mock.patch.object(
+            RagWarmup, "_import_class", return_value=WarmTextFileRag
+        ):
+            warmup.start()
+            self.assertTrue(warmup.wait(timeout=30))
+        self.assertEqual(warmup.status()["stores"], {"network/retriever": "loaded"})
+
+        async def query() -> str:
+            rag = WarmTextFileRag()
+            vectorstore = await rag.build_vector_store({"urls": [path]})
+            return await rag.query_vectorstore(vectorstore, "carry-on size")
+
+        self.assertIn("Carry-on bags", asyncio.run(query()))
+        self.assertEqual(self.cache.stats()["hits"], 1)
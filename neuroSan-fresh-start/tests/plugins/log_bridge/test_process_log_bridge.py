@@ -0,0 +1,356 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import codecs
+import io
+import json
+import logging
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from unittest import TestCase
+from unittest import skipIf
+from unittest.mock import patch
+
+from plugins.log_bridge.line_parsing import LEVEL_WORD
+from plugins.log_bridge.line_parsing import classify_line
+from plugins.log_bridge.line_parsing import orjson
+from plugins.log_bridge.line_parsing import scan_braces
+from plugins.log_bridge.pipe_multiplexer import PipeMultiplexer
+from plugins.log_bridge.process_log_bridge import ProcessLogBridge
+from plugins.log_bridge.record_sink import find_records
+
+# Writes JSON split over several lines, CRLF and CR line endings, and a last line without a line ending
+CHILD_SCRIPT = r"""
+import sys
+
+sys.stdout.buffer.write(b'plain INFO line\n{\n  "message": "caf\xc3\xa9 {not a brace}",\n  "request_id": "r-1"\n}\n')
+sys.stdout.buffer.write(b"crlf line\r\ncr line\rlast line")
+sys.stderr.buffer.write(b"ERROR on stderr\n")
+"""
+
+
+class TestProcessLogBridge(TestCase):
+    """
+    Unit tests for the pipe draining of the log bridge.
+    """
+
+    def setUp(self):
+        self.root_handlers = list(logging.getLogger().handlers)
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self):
+        logging.getLogger().handlers[:] = self.root_handlers
+        self.temp_dir.cleanup()
+
+    def make_bridge(self, drain_mode: str) -> ProcessLogBridge:
+        """
+        :return: A bridge rendering its console output into a string
+        """
+        bridge = ProcessLogBridge(level="DEBUG", drain_mode=drain_mode)
+        bridge.console.file = io.StringIO()
+        return bridge
+
+    def test_split_chunk_handles_line_endings_across_reads(self):
+        """
+        Lines, CRLF line endings and multi-byte characters split across reads should be reassembled,
+        and the last line should be returned at EOF even without a line ending.
+        """
+        state = {"decoder": codecs.getincrementaldecoder("utf-8")(errors="replace"), "partial": ""}
+        lines = []
+        for chunk in [b"one\r", b"\ntw", b"o\rthree \xc3", b"\xa9\n\n", b"last", b""]:
+            lines.extend(PipeMultiplexer._split_chunk(state, chunk))  # pylint: disable=protected-access
+        self.assertEqual(lines, ["one", "two", "three é", "", "last"])
+
+    def test_drain_modes_tee_the_same_lines(self):
+        """
+        Both drain modes should mirror every line of both pipes and render the same records.
+        """
+        expected = [
+            "plain INFO line",
+            "{",
+            '  "message": "café {not a brace}",',
+            '  "request_id": "r-1"',
+            "}",
+            "crlf line",
+            "cr line",
+            "last line",
+            "ERROR on stderr",
+        ]
+        for drain_mode in ProcessLogBridge.DRAIN_MODES:
+            with self.subTest(drain_mode=drain_mode):
+                bridge = self.make_bridge(drain_mode)
+                log_file = os.path.join(self.temp_dir.name, f"{drain_mode}.log")
+                process = subprocess.Popen(  # pylint: disable=consider-using-with
+                    [sys.executable, "-c", CHILD_SCRIPT],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    encoding="utf-8",
+                    bufsize=1,
+                )
+                bridge.attach_process_logger(process, "child", log_file)
+                process.wait()
+                self.assertTrue(bridge.wait_for_streams(timeout=30))
+
+                with open(log_file, encoding="utf-8") as tee:
+                    teed = tee.read().splitlines()
+                self.assertEqual(sorted(teed), sorted(expected))
+                rendered = bridge.console.file.getvalue()
+                self.assertIn('"request_id": "r-1"', rendered)
+                self.assertIn("ERROR on stderr", rendered)
+
+    def test_classify_line(self):
+        """
+        Only lines that may hold JSON should be classified for parsing.
+        """
+        # pylint: disable=protected-access
+        self.assertEqual(classify_line('  {"message": "hi"}'), "json")
+        self.assertEqual(classify_line("[1, 2]"), "json")
+        self.assertEqual(classify_line('Request reporting: {"a": 1}'), "fragment")
+        self.assertEqual(classify_line("[2025-06-10 14:03:12] INFO started"), "text")
+        self.assertEqual(classify_line('  "request_id": "r-1"'), "text")
+
+    def test_level_inference_matches_level_regex(self):
+        """
+        The token scan should find the same severity as the level regular expression, whole words only.
+        """
+        bridge = ProcessLogBridge(level="CRITICAL")
+        lines = [
+            "2025-06-10 14:03:13,905 - neuro_san.run_context - DEBUG - Calling tool",
+            "INFO:     127.0.0.1:53426 - POST /api/v1/streaming_chat 200 OK",
+            "INFORMATION about an error: disk full",
+            "xERROR_INFO then Warning, later ERROR",
+            "fatal: not a git repository",
+            "Traceback (most recent call last):",
+            '  File "/app/lights.py", line 42, in invoke',
+            "ends with critical",
+        ]
+        for line in lines:
+            match = LEVEL_WORD.search(line)
+            expected = logging.INFO
+            if match:
+                expected = (
+                    logging.CRITICAL if match.group(1).upper() == "FATAL" else getattr(logging, match.group(1).upper())
+                )
+            elif "traceback" in line.lower():
+                expected = logging.ERROR
+            self.assertEqual(bridge._infer_level_from_text(line), expected, line)  # pylint: disable=protected-access
+
+    @skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_backend_falls_back_to_json(self):
+        """
+        Documents orjson rejects but json accepts should still parse, and invalid JSON should still fail.
+        """
+        bridge = ProcessLogBridge(level="CRITICAL", config={"json_backend": "orjson"})
+        # pylint: disable=protected-access
+        self.assertEqual(bridge._loads_json('{"a": 1}'), {"a": 1})
+        self.assertNotEqual(bridge._loads_json('{"loss": NaN}')["loss"], 0)
+        with self.assertRaises(ValueError):
+            bridge._loads_json('{"message": "Request reporting: {')
+
+    def test_full_render_queue_skips_console_lines_only(self):
+        """
+        Lines that do not fit in the render queue should still be mirrored, and reported as not shown.
+        """
+        bridge = ProcessLogBridge(level="DEBUG", config={"render": {"queue_lines": 2, "plain_backlog": 100}})
+        bridge.console.file = io.StringIO()
+        log_file = os.path.join(self.temp_dir.name, "child.log")
+        # pylint: disable=protected-access
+        # pylint: disable=consider-using-with
+        state = bridge._make_stream_state("child", open(log_file, "a", encoding="utf-8"))
+        bridge._open_streams = 1
+        # The renderer is not running yet, so the queue fills up
+        for number in range(5):
+            bridge._handle_line(state, f"line {number}")
+        bridge._renderer.start()
+        bridge._finish_stream(io.StringIO(), state)
+        self.assertTrue(bridge.wait_for_streams(timeout=30))
+
+        with open(log_file, encoding="utf-8") as tee:
+            self.assertEqual(tee.read().splitlines(), [f"line {number}" for number in range(5)])
+        self.assertEqual(bridge.render_counts, {"rich": 2, "plain": 0, "skipped": 3})
+        rendered = bridge.console.file.getvalue()
+        self.assertIn("line 1", rendered)
+        self.assertNotIn("line 4", rendered)
+        self.assertIn("3 lines not shown", rendered)
+
+    def test_render_backlog_switches_to_plain_lines(self):
+        """
+        A backlog of lines should be rendered as plain one-line output, JSON records included, until it shrinks.
+        """
+        bridge = ProcessLogBridge(level="DEBUG", config={"render": {"plain_backlog": 4}})
+        bridge.console.file = io.StringIO()
+        log_file = os.path.join(self.temp_dir.name, "child.log")
+        # pylint: disable=protected-access
+        # pylint: disable=consider-using-with
+        state = bridge._make_stream_state("child", open(log_file, "a", encoding="utf-8"))
+        bridge._open_streams = 1
+        bridge._handle_line(state, '{"message": "tool failed", "message_type": "Error"}')
+        for number in range(9):
+            bridge._handle_line(state, f"line {number}")
+        bridge._finish_stream(io.StringIO(), state)
+        bridge._renderer.start()
+        self.assertTrue(bridge.wait_for_streams(timeout=30))
+
+        self.assertEqual(bridge.render_counts, {"rich": 2, "plain": 8, "skipped": 0})
+        rendered = bridge.console.file.getvalue()
+        self.assertIn('ERROR    child - {"message": "tool failed", "message_type": "Error"}', rendered)
+        self.assertIn("INFO     child - line 0", rendered)
+        self.assertIn("rendering rich lines again", rendered)
+
+    def test_scan_braces_matches_scanning_the_joined_block(self):
+        """
+        Scanning the lines of a block one by one should find the brace balance of a char by char scan of the
+        joined block, with quotes and escapes carried over line breaks.
+        """
+        rng = random.Random(7)
+        for _ in range(500):
+            lines = ["".join(rng.choice('{}"\\ax') for _ in range(rng.randrange(12))) for _ in range(4)]
+            depth, in_str, esc = 0, False, False
+            for ch in "\n".join(lines):
+                if esc:
+                    esc = False
+                elif ch == "\\":
+                    esc = True
+                elif ch == '"':
+                    in_str = not in_str
+                elif not in_str and ch in "{}":
+                    depth += 1 if ch == "{" else -1
+
+            state = {"balance": 0, "in_string": False}
+            for line in lines:
+                scan_braces(state, line)
+            self.assertEqual((state["balance"], state["in_string"]), (depth, in_str), lines)
+
+    def test_nested_and_escaped_json_is_reassembled_and_parsed_once(self):
+        """
+        Pretty-printed records with nested objects, and braces, quotes and backslashes in strings,
+        should be reassembled into one record, parsed once when the block is complete.
+        """
+        record = {
+            "message": 'Tool said "use {braces} like this: }}{" and \\"escaped\\" quotes',
+            "details": {"path": "C:\\tools\\", "nested": {"empty": {}, "list": [{"a": 1}, "}"]}, "note": "é{"},
+            "message_type": "Info",
+            "request_id": "r-1",
+        }
+        for prefix, suffix in [("", ""), ("Tool result: ", " (took 3 ms)")]:
+            with self.subTest(prefix=prefix):
+                bridge = ProcessLogBridge(level="CRITICAL")
+                lines = (prefix + json.dumps(record, indent=2, ensure_ascii=False) + suffix).splitlines()
+                # pylint: disable=protected-access
+                state = bridge._make_stream_state("child", io.StringIO())
+                with patch.object(bridge, "_emit_json_block") as emit, patch.object(
+                    bridge, "_loads_json", wraps=bridge._loads_json
+                ) as loads:
+                    for line in lines:
+                        bridge._render_line(state, line)
+                emit.assert_called_once_with(state, record, False)
+                self.assertEqual(len([call for call in loads.call_args_list if "\n" in call.args[0]]), 1)
+                self.assertFalse(state["collecting"])
+                self.assertFalse(state["in_string"])
+
+    def test_parsed_records_are_stored_with_their_meta_fields(self):
+        """
+        With a records directory, parsed JSON records should be stored with the request_id and user_id
+        found in them or in their message, and be findable once the bridge is closed.
+        """
+        records_dir = os.path.join(self.temp_dir.name, "records")
+        bridge = ProcessLogBridge(level="CRITICAL", config={"records": {"directory": records_dir}})
+        # pylint: disable=protected-access
+        state = bridge._make_stream_state("child", io.StringIO())
+        bridge._render_line(state, "plain text line")
+        reporting = 'Request reporting: {\\"request_id\\": \\"r-9\\"}'
+        bridge._render_line(state, f'{{"message": "{reporting}", "user_id": "alice", "message_type": "Warning"}}')
+        bridge.close(timeout=1)
+
+        records = list(find_records(records_dir, request_id="r-9"))
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["process"], "child")
+        self.assertEqual(records[0]["level"], "WARNING")
+        self.assertEqual(records[0]["user_id"], "alice")
+        self.assertEqual(records[0]["record"]["message"], 'Request reporting: {"request_id": "r-9"}')
+
+    def test_records_are_stored_whatever_the_console_shows(self):
+        """
+        Records shown as plain lines or skipped on the console should all be stored, timed by their Timestamp
+        or else by the time they were read, and be findable after flush_seconds while the stream is still open.
+        """
+        records_dir = os.path.join(self.temp_dir.name, "records")
+        config = {
+            "render": {"queue_lines": 2, "plain_backlog": 1},
+            "records": {"directory": records_dir, "flush_seconds": 0.1},
+        }
+        bridge = ProcessLogBridge(level="CRITICAL", config=config)
+        # pylint: disable=protected-access
+        state = bridge._make_stream_state("child", io.StringIO())
+        bridge._streams[("child", "STDOUT")] = state
+        bridge._open_streams = 1
+        before = time.time()
+        # The renderer is not running, so only the first two lines fit in its queue
+        bridge._handle_line(state, '{"message": "early", "request_id": "r-1", "Timestamp": "2025-06-10T14:00:00"}')
+        for number in range(2, 6):
+            bridge._handle_line(state, "{")
+            bridge._handle_line(state, f'  "message": "record {number}", "request_id": "r-{number}"')
+            bridge._handle_line(state, "}")
+        bridge._renderer.start()
+        bridge._recorder.start()
+
+        deadline = time.monotonic() + 30
+        while len(list(find_records(records_dir, since=0))) < 5 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        records = list(find_records(records_dir, since=0))
+        self.assertEqual([record["request_id"] for record in records], ["r-1", "r-2", "r-3", "r-4", "r-5"])
+        self.assertEqual(records[0]["time"][:19], "2025-06-10T14:00:00")
+        self.assertGreaterEqual(datetime.fromisoformat(records[1]["time"]).timestamp(), before)
+
+        bridge._finish_stream(io.StringIO(), state)
+        self.assertTrue(bridge.wait_for_streams(timeout=30))
+        self.assertEqual(bridge.render_counts["skipped"], 11)
+
+    def test_skipped_lines_beyond_the_records_queue_are_dropped_without_waiting(self):
+        """
+        Lines skipped on the console should wait for the renderer in a bounded queue, filled without waiting:
+        the ones beyond it should be dropped from the records and counted, the others stored.
+        """
+        records_dir = os.path.join(self.temp_dir.name, "records")
+        config = {"render": {"queue_lines": 1}, "records": {"directory": records_dir, "queue_lines": 2}}
+        bridge = ProcessLogBridge(level="CRITICAL", config=config)
+        # pylint: disable=protected-access
+        state = bridge._make_stream_state("child", io.StringIO())
+        bridge._open_streams = 1
+        # Neither the renderer nor the recorder is running, so this only returns if nothing waits for them
+        for number in range(1, 7):
+            bridge._handle_line(state, f'{{"message": "record {number}", "request_id": "r-{number}"}}')
+        bridge._renderer.start()
+        bridge._finish_stream(io.StringIO(), state)
+        bridge.close(timeout=30)
+
+        records = list(find_records(records_dir, since=0))
+        self.assertEqual([record["request_id"] for record in records], ["r-1", "r-2", "r-3"])
+        self.assertEqual(bridge._recorder.dropped, 3)
+        self.assertEqual(bridge.render_counts["skipped"], 5)
+
+    def test_unknown_drain_mode_is_rejected(self):
+        """
+        An unknown drain mode should fail fast rather than silently drain with threads.
+        """
+        with self.assertRaises(ValueError):
+            ProcessLogBridge(drain_mode="asyncio")
@@ -0,0 +1,120 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import gzip
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stdout
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import patch
+
+from plugins.log_bridge import find_records as find_records_cli
+from plugins.log_bridge.record_sink import RecordSink
+from plugins.log_bridge.record_sink import find_records
+from plugins.log_bridge.record_sink import list_segments
+from plugins.log_bridge.record_sink import read_index
+
+START = 1_750_000_000.0
+
+
+class TestRecordSink(TestCase):
+    """
+    Unit tests for the indexed store of log records.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.directory = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_records(self, count: int, **kwargs) -> RecordSink:
+        """
+        :param count: Number of records to append, one second apart, 5 per request and 10 per user
+        :return: The sink they were appended to, flushed
+        """
+        sink = RecordSink(self.directory, **kwargs)
+        for number in range(count):
+            record = {"request_id": f"r-{number // 5}", "user_id": f"u-{number // 10}", "number": number}
+            sink.append(record, timestamp=START + number)
+        sink.flush()
+        return sink
+
+    def test_records_are_found_by_request_user_and_time(self):
+        """
+        Records should be found by any combination of conditions, oldest first, across blocks and segments.
+        """
+        self.write_records(100, segment_bytes=1000, block_records=4)
+        self.assertGreater(len(list_segments(self.directory)), 1)
+
+        numbers = [record["number"] for record in find_records(self.directory, request_id="r-7")]
+        self.assertEqual(numbers, [35, 36, 37, 38, 39])
+        numbers = [record["number"] for record in find_records(self.directory, request_id="r-7", user_id="u-4")]
+        self.assertEqual(numbers, [])
+        numbers = [record["number"] for record in find_records(self.directory, since=START + 41, until=START + 43.5)]
+        self.assertEqual(numbers, [41, 42, 43])
+        numbers = [record["number"] for record in find_records(self.directory, user_id="u-9", since=START + 97)]
+        self.assertEqual(numbers, [97, 98, 99])
+        self.assertEqual(len(list(find_records(self.directory, request_id="r-100"))), 0)
+
+    def test_only_matching_blocks_are_decompressed(self):
+        """
+        A request should be found by decompressing only the blocks holding its records.
+        """
+        self.write_records(100, block_records=5)
+        with patch("plugins.log_bridge.record_sink.gzip.decompress", wraps=gzip.decompress) as decompress:
+            self.assertEqual(len(list(find_records(self.directory, request_id="r-3"))), 5)
+        self.assertEqual(decompress.call_count, 1)
+
+    def test_segments_are_gzip_files_and_old_ones_are_deleted(self):
+        """
+        Each segment should read as a whole with gzip, only the newest segments should be kept,
+        and a new sink should start a new segment after them.
+        """
+        self.write_records(100, segment_bytes=500, max_segments=3, block_records=4)
+        segments = list_segments(self.directory)
+        self.assertEqual(len(segments), 3)
+        for _, segment_path, index_path in segments:
+            with gzip.open(segment_path, "rt", encoding="utf-8") as segment:
+                lines = segment.read().splitlines()
+            self.assertEqual(len(lines), sum(entry["records"] for entry in read_index(index_path)))
+        self.assertEqual(json.loads(lines[-1])["number"], 99)
+
+        last_number = segments[-1][0]
+        sink = RecordSink(self.directory, max_segments=3)
+        sink.append({"request_id": "r-new"})
+        sink.flush()
+        self.assertEqual([number for number, _, _ in list_segments(self.directory)][-1], last_number + 1)
+        self.assertEqual(len(list(find_records(self.directory, request_id="r-new"))), 1)
+
+    def test_find_records_command_prints_json_lines(self):
+        """
+        The command should print the matching records, one JSON document per line.
+        """
+        self.write_records(20)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            find_records_cli.main(["--records-dir", self.directory, "--request-id", "r-2"])
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual([record["number"] for record in records], [10, 11, 12, 13, 14])
+        self.assertEqual(datetime.fromisoformat(records[0]["time"]).timestamp(), START + 10)
+
+        with self.assertRaises(SystemExit), redirect_stdout(io.StringIO()), patch("sys.stderr", io.StringIO()):
+            find_records_cli.main(["--records-dir", os.path.join(self.directory, "missing"), "--request-id", "r-2"])